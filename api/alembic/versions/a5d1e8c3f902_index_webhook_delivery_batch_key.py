@@ -0,0 +1,32 @@
+"""index webhook delivery batch key
+
+Revision ID: a5d1e8c3f902
+Revises: e7b3c9d1a045
+Create Date: 2026-10-19 02:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a5d1e8c3f902"
+down_revision: Union[str, None] = "e7b3c9d1a045"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_webhook_deliveries_batch",
+        "webhook_deliveries",
+        ["batch_key"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_webhook_deliveries_batch", table_name="webhook_deliveries")
@@ -0,0 +1,86 @@
+"""add workflow run listing indexes
+
+Revision ID: b7e3c1a9d245
+Revises: 6fd8fac02883
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e3c1a9d245"
+down_revision: Union[str, None] = "6fd8fac02883"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # workflow_runs can be very large; build the indexes without locking writes
+    with op.get_context().autocommit_block():
+        # Keyset pagination in the default sort (created_at DESC, id DESC)
+        op.create_index(
+            "idx_workflow_runs_workflow_id_created_at",
+            "workflow_runs",
+            [
+                "workflow_id",
+                sa.text("created_at DESC NULLS LAST"),
+                sa.text("id DESC"),
+            ],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Keyset pagination sorted by call duration
+        op.create_index(
+            "idx_workflow_runs_workflow_id_duration",
+            "workflow_runs",
+            [
+                "workflow_id",
+                sa.text(
+                    "((cost_info ->> 'call_duration_seconds')::double precision) "
+                    "DESC NULLS LAST"
+                ),
+                sa.text("id DESC"),
+            ],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # dispositionCode filter
+        op.create_index(
+            "idx_workflow_runs_workflow_id_disposition",
+            "workflow_runs",
+            [
+                "workflow_id",
+                sa.text("((gathered_context::jsonb ->> 'mapped_call_disposition'))"),
+            ],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # callTags filter (@> containment)
+        op.create_index(
+            "idx_workflow_runs_call_tags",
+            "workflow_runs",
+            [sa.text("((gathered_context::jsonb -> 'call_tags')) jsonb_path_ops")],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name in (
+            "idx_workflow_runs_call_tags",
+            "idx_workflow_runs_workflow_id_disposition",
+            "idx_workflow_runs_workflow_id_duration",
+            "idx_workflow_runs_workflow_id_created_at",
+        ):
+            op.drop_index(
+                index_name,
+                table_name="workflow_runs",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
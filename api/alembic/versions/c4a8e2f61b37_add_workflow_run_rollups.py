@@ -0,0 +1,69 @@
+"""add workflow run rollups
+
+Revision ID: c4a8e2f61b37
+Revises: b7e3c1a9d245
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a8e2f61b37"
+down_revision: Union[str, None] = "b7e3c1a9d245"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "workflow_run_rollups",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("organization_id", sa.Integer(), nullable=True),
+        sa.Column("workflow_id", sa.Integer(), nullable=False),
+        sa.Column("slot_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("disposition", sa.String(), nullable=False),
+        sa.Column("duration_bucket", sa.String(), nullable=False),
+        sa.Column("run_count", sa.Integer(), nullable=False),
+        sa.Column("completed_count", sa.Integer(), nullable=False),
+        sa.Column("completed_duration_seconds", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"]),
+        sa.ForeignKeyConstraint(["workflow_id"], ["workflows.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "workflow_id",
+            "slot_start",
+            "disposition",
+            "duration_bucket",
+            name="unique_workflow_run_rollup",
+        ),
+    )
+    op.create_index(
+        op.f("ix_workflow_run_rollups_id"), "workflow_run_rollups", ["id"], unique=False
+    )
+    op.create_index(
+        "idx_workflow_run_rollups_org_slot",
+        "workflow_run_rollups",
+        ["organization_id", "slot_start"],
+        unique=False,
+    )
+    op.create_table(
+        "workflow_run_rollup_coverage",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("covered_from", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("covered_through", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("workflow_run_rollup_coverage")
+    op.drop_index(
+        "idx_workflow_run_rollups_org_slot", table_name="workflow_run_rollups"
+    )
+    op.drop_index(op.f("ix_workflow_run_rollups_id"), table_name="workflow_run_rollups")
+    op.drop_table("workflow_run_rollups")
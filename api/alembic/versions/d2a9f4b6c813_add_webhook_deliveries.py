@@ -0,0 +1,88 @@
+"""add webhook deliveries outbox
+
+Revision ID: d2a9f4b6c813
+Revises: c4a8e2f61b37
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2a9f4b6c813"
+down_revision: Union[str, None] = "c4a8e2f61b37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "webhook_deliveries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("organization_id", sa.Integer(), nullable=False),
+        sa.Column("workflow_run_id", sa.Integer(), nullable=True),
+        sa.Column("webhook_name", sa.String(), nullable=False),
+        sa.Column("http_method", sa.String(), nullable=False),
+        sa.Column("endpoint_url", sa.String(), nullable=False),
+        sa.Column("destination_host", sa.String(), nullable=False),
+        sa.Column("custom_headers", sa.JSON(), nullable=False),
+        sa.Column("credential_uuid", sa.String(), nullable=True),
+        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("idempotency_key", sa.String(), nullable=False),
+        sa.Column("batch_key", sa.String(), nullable=True),
+        sa.Column("batch_max_size", sa.Integer(), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "pending",
+                "delivering",
+                "delivered",
+                "failed",
+                name="webhook_delivery_status",
+            ),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("retry_base_seconds", sa.Float(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_status_code", sa.Integer(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("delivered_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["organization_id"], ["organizations.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["workflow_run_id"], ["workflow_runs.id"], ondelete="SET NULL"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("idempotency_key"),
+    )
+    op.create_index(
+        op.f("ix_webhook_deliveries_id"), "webhook_deliveries", ["id"], unique=False
+    )
+    op.create_index(
+        "idx_webhook_deliveries_due",
+        "webhook_deliveries",
+        ["next_attempt_at"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('pending', 'delivering')"),
+    )
+    op.create_index(
+        "idx_webhook_deliveries_created",
+        "webhook_deliveries",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_webhook_deliveries_created", table_name="webhook_deliveries")
+    op.drop_index("idx_webhook_deliveries_due", table_name="webhook_deliveries")
+    op.drop_index(op.f("ix_webhook_deliveries_id"), table_name="webhook_deliveries")
+    op.drop_table("webhook_deliveries")
+    sa.Enum(name="webhook_delivery_status").drop(op.get_bind(), checkfirst=True)
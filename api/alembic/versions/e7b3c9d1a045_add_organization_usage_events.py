@@ -0,0 +1,66 @@
+"""add organization usage events ledger
+
+Revision ID: e7b3c9d1a045
+Revises: d2a9f4b6c813
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b3c9d1a045"
+down_revision: Union[str, None] = "d2a9f4b6c813"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "organization_usage_events",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("organization_id", sa.Integer(), nullable=False),
+        sa.Column("cycle_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "kind",
+            sa.Enum("reservation", "consumption", name="usage_event_kind"),
+            nullable=False,
+        ),
+        sa.Column("dograh_tokens", sa.Float(), nullable=False),
+        sa.Column("duration_seconds", sa.Integer(), nullable=False),
+        sa.Column("amount_usd", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("folded_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["organization_id"], ["organizations.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["cycle_id"], ["organization_usage_cycles.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_organization_usage_events_id"),
+        "organization_usage_events",
+        ["id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_usage_events_unfolded",
+        "organization_usage_events",
+        ["cycle_id"],
+        unique=False,
+        postgresql_where=sa.text("folded_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_usage_events_unfolded", table_name="organization_usage_events")
+    op.drop_index(
+        op.f("ix_organization_usage_events_id"), table_name="organization_usage_events"
+    )
+    op.drop_table("organization_usage_events")
+    sa.Enum(name="usage_event_kind").drop(op.get_bind(), checkfirst=True)
@@ -48,7 +48,15 @@ from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
+from api.constants import MEDIA_WORKER_INDEX, MEDIA_WORKERS
 from api.routes.main import router as main_router
+from api.services.media_workers.registry import run_heartbeat
+from api.services.media_workers.routing import (
+    MediaSessionCounterMiddleware,
+    MediaWorkerRouterMiddleware,
+    get_active_media_sessions,
+)
+from api.services.workflow.tools.http_tool_engine import close_http_tool_engine
 from api.tasks.arq import get_arq_redis
 
 API_PREFIX = "/api/v1"
@@ -59,10 +67,20 @@ async def lifespan(app: FastAPI):
     # warmup arq pool
     await get_arq_redis()
 
+    heartbeat_task = None
+    if MEDIA_WORKER_INDEX is not None:
+        heartbeat_task = asyncio.create_task(
+            run_heartbeat(MEDIA_WORKER_INDEX, get_active_media_sessions)
+        )
+
     yield  # Run app
 
     # Shutdown sequence - this runs when FastAPI is shutting down
     logger.info("Starting graceful shutdown...")
+    if heartbeat_task:
+        heartbeat_task.cancel()
+        await asyncio.gather(heartbeat_task, return_exceptions=True)
+    await close_http_tool_engine()
 
 
 app = FastAPI(
@@ -83,6 +101,12 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
+# Call media websockets run in dedicated media worker processes when configured
+if MEDIA_WORKER_INDEX is not None:
+    app.add_middleware(MediaSessionCounterMiddleware)
+elif MEDIA_WORKERS > 0:
+    app.add_middleware(MediaWorkerRouterMiddleware)
+
 api_router = APIRouter()
 
 # include subrouters here
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -16,6 +17,13 @@ VOICEMAIL_RECORDING_DURATION = 5.0
 
 # Configuration constants
 ENABLE_TRACING = os.getenv("ENABLE_TRACING", "false").lower() == "true"
+# LLM span payload capture: "full", "delta" (only messages appended since the
+# previous span) or "metadata" (no messages/tools)
+TRACING_CAPTURE_MODE = os.getenv("TRACING_CAPTURE_MODE", "delta").lower()
+# Fraction of calls whose LLM spans record context payloads
+TRACING_SAMPLE_RATE = float(os.getenv("TRACING_SAMPLE_RATE", "1.0"))
+# Slow LLM spans (seconds) record the full context even when not sampled
+TRACING_TAIL_LATENCY_SECONDS = os.getenv("TRACING_TAIL_LATENCY_SECONDS")
 ENABLE_RNNOISE = os.getenv("ENABLE_RNNOISE", "false").lower() == "true"
 
 # URLs for deployment
@@ -134,3 +142,115 @@ TURN_CREDENTIAL_TTL = int(os.getenv("TURN_CREDENTIAL_TTL", "86400"))
 # OSS Email/Password Auth
 OSS_JWT_SECRET = os.getenv("OSS_JWT_SECRET", "change-me-in-production")
 OSS_JWT_EXPIRY_HOURS = int(os.getenv("OSS_JWT_EXPIRY_HOURS", "720"))  # 30 days
+
+# Authenticated principal cache (see api/services/auth/principal_cache.py)
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "30"))
+AUTH_CACHE_NEGATIVE_TTL_SECONDS = float(
+    os.getenv("AUTH_CACHE_NEGATIVE_TTL_SECONDS", "5")
+)
+AUTH_CACHE_USE_REDIS = os.getenv("AUTH_CACHE_USE_REDIS", "false").lower() == "true"
+
+# Telephony audio output pacing (see pipecat/utils/media_clock.py). Both are
+# opt-in: by default each call sleeps per audio chunk, in real time.
+MEDIA_CLOCK_ENABLED = os.getenv("MEDIA_CLOCK_ENABLED", "false").lower() == "true"
+AUDIO_OUT_SEND_AHEAD_MS = int(os.getenv("AUDIO_OUT_SEND_AHEAD_MS", "0"))
+
+# Media workers (see api/services/media_workers). When MEDIA_WORKERS > 0, call
+# media websockets are relayed to dedicated pipeline processes, and signaling
+# WebSocket senders are shared between processes over Redis.
+MEDIA_WORKERS = int(os.getenv("MEDIA_WORKERS", "0"))
+MEDIA_WORKER_HOST = os.getenv("MEDIA_WORKER_HOST", "127.0.0.1")
+MEDIA_WORKER_BASE_PORT = int(os.getenv("MEDIA_WORKER_BASE_PORT", "8100"))
+MEDIA_WORKER_PIN_CPUS = os.getenv("MEDIA_WORKER_PIN_CPUS", "true").lower() == "true"
+MEDIA_WORKER_HEARTBEAT_SECONDS = int(os.getenv("MEDIA_WORKER_HEARTBEAT_SECONDS", "2"))
+MEDIA_WORKER_AFFINITY_TTL_SECONDS = int(
+    os.getenv("MEDIA_WORKER_AFFINITY_TTL_SECONDS", "3600")
+)
+# Public websocket base URL of a media worker, with {index} and {port}
+# placeholders (e.g. "wss://media.example.com:{port}"). When set, telephony
+# providers stream call audio to the run's worker directly instead of through
+# the API process.
+MEDIA_WORKER_PUBLIC_URL = os.getenv("MEDIA_WORKER_PUBLIC_URL", "")
+# Set by the media worker launcher for the process it starts
+MEDIA_WORKER_INDEX = (
+    int(os.environ["MEDIA_WORKER_INDEX"]) if os.getenv("MEDIA_WORKER_INDEX") else None
+)
+
+# Post-call webhook delivery (see api/services/integrations/webhook_delivery.py)
+WEBHOOK_DELIVERY_CONCURRENCY = int(os.getenv("WEBHOOK_DELIVERY_CONCURRENCY", "20"))
+WEBHOOK_DELIVERY_TIMEOUT_SECONDS = float(
+    os.getenv("WEBHOOK_DELIVERY_TIMEOUT_SECONDS", "30")
+)
+WEBHOOK_MAX_ATTEMPTS = int(os.getenv("WEBHOOK_MAX_ATTEMPTS", "8"))
+WEBHOOK_RETRY_BASE_SECONDS = float(os.getenv("WEBHOOK_RETRY_BASE_SECONDS", "30"))
+WEBHOOK_RETRY_MAX_SECONDS = float(os.getenv("WEBHOOK_RETRY_MAX_SECONDS", "3600"))
+WEBHOOK_RATE_LIMIT_PER_HOST = int(os.getenv("WEBHOOK_RATE_LIMIT_PER_HOST", "20"))
+
+# Variable extraction (see api/services/workflow/pipecat_engine_variable_extractor.py)
+# Send only the turns since the previous extraction plus the current values
+VARIABLE_EXTRACTION_INCREMENTAL = (
+    os.getenv("VARIABLE_EXTRACTION_INCREMENTAL", "true").lower() == "true"
+)
+# Background extractions requested within this window share one LLM request
+VARIABLE_EXTRACTION_DEBOUNCE_MS = int(
+    os.getenv("VARIABLE_EXTRACTION_DEBOUNCE_MS", "500")
+)
+
+# Streaming run logs (see api/services/pipecat/run_log.py). Transcript and
+# feedback events are appended to a file per run and mirrored to a Redis stream
+# for live tailing.
+RUN_LOG_DIR = os.getenv(
+    "RUN_LOG_DIR", os.path.join(tempfile.gettempdir(), "dograh-run-logs")
+)
+RUN_LOG_FLUSH_INTERVAL_SECONDS = float(os.getenv("RUN_LOG_FLUSH_INTERVAL_SECONDS", "1"))
+RUN_LOG_STREAM_ENABLED = os.getenv("RUN_LOG_STREAM_ENABLED", "true").lower() == "true"
+RUN_LOG_STREAM_MAXLEN = int(os.getenv("RUN_LOG_STREAM_MAXLEN", "10000"))
+RUN_LOG_STREAM_TTL_SECONDS = int(os.getenv("RUN_LOG_STREAM_TTL_SECONDS", "86400"))
+# Log files untouched for this long were left by a worker that died mid-call
+# and are deleted by a periodic cleanup job
+RUN_LOG_STALE_SECONDS = int(os.getenv("RUN_LOG_STALE_SECONDS", "21600"))
+
+# Speculative LLM generation (see LLMUserAggregatorParams). Start the LLM as
+# soon as the user pauses with a final transcript and only speak the response
+# once the user turn is confirmed.
+ENABLE_SPECULATIVE_GENERATION = (
+    os.getenv("ENABLE_SPECULATIVE_GENERATION", "false").lower() == "true"
+)
+
+# STT time-to-final-segment estimation. STT services measure how long the final
+# transcript takes after the user stops speaking and publish the recent P99 to
+# the turn stop strategies instead of a static per-provider value. Estimates are
+# shared by all workers through Redis with STT_TTFS_PERSIST_REDIS; windows expire
+# after the TTL. The estimate is bounded by the static value, both are opt-in.
+STT_TTFS_ESTIMATION = os.getenv("STT_TTFS_ESTIMATION", "false").lower() == "true"
+STT_TTFS_PERSIST_REDIS = os.getenv("STT_TTFS_PERSIST_REDIS", "false").lower() == "true"
+STT_TTFS_WINDOW_TTL_SECONDS = int(os.getenv("STT_TTFS_WINDOW_TTL_SECONDS", "1800"))
+
+# TTS phrase cache. Phrases synthesized by any TTS provider are cached (audio
+# and word timestamps) in an in-process LRU bounded by size and replayed when
+# they repeat. Phrases spoken live are cached once seen twice, in memory only.
+# With TTS_PHRASE_CACHE_PERSIST_REDIS, presynthesized workflow messages are
+# also shared with the other workers through Redis (they can contain the
+# caller's name, so this is off by default). The cache itself is opt-in.
+TTS_PHRASE_CACHE = os.getenv("TTS_PHRASE_CACHE", "false").lower() == "true"
+TTS_PHRASE_CACHE_MEMORY_MB = int(os.getenv("TTS_PHRASE_CACHE_MEMORY_MB", "64"))
+TTS_PHRASE_CACHE_PERSIST_REDIS = (
+    os.getenv("TTS_PHRASE_CACHE_PERSIST_REDIS", "false").lower() == "true"
+)
+TTS_PHRASE_CACHE_TTL_SECONDS = int(os.getenv("TTS_PHRASE_CACHE_TTL_SECONDS", "86400"))
+# Fixed messages of the workflow (end call and transfer call tools) are
+# synthesized into the phrase cache at call setup, in the background, so they
+# play without waiting on the TTS provider. Needs the phrase cache and a TTS
+# service that returns whole phrases over HTTP: websocket services and those
+# with word timestamps (Cartesia, ElevenLabs, Deepgram, ...) don't support it,
+# so it is opt-in.
+TTS_PRESYNTHESIS = os.getenv("TTS_PRESYNTHESIS", "false").lower() == "true"
+TTS_PRESYNTHESIS_MAX_CONCURRENCY = int(
+    os.getenv("TTS_PRESYNTHESIS_MAX_CONCURRENCY", "4")
+)
+
+# Custom tool prefetch
+# Every custom tool of the workflow and its credential are resolved with one
+# query at call setup, so schema generation and tool execution don't query
+# Postgres mid-conversation. Tools edited during a call apply from the next call.
+CUSTOM_TOOL_PREFETCH = os.getenv("CUSTOM_TOOL_PREFETCH", "true").lower() == "true"
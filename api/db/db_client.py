@@ -12,6 +12,7 @@ from api.db.reports_client import ReportsClient
 from api.db.tool_client import ToolClient
 from api.db.user_client import UserClient
 from api.db.webhook_credential_client import WebhookCredentialClient
+from api.db.webhook_delivery_client import WebhookDeliveryClient
 from api.db.workflow_client import WorkflowClient
 from api.db.workflow_run_client import WorkflowRunClient
 from api.db.workflow_template_client import WorkflowTemplateClient
@@ -33,6 +34,7 @@ class DBClient(
     EmbedTokenClient,
     AgentTriggerClient,
     WebhookCredentialClient,
+    WebhookDeliveryClient,
     ToolClient,
     KnowledgeBaseClient,
 ):
@@ -55,6 +57,7 @@ class DBClient(
     - EmbedTokenClient: handles embed token and session operations
     - AgentTriggerClient: handles agent trigger operations for API-based call triggering
     - WebhookCredentialClient: handles webhook credential operations
+    - WebhookDeliveryClient: handles the post-call webhook delivery outbox
     - ToolClient: handles tool operations for reusable HTTP API tools
     - KnowledgeBaseClient: handles knowledge base document and vector search operations
     """
@@ -1,14 +1,32 @@
 """Common filter utilities for database queries."""
 
+import base64
+import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import Float, Integer, and_, cast, func
+from sqlalchemy import Float, Integer, and_, cast, func, or_
 from sqlalchemy.dialects.postgresql import JSONB
 
 from api.db.models import WorkflowRunModel
 
 
+def get_workflow_run_sort_column(sort_by: Optional[str] = None):
+    """
+    Get the column workflow run queries are sorted by.
+
+    Args:
+        sort_by: Field to sort by ('duration', 'created_at', etc.)
+
+    Returns:
+        SQLAlchemy column expression
+    """
+    if sort_by == "duration":
+        return WorkflowRunModel.cost_info.op("->>")("call_duration_seconds").cast(Float)
+    # Default to created_at
+    return WorkflowRunModel.created_at
+
+
 def get_workflow_run_order_clause(
     sort_by: Optional[str] = None,
     sort_order: str = "desc",
@@ -23,14 +41,7 @@ def get_workflow_run_order_clause(
     Returns:
         SQLAlchemy order clause
     """
-    # Determine sort column
-    if sort_by == "duration":
-        sort_column = WorkflowRunModel.cost_info.op("->>")(
-            "call_duration_seconds"
-        ).cast(Float)
-    else:
-        # Default to created_at
-        sort_column = WorkflowRunModel.created_at
+    sort_column = get_workflow_run_sort_column(sort_by)
 
     # Apply sort order
     if sort_order == "asc":
@@ -39,6 +50,97 @@ def get_workflow_run_order_clause(
         return sort_column.desc().nullslast()
 
 
+def encode_workflow_run_cursor(sort_by: Optional[str], sort_value: Any, run_id: int):
+    """
+    Encode the position after a workflow run as an opaque keyset cursor.
+
+    Args:
+        sort_by: Field the listing is sorted by
+        sort_value: Value of the sort column for the last returned run
+        run_id: ID of the last returned run
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps({"s": sort_by or "created_at", "v": sort_value, "id": run_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_workflow_run_cursor(cursor: str, sort_by: Optional[str]) -> Tuple[Any, int]:
+    """
+    Decode a cursor produced by ``encode_workflow_run_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort.
+
+    Returns:
+        Tuple of (sort_value, run_id)
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        run_id = int(payload["id"])
+        sort_value = payload["v"]
+        cursor_sort = payload["s"]
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+
+    if cursor_sort != (sort_by or "created_at"):
+        raise ValueError("Cursor does not match the requested sort")
+    if sort_value is None:
+        return sort_value, run_id
+    if cursor_sort == "duration":
+        if isinstance(sort_value, bool) or not isinstance(sort_value, (int, float)):
+            raise ValueError("Invalid cursor")
+    elif isinstance(sort_value, str):
+        sort_value = datetime.fromisoformat(sort_value)
+    else:
+        raise ValueError("Invalid cursor")
+    return sort_value, run_id
+
+
+def get_workflow_run_keyset_condition(
+    sort_by: Optional[str],
+    sort_order: str,
+    sort_value: Any,
+    run_id: int,
+):
+    """
+    Get the condition selecting runs after a cursor position.
+
+    Matches the ordering of ``get_workflow_run_order_clause`` with ``id`` as the
+    tie-breaker (NULL sort values last), so consecutive pages neither skip nor
+    repeat rows, and the database can seek straight to the cursor position
+    instead of scanning and discarding OFFSET rows.
+
+    Args:
+        sort_by: Field to sort by ('duration', 'created_at', etc.)
+        sort_order: 'asc' or 'desc'
+        sort_value: Sort column value of the last returned run
+        run_id: ID of the last returned run
+
+    Returns:
+        SQLAlchemy condition
+    """
+    sort_column = get_workflow_run_sort_column(sort_by)
+    ascending = sort_order == "asc"
+    id_after = (
+        WorkflowRunModel.id > run_id if ascending else WorkflowRunModel.id < run_id
+    )
+
+    if sort_value is None:
+        # Already in the trailing NULL section
+        return and_(sort_column.is_(None), id_after)
+
+    value_after = sort_column > sort_value if ascending else sort_column < sort_value
+    return or_(
+        value_after,
+        and_(sort_column == sort_value, id_after),
+        sort_column.is_(None),
+    )
+
+
 # Mapping of attribute names to database fields
 ATTRIBUTE_FIELD_MAPPING = {
     "dateRange": "created_at",
@@ -381,6 +381,81 @@ class WorkflowRunModel(Base):
         ),
         Index("idx_workflow_runs_workflow_id", "workflow_id"),
         Index("idx_workflow_runs_campaign_id", "campaign_id"),
+        # Run listing: keyset pagination and commonly filtered JSON attributes
+        Index(
+            "idx_workflow_runs_workflow_id_created_at",
+            "workflow_id",
+            text("created_at DESC NULLS LAST"),
+            text("id DESC"),
+        ),
+        Index(
+            "idx_workflow_runs_workflow_id_duration",
+            "workflow_id",
+            text(
+                "((cost_info ->> 'call_duration_seconds')::double precision) "
+                "DESC NULLS LAST"
+            ),
+            text("id DESC"),
+        ),
+        Index(
+            "idx_workflow_runs_workflow_id_disposition",
+            "workflow_id",
+            text("((gathered_context::jsonb ->> 'mapped_call_disposition'))"),
+        ),
+        Index(
+            "idx_workflow_runs_call_tags",
+            text("((gathered_context::jsonb -> 'call_tags')) jsonb_path_ops"),
+            postgresql_using="gin",
+        ),
+    )
+
+
+class WorkflowRunRollupModel(Base):
+    """
+    Pre-aggregated workflow run counts per 15-minute slot, used by reports
+    instead of scanning workflow_runs. 15-minute slots line up with every
+    timezone's midnight, so rollups can be summed into days of any timezone.
+    """
+
+    __tablename__ = "workflow_run_rollups"
+
+    id = Column(Integer, primary_key=True, index=True)
+    organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=True)
+    workflow_id = Column(Integer, ForeignKey("workflows.id"), nullable=False)
+    slot_start = Column(DateTime(timezone=True), nullable=False)
+    disposition = Column(String, nullable=False)
+    duration_bucket = Column(String, nullable=False)
+    run_count = Column(Integer, nullable=False, default=0)
+    completed_count = Column(Integer, nullable=False, default=0)
+    completed_duration_seconds = Column(Float, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "workflow_id",
+            "slot_start",
+            "disposition",
+            "duration_bucket",
+            name="unique_workflow_run_rollup",
+        ),
+        Index("idx_workflow_run_rollups_org_slot", "organization_id", "slot_start"),
+    )
+
+
+class WorkflowRunRollupCoverageModel(Base):
+    """
+    Time range fully covered by workflow_run_rollups. Reports aggregate raw
+    workflow_runs outside of it.
+    """
+
+    __tablename__ = "workflow_run_rollup_coverage"
+
+    id = Column(Integer, primary_key=True)
+    covered_from = Column(DateTime(timezone=True), nullable=False)
+    covered_through = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
     )
 
 
@@ -504,6 +579,43 @@ class OrganizationUsageCycleModel(Base):
     )
 
 
+class OrganizationUsageEventModel(Base):
+    """
+    Append-only ledger of usage deltas (reservations and run consumption) for a usage
+    cycle. Writers insert events without locking the cycle row; a periodic reconciler
+    folds unfolded events into ``OrganizationUsageCycleModel`` totals.
+    """
+
+    __tablename__ = "organization_usage_events"
+
+    id = Column(Integer, primary_key=True, index=True)
+    organization_id = Column(
+        Integer, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
+    )
+    cycle_id = Column(
+        Integer,
+        ForeignKey("organization_usage_cycles.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    kind = Column(
+        Enum("reservation", "consumption", name="usage_event_kind"), nullable=False
+    )
+    dograh_tokens = Column(Float, nullable=False, default=0)
+    duration_seconds = Column(Integer, nullable=False, default=0)
+    amount_usd = Column(Float, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
+    # Set when the event has been added to the cycle totals
+    folded_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index(
+            "idx_usage_events_unfolded",
+            "cycle_id",
+            postgresql_where=text("folded_at IS NULL"),
+        ),
+    )
+
+
 class CampaignModel(Base):
     __tablename__ = "campaigns"
 
@@ -590,6 +702,72 @@ class CampaignModel(Base):
     )
 
 
+class WebhookDeliveryModel(Base):
+    """
+    Outbox of post-call webhook requests. Rows are written when a run completes
+    and delivered (with retries) by the webhook delivery engine.
+    """
+
+    __tablename__ = "webhook_deliveries"
+
+    id = Column(Integer, primary_key=True, index=True)
+    organization_id = Column(
+        Integer, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
+    )
+    workflow_run_id = Column(
+        Integer, ForeignKey("workflow_runs.id", ondelete="SET NULL"), nullable=True
+    )
+    webhook_name = Column(String, nullable=False)
+    http_method = Column(String, nullable=False, default="POST")
+    endpoint_url = Column(String, nullable=False)
+    destination_host = Column(String, nullable=False)
+    # Non-secret headers; credentials are resolved at delivery time
+    custom_headers = Column(JSON, nullable=False, default=dict)
+    credential_uuid = Column(String, nullable=True)
+    payload = Column(JSON, nullable=True)
+    idempotency_key = Column(String, nullable=False, unique=True)
+    # Deliveries sharing a batch key may be sent together as one request. A
+    # batch's key is replaced by one of its own when it is first sent.
+    batch_key = Column(String, nullable=True)
+    batch_max_size = Column(Integer, nullable=True)
+    status = Column(
+        Enum(
+            "pending",
+            "delivering",
+            "delivered",
+            "failed",
+            name="webhook_delivery_status",
+        ),
+        nullable=False,
+        default="pending",
+    )
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=1)
+    retry_base_seconds = Column(Float, nullable=False, default=30)
+    next_attempt_at = Column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+    last_status_code = Column(Integer, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
+    delivered_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index(
+            "idx_webhook_deliveries_due",
+            "next_attempt_at",
+            postgresql_where=text("status IN ('pending', 'delivering')"),
+        ),
+        Index("idx_webhook_deliveries_created", "created_at"),
+        # Claims pull the pending siblings of a batch by batch key
+        Index(
+            "idx_webhook_deliveries_batch",
+            "batch_key",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+
 class QueuedRunModel(Base):
     __tablename__ = "queued_runs"
 
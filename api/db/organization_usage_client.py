@@ -1,9 +1,10 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from typing import Optional
 from zoneinfo import ZoneInfo
 
 from dateutil.relativedelta import relativedelta
-from sqlalchemy import Date, and_, cast, func, select
+from sqlalchemy import Date, and_, cast, func, select, text
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import joinedload
 
@@ -12,11 +13,14 @@ from api.db.filters import apply_workflow_run_filters
 from api.db.models import (
     OrganizationModel,
     OrganizationUsageCycleModel,
+    OrganizationUsageEventModel,
     UserConfigurationModel,
     UserModel,
     WorkflowModel,
     WorkflowRunModel,
+    WorkflowRunRollupModel,
 )
+from api.db.rollups import split_by_rollup_coverage
 from api.schemas.user_configuration import UserConfiguration
 
 
@@ -100,6 +104,34 @@ class OrganizationUsageClient(BaseDBClient):
         )
         return cycle_result.scalar_one()
 
+    async def record_usage_event(
+        self,
+        organization_id: int,
+        cycle_id: int,
+        kind: str,
+        dograh_tokens: float = 0,
+        duration_seconds: float = 0,
+        amount_usd: Optional[float] = None,
+    ) -> None:
+        """Append a usage delta to the ledger of a cycle.
+
+        The cycle row itself is not touched (or locked); ``fold_usage_events``
+        adds the delta to the cycle totals later.
+        """
+        async with self.async_session() as session:
+            await session.execute(
+                insert(OrganizationUsageEventModel).values(
+                    organization_id=organization_id,
+                    cycle_id=cycle_id,
+                    kind=kind,
+                    dograh_tokens=dograh_tokens,
+                    duration_seconds=int(round(duration_seconds)),
+                    amount_usd=amount_usd,
+                    created_at=datetime.now(timezone.utc),
+                )
+            )
+            await session.commit()
+
     async def check_and_reserve_quota(
         self, organization_id: int, estimated_tokens: int = 0
     ) -> bool:
@@ -107,7 +139,9 @@ class OrganizationUsageClient(BaseDBClient):
         Check if organization has sufficient quota and optionally reserve tokens.
         Returns True if quota is available, False otherwise.
 
-        This method is fully atomic and safe for concurrent access from multiple processes.
+        This method is fully atomic and safe for concurrent access from multiple processes:
+        the cycle row is locked while its usage (including unfolded ledger events) is
+        checked and the reservation appended to the ledger.
         """
         async with self.async_session() as session:
             # Get organization
@@ -125,28 +159,33 @@ class OrganizationUsageClient(BaseDBClient):
                 organization_id, session, commit=False
             )
 
-            # Atomic check and update with row-level lock
+            # Row-level lock so concurrent reservations are checked one at a time
             result = await session.execute(
                 select(OrganizationUsageCycleModel)
-                .where(
-                    and_(
-                        OrganizationUsageCycleModel.id == cycle.id,
-                        OrganizationUsageCycleModel.used_dograh_tokens
-                        + estimated_tokens
-                        <= OrganizationUsageCycleModel.quota_dograh_tokens,
-                    )
-                )
+                .where(OrganizationUsageCycleModel.id == cycle.id)
                 .with_for_update(skip_locked=False)
             )
-
-            cycle_locked = result.scalar_one_or_none()
-            if cycle_locked:
-                # Update the usage atomically
-                cycle_locked.used_dograh_tokens += estimated_tokens
+            cycle_locked = result.scalar_one()
+            pending_tokens, _, _ = await self._get_unfolded_usage(
+                session, cycle_locked.id
+            )
+            used = cycle_locked.used_dograh_tokens + pending_tokens
+            if used + estimated_tokens > cycle_locked.quota_dograh_tokens:
                 await session.commit()
-                return True
-
-            return False
+                return False
+
+            if estimated_tokens:
+                await session.execute(
+                    insert(OrganizationUsageEventModel).values(
+                        organization_id=organization_id,
+                        cycle_id=cycle_locked.id,
+                        kind="reservation",
+                        dograh_tokens=estimated_tokens,
+                        created_at=datetime.now(timezone.utc),
+                    )
+                )
+            await session.commit()
+            return True
 
     async def update_usage_after_run(
         self,
@@ -155,35 +194,101 @@ class OrganizationUsageClient(BaseDBClient):
         duration_seconds: int = 0,
         charge_usd: float = None,
     ) -> None:
-        """Update usage after a workflow run completes with actual token count and duration.
+        """Record usage after a workflow run completes with actual token count and duration.
 
-        This method is fully atomic and safe for concurrent access from multiple processes.
+        The usage is appended to the ledger instead of updating the cycle row under
+        a row lock, so concurrent completions of one organization do not serialize.
         """
         async with self.async_session() as session:
-            # Get or create current cycle within the same session/transaction
             cycle = await self._get_or_create_current_cycle_impl(
-                organization_id, session, commit=False
+                organization_id, session, commit=True
             )
+            cycle_id = cycle.id
+
+        await self.record_usage_event(
+            organization_id,
+            cycle_id,
+            "consumption",
+            dograh_tokens=actual_tokens,
+            duration_seconds=duration_seconds,
+            amount_usd=charge_usd,
+        )
 
-            # Acquire a row-level lock for atomic update
-            result = await session.execute(
-                select(OrganizationUsageCycleModel)
-                .where(OrganizationUsageCycleModel.id == cycle.id)
-                .with_for_update(skip_locked=False)
-            )
-            cycle_locked = result.scalar_one()
-
-            # Update usage atomically
-            cycle_locked.used_dograh_tokens += actual_tokens
-            cycle_locked.total_duration_seconds += int(round(duration_seconds))
+    async def fold_usage_events(self, limit: int = 10000) -> int:
+        """Add unfolded ledger events to their cycle totals.
 
-            # Update USD amount if provided
-            if charge_usd is not None:
-                if cycle_locked.used_amount_usd is None:
-                    cycle_locked.used_amount_usd = 0
-                cycle_locked.used_amount_usd += charge_usd
+        Each cycle row is updated once per call with the sum of its events, in
+        the same transaction that marks the events folded. Events locked by a
+        concurrent fold are skipped.
 
+        Returns:
+            Number of events folded.
+        """
+        async with self.async_session() as session:
+            result = await session.execute(
+                text(
+                    """
+                    WITH folded AS (
+                        UPDATE organization_usage_events
+                        SET folded_at = now()
+                        WHERE id IN (
+                            SELECT id FROM organization_usage_events
+                            WHERE folded_at IS NULL
+                            ORDER BY id
+                            LIMIT :limit
+                            FOR UPDATE SKIP LOCKED
+                        )
+                        RETURNING cycle_id, dograh_tokens, duration_seconds, amount_usd
+                    ),
+                    totals AS (
+                        SELECT
+                            cycle_id,
+                            SUM(dograh_tokens) AS dograh_tokens,
+                            SUM(duration_seconds) AS duration_seconds,
+                            SUM(amount_usd) AS amount_usd,
+                            COUNT(*) AS events
+                        FROM folded
+                        GROUP BY cycle_id
+                    )
+                    UPDATE organization_usage_cycles AS c
+                    SET
+                        used_dograh_tokens = c.used_dograh_tokens + totals.dograh_tokens,
+                        total_duration_seconds =
+                            c.total_duration_seconds + totals.duration_seconds,
+                        used_amount_usd = CASE
+                            WHEN totals.amount_usd IS NULL THEN c.used_amount_usd
+                            ELSE COALESCE(c.used_amount_usd, 0) + totals.amount_usd
+                        END,
+                        updated_at = now()
+                    FROM totals
+                    WHERE c.id = totals.cycle_id
+                    RETURNING totals.events
+                    """
+                ),
+                {"limit": limit},
+            )
+            folded = sum(result.scalars().all())
             await session.commit()
+            return folded
+
+    async def _get_unfolded_usage(
+        self, session, cycle_id: int
+    ) -> tuple[float, int, Optional[float]]:
+        """Sum of (tokens, duration seconds, USD) of a cycle's unfolded events."""
+        result = await session.execute(
+            select(
+                func.coalesce(func.sum(OrganizationUsageEventModel.dograh_tokens), 0),
+                func.coalesce(
+                    func.sum(OrganizationUsageEventModel.duration_seconds), 0
+                ),
+                func.sum(OrganizationUsageEventModel.amount_usd),
+            ).where(
+                OrganizationUsageEventModel.cycle_id == cycle_id,
+                OrganizationUsageEventModel.folded_at.is_(None),
+            )
+        )
+        tokens, duration, amount_usd = result.one()
+        return float(tokens), int(duration), amount_usd
 
     async def get_current_usage(self, organization_id: int) -> dict:
         """Get current period usage information."""
@@ -199,6 +304,15 @@ class OrganizationUsageClient(BaseDBClient):
                 organization_id, session, commit=False
             )
 
+            # Usage recorded since the last fold of the ledger
+            (
+                pending_tokens,
+                pending_duration,
+                pending_usd,
+            ) = await self._get_unfolded_usage(session, cycle.id)
+            used_dograh_tokens = cycle.used_dograh_tokens + pending_tokens
+            used_amount_usd = (cycle.used_amount_usd or 0) + (pending_usd or 0)
+
             # Calculate next refresh date
             if org.quota_type == "monthly":
                 next_refresh = cycle.period_end + relativedelta(days=1)
@@ -208,23 +322,22 @@ class OrganizationUsageClient(BaseDBClient):
             result = {
                 "period_start": cycle.period_start.isoformat(),
                 "period_end": cycle.period_end.isoformat(),
-                "used_dograh_tokens": cycle.used_dograh_tokens,
+                "used_dograh_tokens": used_dograh_tokens,
                 "quota_dograh_tokens": cycle.quota_dograh_tokens,
                 "percentage_used": (
-                    round(
-                        (cycle.used_dograh_tokens / cycle.quota_dograh_tokens) * 100, 2
-                    )
+                    round((used_dograh_tokens / cycle.quota_dograh_tokens) * 100, 2)
                     if cycle.quota_dograh_tokens > 0
                     else 0
                 ),
                 "next_refresh_date": next_refresh.date().isoformat(),
                 "quota_enabled": org.quota_enabled,
-                "total_duration_seconds": cycle.total_duration_seconds,
+                "total_duration_seconds": cycle.total_duration_seconds
+                + pending_duration,
             }
 
             # Add USD fields if organization has pricing
             if org.price_per_second_usd is not None:
-                result["used_amount_usd"] = cycle.used_amount_usd or 0
+                result["used_amount_usd"] = used_amount_usd
                 result["quota_amount_usd"] = cycle.quota_amount_usd
                 result["currency"] = "USD"
                 result["price_per_second_usd"] = org.price_per_second_usd
@@ -232,7 +345,7 @@ class OrganizationUsageClient(BaseDBClient):
                 # Calculate percentage based on USD if available
                 if cycle.quota_amount_usd and cycle.quota_amount_usd > 0:
                     result["percentage_used"] = round(
-                        ((cycle.used_amount_usd or 0) / cycle.quota_amount_usd) * 100, 2
+                        (used_amount_usd / cycle.quota_amount_usd) * 100, 2
                     )
 
             return result
@@ -383,31 +496,90 @@ class OrganizationUsageClient(BaseDBClient):
             except Exception:
                 # Fallback to UTC if timezone is invalid
                 user_timezone = "UTC"
-            # Query to get daily aggregates
-            # Use AT TIME ZONE to convert to user's timezone before grouping by date
-            date_expr = cast(
-                func.timezone(user_timezone, WorkflowRunModel.created_at), Date
+            # Daily aggregates come from the pre-aggregated rollups where they
+            # cover the window and from raw runs for the rest. AT TIME ZONE
+            # converts to the user's timezone before grouping by date. Runs are
+            # attributed to the organization selected by the workflow's owner,
+            # in both cases (rollups are joined to their workflow for that).
+            daily_totals: dict = {}
+
+            def _add(rows):
+                for row in rows:
+                    seconds, count = daily_totals.get(row.date, (0, 0))
+                    daily_totals[row.date] = (
+                        seconds + (row.total_seconds or 0),
+                        count + (row.call_count or 0),
+                    )
+
+            rollup_range, live_ranges = await split_by_rollup_coverage(
+                session, start_date, end_date + timedelta(microseconds=1)
             )
 
-            daily_usage = await session.execute(
-                select(
-                    date_expr.label("date"),
-                    func.sum(
-                        WorkflowRunModel.cost_info["call_duration_seconds"].as_float()
-                    ).label("total_seconds"),
-                    func.count(WorkflowRunModel.id).label("call_count"),
+            if rollup_range:
+                slot_date = cast(
+                    func.timezone(user_timezone, WorkflowRunRollupModel.slot_start),
+                    Date,
                 )
-                .join(WorkflowModel, WorkflowModel.id == WorkflowRunModel.workflow_id)
-                .join(UserModel, UserModel.id == WorkflowModel.user_id)
-                .where(
-                    UserModel.selected_organization_id == organization_id,
-                    WorkflowRunModel.created_at >= start_date,
-                    WorkflowRunModel.created_at <= end_date,
-                    WorkflowRunModel.is_completed == True,
+                _add(
+                    await session.execute(
+                        select(
+                            slot_date.label("date"),
+                            func.sum(
+                                WorkflowRunRollupModel.completed_duration_seconds
+                            ).label("total_seconds"),
+                            func.sum(WorkflowRunRollupModel.completed_count).label(
+                                "call_count"
+                            ),
+                        )
+                        .join(
+                            WorkflowModel,
+                            WorkflowModel.id == WorkflowRunRollupModel.workflow_id,
+                        )
+                        .join(UserModel, UserModel.id == WorkflowModel.user_id)
+                        .where(
+                            UserModel.selected_organization_id == organization_id,
+                            WorkflowRunRollupModel.slot_start >= rollup_range[0],
+                            WorkflowRunRollupModel.slot_start < rollup_range[1],
+                        )
+                        .group_by(slot_date)
+                    )
                 )
-                .group_by(date_expr)
-                .order_by(date_expr.desc())
+
+            date_expr = cast(
+                func.timezone(user_timezone, WorkflowRunModel.created_at), Date
             )
+            for range_start, range_stop in live_ranges:
+                _add(
+                    await session.execute(
+                        select(
+                            date_expr.label("date"),
+                            func.sum(
+                                WorkflowRunModel.cost_info[
+                                    "call_duration_seconds"
+                                ].as_float()
+                            ).label("total_seconds"),
+                            func.count(WorkflowRunModel.id).label("call_count"),
+                        )
+                        .join(
+                            WorkflowModel,
+                            WorkflowModel.id == WorkflowRunModel.workflow_id,
+                        )
+                        .join(UserModel, UserModel.id == WorkflowModel.user_id)
+                        .where(
+                            UserModel.selected_organization_id == organization_id,
+                            WorkflowRunModel.created_at >= range_start,
+                            WorkflowRunModel.created_at < range_stop,
+                            WorkflowRunModel.is_completed == True,
+                        )
+                        .group_by(date_expr)
+                    )
+                )
+
+            daily_usage = [
+                SimpleNamespace(date=day, total_seconds=seconds, call_count=count)
+                for day, (seconds, count) in sorted(daily_totals.items(), reverse=True)
+                if count
+            ]
 
             breakdown = []
             total_minutes = 0
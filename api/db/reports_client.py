@@ -1,140 +1,296 @@
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from sqlalchemy import String, and_, func, select
+from sqlalchemy import and_, delete, func, insert, literal, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from api.db.base_client import BaseDBClient
-from api.db.models import WorkflowModel, WorkflowRunModel
+from api.db.models import (
+    WorkflowModel,
+    WorkflowRunModel,
+    WorkflowRunRollupCoverageModel,
+    WorkflowRunRollupModel,
+)
+from api.db.rollups import (
+    ROLLUP_LOCK_KEY,
+    completed_duration_expr,
+    disposition_expr,
+    duration_bucket_expr,
+    rollup_slot_index,
+    slot_start_expr,
+    split_by_rollup_coverage,
+)
+
+# Rows fetched per round trip when streaming runs for export
+STREAM_BATCH_SIZE = 1000
 
 
 class ReportsClient(BaseDBClient):
-    async def get_workflow_runs_for_daily_report(
+    async def get_daily_report_counts(
         self,
         organization_id: int,
         start_utc: datetime,
         end_utc: datetime,
         workflow_id: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Tuple[str, str, int]]:
         """
-        Optimized method for daily reports - fetches only required JSON fields.
-        Uses PostgreSQL JSON operators to extract only needed fields from JSON columns.
+        Count runs by disposition and duration bucket for a report window.
+
+        Reads pre-aggregated rollups where available and aggregates raw runs
+        (in the database) for the rest of the window.
 
         Args:
             organization_id: The organization ID to filter by
             start_utc: Start datetime in UTC
-            end_utc: End datetime in UTC
+            end_utc: End datetime in UTC (inclusive)
             workflow_id: Optional workflow ID to filter by
 
         Returns:
-            List of dictionaries with report-specific fields
+            List of (disposition, duration_bucket, count) tuples
         """
+        counts: Dict[Tuple[str, str], int] = {}
         async with self.async_session() as session:
-            # Select only the specific JSON fields needed for daily reports
-            # Using PostgreSQL's JSON operators to extract specific fields
-            query = (
-                select(
-                    WorkflowRunModel.id,
-                    WorkflowRunModel.workflow_id,
-                    WorkflowRunModel.created_at,
-                    # Extract only specific fields from JSON columns
-                    # Use TRIM and REPLACE to remove any quotes from JSON values
-                    func.coalesce(
-                        func.replace(
-                            func.replace(
-                                func.cast(
-                                    WorkflowRunModel.gathered_context[
-                                        "mapped_call_disposition"
-                                    ],
-                                    String,
-                                ),
-                                '"',
-                                "",
-                            ),
-                            "'",
-                            "",
-                        ),
-                        "UNKNOWN",
-                    ).label("disposition"),
-                    func.coalesce(
-                        func.replace(
-                            func.replace(
-                                func.cast(
-                                    WorkflowRunModel.gathered_context[
-                                        "customer_phone_number"
-                                    ],
-                                    String,
-                                ),
-                                '"',
-                                "",
-                            ),
-                            "'",
-                            "",
-                        ),
-                        func.replace(
-                            func.replace(
-                                func.cast(
-                                    WorkflowRunModel.initial_context["phone_number"],
-                                    String,
-                                ),
-                                '"',
-                                "",
-                            ),
-                            "'",
-                            "",
-                        ),
-                        "",
-                    ).label("phone_number"),
-                    func.coalesce(
-                        func.replace(
-                            func.replace(
-                                func.cast(
-                                    WorkflowRunModel.usage_info[
-                                        "call_duration_seconds"
-                                    ],
-                                    String,
-                                ),
-                                '"',
-                                "",
-                            ),
-                            "'",
-                            "",
-                        ),
-                        "0",
-                    ).label("call_duration_seconds"),
-                    WorkflowModel.name.label("workflow_name"),
+            rollup_range, live_ranges = await split_by_rollup_coverage(
+                session, start_utc, end_utc + timedelta(microseconds=1)
+            )
+
+            if rollup_range:
+                query = (
+                    select(
+                        WorkflowRunRollupModel.disposition,
+                        WorkflowRunRollupModel.duration_bucket,
+                        func.sum(WorkflowRunRollupModel.run_count),
+                    )
+                    .where(
+                        WorkflowRunRollupModel.organization_id == organization_id,
+                        WorkflowRunRollupModel.slot_start >= rollup_range[0],
+                        WorkflowRunRollupModel.slot_start < rollup_range[1],
+                    )
+                    .group_by(
+                        WorkflowRunRollupModel.disposition,
+                        WorkflowRunRollupModel.duration_bucket,
+                    )
                 )
-                .select_from(WorkflowRunModel)
-                .join(WorkflowModel, WorkflowRunModel.workflow_id == WorkflowModel.id)
-                .where(
-                    and_(
+                if workflow_id is not None:
+                    query = query.where(
+                        WorkflowRunRollupModel.workflow_id == workflow_id
+                    )
+                for disposition, bucket, count in await session.execute(query):
+                    counts[(disposition, bucket)] = int(count)
+
+            disposition = disposition_expr()
+            bucket = duration_bucket_expr()
+            for range_start, range_stop in live_ranges:
+                query = (
+                    select(disposition, bucket, func.count(WorkflowRunModel.id))
+                    .join(
+                        WorkflowModel, WorkflowRunModel.workflow_id == WorkflowModel.id
+                    )
+                    .where(
                         WorkflowModel.organization_id == organization_id,
-                        WorkflowRunModel.created_at >= start_utc,
-                        WorkflowRunModel.created_at <= end_utc,
+                        WorkflowRunModel.created_at >= range_start,
+                        WorkflowRunModel.created_at < range_stop,
+                    )
+                    .group_by(disposition, bucket)
+                )
+                if workflow_id is not None:
+                    query = query.where(WorkflowRunModel.workflow_id == workflow_id)
+                for row_disposition, row_bucket, count in await session.execute(query):
+                    key = (row_disposition, row_bucket)
+                    counts[key] = counts.get(key, 0) + count
+
+        return [
+            (disposition, bucket, count)
+            for (disposition, bucket), count in counts.items()
+        ]
+
+    async def stream_workflow_runs_for_daily_report(
+        self,
+        organization_id: int,
+        start_utc: datetime,
+        end_utc: datetime,
+        workflow_id: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream runs of a report window with only the fields needed for export.
+
+        Rows are fetched from a server-side cursor in batches, so memory use
+        does not grow with the number of runs.
+
+        Args:
+            organization_id: The organization ID to filter by
+            start_utc: Start datetime in UTC
+            end_utc: End datetime in UTC
+            workflow_id: Optional workflow ID to filter by
+
+        Yields:
+            Dictionaries with id, workflow_id, workflow_name, created_at,
+            phone_number, disposition and call_duration_seconds
+        """
+        query = (
+            select(
+                WorkflowRunModel.id,
+                WorkflowRunModel.workflow_id,
+                WorkflowRunModel.created_at,
+                disposition_expr().label("disposition"),
+                func.coalesce(
+                    WorkflowRunModel.gathered_context.op("->>")(
+                        "customer_phone_number"
+                    ),
+                    WorkflowRunModel.initial_context.op("->>")("phone_number"),
+                    "",
+                ).label("phone_number"),
+                func.coalesce(
+                    WorkflowRunModel.usage_info.op("->>")("call_duration_seconds"),
+                    "0",
+                ).label("call_duration_seconds"),
+                WorkflowModel.name.label("workflow_name"),
+            )
+            .select_from(WorkflowRunModel)
+            .join(WorkflowModel, WorkflowRunModel.workflow_id == WorkflowModel.id)
+            .where(
+                and_(
+                    WorkflowModel.organization_id == organization_id,
+                    WorkflowRunModel.created_at >= start_utc,
+                    WorkflowRunModel.created_at <= end_utc,
+                )
+            )
+            .order_by(WorkflowRunModel.created_at, WorkflowRunModel.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+
+        if workflow_id is not None:
+            query = query.where(WorkflowRunModel.workflow_id == workflow_id)
+
+        async with self.async_session() as session:
+            result = await session.stream(query)
+            async for row in result:
+                yield row._asdict()
+
+    async def refresh_workflow_run_rollups(
+        self,
+        start_utc: datetime,
+        end_utc: datetime,
+        workflow_id: Optional[int] = None,
+    ) -> None:
+        """
+        Rebuild the rollups of the slots in ``[start_utc, end_utc)``.
+
+        Both bounds must be slot-aligned. Existing rollups of the range are
+        replaced in one transaction, so runs whose disposition or duration
+        changed since the last refresh move to their new bucket.
+
+        Args:
+            start_utc: First slot to rebuild
+            end_utc: End of the last slot to rebuild (exclusive)
+            workflow_id: Only rebuild this workflow's rollups
+        """
+        slot_start = slot_start_expr()
+        disposition = disposition_expr()
+        bucket = duration_bucket_expr()
+        aggregate = (
+            select(
+                WorkflowModel.organization_id,
+                WorkflowRunModel.workflow_id,
+                slot_start,
+                disposition,
+                bucket,
+                func.count(WorkflowRunModel.id),
+                func.count(WorkflowRunModel.id).filter(
+                    WorkflowRunModel.is_completed == True
+                ),
+                func.coalesce(func.sum(completed_duration_expr()), literal(0.0)),
+            )
+            .join(WorkflowModel, WorkflowRunModel.workflow_id == WorkflowModel.id)
+            .where(
+                WorkflowRunModel.created_at >= start_utc,
+                WorkflowRunModel.created_at < end_utc,
+            )
+            .group_by(
+                WorkflowModel.organization_id,
+                WorkflowRunModel.workflow_id,
+                slot_start,
+                disposition,
+                bucket,
+            )
+        )
+        stale = delete(WorkflowRunRollupModel).where(
+            WorkflowRunRollupModel.slot_start >= start_utc,
+            WorkflowRunRollupModel.slot_start < end_utc,
+        )
+        if workflow_id is not None:
+            aggregate = aggregate.where(WorkflowRunModel.workflow_id == workflow_id)
+            stale = stale.where(WorkflowRunRollupModel.workflow_id == workflow_id)
+
+        async with self.async_session() as session:
+            # Serialize overlapping rebuilds so they cannot both insert. A full
+            # refresh excludes everything, a workflow's refresh only the same
+            # workflow's slots (locked in order, so refreshes can't deadlock)
+            if workflow_id is None:
+                await session.execute(
+                    text("SELECT pg_advisory_xact_lock(:key)"),
+                    {"key": ROLLUP_LOCK_KEY},
+                )
+            else:
+                await session.execute(
+                    text("SELECT pg_advisory_xact_lock_shared(:key)"),
+                    {"key": ROLLUP_LOCK_KEY},
+                )
+                for slot in range(
+                    rollup_slot_index(start_utc), rollup_slot_index(end_utc)
+                ):
+                    await session.execute(
+                        text("SELECT pg_advisory_xact_lock(:workflow_id, :slot)"),
+                        {"workflow_id": workflow_id, "slot": slot},
                     )
+            await session.execute(stale)
+            await session.execute(
+                insert(WorkflowRunRollupModel).from_select(
+                    [
+                        "organization_id",
+                        "workflow_id",
+                        "slot_start",
+                        "disposition",
+                        "duration_bucket",
+                        "run_count",
+                        "completed_count",
+                        "completed_duration_seconds",
+                    ],
+                    aggregate,
                 )
             )
+            await session.commit()
 
-            if workflow_id is not None:
-                query = query.where(WorkflowRunModel.workflow_id == workflow_id)
+    async def get_rollup_coverage(self) -> Optional[Tuple[datetime, datetime]]:
+        """Get the (covered_from, covered_through) range of the rollups."""
+        async with self.async_session() as session:
+            coverage = (
+                await session.execute(select(WorkflowRunRollupCoverageModel).limit(1))
+            ).scalar_one_or_none()
+            if coverage is None:
+                return None
+            return coverage.covered_from, coverage.covered_through
 
-            result = await session.execute(query)
-            rows = result.all()
-
-            return [
-                {
-                    "id": row.id,
-                    "workflow_id": row.workflow_id,
-                    "workflow_name": row.workflow_name,
-                    "created_at": row.created_at,
-                    "gathered_context": {
-                        "mapped_call_disposition": row.disposition,
-                        "customer_phone_number": row.phone_number,  # Also provide it here for compatibility
+    async def set_rollup_coverage(
+        self, covered_from: datetime, covered_through: datetime
+    ) -> None:
+        """Record the time range fully covered by the rollups."""
+        async with self.async_session() as session:
+            await session.execute(
+                pg_insert(WorkflowRunRollupCoverageModel)
+                .values(
+                    id=1, covered_from=covered_from, covered_through=covered_through
+                )
+                .on_conflict_do_update(
+                    index_elements=["id"],
+                    set_={
+                        "covered_from": covered_from,
+                        "covered_through": covered_through,
+                        "updated_at": func.now(),
                     },
-                    "usage_info": {"call_duration_seconds": row.call_duration_seconds},
-                    "initial_context": {"phone_number": row.phone_number},
-                }
-                for row in rows
-            ]
+                )
+            )
+            await session.commit()
 
     async def get_workflows_for_organization(
         self, organization_id: int
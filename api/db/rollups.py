@@ -0,0 +1,137 @@
+"""Query utilities for pre-aggregated workflow run rollups.
+
+Runs are rolled up per workflow, 15-minute slot, disposition and duration
+bucket into ``workflow_run_rollups``. Reports read the rollups for the time
+range recorded in ``workflow_run_rollup_coverage`` and aggregate raw
+``workflow_runs`` (with the same expressions) for the rest of the window.
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Float, case, cast, func, select
+
+from api.db.models import WorkflowRunModel, WorkflowRunRollupCoverageModel
+
+ROLLUP_SLOT_SECONDS = 900
+ROLLUP_SLOT = timedelta(seconds=ROLLUP_SLOT_SECONDS)
+
+# Key of the advisory lock a full rollup refresh holds exclusively. A single
+# workflow's refresh holds it shared and locks (workflow_id, slot index) pairs,
+# so run completions only wait on each other for the same workflow and slot
+ROLLUP_LOCK_KEY = 730_001
+
+# Duration buckets as (name, range_start, range_end), in report order
+DURATION_BUCKETS = [
+    ("0-10", 0, 10),
+    ("10-30", 10, 30),
+    ("30-60", 30, 60),
+    ("60-120", 60, 120),
+    ("120-180", 120, 180),
+    (">180", 180, None),
+]
+# Bucket of runs whose duration is not a number
+NO_DURATION_BUCKET = "none"
+
+_NUMERIC_PATTERN = r"^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]+)?\s*$"
+
+
+def _as_utc(dt: datetime) -> datetime:
+    return dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt
+
+
+def floor_to_rollup_slot(dt: datetime) -> datetime:
+    """Round a datetime down to the start of its rollup slot (UTC)."""
+    ts = _as_utc(dt).timestamp()
+    return datetime.fromtimestamp(ts - ts % ROLLUP_SLOT_SECONDS, tz=UTC)
+
+
+def rollup_slot_index(dt: datetime) -> int:
+    """Number of the rollup slot a datetime falls in, counted from the epoch."""
+    return int(_as_utc(dt).timestamp()) // ROLLUP_SLOT_SECONDS
+
+
+def ceil_to_rollup_slot(dt: datetime) -> datetime:
+    """Round a datetime up to the start of the next rollup slot (UTC)."""
+    floored = floor_to_rollup_slot(dt)
+    return floored if floored == _as_utc(dt) else floored + ROLLUP_SLOT
+
+
+def slot_start_expr():
+    """Start of the rollup slot a run falls in."""
+    epoch = func.extract("epoch", WorkflowRunModel.created_at)
+    return func.to_timestamp(
+        func.floor(epoch / ROLLUP_SLOT_SECONDS) * ROLLUP_SLOT_SECONDS
+    )
+
+
+def disposition_expr():
+    """Mapped call disposition of a run, ``UNKNOWN`` when missing."""
+    return func.coalesce(
+        WorkflowRunModel.gathered_context.op("->>")("mapped_call_disposition"),
+        "UNKNOWN",
+    )
+
+
+def duration_bucket_expr():
+    """Report duration bucket of a run, from ``usage_info.call_duration_seconds``.
+
+    A missing duration counts as 0 seconds; non-numeric values fall into
+    ``NO_DURATION_BUCKET``.
+    """
+    duration_text = func.coalesce(
+        WorkflowRunModel.usage_info.op("->>")("call_duration_seconds"), "0"
+    )
+    duration = case(
+        (duration_text.op("~")(_NUMERIC_PATTERN), cast(duration_text, Float)),
+        else_=None,
+    )
+    whens = [(duration.is_(None), NO_DURATION_BUCKET)]
+    whens += [
+        (duration < range_end, name)
+        for name, _, range_end in DURATION_BUCKETS
+        if range_end is not None
+    ]
+    return case(*whens, else_=DURATION_BUCKETS[-1][0])
+
+
+def completed_duration_expr():
+    """Billed call duration (``cost_info``) of a completed run, else 0."""
+    return case(
+        (
+            WorkflowRunModel.is_completed == True,
+            cast(WorkflowRunModel.cost_info.op("->>")("call_duration_seconds"), Float),
+        ),
+        else_=0.0,
+    )
+
+
+async def split_by_rollup_coverage(
+    session, start: datetime, stop: datetime
+) -> Tuple[Optional[Tuple[datetime, datetime]], List[Tuple[datetime, datetime]]]:
+    """
+    Split the half-open window ``[start, stop)`` by rollup coverage.
+
+    Returns:
+        Tuple of (rollup_range, live_ranges). ``rollup_range`` is the
+        slot-aligned part that can be read from rollups (or None) and
+        ``live_ranges`` are the parts that must be aggregated from raw runs.
+    """
+    start, stop = _as_utc(start), _as_utc(stop)
+    coverage = (
+        await session.execute(select(WorkflowRunRollupCoverageModel).limit(1))
+    ).scalar_one_or_none()
+    if coverage is None:
+        return None, [(start, stop)]
+
+    rollup_from = max(ceil_to_rollup_slot(start), coverage.covered_from)
+    rollup_to = min(floor_to_rollup_slot(stop), coverage.covered_through)
+    if rollup_from >= rollup_to:
+        return None, [(start, stop)]
+
+    live_ranges = []
+    if start < rollup_from:
+        live_ranges.append((start, rollup_from))
+    if rollup_to < stop:
+        live_ranges.append((rollup_to, stop))
+    return (rollup_from, rollup_to), live_ranges
@@ -1,14 +1,14 @@
 """Database client for managing tools."""
 
 from datetime import UTC, datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from loguru import logger
-from sqlalchemy import select, update
+from sqlalchemy import and_, select, update
 from sqlalchemy.orm import selectinload
 
 from api.db.base_client import BaseDBClient
-from api.db.models import ToolModel
+from api.db.models import ExternalCredentialModel, ToolModel
 from api.enums import ToolCategory, ToolStatus
 
 
@@ -317,3 +317,46 @@ class ToolClient(BaseDBClient):
 
             result = await session.execute(query)
             return list(result.scalars().all())
+
+    async def get_tools_with_credentials(
+        self,
+        tool_uuids: List[str],
+        organization_id: int,
+    ) -> List[Tuple[ToolModel, Optional[ExternalCredentialModel]]]:
+        """Get multiple tools with the credentials they reference, in one query.
+
+        The credential of a tool is the active credential of the organization
+        whose UUID is the tool's ``config.credential_uuid``.
+
+        Args:
+            tool_uuids: List of tool UUIDs to fetch
+            organization_id: ID of the organization (for authorization)
+
+        Returns:
+            List of (ToolModel, credential) pairs (only active tools); the
+            credential is None if the tool has none or it wasn't found
+        """
+        if not tool_uuids:
+            return []
+
+        credential_uuid = ToolModel.definition["config"]["credential_uuid"].as_string()
+        async with self.async_session() as session:
+            query = (
+                select(ToolModel, ExternalCredentialModel)
+                .outerjoin(
+                    ExternalCredentialModel,
+                    and_(
+                        ExternalCredentialModel.credential_uuid == credential_uuid,
+                        ExternalCredentialModel.organization_id == organization_id,
+                        ExternalCredentialModel.is_active.is_(True),
+                    ),
+                )
+                .where(
+                    ToolModel.tool_uuid.in_(tool_uuids),
+                    ToolModel.organization_id == organization_id,
+                    ToolModel.status == ToolStatus.ACTIVE.value,
+                )
+            )
+
+            result = await session.execute(query)
+            return [(tool, credential) for tool, credential in result.all()]
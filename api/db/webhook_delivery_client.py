@@ -0,0 +1,221 @@
+"""Database client for the post-call webhook delivery outbox."""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from api.db.base_client import BaseDBClient
+from api.db.models import WebhookDeliveryModel
+
+_DUE_STATUSES = ("pending", "delivering")
+
+
+class WebhookDeliveryClient(BaseDBClient):
+    """Client for queueing, claiming and completing webhook deliveries."""
+
+    async def enqueue_webhook_deliveries(
+        self, deliveries: List[Dict[str, Any]]
+    ) -> List[int]:
+        """Insert deliveries into the outbox.
+
+        Rows whose idempotency key already exists (e.g. when the post-run task
+        is retried) are skipped.
+
+        Returns:
+            IDs of the newly inserted rows.
+        """
+        if not deliveries:
+            return []
+        async with self.async_session() as session:
+            result = await session.execute(
+                insert(WebhookDeliveryModel)
+                .values(deliveries)
+                .on_conflict_do_nothing(index_elements=["idempotency_key"])
+                .returning(WebhookDeliveryModel.id)
+            )
+            await session.commit()
+            return list(result.scalars().all())
+
+    async def claim_due_webhook_deliveries(
+        self,
+        limit: int,
+        lease_seconds: float,
+        ids: Optional[Sequence[int]] = None,
+    ) -> List[Any]:
+        """Claim due deliveries for sending.
+
+        Claimed rows are marked ``delivering`` and leased until
+        ``now + lease_seconds``; a row whose lease expires (its worker died
+        mid-send) becomes due again. Rows locked by another worker are
+        skipped. Pending rows sharing a batch key with a claimed row are
+        claimed with it so the batch is sent as one request.
+
+        Args:
+            limit: Maximum number of due rows to claim.
+            lease_seconds: How long the claim holds.
+            ids: Only consider these rows.
+
+        Returns:
+            The claimed rows.
+        """
+        now = datetime.now(UTC)
+        lease_until = now + timedelta(seconds=lease_seconds)
+        due = (
+            select(WebhookDeliveryModel.id)
+            .where(
+                WebhookDeliveryModel.status.in_(_DUE_STATUSES),
+                WebhookDeliveryModel.next_attempt_at <= now,
+            )
+            .order_by(WebhookDeliveryModel.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        if ids is not None:
+            due = due.where(WebhookDeliveryModel.id.in_(ids))
+
+        claim = update(WebhookDeliveryModel).values(
+            status="delivering", next_attempt_at=lease_until
+        )
+        columns = WebhookDeliveryModel.__table__.c
+
+        async with self.async_session() as session:
+            result = await session.execute(
+                claim.where(WebhookDeliveryModel.id.in_(due.scalar_subquery()))
+                .returning(*columns)
+                .execution_options(synchronize_session=False)
+            )
+            rows = list(result.all())
+
+            batch_keys = {row.batch_key for row in rows if row.batch_key}
+            if batch_keys:
+                # Rows still in their batching window join the batch early;
+                # rows waiting to be retried keep their backoff.
+                siblings = (
+                    select(WebhookDeliveryModel.id)
+                    .where(
+                        WebhookDeliveryModel.batch_key.in_(batch_keys),
+                        WebhookDeliveryModel.status == "pending",
+                        or_(
+                            WebhookDeliveryModel.attempts == 0,
+                            WebhookDeliveryModel.next_attempt_at <= now,
+                        ),
+                    )
+                    .order_by(WebhookDeliveryModel.id)
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+                result = await session.execute(
+                    claim.where(WebhookDeliveryModel.id.in_(siblings.scalar_subquery()))
+                    .returning(*columns)
+                    .execution_options(synchronize_session=False)
+                )
+                rows.extend(result.all())
+
+            await session.commit()
+            return rows
+
+    async def pin_webhook_batch(self, ids: Sequence[int], batch_key: str) -> None:
+        """Give the deliveries of a batch a batch key of their own.
+
+        Args:
+            ids: The deliveries sent together.
+            batch_key: The batch key of these deliveries only.
+        """
+        async with self.async_session() as session:
+            await session.execute(
+                update(WebhookDeliveryModel)
+                .where(WebhookDeliveryModel.id.in_(ids))
+                .values(batch_key=batch_key)
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+
+    async def record_webhook_delivery_attempt(
+        self,
+        ids: Sequence[int],
+        status: str,
+        status_code: Optional[int] = None,
+        error: Optional[str] = None,
+        next_attempt_at: Optional[datetime] = None,
+        count_attempt: bool = True,
+    ) -> None:
+        """Record the outcome of sending deliveries.
+
+        Args:
+            ids: Deliveries sent together (one row, or one batch).
+            status: ``delivered``, ``failed`` or ``pending`` (retry later).
+            status_code: HTTP status of the response, if any.
+            error: Error description for failed attempts.
+            next_attempt_at: When a ``pending`` delivery becomes due again.
+            count_attempt: False when the request was never sent (e.g. the
+                destination's rate limit was reached).
+        """
+        now = datetime.now(UTC)
+        values: Dict[str, Any] = {
+            "status": status,
+            "last_status_code": status_code,
+            "last_error": error,
+            "next_attempt_at": next_attempt_at or now,
+        }
+        if count_attempt:
+            values["attempts"] = WebhookDeliveryModel.attempts + 1
+        if status == "delivered":
+            values["delivered_at"] = now
+
+        async with self.async_session() as session:
+            await session.execute(
+                update(WebhookDeliveryModel)
+                .where(WebhookDeliveryModel.id.in_(ids))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+
+    async def get_webhook_delivery_stats(self, since: datetime) -> Dict[str, Any]:
+        """Delivery counts, latency and failing destinations since ``since``.
+
+        Latency is measured from enqueue (run completion) to delivery, so it
+        includes retries and batching windows.
+        """
+        model = WebhookDeliveryModel
+        latency = func.extract("epoch", model.delivered_at - model.created_at)
+
+        async with self.async_session() as session:
+            status_rows = await session.execute(
+                select(model.status, func.count())
+                .where(model.created_at >= since)
+                .group_by(model.status)
+            )
+            delivered = await session.execute(
+                select(
+                    func.percentile_cont(0.5).within_group(latency),
+                    func.percentile_cont(0.95).within_group(latency),
+                    func.avg(model.attempts),
+                ).where(model.created_at >= since, model.status == "delivered")
+            )
+            p50, p95, mean_attempts = delivered.one()
+            failing_rows = await session.execute(
+                select(model.destination_host, func.count())
+                .where(model.created_at >= since, model.status == "failed")
+                .group_by(model.destination_host)
+                .order_by(func.count().desc())
+                .limit(10)
+            )
+
+        return {
+            "by_status": {status: count for status, count in status_rows.all()},
+            "delivery_latency_p50_seconds": (
+                round(float(p50), 3) if p50 is not None else None
+            ),
+            "delivery_latency_p95_seconds": (
+                round(float(p95), 3) if p95 is not None else None
+            ),
+            "mean_attempts": (
+                round(float(mean_attempts), 2) if mean_attempts is not None else None
+            ),
+            "top_failing_hosts": [
+                {"host": host, "failed": count} for host, count in failing_rows.all()
+            ],
+        }
@@ -1,13 +1,22 @@
+import json
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import func, text
 from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload, selectinload
 
 from api.db.base_client import BaseDBClient
-from api.db.filters import apply_workflow_run_filters, get_workflow_run_order_clause
+from api.db.filters import (
+    apply_workflow_run_filters,
+    decode_workflow_run_cursor,
+    encode_workflow_run_cursor,
+    get_workflow_run_keyset_condition,
+    get_workflow_run_order_clause,
+    get_workflow_run_sort_column,
+)
 from api.db.models import (
     OrganizationModel,
     UserModel,
@@ -18,6 +27,57 @@ from api.db.models import (
 from api.enums import CallType, StorageBackend
 from api.schemas.workflow import WorkflowRunResponseSchema
 
+# Columns loaded for run listings. Heavy JSON columns (logs, usage_info,
+# annotations) are left out.
+_WORKFLOW_RUN_LIST_COLUMNS = (
+    WorkflowRunModel.id,
+    WorkflowRunModel.workflow_id,
+    WorkflowRunModel.name,
+    WorkflowRunModel.mode,
+    WorkflowRunModel.created_at,
+    WorkflowRunModel.is_completed,
+    WorkflowRunModel.recording_url,
+    WorkflowRunModel.transcript_url,
+    WorkflowRunModel.cost_info,
+    WorkflowRunModel.definition_id,
+    WorkflowRunModel.initial_context,
+    WorkflowRunModel.gathered_context,
+    WorkflowRunModel.call_type,
+)
+
+# Seconds a run count is reused across page requests
+RUN_COUNT_CACHE_TTL_SECONDS = 30.0
+MAX_CACHED_RUN_COUNTS = 1024
+
+# count key -> (expires_at, workflow_id, count)
+_run_count_cache: Dict[str, Tuple[float, int, int]] = {}
+
+
+def _get_cached_run_count(count_key: str) -> Optional[int]:
+    cached = _run_count_cache.get(count_key)
+    if cached is None or cached[0] <= time.monotonic():
+        return None
+    return cached[2]
+
+
+def _store_run_count(count_key: str, workflow_id: int, count: int) -> None:
+    if len(_run_count_cache) >= MAX_CACHED_RUN_COUNTS:
+        now = time.monotonic()
+        for key in [k for k, v in _run_count_cache.items() if v[0] <= now]:
+            del _run_count_cache[key]
+        if len(_run_count_cache) >= MAX_CACHED_RUN_COUNTS:
+            _run_count_cache.pop(next(iter(_run_count_cache)))
+    _run_count_cache[count_key] = (
+        time.monotonic() + RUN_COUNT_CACHE_TTL_SECONDS,
+        workflow_id,
+        count,
+    )
+
+
+def _invalidate_run_counts(workflow_id: int) -> None:
+    for key in [k for k, v in _run_count_cache.items() if v[1] == workflow_id]:
+        del _run_count_cache[key]
+
 
 class WorkflowRunClient(BaseDBClient):
     async def create_workflow_run(
@@ -93,6 +153,7 @@ class WorkflowRunClient(BaseDBClient):
                 await session.rollback()
                 raise e
             await session.refresh(new_run)
+        _invalidate_run_counts(workflow_id)
         return new_run
 
     async def get_all_workflow_runs(self) -> list[WorkflowRunModel]:
@@ -236,11 +297,27 @@ class WorkflowRunClient(BaseDBClient):
         filters: Optional[List[Dict[str, Any]]] = None,
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = "desc",
-    ) -> tuple[list[WorkflowRunResponseSchema], int]:
+        cursor: Optional[str] = None,
+    ) -> tuple[list[WorkflowRunResponseSchema], int, Optional[str]]:
+        """
+        Get a page of runs for a workflow.
+
+        Pages can be addressed by ``offset`` or, preferably for deep pages, by
+        the ``cursor`` returned with the previous page (keyset pagination). Only
+        the listed columns are loaded, and the total count is cached briefly
+        per workflow and filter set.
+
+        Returns:
+            Tuple of (runs, total_count, next_cursor). ``next_cursor`` is None
+            on the last page.
+
+        Raises:
+            ValueError: If ``cursor`` is malformed or issued for another sort.
+        """
         async with self.async_session() as session:
             # Build base query
             base_query = (
-                select(WorkflowRunModel)
+                select(*_WORKFLOW_RUN_LIST_COLUMNS)
                 .join(WorkflowModel, WorkflowRunModel.workflow_id == WorkflowModel.id)
                 .where(WorkflowRunModel.workflow_id == workflow_id)
             )
@@ -257,16 +334,51 @@ class WorkflowRunClient(BaseDBClient):
             # Apply filters
             base_query = apply_workflow_run_filters(base_query, filters)
 
-            # Count total with filters
-            count_query = base_query.with_only_columns(func.count(WorkflowRunModel.id))
-            count_result = await session.execute(count_query)
-            total_count = count_result.scalar()
+            # Count total with filters, reusing a recent count when available
+            count_key = json.dumps(
+                [workflow_id, organization_id, user_id, filters], default=str
+            )
+            total_count = _get_cached_run_count(count_key)
+            if total_count is None:
+                count_query = base_query.with_only_columns(
+                    func.count(WorkflowRunModel.id)
+                )
+                count_result = await session.execute(count_query)
+                total_count = count_result.scalar()
+                _store_run_count(count_key, workflow_id, total_count)
 
-            # Get paginated results with filters and sorting
+            # Get paginated results with filters and sorting. The sort value is
+            # selected alongside the row to build the next cursor.
+            sort_column = get_workflow_run_sort_column(sort_by)
             order_clause = get_workflow_run_order_clause(sort_by, sort_order)
+            id_order = (
+                WorkflowRunModel.id.asc()
+                if sort_order == "asc"
+                else WorkflowRunModel.id.desc()
+            )
+            page_query = base_query.add_columns(sort_column.label("sort_value"))
+            if cursor:
+                sort_value, last_id = decode_workflow_run_cursor(cursor, sort_by)
+                page_query = page_query.where(
+                    get_workflow_run_keyset_condition(
+                        sort_by, sort_order, sort_value, last_id
+                    )
+                )
+            else:
+                page_query = page_query.offset(offset)
+
+            # Fetch one extra row to know whether another page exists
             result = await session.execute(
-                base_query.order_by(order_clause).limit(limit).offset(offset)
+                page_query.order_by(order_clause, id_order).limit(limit + 1)
             )
+            rows = result.all()
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_cursor = encode_workflow_run_cursor(
+                    sort_by, rows[-1].sort_value, rows[-1].id
+                )
+
             runs = [
                 WorkflowRunResponseSchema.model_validate(
                     {
@@ -304,9 +416,9 @@ class WorkflowRunClient(BaseDBClient):
                         "call_type": run.call_type,
                     }
                 )
-                for run in result.scalars().all()
+                for run in rows
             ]
-            return runs, total_count
+            return runs, total_count, next_cursor
 
     async def update_workflow_run(
         self,
@@ -365,6 +477,27 @@ class WorkflowRunClient(BaseDBClient):
             await session.refresh(run)
         return run
 
+    async def set_workflow_run_log(self, run_id: int, key: str, raw_json: str) -> None:
+        """Set one key of the ``logs`` column to an already-serialized JSON value.
+
+        The merge happens in Postgres, so large logs (e.g. the real-time
+        feedback events of a long call) are neither loaded nor re-serialized
+        here, and the row is not locked for a read-modify-write.
+        """
+        async with self.async_session() as session:
+            result = await session.execute(
+                text(
+                    "UPDATE workflow_runs SET logs = ("
+                    "COALESCE(logs::jsonb, '{}'::jsonb) "
+                    "|| jsonb_build_object(CAST(:key AS text), CAST(:value AS jsonb))"
+                    ")::json WHERE id = :run_id"
+                ),
+                {"run_id": run_id, "key": key, "value": raw_json},
+            )
+            if result.rowcount == 0:
+                raise ValueError(f"Workflow run with ID {run_id} not found")
+            await session.commit()
+
     async def update_admin_comment(
         self, run_id: int, admin_comment: str
     ) -> WorkflowRunModel:
@@ -99,6 +99,7 @@ class RedisChannel(Enum):
     """Redis pub/sub channel names"""
 
     CAMPAIGN_EVENTS = "campaign_events"
+    AUTH_PRINCIPAL_INVALIDATIONS = "auth_principal_invalidations"
 
 
 class TriggerState(Enum):
@@ -1,7 +1,9 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from api.db.models import UserModel
@@ -94,7 +96,17 @@ async def get_workflow_options(
     return [WorkflowOption(**w) for w in workflows]
 
 
-@router.get("/daily/runs", response_model=List[WorkflowRunDetail])
+@router.get(
+    "/daily/runs",
+    response_class=StreamingResponse,
+    # The body is streamed, so the schema is only declared for the docs
+    responses={
+        200: {
+            "model": List[WorkflowRunDetail],
+            "description": "JSON array of the day's runs, streamed",
+        }
+    },
+)
 async def get_daily_runs_detail(
     date: str = Query(..., description="Date in YYYY-MM-DD format"),
     timezone: str = Query(..., description="IANA timezone (e.g., 'America/New_York')"),
@@ -102,10 +114,12 @@ async def get_daily_runs_detail(
         None, description="Optional workflow ID to filter by"
     ),
     user: UserModel = Depends(get_user),
-) -> List[WorkflowRunDetail]:
+) -> StreamingResponse:
     """
     Get detailed workflow runs for the specified date.
-    Used for CSV export functionality.
+    Used for CSV export functionality. The response is a JSON array of
+    WorkflowRunDetail, streamed as rows are read from the database rather
+    than validated against a response model.
     """
     if not user.selected_organization_id:
         raise HTTPException(status_code=400, detail="No organization selected")
@@ -118,15 +132,28 @@ async def get_daily_runs_detail(
             status_code=400, detail="Invalid date format. Use YYYY-MM-DD"
         )
 
+    try:
+        ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid timezone")
+
     report_service = DailyReportService()
+    runs = report_service.stream_daily_runs_detail(
+        organization_id=user.selected_organization_id,
+        date=date,
+        timezone=timezone,
+        workflow_id=workflow_id,
+    )
 
-    try:
-        runs = await report_service.get_daily_runs_detail(
-            organization_id=user.selected_organization_id,
-            date=date,
-            timezone=timezone,
-            workflow_id=workflow_id,
-        )
-        return [WorkflowRunDetail(**run) for run in runs]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    async def _json_array():
+        # Serialize run by run so the export never holds the whole day in memory
+        yield "["
+        first = True
+        async for run in runs:
+            if not first:
+                yield ","
+            first = False
+            yield WorkflowRunDetail(**run).model_dump_json()
+        yield "]"
+
+    return StreamingResponse(_json_array(), media_type="application/json")
@@ -1,5 +1,5 @@
 import json
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -8,6 +8,7 @@ from pydantic import BaseModel
 from api.db import db_client
 from api.db.models import UserModel
 from api.services.auth.depends import get_superuser
+from api.services.auth.principal_cache import get_principal_cache
 from api.services.auth.stack_auth import stackauth
 
 router = APIRouter(prefix="/superuser", tags=["superuser"])
@@ -153,6 +154,24 @@ async def get_workflow_runs(
     )
 
 
+@router.get("/auth-cache-stats")
+async def get_auth_cache_stats(
+    user: UserModel = Depends(get_superuser),
+) -> dict:
+    """Hit-rate counters of this worker's authenticated principal cache."""
+    return get_principal_cache().stats()
+
+
+@router.get("/webhook-delivery-stats")
+async def get_webhook_delivery_stats(
+    hours: int = Query(24, ge=1, le=24 * 30),
+    user: UserModel = Depends(get_superuser),
+) -> dict:
+    """Post-call webhook delivery counts, latency and failing destinations."""
+    since = datetime.now(UTC) - timedelta(hours=hours)
+    return await db_client.get_webhook_delivery_stats(since)
+
+
 # ------------------ Admin Comment ------------------
 
 
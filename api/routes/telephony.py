@@ -33,6 +33,7 @@ from api.services.auth.depends import get_user
 from api.services.campaign.campaign_call_dispatcher import campaign_call_dispatcher
 from api.services.campaign.campaign_event_publisher import get_campaign_event_publisher
 from api.services.campaign.circuit_breaker import circuit_breaker
+from api.services.media_workers.routing import media_stream_endpoint
 from api.services.quota_service import check_dograh_quota, check_dograh_quota_by_user_id
 from api.services.telephony.call_transfer_manager import get_call_transfer_manager
 from api.services.telephony.factory import (
@@ -1433,7 +1434,10 @@ async def handle_inbound_telephony(
 
         # Generate response URLs
         _, wss_backend_endpoint = await get_backend_endpoints()
-        websocket_url = f"{wss_backend_endpoint}/api/v1/telephony/ws/{workflow_id}/{workflow_context['user_id']}/{workflow_run_id}"
+        stream_endpoint = await media_stream_endpoint(
+            workflow_run_id, wss_backend_endpoint
+        )
+        websocket_url = f"{stream_endpoint}/api/v1/telephony/ws/{workflow_id}/{workflow_context['user_id']}/{workflow_run_id}"
         response = await provider_class.generate_inbound_response(
             websocket_url, workflow_run_id
         )
@@ -44,6 +44,12 @@ class HttpApiConfig(BaseModel):
     timeout_ms: Optional[int] = Field(
         default=5000, description="Request timeout in milliseconds"
     )
+    cache_ttl_seconds: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=3600,
+        description="Cache successful GET responses for this many seconds (opt-in)",
+    )
 
 
 class EndCallConfig(BaseModel):
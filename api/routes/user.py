@@ -11,6 +11,7 @@ from api.db.models import (
     UserModel,
 )
 from api.services.auth.depends import get_user
+from api.services.auth.principal_cache import api_key_cache_key, get_principal_cache
 from api.services.configuration.check_validity import (
     APIKeyStatusResponse,
     UserConfigurationValidator,
@@ -289,13 +290,16 @@ async def archive_api_key(
     api_keys = await db_client.get_api_keys_by_organization(
         user.selected_organization_id, include_archived=True
     )
-    if not any(key.id == api_key_id for key in api_keys):
+    api_key = next((key for key in api_keys if key.id == api_key_id), None)
+    if api_key is None:
         raise HTTPException(status_code=404, detail="API key not found")
 
     success = await db_client.archive_api_key(api_key_id)
     if not success:
         raise HTTPException(status_code=500, detail="Failed to archive API key")
 
+    await get_principal_cache().invalidate(api_key_cache_key(api_key.key_hash))
+
     return {"success": True, "message": "API key archived successfully"}
 
 
@@ -312,13 +316,17 @@ async def reactivate_api_key(
     api_keys = await db_client.get_api_keys_by_organization(
         user.selected_organization_id, include_archived=True
     )
-    if not any(key.id == api_key_id for key in api_keys):
+    api_key = next((key for key in api_keys if key.id == api_key_id), None)
+    if api_key is None:
         raise HTTPException(status_code=404, detail="API key not found")
 
     success = await db_client.reactivate_api_key(api_key_id)
     if not success:
         raise HTTPException(status_code=500, detail="Failed to reactivate API key")
 
+    # Drop the cached rejection so the key works again immediately
+    await get_principal_cache().invalidate(api_key_cache_key(api_key.key_hash))
+
     return {"success": True, "message": "API key reactivated successfully"}
 
 
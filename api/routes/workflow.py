@@ -16,6 +16,7 @@ from api.enums import CallType
 from api.schemas.workflow import WorkflowRunResponseSchema
 from api.services.auth.depends import get_user
 from api.services.mps_service_key_client import mps_service_key_client
+from api.services.pipecat.run_log import EVENTS_LOG, is_stream_id, read_run_log
 from api.services.workflow.dto import ReactFlowDTO
 from api.services.workflow.errors import ItemKind, WorkflowError
 from api.services.workflow.workflow import WorkflowGraph
@@ -651,6 +652,41 @@ async def get_workflow_run(
     }
 
 
+class WorkflowRunLiveLogResponse(BaseModel):
+    entries: List[dict]
+    next: str
+
+
+@router.get("/{workflow_id}/runs/{run_id}/live-log")
+async def get_workflow_run_live_log(
+    workflow_id: int,
+    run_id: int,
+    stream: Literal["transcript", "events"] = "transcript",
+    after: str = Query("0-0", description="Id of the last entry already read"),
+    limit: int = Query(100, ge=1, le=1000),
+    user: UserModel = Depends(get_user),
+) -> WorkflowRunLiveLogResponse:
+    """Tail the transcript or feedback events of a run while the call is live.
+
+    Poll with the returned ``next`` as ``after`` to get the newer entries.
+    """
+    if not is_stream_id(after):
+        raise HTTPException(status_code=400, detail="Invalid 'after' entry id")
+
+    run = await db_client.get_workflow_run(
+        run_id, organization_id=user.selected_organization_id
+    )
+    if not run or run.workflow_id != workflow_id:
+        raise HTTPException(status_code=404, detail="Workflow run not found")
+
+    entries, next_id = await read_run_log(run_id, stream, after=after, count=limit)
+    if stream == EVENTS_LOG:
+        entries = [
+            {"id": item["id"], "entry": json.loads(item["entry"])} for item in entries
+        ]
+    return WorkflowRunLiveLogResponse(entries=entries, next=next_id)
+
+
 class WorkflowRunsResponse(BaseModel):
     runs: List[WorkflowRunResponseSchema]
     total_count: int
@@ -658,6 +694,7 @@ class WorkflowRunsResponse(BaseModel):
     limit: int
     total_pages: int
     applied_filters: Optional[List[dict]] = None
+    next_cursor: Optional[str] = None
 
 
 @router.get("/{workflow_id}/runs")
@@ -672,6 +709,9 @@ async def get_workflow_runs(
     sort_order: Optional[str] = Query(
         "desc", description="Sort order ('asc' or 'desc')"
     ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (overrides page)"
+    ),
     user: UserModel = Depends(get_user),
 ) -> WorkflowRunsResponse:
     """
@@ -679,6 +719,9 @@ async def get_workflow_runs(
 
     Filters should be provided as a JSON-encoded array of filter criteria.
     Example: [{"attribute": "dateRange", "value": {"from": "2024-01-01", "to": "2024-01-31"}}]
+
+    Pass the returned ``next_cursor`` back as ``cursor`` to fetch the next page
+    without the cost of a large OFFSET.
     """
     offset = (page - 1) * limit
 
@@ -705,15 +748,23 @@ async def get_workflow_runs(
                     status_code=403, detail=f"Invalid attribute '{attribute}'"
                 )
 
-    runs, total_count = await db_client.get_workflow_runs_by_workflow_id(
-        workflow_id,
-        organization_id=user.selected_organization_id,
-        limit=limit,
-        offset=offset,
-        filters=filter_criteria if filter_criteria else None,
-        sort_by=sort_by,
-        sort_order=sort_order,
-    )
+    try:
+        (
+            runs,
+            total_count,
+            next_cursor,
+        ) = await db_client.get_workflow_runs_by_workflow_id(
+            workflow_id,
+            organization_id=user.selected_organization_id,
+            limit=limit,
+            offset=offset,
+            filters=filter_criteria if filter_criteria else None,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     total_pages = (total_count + limit - 1) // limit
 
@@ -724,6 +775,7 @@ async def get_workflow_runs(
         limit=limit,
         total_pages=total_pages,
         applied_filters=filter_criteria if filter_criteria else None,
+        next_cursor=next_cursor,
     )
 
 
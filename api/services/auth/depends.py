@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Annotated, Optional
 
 import httpx
@@ -9,8 +10,15 @@ from api.constants import AUTH_PROVIDER, DOGRAH_MPS_SECRET_KEY, MPS_API_URL
 from api.db import db_client
 from api.db.models import UserModel
 from api.schemas.user_configuration import UserConfiguration
+from api.services.auth.principal_cache import (
+    api_key_cache_key,
+    get_principal_cache,
+    token_cache_key,
+    unverified_token_claims,
+)
 from api.services.auth.stack_auth import stackauth
 from api.services.configuration.registry import ServiceProviders
+from api.utils.api_key import hash_api_key
 from api.utils.auth import decode_jwt_token
 
 
@@ -22,14 +30,38 @@ async def get_user(
     # Check if API key is provided (takes precedence)
     # ------------------------------------------------------------------
     if x_api_key:
-        return await _handle_api_key_auth(x_api_key)
+        return await get_principal_cache().get_or_load(
+            api_key_cache_key(hash_api_key(x_api_key)),
+            partial(_handle_api_key_auth, x_api_key),
+        )
 
     # ------------------------------------------------------------------
     # Check if we're using local (email/password) auth
     # ------------------------------------------------------------------
     if AUTH_PROVIDER == "local":
-        return await _handle_oss_auth(authorization)
+        loader = partial(_handle_oss_auth, authorization)
+    else:
+        loader = partial(_handle_stack_auth, authorization)
+
+    token = authorization.removeprefix("Bearer ") if authorization else None
+    if not token:
+        return await loader()
+
+    # Resolved principals are cached per token (and selected team), so repeated
+    # requests skip the Stack Auth round trip and the user/organization sync.
+    claims = unverified_token_claims(token)
+    return await get_principal_cache().get_or_load(
+        token_cache_key(token, claims.get("selected_team_id")),
+        loader,
+        expires_at=claims.get("exp"),
+    )
 
+
+async def _handle_stack_auth(authorization: str | None) -> UserModel:
+    """
+    Handle authentication via a Stack Auth access token.
+    Syncs the Stack user and selected team into the local database.
+    """
     # ------------------------------------------------------------------
     # 1. Validate and fetch the authenticated Stack user
     # ------------------------------------------------------------------
@@ -92,6 +124,9 @@ async def get_user(
             # Update the user_model object to reflect the change
             user_model.selected_organization_id = organization.id
 
+            # Other sessions of this user may still hold the old organization
+            await get_principal_cache().invalidate_user(user_model.id)
+
             # Only create default configuration if organization was just created
             # This prevents race conditions where multiple concurrent requests
             # might try to create configurations
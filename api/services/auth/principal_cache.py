@@ -0,0 +1,424 @@
+"""Short-TTL cache of authenticated principals.
+
+Resolving the user behind a request costs a Stack Auth round trip plus several
+database calls (or an API key lookup and a user lookup). Dashboard polling and
+public API clients repeat the same credentials many times a minute, so the
+resolved principal is cached keyed by a hash of the token or API key:
+
+- An in-process cache, optionally backed by Redis so API workers share it.
+- Negative caching of rejected (401) credentials for a shorter TTL.
+- Concurrent misses for the same credential share a single resolution.
+- Explicit invalidation on API key archive/reactivation and when a user
+  switches organization, published over Redis pub/sub so every API worker
+  drops its in-process entries right away. With Redis enabled the
+  in-process layer also uses a short TTL.
+- Other changes are picked up when entries expire: a principal only holds the
+  user's id, organization, superuser flag and email, and an organization's
+  settings are always read from the database, but e.g. an ``is_superuser``
+  change made directly in the database takes up to ``AUTH_CACHE_TTL_SECONDS``
+  to apply.
+- Token entries never outlive the token's ``exp`` and are keyed on its
+  selected team, when it carries one.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+import jwt
+import redis.asyncio as aioredis
+from fastapi import HTTPException
+from loguru import logger
+
+from api.constants import (
+    AUTH_CACHE_NEGATIVE_TTL_SECONDS,
+    AUTH_CACHE_TTL_SECONDS,
+    AUTH_CACHE_USE_REDIS,
+    REDIS_URL,
+)
+from api.db.models import UserModel
+from api.enums import RedisChannel
+
+REDIS_KEY_PREFIX = "auth:principal:"
+
+# In-process TTL when Redis is the shared source of truth
+LOCAL_TTL_WITH_REDIS_SECONDS = 5.0
+
+# Upper bound on in-process entries
+MAX_LOCAL_ENTRIES = 10000
+
+# Wait before resubscribing to invalidations after the listener failed
+INVALIDATION_RETRY_SECONDS = 1.0
+
+
+@dataclass
+class AuthPrincipal:
+    """The parts of an authenticated user that request handlers rely on."""
+
+    user_id: int
+    provider_id: str
+    selected_organization_id: Optional[int]
+    is_superuser: bool
+    email: Optional[str]
+
+    @classmethod
+    def from_user(cls, user: UserModel) -> "AuthPrincipal":
+        return cls(
+            user_id=user.id,
+            provider_id=user.provider_id,
+            selected_organization_id=user.selected_organization_id,
+            is_superuser=bool(user.is_superuser),
+            email=user.email,
+        )
+
+    def to_user(self) -> UserModel:
+        """Build a fresh, detached ``UserModel`` for the current request."""
+        return UserModel(
+            id=self.user_id,
+            provider_id=self.provider_id,
+            selected_organization_id=self.selected_organization_id,
+            is_superuser=self.is_superuser,
+            email=self.email,
+        )
+
+
+@dataclass
+class _Entry:
+    expires_at: float
+    principal: Optional[AuthPrincipal] = None
+    error: Optional[str] = None
+
+
+def unverified_token_claims(token: str) -> dict:
+    """Claims of a JWT, without verifying it.
+
+    Only used to key and expire cache entries; the loader still verifies the
+    token on a miss. Returns an empty dict for tokens that aren't JWTs.
+    """
+    try:
+        return jwt.decode(token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        return {}
+
+
+def token_cache_key(token: str, selected_team_id: Optional[str] = None) -> str:
+    """Cache key for a bearer token (Stack Auth or local JWT).
+
+    Stack Auth tokens carry the selected team, so a token issued after a team
+    switch never resolves to the principal cached for the previous team.
+    """
+    key = "token:" + hashlib.sha256(token.encode()).hexdigest()
+    if selected_team_id:
+        key += ":team:" + str(selected_team_id)
+    return key
+
+
+def api_key_cache_key(key_hash: str) -> str:
+    """Cache key for an API key, given its stored SHA256 hash."""
+    return "api_key:" + key_hash
+
+
+class PrincipalCache:
+    """Caches resolved principals (and rejected credentials) by credential hash."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = AUTH_CACHE_TTL_SECONDS,
+        negative_ttl_seconds: float = AUTH_CACHE_NEGATIVE_TTL_SECONDS,
+        use_redis: bool = AUTH_CACHE_USE_REDIS,
+        broadcast_invalidations: bool = True,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.use_redis = use_redis
+        self.broadcast_invalidations = broadcast_invalidations
+        self._local_ttl = (
+            min(ttl_seconds, LOCAL_TTL_WITH_REDIS_SECONDS) if use_redis else ttl_seconds
+        )
+        self._local: Dict[str, _Entry] = {}
+        # user:<id> -> cache keys resolving to that user
+        self._tags: Dict[str, Set[str]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._redis_client: Optional[aioredis.Redis] = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._stats = {
+            "hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+            "redis_errors": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    async def _get_redis(self) -> aioredis.Redis:
+        """Get or create Redis connection."""
+        if self._redis_client is None:
+            self._redis_client = await aioredis.from_url(
+                REDIS_URL, decode_responses=True
+            )
+        return self._redis_client
+
+    async def get_or_load(
+        self,
+        cache_key: str,
+        loader: Callable[[], Awaitable[UserModel]],
+        expires_at: Optional[float] = None,
+    ) -> UserModel:
+        """Return the user for ``cache_key``, resolving it with ``loader`` on a miss.
+
+        A 401 raised by ``loader`` is cached (negative caching) and re-raised on
+        subsequent lookups until it expires. Other errors are never cached.
+
+        Args:
+            cache_key: Key from ``token_cache_key`` or ``api_key_cache_key``.
+            loader: Resolves the user from scratch.
+            expires_at: Unix time the credential expires at (a token's
+                ``exp``); the resolved principal is not cached past it.
+
+        Returns:
+            A fresh ``UserModel`` the caller may modify freely.
+        """
+        if not self.enabled:
+            return await loader()
+        self._ensure_listener()
+
+        entry = await self._lookup(cache_key)
+        if entry is not None:
+            if entry.principal is None:
+                self._stats["negative_hits"] += 1
+                raise HTTPException(status_code=401, detail=entry.error)
+            self._stats["hits"] += 1
+            return entry.principal.to_user()
+
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            self._stats["hits"] += 1
+            principal = await asyncio.shield(inflight)
+            return principal.to_user()
+
+        self._stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            user = await loader()
+        except HTTPException as e:
+            if e.status_code == 401 and self.negative_ttl_seconds > 0:
+                await self._store(cache_key, _Entry(0.0, error=e.detail))
+            future.set_exception(e)
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(cache_key, None)
+
+        principal = AuthPrincipal.from_user(user)
+        ttl = self.ttl_seconds
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl > 0:
+            await self._store(cache_key, _Entry(0.0, principal=principal), ttl)
+        future.set_result(principal)
+        return user
+
+    async def invalidate(self, cache_key: str) -> None:
+        """Drop a single credential from the cache, in every process."""
+        self._stats["invalidations"] += 1
+        self._drop_local({"key": cache_key})
+        await self._publish({"key": cache_key})
+        if self.use_redis:
+            try:
+                redis_client = await self._get_redis()
+                await redis_client.delete(REDIS_KEY_PREFIX + cache_key)
+            except Exception as e:
+                self._stats["redis_errors"] += 1
+                logger.warning(f"Failed to invalidate cached principal: {e}")
+
+    async def invalidate_user(self, user_id: int) -> None:
+        """Drop every cached credential resolving to ``user_id``."""
+        await self._invalidate_tag(f"user:{user_id}")
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and the hit rate since process start."""
+        lookups = (
+            self._stats["hits"] + self._stats["negative_hits"] + self._stats["misses"]
+        )
+        hit_rate = (
+            (self._stats["hits"] + self._stats["negative_hits"]) / lookups
+            if lookups
+            else 0.0
+        )
+        return {
+            **self._stats,
+            "local_entries": len(self._local),
+            "hit_rate": round(hit_rate, 4),
+        }
+
+    async def _lookup(self, cache_key: str) -> Optional[_Entry]:
+        now = time.monotonic()
+        entry = self._local.get(cache_key)
+        if entry is not None:
+            if entry.expires_at > now:
+                return entry
+            del self._local[cache_key]
+
+        if not self.use_redis:
+            return None
+
+        try:
+            redis_client = await self._get_redis()
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.get(REDIS_KEY_PREFIX + cache_key)
+            pipe.ttl(REDIS_KEY_PREFIX + cache_key)
+            raw, remaining = await pipe.execute()
+        except Exception as e:
+            self._stats["redis_errors"] += 1
+            logger.warning(f"Principal cache Redis lookup failed: {e}")
+            return None
+        if not raw:
+            return None
+
+        data = json.loads(raw)
+        principal = data.get("principal")
+        entry = _Entry(
+            expires_at=0.0,
+            principal=AuthPrincipal(**principal) if principal else None,
+            error=data.get("error"),
+        )
+        local_ttl = self._local_ttl if entry.principal else self.negative_ttl_seconds
+        if remaining and remaining > 0:
+            local_ttl = min(local_ttl, remaining)
+        self._store_local(cache_key, entry, local_ttl)
+        return entry
+
+    async def _store(
+        self, cache_key: str, entry: _Entry, ttl: Optional[float] = None
+    ) -> None:
+        if ttl is None:
+            ttl = self.ttl_seconds if entry.principal else self.negative_ttl_seconds
+        local_ttl = min(self._local_ttl, ttl) if entry.principal else ttl
+        self._store_local(cache_key, entry, local_ttl)
+
+        if not self.use_redis:
+            return
+        if entry.principal:
+            value = json.dumps({"principal": asdict(entry.principal)})
+        else:
+            value = json.dumps({"error": entry.error})
+        try:
+            redis_client = await self._get_redis()
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.set(REDIS_KEY_PREFIX + cache_key, value, ex=max(1, int(ttl)))
+            for tag in self._entry_tags(entry):
+                tag_key = REDIS_KEY_PREFIX + tag
+                pipe.sadd(tag_key, cache_key)
+                pipe.expire(tag_key, max(1, int(self.ttl_seconds)))
+            await pipe.execute()
+        except Exception as e:
+            self._stats["redis_errors"] += 1
+            logger.warning(f"Principal cache Redis store failed: {e}")
+
+    def _store_local(self, cache_key: str, entry: _Entry, ttl: float) -> None:
+        if len(self._local) >= MAX_LOCAL_ENTRIES:
+            now = time.monotonic()
+            for key in [k for k, v in self._local.items() if v.expires_at <= now]:
+                del self._local[key]
+            if len(self._local) >= MAX_LOCAL_ENTRIES:
+                self._local.pop(next(iter(self._local)))
+        entry.expires_at = time.monotonic() + ttl
+        self._local[cache_key] = entry
+        for tag in self._entry_tags(entry):
+            self._tags.setdefault(tag, set()).add(cache_key)
+
+    @staticmethod
+    def _entry_tags(entry: _Entry) -> Tuple[str, ...]:
+        if entry.principal is None:
+            return ()
+        return (f"user:{entry.principal.user_id}",)
+
+    async def _invalidate_tag(self, tag: str) -> None:
+        self._stats["invalidations"] += 1
+        self._drop_local({"tag": tag})
+        await self._publish({"tag": tag})
+
+        if not self.use_redis:
+            return
+        try:
+            redis_client = await self._get_redis()
+            tag_key = REDIS_KEY_PREFIX + tag
+            cache_keys = await redis_client.smembers(tag_key)
+            await redis_client.delete(
+                tag_key, *(REDIS_KEY_PREFIX + key for key in cache_keys)
+            )
+        except Exception as e:
+            self._stats["redis_errors"] += 1
+            logger.warning(f"Failed to invalidate cached principals for {tag}: {e}")
+
+    def _drop_local(self, invalidation: Dict[str, str]) -> None:
+        """Apply an invalidation (``{"key": ...}`` or ``{"tag": ...}``) locally."""
+        if "key" in invalidation:
+            self._local.pop(invalidation["key"], None)
+        for cache_key in self._tags.pop(invalidation.get("tag"), set()):
+            self._local.pop(cache_key, None)
+
+    async def _publish(self, invalidation: Dict[str, str]) -> None:
+        if not self.broadcast_invalidations:
+            return
+        try:
+            redis_client = await self._get_redis()
+            await redis_client.publish(
+                RedisChannel.AUTH_PRINCIPAL_INVALIDATIONS.value,
+                json.dumps(invalidation),
+            )
+        except Exception as e:
+            self._stats["redis_errors"] += 1
+            logger.warning(f"Failed to publish principal invalidation: {e}")
+
+    def _ensure_listener(self) -> None:
+        if self.broadcast_invalidations and (
+            self._listener_task is None or self._listener_task.done()
+        ):
+            self._listener_task = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        """Apply the invalidations published by other processes."""
+        while True:
+            try:
+                redis_client = await self._get_redis()
+                pubsub = redis_client.pubsub()
+                await pubsub.subscribe(RedisChannel.AUTH_PRINCIPAL_INVALIDATIONS.value)
+                try:
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._drop_local(json.loads(message["data"]))
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._stats["redis_errors"] += 1
+                logger.warning(f"Principal cache invalidation listener failed: {e}")
+                # Invalidations may have been missed meanwhile
+                self._local.clear()
+                self._tags.clear()
+                await asyncio.sleep(INVALIDATION_RETRY_SECONDS)
+
+
+# Global principal cache instance
+_principal_cache: Optional[PrincipalCache] = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Get or create the global principal cache instance."""
+    global _principal_cache
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache()
+    return _principal_cache
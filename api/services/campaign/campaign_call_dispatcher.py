@@ -13,7 +13,7 @@ from api.services.campaign.errors import (
     ConcurrentSlotAcquisitionError,
     PhoneNumberPoolExhaustedError,
 )
-from api.services.campaign.rate_limiter import rate_limiter
+from api.services.campaign.rate_limiter import DispatchAcquisition, rate_limiter
 from api.services.telephony.base import TelephonyProvider
 from api.services.telephony.factory import get_telephony_provider
 from api.utils.common import get_backend_endpoints
@@ -87,19 +87,17 @@ class CampaignCallDispatcher:
         processed_count = 0
         for i, queued_run in enumerate(queued_runs):
             try:
-                # Apply rate limiting, i.e lets not initiate more than rate_limit_per_second
-                # calls per second. It is different than concurrency limit.
-                await self.apply_rate_limit(
-                    campaign.organization_id, campaign.rate_limit_per_second
-                )
-
-                # Acquire concurrent slot - waits until a slot is available
-                slot_id = await self.acquire_concurrent_slot(
+                # Acquire a rate token (not more than rate_limit_per_second calls
+                # per second, different than the concurrency limit), a concurrent
+                # slot and a from_number - waits until all three are available
+                slot_id, from_number = await self.acquire_call_resources(
                     campaign.organization_id, campaign
                 )
 
                 # Dispatch the call
-                workflow_run = await self.dispatch_call(queued_run, campaign, slot_id)
+                workflow_run = await self.dispatch_call(
+                    queued_run, campaign, slot_id, from_number
+                )
 
                 # Update queued run as processed
                 await db_client.update_queued_run(
@@ -156,26 +154,29 @@ class CampaignCallDispatcher:
         return processed_count
 
     async def dispatch_call(
-        self, queued_run: QueuedRunModel, campaign: any, slot_id: str
+        self,
+        queued_run: QueuedRunModel,
+        campaign: any,
+        slot_id: str,
+        from_number: str,
     ) -> Optional[WorkflowRunModel]:
-        """Creates workflow run and initiates call. Requires a pre-acquired slot_id."""
-        from_number = None
-
+        """Creates workflow run and initiates call. Requires a pre-acquired slot_id
+        and from_number."""
         # Get workflow details
         workflow = await db_client.get_workflow_by_id(campaign.workflow_id)
         if not workflow:
-            # Release slot before raising
-            await rate_limiter.release_concurrent_slot(
-                campaign.organization_id, slot_id
+            # Release slot and from_number before raising
+            await rate_limiter.release_dispatch_resources(
+                campaign.organization_id, slot_id, from_number
             )
             raise ValueError(f"Workflow {campaign.workflow_id} not found")
 
         # Extract phone number
         phone_number = queued_run.context_variables.get("phone_number")
         if not phone_number:
-            # Release slot before raising
-            await rate_limiter.release_concurrent_slot(
-                campaign.organization_id, slot_id
+            # Release slot and from_number before raising
+            await rate_limiter.release_dispatch_resources(
+                campaign.organization_id, slot_id, from_number
             )
             raise ValueError(f"No phone number in queued run {queued_run.id}")
 
@@ -183,17 +184,6 @@ class CampaignCallDispatcher:
         provider = await self.get_telephony_provider(campaign.organization_id)
         workflow_run_mode = provider.PROVIDER_NAME
 
-        # Acquire a unique from_number from the pool
-        from_number = await self.acquire_from_number(campaign.organization_id)
-        if from_number is None:
-            # Release concurrent slot before raising
-            await rate_limiter.release_concurrent_slot(
-                campaign.organization_id, slot_id
-            )
-            raise PhoneNumberPoolExhaustedError(
-                organization_id=campaign.organization_id
-            )
-
         logger.info(f"Provider name: {provider.PROVIDER_NAME}")
         logger.info(f"Queued run context: {queued_run.context_variables}")
 
@@ -221,24 +211,16 @@ class CampaignCallDispatcher:
                 queued_run_id=queued_run.id,  # Link to queued run for retry tracking
             )
 
-            # Store slot_id mapping in Redis for cleanup later
-            await rate_limiter.store_workflow_slot_mapping(
-                workflow_run.id, campaign.organization_id, slot_id
-            )
-
-            # Store from_number mapping for cleanup on call completion
-            await rate_limiter.store_workflow_from_number_mapping(
-                workflow_run.id, campaign.organization_id, from_number
+            # Store slot_id and from_number mappings in Redis for cleanup on
+            # call completion
+            await rate_limiter.store_workflow_call_mappings(
+                workflow_run.id, campaign.organization_id, slot_id, from_number
             )
         except Exception as e:
             # Release slot and from_number on error
-            await rate_limiter.release_concurrent_slot(
-                campaign.organization_id, slot_id
+            await rate_limiter.release_dispatch_resources(
+                campaign.organization_id, slot_id, from_number
             )
-            if from_number:
-                await rate_limiter.release_from_number(
-                    campaign.organization_id, from_number
-                )
             raise
 
         # Add "retry" tag if this is a retry call
@@ -315,73 +297,16 @@ class CampaignCallDispatcher:
                 },
             )
 
-            # Release concurrent slot on failure
-            mapping = await rate_limiter.get_workflow_slot_mapping(workflow_run.id)
-            if mapping:
-                org_id, slot_id = mapping
-                await rate_limiter.release_concurrent_slot(org_id, slot_id)
-                await rate_limiter.delete_workflow_slot_mapping(workflow_run.id)
-
-            # Release from_number on failure
-            from_number_mapping = await rate_limiter.get_workflow_from_number_mapping(
-                workflow_run.id
-            )
-            if from_number_mapping:
-                fn_org_id, fn_number = from_number_mapping
-                await rate_limiter.release_from_number(fn_org_id, fn_number)
-                await rate_limiter.delete_workflow_from_number_mapping(workflow_run.id)
+            # Release concurrent slot and from_number on failure
+            await rate_limiter.release_workflow_resources(workflow_run.id)
 
             raise
 
         return workflow_run
 
-    async def apply_rate_limit(self, organization_id: int, rate_limit: int) -> None:
-        """
-        Enforces rate limiting - waits if necessary to comply with rate limit
-
-        Example usage:
-        ```
-        # This will wait up to 1 second if needed to respect rate limit
-        await self.apply_rate_limit(org_id, 1)  # 1 call per second
-        await twilio.initiate_call(...)  # Now safe to call
-        ```
-        """
-        max_wait = 1.0  # Maximum time to wait for a slot
-        start_time = time.time()
-
-        while True:
-            # Try to acquire token
-            if await rate_limiter.acquire_token(organization_id, rate_limit):
-                return  # Got permission to proceed
-
-            # Check how long to wait
-            wait_time = await rate_limiter.get_next_available_slot(
-                organization_id, rate_limit
-            )
-
-            # Don't wait forever
-            if time.time() - start_time + wait_time > max_wait:
-                raise TimeoutError("Rate limit timeout - try again later")
-
-            # Wait for next available slot
-            await asyncio.sleep(wait_time)
-
-    async def acquire_concurrent_slot(
-        self, organization_id: int, campaign: any, timeout: float = 600
-    ) -> str:
-        """
-        Acquires a concurrent call slot - waits if necessary until a slot is available.
-
-        Args:
-            organization_id: The organization ID
-            campaign: The campaign object
-            timeout: Maximum time to wait for a slot (default 10 minutes)
-
-        Returns the slot_id which must be released when the call completes.
-
-        Raises:
-            ConcurrentSlotAcquisitionError: If slot cannot be acquired within timeout
-        """
+    async def get_max_concurrent(self, organization_id: int, campaign: any) -> int:
+        """Concurrent call limit of a campaign: the lower of the campaign's
+        max_concurrency and the organization's limit."""
         # Get concurrent limit for organization
         org_concurrent_limit = await self.get_org_concurrent_limit(organization_id)
 
@@ -394,98 +319,109 @@ class CampaignCallDispatcher:
 
         # Use the lower of campaign limit and org limit
         if campaign_max_concurrency is not None:
-            max_concurrent = min(campaign_max_concurrency, org_concurrent_limit)
-        else:
-            max_concurrent = org_concurrent_limit
-
-        # Track wait time for alerting
-        wait_start = time.time()
-
-        # Wait until we can acquire a concurrent slot
-        while True:
-            slot_id = await rate_limiter.try_acquire_concurrent_slot(
-                organization_id, max_concurrent
-            )
-            if slot_id:
-                return slot_id
-
-            # Check if we've been waiting too long
-            wait_time = time.time() - wait_start
-            if wait_time > timeout:
-                raise ConcurrentSlotAcquisitionError(
-                    organization_id=organization_id,
-                    campaign_id=campaign.id,
-                    wait_time=wait_time,
-                )
-
-            logger.debug(
-                f"Attempting to get a slot for {organization_id} {campaign.id}, "
-                f"waited {wait_time:.1f}s"
-            )
+            return min(campaign_max_concurrency, org_concurrent_limit)
+        return org_concurrent_limit
+
+    async def acquire_call_resources(
+        self,
+        organization_id: int,
+        campaign: any,
+        rate_limit_timeout: float = 1.0,
+        slot_timeout: float = 600,
+        from_number_timeout: float = 60,
+    ) -> tuple[str, str]:
+        """
+        Acquires a rate token, a concurrent call slot and a from_number, waiting
+        until all three are available. Each attempt is a single Redis round trip
+        that takes all three or none.
 
-            # Wait before retrying
-            await asyncio.sleep(1)
+        Args:
+            organization_id: The organization ID
+            campaign: The campaign object
+            rate_limit_timeout: Maximum time to wait for a rate token, once the
+                other resources are free
+            slot_timeout: Maximum time to wait for a slot (default 10 minutes)
+            from_number_timeout: Maximum time to wait for a from_number
 
-    async def acquire_from_number(
-        self, organization_id: int, timeout: float = 60
-    ) -> Optional[str]:
-        """
-        Acquire a from_number from the pool with retry.
-        Waits up to timeout seconds, polling every 1s.
+        Returns the (slot_id, from_number) which must be released when the call
+        completes.
 
-        Returns the phone number or None if timeout is exceeded.
+        Raises:
+            TimeoutError: If rate limited for longer than rate_limit_timeout
+            ConcurrentSlotAcquisitionError: If slot cannot be acquired within timeout
+            PhoneNumberPoolExhaustedError: If no from_number frees up within timeout
         """
-        wait_start = time.time()
+        max_concurrent = await self.get_max_concurrent(organization_id, campaign)
+        rate_limit = campaign.rate_limit_per_second
+
+        # Time spent waiting on each resource, for timeouts and alerting. The
+        # rate limit wait only counts consecutive rate limited attempts: tokens
+        # taken by other dispatchers while this one waited for a slot or a
+        # from_number start a new wait, as when the token was taken first.
+        waits = {
+            DispatchAcquisition.RATE_LIMITED: 0.0,
+            DispatchAcquisition.NO_CONCURRENT_SLOT: 0.0,
+            DispatchAcquisition.NO_FROM_NUMBER: 0.0,
+        }
 
         while True:
-            from_number = await rate_limiter.acquire_from_number(organization_id)
-            if from_number:
-                return from_number
-
-            wait_time = time.time() - wait_start
-            if wait_time > timeout:
-                logger.warning(
-                    f"From number pool exhausted for org {organization_id} "
-                    f"after waiting {wait_time:.1f}s"
+            acquisition = await rate_limiter.acquire_dispatch_resources(
+                organization_id, rate_limit, max_concurrent
+            )
+            if acquisition.status == DispatchAcquisition.ACQUIRED:
+                return acquisition.slot_id, acquisition.from_number
+            if acquisition.status != DispatchAcquisition.RATE_LIMITED:
+                waits[DispatchAcquisition.RATE_LIMITED] = 0.0
+
+            waited = waits[acquisition.status]
+            if acquisition.status == DispatchAcquisition.RATE_LIMITED:
+                delay = acquisition.retry_after
+                # Don't wait forever
+                if waited + delay > rate_limit_timeout:
+                    raise TimeoutError("Rate limit timeout - try again later")
+            elif acquisition.status == DispatchAcquisition.NO_CONCURRENT_SLOT:
+                delay = 1.0
+                if waited > slot_timeout:
+                    raise ConcurrentSlotAcquisitionError(
+                        organization_id=organization_id,
+                        campaign_id=campaign.id,
+                        wait_time=waited,
+                    )
+                logger.debug(
+                    f"Attempting to get a slot for {organization_id} {campaign.id}, "
+                    f"waited {waited:.1f}s"
+                )
+            else:
+                delay = 1.0
+                if waited > from_number_timeout:
+                    logger.warning(
+                        f"From number pool exhausted for org {organization_id} "
+                        f"after waiting {waited:.1f}s"
+                    )
+                    raise PhoneNumberPoolExhaustedError(organization_id=organization_id)
+                logger.debug(
+                    f"All from_numbers in use for org {organization_id}, "
+                    f"waited {waited:.1f}s, retrying..."
                 )
-                return None
 
-            logger.debug(
-                f"All from_numbers in use for org {organization_id}, "
-                f"waited {wait_time:.1f}s, retrying..."
-            )
-            await asyncio.sleep(1)
+            started = time.time()
+            await asyncio.sleep(delay)
+            waits[acquisition.status] += time.time() - started
 
     async def release_call_slot(self, workflow_run_id: int) -> bool:
         """
         Release concurrent slot and from_number when a call completes.
         Called by Twilio webhooks or workflow completion handlers.
         """
-        slot_released = False
-        mapping = await rate_limiter.get_workflow_slot_mapping(workflow_run_id)
-        if mapping:
-            org_id, slot_id = mapping
-            success = await rate_limiter.release_concurrent_slot(org_id, slot_id)
-            if success:
-                await rate_limiter.delete_workflow_slot_mapping(workflow_run_id)
-                logger.info(
-                    f"Released concurrent slot for workflow run {workflow_run_id}"
-                )
-                slot_released = True
-
-        # Release from_number back to pool
-        from_number_mapping = await rate_limiter.get_workflow_from_number_mapping(
+        slot_released, from_number = await rate_limiter.release_workflow_resources(
             workflow_run_id
         )
-        if from_number_mapping:
-            fn_org_id, fn_number = from_number_mapping
-            fn_success = await rate_limiter.release_from_number(fn_org_id, fn_number)
-            if fn_success:
-                await rate_limiter.delete_workflow_from_number_mapping(workflow_run_id)
-                logger.info(
-                    f"Released from_number {fn_number} for workflow run {workflow_run_id}"
-                )
-
+        if slot_released:
+            logger.info(f"Released concurrent slot for workflow run {workflow_run_id}")
+        if from_number:
+            logger.info(
+                f"Released from_number {from_number} for workflow run {workflow_run_id}"
+            )
         return slot_released
 
 
@@ -11,9 +11,79 @@ from typing import Optional, Tuple
 import redis.asyncio as aioredis
 from loguru import logger
 
-from api.constants import DEFAULT_CIRCUIT_BREAKER_CONFIG, REDIS_URL
+from api.constants import DEFAULT_CIRCUIT_BREAKER_CONFIG
 from api.db import db_client
 from api.services.campaign.campaign_event_publisher import get_campaign_event_publisher
+from api.services.campaign.redis_scripts import (
+    RedisScript,
+    close_campaign_redis,
+    get_campaign_redis,
+)
+
+_RECORD_OUTCOME_SCRIPT = RedisScript(
+    """
+local fail_key = KEYS[1]
+local succ_key = KEYS[2]
+local now = tonumber(ARGV[1])
+local window_start = tonumber(ARGV[2])
+local is_failure = tonumber(ARGV[3])
+local threshold = tonumber(ARGV[4])
+local min_calls = tonumber(ARGV[5])
+local ttl = tonumber(ARGV[6])
+
+-- Trim both sets to the sliding window
+redis.call('ZREMRANGEBYSCORE', fail_key, 0, window_start)
+redis.call('ZREMRANGEBYSCORE', succ_key, 0, window_start)
+
+-- Add the new outcome to the appropriate set
+if is_failure == 1 then
+    redis.call('ZADD', fail_key, now, now)
+else
+    redis.call('ZADD', succ_key, now, now)
+end
+
+-- Refresh TTL on both keys
+redis.call('EXPIRE', fail_key, ttl)
+redis.call('EXPIRE', succ_key, ttl)
+
+-- Count via ZCARD (O(1))
+local failures = redis.call('ZCARD', fail_key)
+local successes = redis.call('ZCARD', succ_key)
+local total = failures + successes
+
+-- Check trip condition
+if total >= min_calls and (failures / total) >= threshold then
+    return {1, failures, successes, total}
+end
+
+return {0, failures, successes, total}
+"""
+)
+
+_CHECK_OPEN_SCRIPT = RedisScript(
+    """
+local fail_key = KEYS[1]
+local succ_key = KEYS[2]
+local window_start = tonumber(ARGV[1])
+local threshold = tonumber(ARGV[2])
+local min_calls = tonumber(ARGV[3])
+
+-- Trim both sets
+redis.call('ZREMRANGEBYSCORE', fail_key, 0, window_start)
+redis.call('ZREMRANGEBYSCORE', succ_key, 0, window_start)
+
+-- Count via ZCARD
+local failures = redis.call('ZCARD', fail_key)
+local successes = redis.call('ZCARD', succ_key)
+local total = failures + successes
+
+if total >= min_calls and (failures / total) >= threshold then
+    return {1, failures, successes, total}
+end
+
+return {0, failures, successes, total}
+"""
+)
 
 
 class CircuitBreaker:
@@ -23,11 +93,9 @@ class CircuitBreaker:
         self.redis_client: Optional[aioredis.Redis] = None
 
     async def _get_redis(self) -> aioredis.Redis:
-        """Get or create Redis connection."""
+        """Get the shared campaign Redis connection."""
         if self.redis_client is None:
-            self.redis_client = await aioredis.from_url(
-                REDIS_URL, decode_responses=True
-            )
+            self.redis_client = await get_campaign_redis()
         return self.redis_client
 
     @staticmethod
@@ -70,56 +138,18 @@ class CircuitBreaker:
 
         fail_key, succ_key = self._keys(campaign_id)
 
-        lua_script = """
-        local fail_key = KEYS[1]
-        local succ_key = KEYS[2]
-        local now = tonumber(ARGV[1])
-        local window_start = tonumber(ARGV[2])
-        local is_failure = tonumber(ARGV[3])
-        local threshold = tonumber(ARGV[4])
-        local min_calls = tonumber(ARGV[5])
-        local ttl = tonumber(ARGV[6])
-
-        -- Trim both sets to the sliding window
-        redis.call('ZREMRANGEBYSCORE', fail_key, 0, window_start)
-        redis.call('ZREMRANGEBYSCORE', succ_key, 0, window_start)
-
-        -- Add the new outcome to the appropriate set
-        if is_failure == 1 then
-            redis.call('ZADD', fail_key, now, now)
-        else
-            redis.call('ZADD', succ_key, now, now)
-        end
-
-        -- Refresh TTL on both keys
-        redis.call('EXPIRE', fail_key, ttl)
-        redis.call('EXPIRE', succ_key, ttl)
-
-        -- Count via ZCARD (O(1))
-        local failures = redis.call('ZCARD', fail_key)
-        local successes = redis.call('ZCARD', succ_key)
-        local total = failures + successes
-
-        -- Check trip condition
-        if total >= min_calls and (failures / total) >= threshold then
-            return {1, failures, successes, total}
-        end
-
-        return {0, failures, successes, total}
-        """
-
         try:
-            result = await redis_client.eval(
-                lua_script,
-                2,
-                fail_key,
-                succ_key,
-                now,
-                window_start,
-                1 if is_failure else 0,
-                threshold,
-                min_calls,
-                window_seconds + 60,  # TTL with buffer
+            result = await _RECORD_OUTCOME_SCRIPT(
+                redis_client,
+                [fail_key, succ_key],
+                [
+                    now,
+                    window_start,
+                    1 if is_failure else 0,
+                    threshold,
+                    min_calls,
+                    window_seconds + 60,  # TTL with buffer
+                ],
             )
 
             tripped = bool(result[0])
@@ -174,38 +204,11 @@ class CircuitBreaker:
 
         fail_key, succ_key = self._keys(campaign_id)
 
-        lua_script = """
-        local fail_key = KEYS[1]
-        local succ_key = KEYS[2]
-        local window_start = tonumber(ARGV[1])
-        local threshold = tonumber(ARGV[2])
-        local min_calls = tonumber(ARGV[3])
-
-        -- Trim both sets
-        redis.call('ZREMRANGEBYSCORE', fail_key, 0, window_start)
-        redis.call('ZREMRANGEBYSCORE', succ_key, 0, window_start)
-
-        -- Count via ZCARD
-        local failures = redis.call('ZCARD', fail_key)
-        local successes = redis.call('ZCARD', succ_key)
-        local total = failures + successes
-
-        if total >= min_calls and (failures / total) >= threshold then
-            return {1, failures, successes, total}
-        end
-
-        return {0, failures, successes, total}
-        """
-
         try:
-            result = await redis_client.eval(
-                lua_script,
-                2,
-                fail_key,
-                succ_key,
-                window_start,
-                threshold,
-                min_calls,
+            result = await _CHECK_OPEN_SCRIPT(
+                redis_client,
+                [fail_key, succ_key],
+                [window_start, threshold, min_calls],
             )
 
             is_open = bool(result[0])
@@ -293,8 +296,8 @@ class CircuitBreaker:
     async def close(self):
         """Close Redis connection."""
         if self.redis_client:
-            await self.redis_client.close()
             self.redis_client = None
+            await close_campaign_redis()
 
 
 # Global circuit breaker instance
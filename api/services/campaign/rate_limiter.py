@@ -1,11 +1,195 @@
 import time
 import uuid
+from dataclasses import dataclass
 from typing import Optional
 
 import redis.asyncio as aioredis
 from loguru import logger
 
-from api.constants import REDIS_URL
+from api.services.campaign.redis_scripts import (
+    RedisScript,
+    close_campaign_redis,
+    get_campaign_redis,
+)
+
+# Lua script for atomic sliding window operation
+_RATE_TOKEN_SCRIPT = RedisScript(
+    """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window_start = tonumber(ARGV[2])
+local max_requests = tonumber(ARGV[3])
+
+-- Remove timestamps older than window
+redis.call('ZREMRANGEBYSCORE', key, 0, window_start)
+
+-- Count requests in current window
+local current_requests = redis.call('ZCARD', key)
+
+if current_requests < max_requests then
+    -- Add current timestamp
+    redis.call('ZADD', key, now, now)
+    redis.call('EXPIRE', key, 2)  -- Expire after 2 seconds
+    return 1
+else
+    return 0
+end
+"""
+)
+
+_CONCURRENT_SLOT_SCRIPT = RedisScript(
+    """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local max_concurrent = tonumber(ARGV[2])
+local stale_cutoff = tonumber(ARGV[3])
+local slot_id = ARGV[4]
+
+-- Remove stale entries
+redis.call('ZREMRANGEBYSCORE', key, 0, stale_cutoff)
+
+-- Get current count
+local current_count = redis.call('ZCARD', key)
+
+if current_count < max_concurrent then
+    -- Add new slot
+    redis.call('ZADD', key, now, slot_id)
+    redis.call('EXPIRE', key, 3600)  -- Expire after 1 hour
+    return slot_id
+else
+    return nil
+end
+"""
+)
+
+_ACQUIRE_FROM_NUMBER_SCRIPT = RedisScript(
+    """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local stale_cutoff = tonumber(ARGV[2])
+
+-- Clean stale entries: members with score > 0 and score < stale_cutoff
+local stale = redis.call('ZRANGEBYSCORE', key, 1, stale_cutoff)
+for i, member in ipairs(stale) do
+    redis.call('ZADD', key, 0, member)
+end
+
+-- Find an available number (score == 0)
+local available = redis.call('ZRANGEBYSCORE', key, 0, 0, 'LIMIT', 0, 1)
+if #available == 0 then
+    return nil
+end
+
+-- Mark as in-use with current timestamp
+redis.call('ZADD', key, now, available[1])
+return available[1]
+"""
+)
+
+_RELEASE_FROM_NUMBER_SCRIPT = RedisScript(
+    """
+local key = KEYS[1]
+local from_number = ARGV[1]
+
+local score = redis.call('ZSCORE', key, from_number)
+if score then
+    redis.call('ZADD', key, 0, from_number)
+    return 1
+end
+return 0
+"""
+)
+
+# Takes a rate token, a concurrent slot and a from_number at once, or none of
+# them. Returns {1, slot_id, from_number} when acquired, {0, oldest rate token
+# timestamp} when rate limited, {-1} without a free slot and {-2} without a
+# free from_number.
+_ACQUIRE_DISPATCH_SCRIPT = RedisScript(
+    """
+local rate_key = KEYS[1]
+local concurrent_key = KEYS[2]
+local pool_key = KEYS[3]
+local now = ARGV[1]
+local window_start = tonumber(ARGV[2])
+local rate_limit = tonumber(ARGV[3])
+local max_concurrent = tonumber(ARGV[4])
+local stale_cutoff = tonumber(ARGV[5])
+local slot_id = ARGV[6]
+
+redis.call('ZREMRANGEBYSCORE', rate_key, 0, window_start)
+if redis.call('ZCARD', rate_key) >= rate_limit then
+    local oldest = redis.call('ZRANGE', rate_key, 0, 0, 'WITHSCORES')
+    return {0, oldest[2]}
+end
+
+redis.call('ZREMRANGEBYSCORE', concurrent_key, 0, stale_cutoff)
+if redis.call('ZCARD', concurrent_key) >= max_concurrent then
+    return {-1}
+end
+
+local stale = redis.call('ZRANGEBYSCORE', pool_key, 1, stale_cutoff)
+for i, member in ipairs(stale) do
+    redis.call('ZADD', pool_key, 0, member)
+end
+local available = redis.call('ZRANGEBYSCORE', pool_key, 0, 0, 'LIMIT', 0, 1)
+if #available == 0 then
+    return {-2}
+end
+
+redis.call('ZADD', rate_key, now, now)
+redis.call('EXPIRE', rate_key, 2)
+redis.call('ZADD', concurrent_key, now, slot_id)
+redis.call('EXPIRE', concurrent_key, 3600)
+redis.call('ZADD', pool_key, now, available[1])
+return {1, slot_id, available[1]}
+"""
+)
+
+# Releases a concurrent slot and a from_number, and deletes the workflow run's
+# slot and from_number mappings (KEYS[3] and KEYS[4], optional). The mappings
+# are deleted even when there was nothing left to release, e.g. once the pool
+# expired, so they don't outlive the call.
+_RELEASE_DISPATCH_SCRIPT = RedisScript(
+    """
+local concurrent_key = KEYS[1]
+local pool_key = KEYS[2]
+local slot_id = ARGV[1]
+local from_number = ARGV[2]
+
+local slot_released = 0
+if slot_id ~= '' then
+    slot_released = redis.call('ZREM', concurrent_key, slot_id)
+end
+
+local number_released = 0
+if from_number ~= '' and redis.call('ZSCORE', pool_key, from_number) then
+    redis.call('ZADD', pool_key, 0, from_number)
+    number_released = 1
+end
+
+if KEYS[3] then
+    redis.call('DEL', KEYS[3], KEYS[4])
+end
+
+return {slot_released, number_released}
+"""
+)
+
+
+@dataclass
+class DispatchAcquisition:
+    """Outcome of ``RateLimiter.acquire_dispatch_resources``."""
+
+    ACQUIRED = "acquired"
+    RATE_LIMITED = "rate_limited"
+    NO_CONCURRENT_SLOT = "no_concurrent_slot"
+    NO_FROM_NUMBER = "no_from_number"
+
+    status: str
+    slot_id: Optional[str] = None
+    from_number: Optional[str] = None
+    # Seconds until a rate token frees up, when rate limited
+    retry_after: float = 0.0
 
 
 class RateLimiter:
@@ -16,11 +200,9 @@ class RateLimiter:
         self.stale_call_timeout = 300  # 5 minutes in seconds
 
     async def _get_redis(self) -> aioredis.Redis:
-        """Get or create Redis connection"""
+        """Get the shared campaign Redis connection"""
         if self.redis_client is None:
-            self.redis_client = await aioredis.from_url(
-                REDIS_URL, decode_responses=True
-            )
+            self.redis_client = await get_campaign_redis()
         return self.redis_client
 
     async def acquire_token(self, organization_id: int, rate_limit: int = 1) -> bool:
@@ -28,38 +210,27 @@ class RateLimiter:
         Enforces strict rate limit: max N calls per rolling second window
         Returns True if allowed, False if rate limited
         """
+        return await self._acquire_window_token(
+            f"rate_limit:{organization_id}", rate_limit
+        )
+
+    async def acquire_keyed_token(self, key: str, rate_limit: int) -> bool:
+        """
+        Same as ``acquire_token`` for a limit that isn't an organization's,
+        e.g. the requests to one webhook destination host
+        Returns True if allowed, False if rate limited
+        """
+        return await self._acquire_window_token(f"keyed_rate_limit:{key}", rate_limit)
+
+    async def _acquire_window_token(self, key: str, rate_limit: int) -> bool:
         redis_client = await self._get_redis()
 
-        key = f"rate_limit:{organization_id}"
         now = time.time()
         window_start = now - 1.0  # 1 second sliding window
 
-        # Lua script for atomic sliding window operation
-        lua_script = """
-        local key = KEYS[1]
-        local now = tonumber(ARGV[1])
-        local window_start = tonumber(ARGV[2])
-        local max_requests = tonumber(ARGV[3])
-        
-        -- Remove timestamps older than window
-        redis.call('ZREMRANGEBYSCORE', key, 0, window_start)
-        
-        -- Count requests in current window
-        local current_requests = redis.call('ZCARD', key)
-        
-        if current_requests < max_requests then
-            -- Add current timestamp
-            redis.call('ZADD', key, now, now)
-            redis.call('EXPIRE', key, 2)  -- Expire after 2 seconds
-            return 1
-        else
-            return 0
-        end
-        """
-
         try:
-            result = await redis_client.eval(
-                lua_script, 1, key, now, window_start, rate_limit
+            result = await _RATE_TOKEN_SCRIPT(
+                redis_client, [key], [now, window_start, rate_limit]
             )
             return bool(result)
         except Exception as e:
@@ -106,42 +277,14 @@ class RateLimiter:
         now = time.time()
         stale_cutoff = now - self.stale_call_timeout
 
-        # Lua script for atomic operation
-        lua_script = """
-        local key = KEYS[1]
-        local now = tonumber(ARGV[1])
-        local max_concurrent = tonumber(ARGV[2])
-        local stale_cutoff = tonumber(ARGV[3])
-        local slot_id = ARGV[4]
-        
-        -- Remove stale entries (older than 30 minutes)
-        redis.call('ZREMRANGEBYSCORE', key, 0, stale_cutoff)
-        
-        -- Get current count
-        local current_count = redis.call('ZCARD', key)
-        
-        if current_count < max_concurrent then
-            -- Add new slot
-            redis.call('ZADD', key, now, slot_id)
-            redis.call('EXPIRE', key, 3600)  -- Expire after 1 hour
-            return slot_id
-        else
-            return nil
-        end
-        """
-
         # Generate unique slot ID (timestamp + random component)
         slot_id = f"{int(now * 1000)}_{uuid.uuid4().hex[:8]}"
 
         try:
-            result = await redis_client.eval(
-                lua_script,
-                1,
-                concurrent_key,
-                now,
-                max_concurrent,
-                stale_cutoff,
-                slot_id,
+            result = await _CONCURRENT_SLOT_SCRIPT(
+                redis_client,
+                [concurrent_key],
+                [now, max_concurrent, stale_cutoff, slot_id],
             )
             return result
         except Exception as e:
@@ -286,30 +429,10 @@ class RateLimiter:
         now = time.time()
         stale_cutoff = now - self.stale_call_timeout
 
-        lua_script = """
-        local key = KEYS[1]
-        local now = tonumber(ARGV[1])
-        local stale_cutoff = tonumber(ARGV[2])
-
-        -- Clean stale entries: members with score > 0 and score < stale_cutoff
-        local stale = redis.call('ZRANGEBYSCORE', key, 1, stale_cutoff)
-        for i, member in ipairs(stale) do
-            redis.call('ZADD', key, 0, member)
-        end
-
-        -- Find an available number (score == 0)
-        local available = redis.call('ZRANGEBYSCORE', key, 0, 0, 'LIMIT', 0, 1)
-        if #available == 0 then
-            return nil
-        end
-
-        -- Mark as in-use with current timestamp
-        redis.call('ZADD', key, now, available[1])
-        return available[1]
-        """
-
         try:
-            result = await redis_client.eval(lua_script, 1, key, now, stale_cutoff)
+            result = await _ACQUIRE_FROM_NUMBER_SCRIPT(
+                redis_client, [key], [now, stale_cutoff]
+            )
             if result:
                 logger.debug(f"Acquired from_number {result} for org {organization_id}")
             return result
@@ -328,20 +451,10 @@ class RateLimiter:
         redis_client = await self._get_redis()
         key = f"from_number_pool:{organization_id}"
 
-        lua_script = """
-        local key = KEYS[1]
-        local from_number = ARGV[1]
-
-        local score = redis.call('ZSCORE', key, from_number)
-        if score then
-            redis.call('ZADD', key, 0, from_number)
-            return 1
-        end
-        return 0
-        """
-
         try:
-            result = await redis_client.eval(lua_script, 1, key, from_number)
+            result = await _RELEASE_FROM_NUMBER_SCRIPT(
+                redis_client, [key], [from_number]
+            )
             if result:
                 logger.debug(
                     f"Released from_number {from_number} for org {organization_id}"
@@ -405,11 +518,159 @@ class RateLimiter:
             logger.error(f"Error deleting workflow from_number mapping: {e}")
             return False
 
+    # ======== DISPATCH METHODS ========
+
+    async def acquire_dispatch_resources(
+        self, organization_id: int, rate_limit: int, max_concurrent: int
+    ) -> DispatchAcquisition:
+        """
+        Atomically take a rate token, a concurrent slot and a from_number in one
+        round trip. Nothing is taken unless all three are available.
+        """
+        redis_client = await self._get_redis()
+        now = time.time()
+        slot_id = f"{int(now * 1000)}_{uuid.uuid4().hex[:8]}"
+
+        try:
+            result = await _ACQUIRE_DISPATCH_SCRIPT(
+                redis_client,
+                [
+                    f"rate_limit:{organization_id}",
+                    f"concurrent_calls:{organization_id}",
+                    f"from_number_pool:{organization_id}",
+                ],
+                [
+                    now,
+                    now - 1.0,  # 1 second sliding window
+                    rate_limit,
+                    max_concurrent,
+                    now - self.stale_call_timeout,
+                    slot_id,
+                ],
+            )
+        except Exception as e:
+            logger.error(f"Dispatch limiter error: {e}")
+            # On error, be conservative and deny
+            return DispatchAcquisition(
+                DispatchAcquisition.RATE_LIMITED, retry_after=1.0
+            )
+
+        code = int(result[0])
+        if code == 1:
+            return DispatchAcquisition(
+                DispatchAcquisition.ACQUIRED, slot_id=result[1], from_number=result[2]
+            )
+        if code == 0:
+            retry_after = max(0.0, float(result[1]) + 1.0 - time.time())
+            return DispatchAcquisition(
+                DispatchAcquisition.RATE_LIMITED, retry_after=retry_after
+            )
+        if code == -1:
+            return DispatchAcquisition(DispatchAcquisition.NO_CONCURRENT_SLOT)
+        return DispatchAcquisition(DispatchAcquisition.NO_FROM_NUMBER)
+
+    async def store_workflow_call_mappings(
+        self,
+        workflow_run_id: int,
+        organization_id: int,
+        slot_id: str,
+        from_number: str,
+    ) -> bool:
+        """
+        Store the slot and from_number mappings of a workflow run in one
+        pipelined round trip.
+        """
+        redis_client = await self._get_redis()
+        slot_key = f"workflow_slot_mapping:{workflow_run_id}"
+        from_number_key = f"workflow_from_number:{workflow_run_id}"
+
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.hset(
+                    slot_key, mapping={"org_id": organization_id, "slot_id": slot_id}
+                )
+                pipe.expire(slot_key, self.stale_call_timeout)
+                pipe.hset(
+                    from_number_key,
+                    mapping={"org_id": organization_id, "from_number": from_number},
+                )
+                pipe.expire(from_number_key, 1800)  # 30 min TTL
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error storing workflow call mappings: {e}")
+            return False
+
+    async def release_dispatch_resources(
+        self,
+        organization_id: int,
+        slot_id: Optional[str],
+        from_number: Optional[str],
+        workflow_run_id: Optional[int] = None,
+    ) -> tuple[bool, bool]:
+        """
+        Release a concurrent slot and a from_number in one round trip, deleting
+        the workflow run's mappings.
+
+        Returns (slot_released, from_number_released).
+        """
+        redis_client = await self._get_redis()
+        keys = [
+            f"concurrent_calls:{organization_id}",
+            f"from_number_pool:{organization_id}",
+        ]
+        if workflow_run_id is not None:
+            keys += [
+                f"workflow_slot_mapping:{workflow_run_id}",
+                f"workflow_from_number:{workflow_run_id}",
+            ]
+
+        try:
+            slot_released, number_released = await _RELEASE_DISPATCH_SCRIPT(
+                redis_client, keys, [slot_id or "", from_number or ""]
+            )
+            return bool(slot_released), bool(number_released)
+        except Exception as e:
+            logger.error(f"Error releasing dispatch resources: {e}")
+            return False, False
+
+    async def release_workflow_resources(
+        self, workflow_run_id: int
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Release the concurrent slot and from_number mapped to a workflow run.
+
+        Returns (slot_released, released from_number or None).
+        """
+        redis_client = await self._get_redis()
+
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.hgetall(f"workflow_slot_mapping:{workflow_run_id}")
+                pipe.hgetall(f"workflow_from_number:{workflow_run_id}")
+                slot_mapping, from_number_mapping = await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error getting workflow call mappings: {e}")
+            return False, None
+
+        org_id = (slot_mapping or from_number_mapping or {}).get("org_id")
+        if org_id is None:
+            return False, None
+
+        from_number = (from_number_mapping or {}).get("from_number")
+        slot_released, number_released = await self.release_dispatch_resources(
+            int(org_id),
+            (slot_mapping or {}).get("slot_id"),
+            from_number,
+            workflow_run_id=workflow_run_id,
+        )
+        return slot_released, from_number if number_released else None
+
     async def close(self):
         """Close Redis connection"""
         if self.redis_client:
-            await self.redis_client.close()
             self.redis_client = None
+            await close_campaign_redis()
 
 
 # Global rate limiter instance
@@ -0,0 +1,79 @@
+"""Shared Redis connection and Lua scripts for campaign dispatching.
+
+``RateLimiter`` and ``CircuitBreaker`` share one connection pool, and run
+their Lua scripts by SHA1 (``EVALSHA``) instead of sending the script body
+with every call. Scripts are loaded once when the connection is created, and
+re-loaded transparently if Redis answers ``NOSCRIPT`` (e.g. after a restart or
+a failover to a replica that never saw them).
+"""
+
+import asyncio
+import hashlib
+from typing import List, Optional, Sequence
+
+import redis.asyncio as aioredis
+from loguru import logger
+from redis.exceptions import NoScriptError
+
+from api.constants import REDIS_URL
+
+_scripts: List["RedisScript"] = []
+
+_redis_client: Optional[aioredis.Redis] = None
+# Concurrent first callers create a single connection
+_redis_client_lock = asyncio.Lock()
+
+
+class RedisScript:
+    """A Lua script run with ``EVALSHA``, loaded on first use if needed.
+
+    Args:
+        source: The Lua source of the script
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.sha = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        _scripts.append(self)
+
+    async def __call__(
+        self, redis_client: aioredis.Redis, keys: Sequence, args: Sequence = ()
+    ):
+        try:
+            return await redis_client.evalsha(self.sha, len(keys), *keys, *args)
+        except NoScriptError:
+            await redis_client.script_load(self.source)
+            return await redis_client.evalsha(self.sha, len(keys), *keys, *args)
+
+
+async def preload_scripts(redis_client: aioredis.Redis):
+    """Load all campaign scripts in one round trip."""
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for script in _scripts:
+            pipe.script_load(script.source)
+        await pipe.execute()
+
+
+async def get_campaign_redis() -> aioredis.Redis:
+    """Get or create the Redis connection shared by campaign dispatching."""
+    global _redis_client
+    if _redis_client is not None:
+        return _redis_client
+    async with _redis_client_lock:
+        if _redis_client is None:
+            redis_client = await aioredis.from_url(REDIS_URL, decode_responses=True)
+            try:
+                await preload_scripts(redis_client)
+            except Exception as e:
+                # Scripts are loaded on first use instead
+                logger.warning(f"Failed to preload campaign Redis scripts: {e}")
+            _redis_client = redis_client
+    return _redis_client
+
+
+async def close_campaign_redis():
+    """Close the shared connection."""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.close()
+        _redis_client = None
@@ -0,0 +1,208 @@
+"""
+Compact, memory-mapped representation of the gender prediction model.
+
+``model.txt`` is compiled once into a binary file holding an open-addressing
+hash table, which is then memory-mapped. Lookups are O(1) and read straight
+from the mapping, so every process using the model shares the same pages of
+the OS page cache instead of each holding ~100k Python dicts and lists.
+
+Binary layout (little endian):
+
+- Header: magic, format version, number of names, number of hash slots,
+  length of the JSON header (model version and metadata)
+- JSON header
+- Hash slots: ``uint32`` per slot, 1-based entry index (0 = empty), indexed by
+  ``crc32(name) & (slots - 1)`` with linear probing
+- Entries: name offset, male count, female count, confidence in
+  ten-thousandths and name length
+- Names: UTF-8 encoded names, concatenated
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Optional, Tuple
+
+from loguru import logger
+
+from api.services.gender.constants import COMPACT_MODEL_CACHE_DIR
+
+MAGIC = b"GNDR"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sIIII")
+_SLOT = struct.Struct("<I")
+_ENTRY = struct.Struct("<IIIHB")
+
+
+def compile_model(model: dict) -> bytes:
+    """Compile a model loaded from ``model.txt`` into the binary format."""
+    # Names are looked up by a one-byte length
+    names = [
+        (name.encode("utf-8"), counts)
+        for name, counts in model.get("names", {}).items()
+        if len(name.encode("utf-8")) <= 255
+    ]
+    slots = 1
+    while slots < len(names) * 2:
+        slots *= 2
+
+    header = json.dumps(
+        {
+            "version": model.get("version", "unknown"),
+            "metadata": model.get("metadata", {}),
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    slot_table = [0] * slots
+    entries = bytearray()
+    blob = bytearray()
+
+    for index, (encoded, (male_count, female_count, confidence)) in enumerate(
+        names, start=1
+    ):
+        slot = zlib.crc32(encoded) & (slots - 1)
+        while slot_table[slot]:
+            slot = (slot + 1) & (slots - 1)
+        slot_table[slot] = index
+        entries += _ENTRY.pack(
+            len(blob),
+            male_count,
+            female_count,
+            round(confidence * 10000),
+            len(encoded),
+        )
+        blob += encoded
+
+    return b"".join(
+        [
+            _HEADER.pack(MAGIC, FORMAT_VERSION, len(names), slots, len(header)),
+            header,
+            struct.pack(f"<{slots}I", *slot_table),
+            bytes(entries),
+            bytes(blob),
+        ]
+    )
+
+
+class CompactGenderModel:
+    """Read-only view over a compiled gender model.
+
+    Args:
+        buffer: The compiled model, typically a memory mapping of the file
+    """
+
+    def __init__(self, buffer):
+        self._buffer = memoryview(buffer)
+        magic, version, self._count, self._slots, header_len = _HEADER.unpack_from(
+            self._buffer
+        )
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Invalid compact gender model")
+
+        offset = _HEADER.size
+        header = json.loads(bytes(self._buffer[offset : offset + header_len]))
+        self.version: str = header["version"]
+        self.metadata: dict = header["metadata"]
+
+        self._slots_offset = offset + header_len
+        self._entries_offset = self._slots_offset + self._slots * _SLOT.size
+        self._names_offset = self._entries_offset + self._count * _ENTRY.size
+        if len(self._buffer) < self._names_offset:
+            raise ValueError("Truncated compact gender model")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def get(self, name: str) -> Optional[Tuple[int, int, float]]:
+        """Look up a normalized (lower-cased, stripped) name.
+
+        Returns:
+            ``(male_count, female_count, confidence)``, or None if unknown
+        """
+        if not self._count:
+            return None
+        encoded = name.encode("utf-8")
+        buffer = self._buffer
+        mask = self._slots - 1
+        slot = zlib.crc32(encoded) & mask
+        while True:
+            index = _SLOT.unpack_from(buffer, self._slots_offset + slot * _SLOT.size)[0]
+            if not index:
+                return None
+            name_offset, male_count, female_count, confidence, name_len = (
+                _ENTRY.unpack_from(
+                    buffer, self._entries_offset + (index - 1) * _ENTRY.size
+                )
+            )
+            if name_len == len(encoded):
+                start = self._names_offset + name_offset
+                if buffer[start : start + name_len] == encoded:
+                    return male_count, female_count, confidence / 10000
+            slot = (slot + 1) & mask
+
+    @classmethod
+    def empty(cls) -> "CompactGenderModel":
+        """A model without names, used when the model file is unavailable."""
+        return cls(compile_model({"metadata": {}, "names": {}}))
+
+
+def _compiled_path(model_path: Path, cache_dir: Path) -> Path:
+    """Where the compiled form of ``model_path`` is stored."""
+    stat = model_path.stat()
+    key = f"{model_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}:{FORMAT_VERSION}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{model_path.stem}-{digest}.bin"
+
+
+def load_compact_model(
+    model_path: Path, cache_dir: Optional[Path] = None
+) -> CompactGenderModel:
+    """Load a model file, compiling and memory-mapping it.
+
+    The compiled file is written atomically, so concurrent processes either
+    reuse it or write identical copies. A compiled file that can't be read
+    (e.g. truncated by a full disk) is deleted and compiled again. If it
+    cannot be written, the model is compiled in memory for this process only.
+    """
+    cache_dir = Path(cache_dir or COMPACT_MODEL_CACHE_DIR)
+    compiled_path = _compiled_path(model_path, cache_dir)
+
+    if compiled_path.exists():
+        try:
+            return _map_compiled(compiled_path)
+        except (ValueError, KeyError, struct.error) as e:
+            logger.warning(
+                f"Rebuilding corrupt compiled gender model {compiled_path}: {e}"
+            )
+            compiled_path.unlink(missing_ok=True)
+
+    with open(model_path, "r", encoding="utf-8") as f:
+        model = json.load(f)
+    if "names" not in model or "metadata" not in model:
+        raise ValueError("Invalid model format")
+    compiled = compile_model(model)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = compiled_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(compiled)
+        os.replace(tmp_path, compiled_path)
+    except OSError as e:
+        logger.warning(f"Could not store compiled gender model in {cache_dir}: {e}")
+        return CompactGenderModel(compiled)
+
+    return _map_compiled(compiled_path)
+
+
+def _map_compiled(compiled_path: Path) -> CompactGenderModel:
+    """Memory-map a compiled model file."""
+    with open(compiled_path, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return CompactGenderModel(mapping)
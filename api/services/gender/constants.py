@@ -2,9 +2,22 @@
 Hyperparameters and configuration for gender prediction service.
 """
 
+import os
+import tempfile
+
 # Confidence threshold for using local model predictions
 CONFIDENCE_THRESHOLD = 0.85
 
 # Redis cache configuration
 REDIS_CACHE_TTL = 86400 * 30  # 30 days in seconds
 REDIS_KEY_PREFIX = "genderservice:"
+REDIS_MGET_CHUNK_SIZE = 1000  # Cache keys fetched per MGET in batch predictions
+
+# GenderAPI bulk lookups for batch predictions
+GENDER_API_BATCH_SIZE = 100  # Names per request (GenderAPI maximum)
+GENDER_API_CONCURRENCY = 4  # Concurrent bulk requests
+
+# Directory for the compiled, memory-mapped model shared by all processes
+COMPACT_MODEL_CACHE_DIR = os.getenv(
+    "GENDER_MODEL_CACHE_DIR", os.path.join(tempfile.gettempdir(), "dograh-gender")
+)
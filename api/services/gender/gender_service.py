@@ -3,6 +3,7 @@ Gender prediction service with local model and GenderAPI fallback.
 Internal service for use within Dograh platform.
 """
 
+import asyncio
 import json
 import os
 import time
@@ -15,10 +16,14 @@ from loguru import logger
 from pydantic import BaseModel, Field
 
 from api.constants import REDIS_URL
+from api.services.gender.compact_model import CompactGenderModel, load_compact_model
 from api.services.gender.constants import (
     CONFIDENCE_THRESHOLD,
+    GENDER_API_BATCH_SIZE,
+    GENDER_API_CONCURRENCY,
     REDIS_CACHE_TTL,
     REDIS_KEY_PREFIX,
+    REDIS_MGET_CHUNK_SIZE,
 )
 
 
@@ -46,6 +51,7 @@ class GenderService:
         confidence_threshold: float = CONFIDENCE_THRESHOLD,
         gender_api_key: Optional[str] = None,
         gender_api_url: str = "https://gender-api.com/v2/gender",
+        gender_api_batch_url: str = "https://gender-api.com/v2/gender/by-first-name-multiple",
     ):
         """
         Initialize the gender service.
@@ -55,10 +61,12 @@ class GenderService:
             confidence_threshold: Minimum confidence to use local model
             gender_api_key: API key for GenderAPI (falls back to env var)
             gender_api_url: GenderAPI endpoint URL
+            gender_api_batch_url: GenderAPI endpoint for multiple names
         """
         self.confidence_threshold = confidence_threshold
         self.gender_api_key = gender_api_key or os.getenv("GENDERAPI_API_KEY")
         self.gender_api_url = gender_api_url
+        self.gender_api_batch_url = gender_api_batch_url
 
         # Load model
         if model_path is None:
@@ -70,29 +78,24 @@ class GenderService:
         self._http_client = None
         self._redis_client: Optional[aioredis.Redis] = None
 
-    def _load_model(self, model_path: Path) -> dict:
-        """Load the compressed gender prediction model."""
+    def _load_model(self, model_path: Path) -> CompactGenderModel:
+        """Load the gender prediction model as a shared, memory-mapped table."""
         if not model_path.exists():
             logger.warning(f"Warning: Model file not found at {model_path}")
-            return {"metadata": {}, "names": {}}
+            return CompactGenderModel.empty()
 
         try:
-            with open(model_path, "r", encoding="utf-8") as f:
-                model = json.load(f)
-
-            # Validate model structure
-            if "names" not in model or "metadata" not in model:
-                raise ValueError("Invalid model format")
+            model = load_compact_model(model_path)
 
             logger.debug(
-                f"Loaded gender prediction model with {model['metadata'].get('total_names', 0):,} names"
+                f"Loaded gender prediction model with {model.metadata.get('total_names', 0):,} names"
             )
 
             return model
 
         except Exception as e:
             logger.error(f"Error loading gender prediction model: {e}")
-            return {"metadata": {}, "names": {}}
+            return CompactGenderModel.empty()
 
     @property
     def http_client(self) -> httpx.AsyncClient:
@@ -132,8 +135,9 @@ class GenderService:
         normalized_name = first_name.lower().strip()
 
         # Step 1: Check local model
-        if normalized_name in self.model["names"]:
-            male_count, female_count, confidence = self.model["names"][normalized_name]
+        model_entry = self.model.get(normalized_name)
+        if model_entry is not None:
+            male_count, female_count, confidence = model_entry
 
             # Use local model if confidence meets threshold
             if confidence >= self.confidence_threshold:
@@ -187,8 +191,13 @@ class GenderService:
                 pass
 
         # Step 4: Return best guess from model or unknown
-        if normalized_name in self.model["names"]:
-            male_count, female_count, confidence = self.model["names"][normalized_name]
+        return self._model_best_guess(model_entry)
+
+    @staticmethod
+    def _model_best_guess(model_entry: Optional[tuple]) -> GenderPrediction:
+        """Prediction from a model entry regardless of confidence, or unknown."""
+        if model_entry is not None:
+            male_count, female_count, confidence = model_entry
             gender = "male" if male_count > female_count else "female"
             return GenderPrediction(
                 gender=gender, confidence=confidence, source="model"
@@ -325,16 +334,148 @@ class GenderService:
         """
         Predict gender for multiple names.
 
+        Follows the same steps as predict(), but for all distinct names at
+        once: cached API results are fetched with chunked MGETs and the
+        remaining names are sent to GenderAPI in bulk requests, with at most
+        GENDER_API_CONCURRENCY requests in flight.
+
         Args:
             names: List of first names
 
         Returns:
-            List of GenderPrediction results
+            List of GenderPrediction results, in the order of names
         """
-        results = []
-        for name in names:
-            result = await self.predict(name)
-            results.append(result)
+        normalized_names = [name.lower().strip() if name else "" for name in names]
+        predictions: dict[str, GenderPrediction] = {
+            "": GenderPrediction(gender="unknown", confidence=0.0, source="model")
+        }
+        model_entries = {}
+
+        # Step 1: Check local model
+        for name in set(normalized_names) - predictions.keys():
+            model_entry = self.model.get(name)
+            model_entries[name] = model_entry
+            if model_entry is not None and model_entry[2] >= self.confidence_threshold:
+                predictions[name] = self._model_best_guess(model_entry)
+
+        # Step 2: Check Redis cache for previous API responses
+        pending = [name for name in model_entries if name not in predictions]
+        if pending:
+            try:
+                redis_client = await self._get_redis()
+                for start in range(0, len(pending), REDIS_MGET_CHUNK_SIZE):
+                    chunk = pending[start : start + REDIS_MGET_CHUNK_SIZE]
+                    cached = await redis_client.mget(
+                        [f"{REDIS_KEY_PREFIX}{name}" for name in chunk]
+                    )
+                    for name, cached_data in zip(chunk, cached):
+                        if cached_data:
+                            predictions[name] = GenderPrediction(
+                                **json.loads(cached_data), source="genderapi"
+                            )
+            except Exception as e:
+                logger.warning(f"Redis cache check failed: {e}")
+
+        # Step 3: Fallback to GenderAPI in bulk
+        pending = [name for name in pending if name not in predictions]
+        if pending and self.gender_api_key:
+            api_results = await self._call_gender_api_bulk(pending)
+            predictions.update(api_results)
+
+            if api_results:
+                try:
+                    redis_client = await self._get_redis()
+                    async with redis_client.pipeline(transaction=False) as pipe:
+                        for name, result in api_results.items():
+                            pipe.setex(
+                                f"{REDIS_KEY_PREFIX}{name}",
+                                REDIS_CACHE_TTL,
+                                json.dumps(
+                                    {
+                                        "gender": result.gender,
+                                        "confidence": result.confidence,
+                                    }
+                                ),
+                            )
+                        await pipe.execute()
+                except Exception as e:
+                    logger.warning(f"Failed to cache results in Redis: {e}")
+
+        # Step 4: Best guess from model or unknown for the rest
+        for name in pending:
+            if name not in predictions:
+                predictions[name] = self._model_best_guess(model_entries[name])
+
+        logger.debug(
+            f"GenderService: Batch of {len(names)} names "
+            f"({len(model_entries)} distinct, {len(pending)} needing GenderAPI)"
+        )
+        return [predictions[name] for name in normalized_names]
+
+    async def _call_gender_api_bulk(
+        self, normalized_names: list[str]
+    ) -> dict[str, GenderPrediction]:
+        """
+        Call GenderAPI for many names, GENDER_API_BATCH_SIZE names per request.
+
+        Failed requests are logged and their names left out of the result.
+
+        Args:
+            normalized_names: Distinct normalized first names
+
+        Returns:
+            Mapping of normalized name to GenderPrediction
+        """
+        headers = {
+            "Authorization": f"Bearer {self.gender_api_key}",
+            "Content-Type": "application/json",
+        }
+        semaphore = asyncio.Semaphore(GENDER_API_CONCURRENCY)
+        results: dict[str, GenderPrediction] = {}
+
+        async def call(batch: list[str]):
+            payload = [{"first_name": name, "id": name} for name in batch]
+            async with semaphore:
+                start_time = time.perf_counter()
+                try:
+                    response = await self.http_client.post(
+                        self.gender_api_batch_url, headers=headers, json=payload
+                    )
+                    response.raise_for_status()
+                    data = response.json()
+                    if not isinstance(data, list):
+                        raise ValueError(f"expected a list, got {type(data).__name__}")
+                except Exception as e:
+                    logger.error(
+                        f"GenderAPI bulk request for {len(batch)} names failed: {e}"
+                    )
+                    return
+                elapsed_time = (time.perf_counter() - start_time) * 1000
+
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
+                name = (item.get("input") or {}).get("id")
+                if name not in batch:
+                    continue
+                gender = (item.get("gender") or "unknown").lower()
+                if gender not in ["male", "female"]:
+                    gender = "unknown"
+                results[name] = GenderPrediction(
+                    gender=gender,
+                    confidence=item.get("probability", 0),
+                    source="genderapi",
+                )
+            logger.info(
+                f"GenderAPI bulk call for {len(batch)} names (took {elapsed_time:.2f}ms)"
+            )
+
+        await asyncio.gather(
+            *(
+                call(normalized_names[start : start + GENDER_API_BATCH_SIZE])
+                for start in range(0, len(normalized_names), GENDER_API_BATCH_SIZE)
+            )
+        )
         return results
 
     async def close(self):
@@ -348,7 +489,7 @@ class GenderService:
 
     async def get_stats(self) -> dict:
         """Get statistics about the service and model."""
-        metadata = self.model.get("metadata", {})
+        metadata = self.model.metadata
 
         # Get Redis cache stats
         cache_stats = {}
@@ -367,7 +508,7 @@ class GenderService:
 
         return {
             "model": {
-                "version": self.model.get("version", "unknown"),
+                "version": self.model.version,
                 "total_names": metadata.get("total_names", 0),
                 "high_confidence_names": metadata.get("high_confidence_names", 0),
                 "confidence_threshold": self.confidence_threshold,
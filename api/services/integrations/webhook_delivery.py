@@ -0,0 +1,447 @@
+"""Durable delivery of post-call webhooks.
+
+When a workflow run completes, each enabled webhook node is rendered once and
+written to the ``webhook_deliveries`` outbox. ``WebhookDeliveryEngine`` then
+sends due rows:
+
+- Concurrently (bounded by ``WEBHOOK_DELIVERY_CONCURRENCY``) over the pooled
+  keep-alive clients of the HTTP tool engine, instead of one fresh client per
+  webhook, sequentially.
+- With an ``Idempotency-Key`` header that is stable across retries, so
+  receivers can drop duplicates.
+- Retrying timeouts, network errors, 408/425/429 and 5xx responses with
+  jittered exponential backoff (honouring ``Retry-After``) until the delivery's
+  attempt budget is spent. Other 4xx responses fail immediately.
+- Rate limited per destination host, so a burst of campaign calls does not
+  flood one CRM. A request over the limit waits briefly for the limit to free
+  up, then is deferred to the next delivery pass. Deferrals do not count as
+  attempts.
+- Optionally batched: webhook nodes with ``batch_config.enabled`` collect the
+  events of many runs for up to ``window_seconds`` and send them as one
+  ``{"events": [...]}`` request. The members of a batch are fixed when it is
+  first sent, so its retries carry the same events and idempotency key.
+
+Rows are claimed with ``FOR UPDATE SKIP LOCKED`` and a lease, so several ARQ
+workers can deliver in parallel and rows held by a crashed worker are picked
+up again once the lease expires.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+from api.constants import (
+    WEBHOOK_DELIVERY_CONCURRENCY,
+    WEBHOOK_DELIVERY_TIMEOUT_SECONDS,
+    WEBHOOK_MAX_ATTEMPTS,
+    WEBHOOK_RATE_LIMIT_PER_HOST,
+    WEBHOOK_RETRY_BASE_SECONDS,
+    WEBHOOK_RETRY_MAX_SECONDS,
+)
+from api.db import db_client
+from api.services.campaign.rate_limiter import rate_limiter
+from api.services.workflow.tools.http_tool_engine import get_http_tool_engine
+from api.utils.credential_auth import build_auth_header
+from api.utils.template_renderer import render_template
+
+# Rows claimed per delivery pass
+DELIVERY_BATCH_LIMIT = 200
+
+# Interval of the periodic delivery pass (deliver_pending_webhooks)
+DELIVERY_POLL_SECONDS = 15
+
+# How long a request over the per-host rate limit waits for a token before it
+# is deferred to the next delivery pass
+RATE_LIMIT_WAIT_SECONDS = 3.0
+
+# Prefix of the batch key of batches whose members are fixed (see _pin_batch)
+PINNED_BATCH_PREFIX = "pinned-"
+
+# Fraction of the backoff delay randomized to spread retries out
+RETRY_JITTER = 0.2
+
+_RETRYABLE_STATUS_CODES = {408, 425, 429}
+_BATCHABLE_METHODS = {"POST", "PUT", "PATCH"}
+
+
+def build_webhook_deliveries(
+    webhook_nodes: List[Dict[str, Any]],
+    render_context: Dict[str, Any],
+    organization_id: int,
+    workflow_run_id: int,
+    workflow_id: int,
+) -> List[Dict[str, Any]]:
+    """Render webhook nodes into outbox rows.
+
+    Disabled nodes and nodes without an endpoint URL are skipped. The
+    idempotency key is derived from the run and node, so re-running the
+    post-run task does not queue a second delivery. Batched nodes share a
+    batch key per workflow node and request configuration (destination,
+    headers and credential), since a batch is sent with its first row's.
+
+    Returns:
+        Values for ``WebhookDeliveryModel`` rows.
+    """
+    now = datetime.now(UTC)
+    deliveries = []
+    for position, node in enumerate(webhook_nodes):
+        data = node.get("data", {})
+        webhook_name = data.get("name", "Unnamed Webhook")
+
+        if not data.get("enabled", True):
+            logger.debug(f"Webhook '{webhook_name}' is disabled, skipping")
+            continue
+
+        url = data.get("endpoint_url")
+        if not url:
+            logger.warning(f"Webhook '{webhook_name}' has no endpoint URL")
+            continue
+
+        method = data.get("http_method", "POST").upper()
+        node_id = node.get("id", position)
+        custom_headers = {
+            h["key"]: h["value"]
+            for h in data.get("custom_headers", [])
+            if h.get("key") and h.get("value")
+        }
+
+        max_attempts = WEBHOOK_MAX_ATTEMPTS
+        retry_base_seconds = WEBHOOK_RETRY_BASE_SECONDS
+        retry_config = data.get("retry_config") or {}
+        if retry_config.get("enabled"):
+            max_attempts = int(retry_config.get("max_retries", 3)) + 1
+            retry_base_seconds = float(retry_config.get("retry_delay_seconds", 5))
+
+        batch_key = None
+        batch_max_size = None
+        next_attempt_at = now
+        batch_config = data.get("batch_config") or {}
+        if batch_config.get("enabled") and method in _BATCHABLE_METHODS:
+            # One batch stream per workflow webhook node and request config
+            batch_key = hashlib.sha256(
+                json.dumps(
+                    [
+                        organization_id,
+                        workflow_id,
+                        node_id,
+                        method,
+                        url,
+                        data.get("credential_uuid"),
+                        custom_headers,
+                    ],
+                    sort_keys=True,
+                ).encode()
+            ).hexdigest()
+            batch_max_size = int(batch_config.get("max_events", 100))
+            next_attempt_at = now + timedelta(
+                seconds=int(batch_config.get("window_seconds", 30))
+            )
+
+        deliveries.append(
+            {
+                "organization_id": organization_id,
+                "workflow_run_id": workflow_run_id,
+                "webhook_name": webhook_name,
+                "http_method": method,
+                "endpoint_url": url,
+                "destination_host": urlsplit(url).hostname or "",
+                "custom_headers": custom_headers,
+                "credential_uuid": data.get("credential_uuid"),
+                "payload": render_template(
+                    data.get("payload_template", {}), render_context
+                ),
+                "idempotency_key": f"run-{workflow_run_id}-node-{node_id}",
+                "batch_key": batch_key,
+                "batch_max_size": batch_max_size,
+                "status": "pending",
+                "attempts": 0,
+                "max_attempts": max_attempts,
+                "retry_base_seconds": retry_base_seconds,
+                "next_attempt_at": next_attempt_at,
+                "created_at": now,
+            }
+        )
+    return deliveries
+
+
+def is_retryable_status(status_code: int) -> bool:
+    """Whether a response status is worth retrying."""
+    return status_code in _RETRYABLE_STATUS_CODES or status_code >= 500
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait according to a ``Retry-After`` header, if parseable."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def retry_delay(
+    attempts: int,
+    base_seconds: float,
+    retry_after: Optional[float] = None,
+    max_seconds: float = WEBHOOK_RETRY_MAX_SECONDS,
+) -> float:
+    """Delay before the next attempt after ``attempts`` failed ones.
+
+    Exponential backoff with ±``RETRY_JITTER`` jitter, capped at
+    ``max_seconds``. A server-provided ``Retry-After`` is used as a lower
+    bound.
+    """
+    delay = min(base_seconds * 2 ** max(attempts - 1, 0), max_seconds)
+    delay *= 1 + random.uniform(-RETRY_JITTER, RETRY_JITTER)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, max_seconds))
+    return delay
+
+
+def group_deliveries(rows: Sequence[Any]) -> List[List[Any]]:
+    """Split claimed rows into requests: batches by key, others one each."""
+    groups: List[List[Any]] = []
+    batches: Dict[str, List[Any]] = {}
+    for row in rows:
+        if row.batch_key:
+            batches.setdefault(row.batch_key, []).append(row)
+        else:
+            groups.append([row])
+    for members in batches.values():
+        members.sort(key=lambda row: row.id)
+        size = max(members[0].batch_max_size or 1, 1)
+        groups.extend(members[i : i + size] for i in range(0, len(members), size))
+    return groups
+
+
+class WebhookDeliveryEngine:
+    """Sends due webhook deliveries from the outbox."""
+
+    def __init__(
+        self,
+        concurrency: int = WEBHOOK_DELIVERY_CONCURRENCY,
+        timeout_seconds: float = WEBHOOK_DELIVERY_TIMEOUT_SECONDS,
+        rate_limit_per_host: int = WEBHOOK_RATE_LIMIT_PER_HOST,
+    ) -> None:
+        self._concurrency = max(concurrency, 1)
+        self._timeout_seconds = timeout_seconds
+        self._rate_limit_per_host = rate_limit_per_host
+
+    async def deliver_due(
+        self,
+        limit: int = DELIVERY_BATCH_LIMIT,
+        ids: Optional[Sequence[int]] = None,
+    ) -> Dict[str, int]:
+        """Claim and send due deliveries.
+
+        Args:
+            limit: Maximum number of due rows to claim.
+            ids: Only deliver these rows (if due).
+
+        Returns:
+            Counts of claimed rows and of outcomes per request.
+        """
+        # The lease must cover queueing behind the concurrency limit
+        rounds = math.ceil(limit / self._concurrency)
+        lease_seconds = rounds * (self._timeout_seconds + RATE_LIMIT_WAIT_SECONDS) + 60
+        rows = await db_client.claim_due_webhook_deliveries(
+            limit, lease_seconds, ids=ids
+        )
+        summary = {
+            "claimed": len(rows),
+            "delivered": 0,
+            "retrying": 0,
+            "failed": 0,
+            "deferred": 0,
+        }
+        if not rows:
+            return summary
+
+        credentials = await self._resolve_credentials(rows)
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def send(group):
+            async with semaphore:
+                outcome = await self._send_group(group, credentials)
+                summary[outcome] += 1
+
+        await asyncio.gather(*(send(group) for group in group_deliveries(rows)))
+        return summary
+
+    async def _resolve_credentials(
+        self, rows: Sequence[Any]
+    ) -> Dict[Tuple[int, str], Dict[str, str]]:
+        """Auth headers of every credential used by ``rows``, fetched once."""
+        keys = {
+            (row.organization_id, row.credential_uuid)
+            for row in rows
+            if row.credential_uuid
+        }
+        headers: Dict[Tuple[int, str], Dict[str, str]] = {}
+        for organization_id, credential_uuid in keys:
+            credential = await db_client.get_credential_by_uuid(
+                credential_uuid, organization_id
+            )
+            if credential:
+                headers[(organization_id, credential_uuid)] = build_auth_header(
+                    credential
+                )
+            else:
+                logger.warning(f"Credential {credential_uuid} not found for webhook")
+        return headers
+
+    async def _acquire_rate_limit_token(self, host: str) -> bool:
+        """Take a token of the host's rate limit, waiting up to
+        ``RATE_LIMIT_WAIT_SECONDS`` for one."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + RATE_LIMIT_WAIT_SECONDS
+        while True:
+            if await rate_limiter.acquire_keyed_token(
+                f"webhook:{host}", self._rate_limit_per_host
+            ):
+                return True
+            # Tokens free up as the limiter's one second window slides
+            delay = random.uniform(0.5, 1.5) / max(self._rate_limit_per_host, 1)
+            if loop.time() + delay > deadline:
+                return False
+            await asyncio.sleep(delay)
+
+    async def _pin_batch(self, group: List[Any]) -> str:
+        """Fix the members of a batch before its first request.
+
+        The rows get a batch key of their own, so retries send the same events
+        (rows queued since are not merged in) with the same idempotency key,
+        even if this worker dies mid-request and the rows are claimed again.
+        """
+        batch_key = PINNED_BATCH_PREFIX + (
+            hashlib.sha256(
+                "\n".join(row.idempotency_key for row in group).encode()
+            ).hexdigest()
+        )
+        await db_client.pin_webhook_batch([row.id for row in group], batch_key)
+        return batch_key
+
+    async def _send_group(
+        self,
+        group: List[Any],
+        credentials: Dict[Tuple[int, str], Dict[str, str]],
+    ) -> str:
+        """Send one request for ``group`` and record the outcome."""
+        first = group[0]
+        ids = [row.id for row in group]
+
+        if not await self._acquire_rate_limit_token(first.destination_host):
+            await db_client.record_webhook_delivery_attempt(
+                ids,
+                "pending",
+                error="Destination rate limit reached",
+                next_attempt_at=datetime.now(UTC)
+                + timedelta(seconds=DELIVERY_POLL_SECONDS),
+                count_attempt=False,
+            )
+            return "deferred"
+
+        batch_key = first.batch_key
+        if batch_key and not batch_key.startswith(PINNED_BATCH_PREFIX):
+            batch_key = await self._pin_batch(group)
+
+        headers = {"Content-Type": "application/json"}
+        if first.credential_uuid:
+            headers.update(
+                credentials.get((first.organization_id, first.credential_uuid), {})
+            )
+        headers.update(first.custom_headers or {})
+
+        if len(group) == 1:
+            idempotency_key = first.idempotency_key
+            body = first.payload
+        else:
+            idempotency_key = "batch-" + batch_key.removeprefix(PINNED_BATCH_PREFIX)
+            body = {"events": [row.payload for row in group]}
+        headers["Idempotency-Key"] = idempotency_key
+        if first.http_method not in _BATCHABLE_METHODS:
+            body = None
+
+        label = f"'{first.webhook_name}'" + (
+            f" (batch of {len(group)})" if len(group) > 1 else ""
+        )
+        attempts = max(row.attempts for row in group) + 1
+        max_attempts = min(row.max_attempts for row in group)
+        status_code = None
+        retry_after = None
+        try:
+            response, timing = await get_http_tool_engine().request(
+                first.http_method,
+                first.endpoint_url,
+                headers,
+                body,
+                None,
+                self._timeout_seconds,
+            )
+            status_code = response.status_code
+            if response.is_success:
+                await db_client.record_webhook_delivery_attempt(
+                    ids, "delivered", status_code=status_code
+                )
+                logger.info(
+                    f"Webhook {label} delivered: {status_code} "
+                    f"in {timing.total_ms:.0f}ms (attempt {attempts})"
+                )
+                return "delivered"
+            error = f"HTTP {status_code}: {response.text[:200]}"
+            retryable = is_retryable_status(status_code)
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        except httpx.RequestError as e:
+            error = f"{type(e).__name__}: {e}"
+            retryable = True
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            retryable = False
+
+        if retryable and attempts < max_attempts:
+            delay = retry_delay(attempts, first.retry_base_seconds, retry_after)
+            await db_client.record_webhook_delivery_attempt(
+                ids,
+                "pending",
+                status_code=status_code,
+                error=error,
+                next_attempt_at=datetime.now(UTC) + timedelta(seconds=delay),
+            )
+            logger.warning(
+                f"Webhook {label} attempt {attempts}/{max_attempts} failed, "
+                f"retrying in {delay:.0f}s: {error}"
+            )
+            return "retrying"
+
+        await db_client.record_webhook_delivery_attempt(
+            ids, "failed", status_code=status_code, error=error
+        )
+        logger.error(f"Webhook {label} failed after {attempts} attempt(s): {error}")
+        return "failed"
+
+
+# Global webhook delivery engine instance
+_webhook_delivery_engine: Optional[WebhookDeliveryEngine] = None
+
+
+def get_webhook_delivery_engine() -> WebhookDeliveryEngine:
+    """Get or create the global webhook delivery engine instance."""
+    global _webhook_delivery_engine
+    if _webhook_delivery_engine is None:
+        _webhook_delivery_engine = WebhookDeliveryEngine()
+    return _webhook_delivery_engine
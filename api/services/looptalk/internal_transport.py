@@ -28,6 +28,7 @@ from pipecat.processors.frame_processor import FrameDirection
 from pipecat.transports.base_input import BaseInputTransport
 from pipecat.transports.base_output import BaseOutputTransport
 from pipecat.transports.base_transport import BaseTransport, TransportParams
+from pipecat.utils.media_clock import MediaPacer
 
 
 class InternalInputTransport(BaseInputTransport):
@@ -219,9 +220,10 @@ class InternalOutputTransport(BaseOutputTransport):
         self._serializer = InternalFrameSerializer()
 
         # Audio timing synchronization (similar to WebsocketServerOutputTransport)
-        # _send_interval is the time interval between audio chunks in seconds
-        self._send_interval = 0
-        self._next_send_time = 0
+        self._pacer = MediaPacer(
+            send_ahead_secs=params.audio_out_send_ahead_secs,
+            use_shared_clock=params.audio_out_shared_clock,
+        )
 
     def set_partner(self, partner: InternalInputTransport):
         """Connect this output transport to an input transport."""
@@ -232,7 +234,7 @@ class InternalOutputTransport(BaseOutputTransport):
         await super().start(frame)
         await self._serializer.setup(frame)
         # Calculate the send interval based on audio chunk size (like WebsocketServerOutputTransport)
-        self._send_interval = (
+        self._pacer.set_interval(
             self._params.audio_out_10ms_chunks * 10 / 1000
         )  # Convert ms to seconds
         await self.set_transport_ready(frame)
@@ -267,23 +269,18 @@ class InternalOutputTransport(BaseOutputTransport):
     async def stop(self, frame: EndFrame):
         """Stop the output transport and reset timing."""
         await super().stop(frame)
-        self._next_send_time = 0
+        self._pacer.reset()
+        await self._pacer.close()
 
     async def cancel(self, frame: CancelFrame):
         """Cancel the output transport and reset timing."""
         await super().cancel(frame)
-        self._next_send_time = 0
+        self._pacer.reset()
+        await self._pacer.close()
 
     async def _write_audio_sleep(self):
         """Simulate audio playback timing (following WebsocketServerOutputTransport pattern)."""
-        # Simulate a clock to ensure audio is sent at real-time pace
-        current_time = time.monotonic()
-        sleep_duration = max(0, self._next_send_time - current_time)
-        await asyncio.sleep(sleep_duration)
-        if sleep_duration == 0:
-            self._next_send_time = time.monotonic() + self._send_interval
-        else:
-            self._next_send_time += self._send_interval
+        await self._pacer.wait()
 
 
 class InternalTransport(BaseTransport):
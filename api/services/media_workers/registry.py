@@ -0,0 +1,171 @@
+"""Redis registry of media worker liveness, load and call affinity.
+
+Every media worker refreshes a heartbeat key and publishes its number of open
+media sessions. API processes pick the worker for a new media session from
+that data:
+
+- A session key (e.g. the workflow run id) that was already routed goes back
+  to the same worker while it is alive, so reconnects and signaling
+  renegotiation reach the process holding the pipeline / peer connection.
+- Otherwise the live worker with the fewest sessions is chosen. The pick is
+  counted immediately so a burst of new calls between heartbeats is spread out;
+  the next heartbeat replaces the estimate with the worker's real count.
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from api.constants import (
+    MEDIA_WORKER_AFFINITY_TTL_SECONDS,
+    MEDIA_WORKER_BASE_PORT,
+    MEDIA_WORKER_HEARTBEAT_SECONDS,
+    MEDIA_WORKER_HOST,
+    REDIS_URL,
+)
+
+LOAD_KEY = "media_workers:load"
+ALIVE_KEY_PREFIX = "media_workers:alive:"
+AFFINITY_KEY_PREFIX = "media_workers:affinity:"
+
+# A worker missing this many heartbeats is considered dead
+HEARTBEAT_MISSES_ALLOWED = 3
+
+
+def worker_port(index: int) -> int:
+    """Port the media worker with ``index`` listens on."""
+    return MEDIA_WORKER_BASE_PORT + index
+
+
+def worker_url(index: int) -> str:
+    """Base websocket URL of the media worker with ``index``."""
+    return f"ws://{MEDIA_WORKER_HOST}:{worker_port(index)}"
+
+
+def select_worker(loads: Dict[int, int], sticky: Optional[int] = None) -> Optional[int]:
+    """Choose a worker among the live ones.
+
+    Args:
+        loads: Open media sessions per live worker index.
+        sticky: Worker the session was previously routed to, if any.
+
+    Returns:
+        The sticky worker if it is alive, else the least-loaded live worker
+        (lowest index on ties), or None when no worker is alive.
+    """
+    if sticky is not None and sticky in loads:
+        return sticky
+    if not loads:
+        return None
+    return min(loads, key=lambda index: (loads[index], index))
+
+
+class MediaWorkerRegistry:
+    """Tracks media workers in Redis and routes media sessions to them."""
+
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None):
+        self._redis_client = redis_client
+
+    async def _get_redis(self) -> aioredis.Redis:
+        """Get or create Redis connection."""
+        if self._redis_client is None:
+            self._redis_client = await aioredis.from_url(
+                REDIS_URL, decode_responses=True
+            )
+        return self._redis_client
+
+    async def heartbeat(self, index: int, active_sessions: int) -> None:
+        """Mark worker ``index`` alive and publish its open session count."""
+        redis_client = await self._get_redis()
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.set(
+            f"{ALIVE_KEY_PREFIX}{index}",
+            "1",
+            ex=MEDIA_WORKER_HEARTBEAT_SECONDS * HEARTBEAT_MISSES_ALLOWED,
+        )
+        pipe.hset(LOAD_KEY, str(index), active_sessions)
+        await pipe.execute()
+
+    async def deregister(self, index: int) -> None:
+        """Remove worker ``index`` from routing (on shutdown)."""
+        redis_client = await self._get_redis()
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.delete(f"{ALIVE_KEY_PREFIX}{index}")
+        pipe.hdel(LOAD_KEY, str(index))
+        await pipe.execute()
+
+    async def get_live_loads(self) -> Dict[int, int]:
+        """Open media sessions per live worker index."""
+        redis_client = await self._get_redis()
+        loads = await redis_client.hgetall(LOAD_KEY)
+        if not loads:
+            return {}
+        indexes = [int(index) for index in loads]
+        alive = await redis_client.mget(
+            [f"{ALIVE_KEY_PREFIX}{index}" for index in indexes]
+        )
+        return {
+            index: int(loads[str(index)])
+            for index, is_alive in zip(indexes, alive)
+            if is_alive
+        }
+
+    async def assign(self, session_key: str) -> Optional[int]:
+        """Pick the worker for a media session and remember the choice.
+
+        Args:
+            session_key: Affinity key of the session, e.g. ``run:<id>``.
+
+        Returns:
+            The worker index, or None when no media worker is alive.
+        """
+        redis_client = await self._get_redis()
+        affinity_key = AFFINITY_KEY_PREFIX + session_key
+        sticky = await redis_client.get(affinity_key)
+        loads = await self.get_live_loads()
+        index = select_worker(loads, int(sticky) if sticky is not None else None)
+        if index is None:
+            return None
+
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.set(affinity_key, index, ex=MEDIA_WORKER_AFFINITY_TTL_SECONDS)
+        if sticky is None or int(sticky) != index:
+            pipe.hincrby(LOAD_KEY, str(index), 1)
+        await pipe.execute()
+        return index
+
+
+# Global media worker registry instance
+_media_worker_registry: Optional[MediaWorkerRegistry] = None
+
+
+def get_media_worker_registry() -> MediaWorkerRegistry:
+    """Get or create the global media worker registry instance."""
+    global _media_worker_registry
+    if _media_worker_registry is None:
+        _media_worker_registry = MediaWorkerRegistry()
+    return _media_worker_registry
+
+
+async def run_heartbeat(index: int, get_active_sessions) -> None:
+    """Publish this worker's heartbeat and load until cancelled.
+
+    Args:
+        index: This media worker's index.
+        get_active_sessions: Returns the current number of open media sessions.
+    """
+    registry = get_media_worker_registry()
+    try:
+        while True:
+            try:
+                await registry.heartbeat(index, get_active_sessions())
+            except Exception as e:
+                logger.warning(f"Media worker {index} heartbeat failed: {e}")
+            await asyncio.sleep(MEDIA_WORKER_HEARTBEAT_SECONDS)
+    finally:
+        try:
+            await registry.deregister(index)
+        except Exception as e:
+            logger.warning(f"Media worker {index} failed to deregister: {e}")
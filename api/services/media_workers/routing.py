@@ -0,0 +1,257 @@
+"""Routing of call media websockets to media workers.
+
+With ``MEDIA_WORKER_PUBLIC_URL`` configured, ``media_stream_endpoint`` assigns
+a run to a media worker when its telephony stream URL is handed to the
+provider, so the provider streams call audio to that worker directly and the
+API process never touches it.
+
+In the API process, ``MediaWorkerRouterMiddleware`` relays the media
+websockets that still reach it (WebRTC signaling, whose media flows over the
+peer connection, ARI, and telephony streams when workers have no public URL)
+to the media worker chosen by ``MediaWorkerRegistry``. The pipeline, and for
+WebRTC the peer connection, then lives in that worker; the API process only
+forwards websocket messages. Everything else (dashboard routes, webhooks)
+stays in the API process.
+
+In a media worker, ``MediaSessionCounterMiddleware`` counts the open media
+sessions reported with the worker's heartbeat.
+"""
+
+import asyncio
+import re
+from typing import Optional
+from urllib.parse import parse_qs
+
+from loguru import logger
+from websockets.asyncio.client import connect
+from websockets.exceptions import ConnectionClosed, InvalidStatus
+
+from api.constants import MEDIA_WORKER_PUBLIC_URL, MEDIA_WORKERS
+from api.services.media_workers.registry import (
+    get_media_worker_registry,
+    worker_port,
+    worker_url,
+)
+
+# Seconds to wait for a media worker to accept a relayed websocket
+RELAY_OPEN_TIMEOUT_SECONDS = 5
+
+# Media websocket routes and the path group identifying the session
+_SESSION_ROUTES = [
+    (re.compile(r"/telephony/ws/\d+/\d+/(\d+)$"), "run"),
+    (re.compile(r"/ws/signaling/\d+/(\d+)$"), "run"),
+    (re.compile(r"/ws/public/signaling/([^/]+)$"), "embed"),
+]
+_ARI_ROUTE = re.compile(r"/telephony/ws/ari$")
+
+# Handshake headers set by the websocket client itself
+_HOP_BY_HOP_HEADERS = {
+    "host",
+    "connection",
+    "upgrade",
+    "content-length",
+    "sec-websocket-key",
+    "sec-websocket-version",
+    "sec-websocket-extensions",
+    "sec-websocket-protocol",
+}
+
+
+def media_session_key(scope) -> Optional[str]:
+    """Affinity key of a media websocket, or None for other websockets.
+
+    Calls are keyed by workflow run id so every connection of a run (e.g.
+    signaling reconnects) reaches the same worker.
+    """
+    path = scope.get("path", "")
+    for pattern, kind in _SESSION_ROUTES:
+        match = pattern.search(path)
+        if match:
+            return f"{kind}:{match.group(1)}"
+
+    if _ARI_ROUTE.search(path):
+        query = parse_qs(scope.get("query_string", b"").decode())
+        run_ids = query.get("workflow_run_id")
+        if run_ids:
+            return f"run:{run_ids[0]}"
+    return None
+
+
+async def media_stream_endpoint(workflow_run_id: int, wss_backend_endpoint: str) -> str:
+    """Base websocket URL a telephony provider should stream a run's audio to.
+
+    Returns the public URL of the media worker assigned to the run when media
+    workers have one, else ``wss_backend_endpoint`` (the API process, which
+    relays the stream or serves it itself).
+    """
+    if MEDIA_WORKERS <= 0 or not MEDIA_WORKER_PUBLIC_URL:
+        return wss_backend_endpoint
+    try:
+        index = await get_media_worker_registry().assign(f"run:{workflow_run_id}")
+    except Exception as e:
+        logger.warning(f"Media worker assignment failed for run {workflow_run_id}: {e}")
+        index = None
+    if index is None:
+        return wss_backend_endpoint
+    return MEDIA_WORKER_PUBLIC_URL.format(index=index, port=worker_port(index))
+
+
+def _client_close_code(code: Optional[int]) -> int:
+    # 1005/1006 are reserved and cannot be sent in a close frame
+    if code is None or code == 1005:
+        return 1000
+    if code == 1006:
+        return 1011
+    return code
+
+
+class MediaWorkerRouterMiddleware:
+    """Relays media websockets from the API process to media workers.
+
+    When no media worker is alive (or the chosen one is unreachable) the
+    session is served by this process, as without media workers.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "websocket":
+            await self.app(scope, receive, send)
+            return
+
+        session_key = media_session_key(scope)
+        if session_key is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            index = await get_media_worker_registry().assign(session_key)
+        except Exception as e:
+            logger.warning(f"Media worker assignment failed for {session_key}: {e}")
+            index = None
+
+        if index is None:
+            await self.app(scope, receive, send)
+            return
+
+        await self._relay(scope, receive, send, index, session_key)
+
+    async def _relay(self, scope, receive, send, index: int, session_key: str):
+        connect_message = await receive()
+        if connect_message["type"] != "websocket.connect":
+            return
+
+        url = worker_url(index) + scope["path"]
+        if scope.get("query_string"):
+            url += "?" + scope["query_string"].decode()
+        headers = [
+            (name.decode("latin-1"), value.decode("latin-1"))
+            for name, value in scope.get("headers", [])
+            if name.decode("latin-1").lower() not in _HOP_BY_HOP_HEADERS
+        ]
+        if scope.get("client"):
+            headers.append(("x-forwarded-for", scope["client"][0]))
+
+        try:
+            worker = await connect(
+                url,
+                additional_headers=headers,
+                subprotocols=scope.get("subprotocols") or None,
+                open_timeout=RELAY_OPEN_TIMEOUT_SECONDS,
+                max_size=None,
+                compression=None,
+                ping_interval=None,
+            )
+        except InvalidStatus as e:
+            # The worker rejected the session before accepting it
+            logger.info(
+                f"Media worker {index} rejected {session_key}: "
+                f"HTTP {e.response.status_code}"
+            )
+            await send({"type": "websocket.close", "code": 1008})
+            return
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.warning(
+                f"Media worker {index} unreachable for {session_key}, "
+                f"serving in the API process: {e}"
+            )
+            replayed = False
+
+            async def replay_receive():
+                nonlocal replayed
+                if not replayed:
+                    replayed = True
+                    return connect_message
+                return await receive()
+
+            await self.app(scope, replay_receive, send)
+            return
+
+        await send({"type": "websocket.accept", "subprotocol": worker.subprotocol})
+
+        async def client_to_worker():
+            while True:
+                message = await receive()
+                if message["type"] == "websocket.receive":
+                    data = message.get("bytes")
+                    await worker.send(data if data is not None else message["text"])
+                elif message["type"] == "websocket.disconnect":
+                    await worker.close(code=_client_close_code(message.get("code")))
+                    return
+
+        async def worker_to_client():
+            try:
+                async for data in worker:
+                    if isinstance(data, bytes):
+                        await send({"type": "websocket.send", "bytes": data})
+                    else:
+                        await send({"type": "websocket.send", "text": data})
+            except ConnectionClosed:
+                pass
+            await send(
+                {
+                    "type": "websocket.close",
+                    "code": _client_close_code(worker.close_code),
+                    "reason": worker.close_reason or "",
+                }
+            )
+
+        tasks = [
+            asyncio.create_task(client_to_worker()),
+            asyncio.create_task(worker_to_client()),
+        ]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await worker.close()
+
+
+class MediaSessionCounterMiddleware:
+    """Counts the media websockets open in a media worker."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "websocket" or media_session_key(scope) is None:
+            await self.app(scope, receive, send)
+            return
+
+        global _active_sessions
+        _active_sessions += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _active_sessions -= 1
+
+
+_active_sessions = 0
+
+
+def get_active_media_sessions() -> int:
+    """Number of media websockets open in this process."""
+    return _active_sessions
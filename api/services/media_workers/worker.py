@@ -0,0 +1,46 @@
+"""Media worker process launcher.
+
+Runs one API instance dedicated to call pipelines, listening on
+``MEDIA_WORKER_HOST:MEDIA_WORKER_BASE_PORT + index`` and (on Linux) pinned to
+one CPU core. Telephony providers stream call audio to it directly when
+``MEDIA_WORKER_PUBLIC_URL`` is set; API processes relay the other media
+websockets to it.
+
+Usage:
+    python -m api.services.media_workers.worker --index 0
+"""
+
+import argparse
+import os
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a media worker process")
+    parser.add_argument("--index", type=int, required=True, help="Media worker index")
+    args = parser.parse_args()
+
+    # Must be set before api.constants is imported
+    os.environ["MEDIA_WORKER_INDEX"] = str(args.index)
+
+    import uvicorn
+    from loguru import logger
+
+    from api.constants import MEDIA_WORKER_HOST, MEDIA_WORKER_PIN_CPUS
+    from api.services.media_workers.registry import worker_port
+
+    if MEDIA_WORKER_PIN_CPUS and hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        cpu = cpus[args.index % len(cpus)]
+        os.sched_setaffinity(0, {cpu})
+        logger.info(f"Media worker {args.index} pinned to CPU {cpu}")
+
+    uvicorn.run(
+        "api.app:app",
+        host=MEDIA_WORKER_HOST,
+        port=worker_port(args.index),
+        workers=1,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,9 @@ from api.db import db_client
 from api.enums import WorkflowRunState
 from api.services.campaign.campaign_call_dispatcher import campaign_call_dispatcher
 from api.services.pipecat.audio_config import AudioConfig
-from api.services.pipecat.in_memory_buffers import (
-    InMemoryAudioBuffer,
-    InMemoryLogsBuffer,
-    InMemoryTranscriptBuffer,
-)
+from api.services.pipecat.in_memory_buffers import InMemoryAudioBuffer
 from api.services.pipecat.pipeline_metrics_aggregator import PipelineMetricsAggregator
+from api.services.pipecat.run_log import StreamingLogsBuffer, StreamingTranscriptBuffer
 from api.services.workflow.pipecat_engine import PipecatEngine
 from api.tasks.arq import enqueue_job
 from api.tasks.function_names import FunctionNames
@@ -27,7 +24,7 @@ def register_event_handlers(
     workflow_run_id: int,
     engine: PipecatEngine,
     audio_buffer: AudioBufferProcessor,
-    in_memory_logs_buffer: InMemoryLogsBuffer,
+    in_memory_logs_buffer: StreamingLogsBuffer,
     pipeline_metrics_aggregator: PipelineMetricsAggregator,
     audio_config=AudioConfig,
 ):
@@ -50,7 +47,8 @@ def register_event_handlers(
         sample_rate=sample_rate,
         num_channels=num_channels,
     )
-    in_memory_transcript_buffer = InMemoryTranscriptBuffer(workflow_run_id)
+    # The transcript is streamed to disk (and a Redis stream) as turns complete
+    in_memory_transcript_buffer = StreamingTranscriptBuffer(workflow_run_id)
 
     # Track both events to ensure LLM is only triggered after both occur
     ready_state = {
@@ -210,16 +208,17 @@ def register_event_handlers(
         # Save real-time feedback logs to workflow run
         if not in_memory_logs_buffer.is_empty:
             try:
-                feedback_events = in_memory_logs_buffer.get_events()
-                await db_client.update_workflow_run(
-                    run_id=workflow_run_id,
-                    logs={"realtime_feedback_events": feedback_events},
-                )
-                logger.debug(
-                    f"Saved {len(feedback_events)} feedback events to workflow run logs"
+                # Events are stored as streamed, without parsing them back
+                await db_client.set_workflow_run_log(
+                    workflow_run_id,
+                    "realtime_feedback_events",
+                    await in_memory_logs_buffer.get_events_json(),
                 )
+                logger.debug("Saved feedback events to workflow run logs")
             except Exception as e:
                 logger.error(f"Error saving realtime feedback logs: {e}", exc_info=True)
+            finally:
+                await in_memory_logs_buffer.discard()
         else:
             logger.debug("Logs buffer is empty, skipping save")
 
@@ -286,7 +285,7 @@ def register_transcript_handlers(
     user_aggregator,
     assistant_aggregator,
     workflow_run_id,
-    in_memory_buffer: InMemoryTranscriptBuffer,
+    in_memory_buffer: StreamingTranscriptBuffer,
 ):
     """Register event handlers for transcript updates on context aggregators.
 
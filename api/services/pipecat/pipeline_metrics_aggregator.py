@@ -5,6 +5,7 @@ from typing import Dict, Optional
 from loguru import logger
 
 from pipecat.frames.frames import (
+    BotStartedSpeakingFrame,
     CancelFrame,
     EndFrame,
     Frame,
@@ -14,7 +15,9 @@ from pipecat.frames.frames import (
 from pipecat.metrics.metrics import (
     LLMTokenUsage,
     LLMUsageMetricsData,
+    SpeculativeGenerationMetricsData,
     STTUsageMetricsData,
+    TTSPhraseCacheMetricsData,
     TTSUsageMetricsData,
 )
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
@@ -30,9 +33,15 @@ class PipelineMetricsAggregator(FrameProcessor):
 
         self._start_time: Optional[float] = None
         self._stop_time: Optional[float] = None
+        # When the bot first started speaking, to measure the time to first audio
+        self._first_audio_time: Optional[float] = None
         self._llm_usage_metrics: Dict[str, LLMTokenUsage] = {}
         self._tts_usage_metrics: Dict[str, int] = defaultdict(int)
         self._stt_usage_metrics: Dict[str, float] = defaultdict(float)
+        # Outcomes of speculative LLM generations, summed over the call
+        self._speculative_generation_metrics: Dict[str, float] = defaultdict(float)
+        # TTS phrase cache lookups, summed over the call
+        self._tts_phrase_cache_metrics: Dict[str, float] = defaultdict(float)
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
@@ -43,6 +52,8 @@ class PipelineMetricsAggregator(FrameProcessor):
             await self._stop(frame)
         elif isinstance(frame, CancelFrame):
             await self._cancel(frame)
+        elif isinstance(frame, BotStartedSpeakingFrame):
+            await self._handle_bot_started_speaking(frame)
         elif isinstance(frame, MetricsFrame):
             for data in frame.data:
                 if isinstance(data, LLMUsageMetricsData):
@@ -51,6 +62,10 @@ class PipelineMetricsAggregator(FrameProcessor):
                     await self._handle_tts_usage_metrics(data)
                 elif isinstance(data, STTUsageMetricsData):
                     await self._handle_stt_usage_metrics(data)
+                elif isinstance(data, SpeculativeGenerationMetricsData):
+                    await self._handle_speculative_generation_metrics(data)
+                elif isinstance(data, TTSPhraseCacheMetricsData):
+                    await self._handle_tts_phrase_cache_metrics(data)
 
         await self.push_frame(frame, direction)
 
@@ -58,6 +73,7 @@ class PipelineMetricsAggregator(FrameProcessor):
         """Start tracking call duration."""
         self._start_time = time.time()
         self._stop_time = None
+        self._first_audio_time = None
 
     async def _stop(self, _: EndFrame):
         """Stop tracking call duration."""
@@ -69,6 +85,11 @@ class PipelineMetricsAggregator(FrameProcessor):
         if self._start_time is not None and self._stop_time is None:
             self._stop_time = time.time()
 
+    async def _handle_bot_started_speaking(self, _: BotStartedSpeakingFrame):
+        if self._start_time is not None and self._first_audio_time is None:
+            self._first_audio_time = time.time()
+            logger.debug(f"Time to first audio: {self.get_time_to_first_audio():.3f}s")
+
     async def _handle_llm_usage_metrics(self, data: LLMUsageMetricsData):
         key = f"{data.processor}|||{data.model}"
         new_usage = data.value
@@ -109,6 +130,27 @@ class PipelineMetricsAggregator(FrameProcessor):
         self._stt_usage_metrics[key] += data.value
         logger.debug(f"STT usage metrics: {self._stt_usage_metrics}")
 
+    async def _handle_speculative_generation_metrics(
+        self, data: SpeculativeGenerationMetricsData
+    ):
+        metrics = self._speculative_generation_metrics
+        if data.committed:
+            metrics["committed"] += 1
+            metrics["latency_saved_seconds"] += data.latency_saved
+        else:
+            metrics["discarded"] += 1
+            metrics["wasted_prompt_tokens"] += data.wasted_prompt_tokens
+            metrics["wasted_completion_tokens"] += data.wasted_completion_tokens
+        logger.debug(f"Speculative generation metrics: {dict(metrics)}")
+
+    async def _handle_tts_phrase_cache_metrics(self, data: TTSPhraseCacheMetricsData):
+        metrics = self._tts_phrase_cache_metrics
+        if data.hit:
+            metrics["hits"] += 1
+            metrics["ttfa_saved_seconds"] += data.ttfa_saved
+        else:
+            metrics["misses"] += 1
+
     def get_llm_usage_metrics(self) -> Dict[str, LLMTokenUsage]:
         """Get the aggregated LLM usage metrics grouped by processor|||model."""
         return self._llm_usage_metrics
@@ -121,6 +163,38 @@ class PipelineMetricsAggregator(FrameProcessor):
         """Get the aggregated STT usage metrics grouped by processor|||model."""
         return self._stt_usage_metrics
 
+    def get_speculative_generation_metrics(self) -> Dict[str, float]:
+        """Get the committed/discarded counts, wasted tokens and latency saved
+        by speculative LLM generation."""
+        metrics = self._speculative_generation_metrics
+        return {
+            "committed": int(metrics["committed"]),
+            "discarded": int(metrics["discarded"]),
+            "wasted_prompt_tokens": int(metrics["wasted_prompt_tokens"]),
+            "wasted_completion_tokens": int(metrics["wasted_completion_tokens"]),
+            "latency_saved_seconds": round(metrics["latency_saved_seconds"], 3),
+        }
+
+    def get_tts_phrase_cache_metrics(self) -> Dict[str, float]:
+        """Get the hits, misses, hit rate and time to first audio saved by the
+        TTS phrase cache."""
+        metrics = self._tts_phrase_cache_metrics
+        hits = int(metrics["hits"])
+        lookups = hits + int(metrics["misses"])
+        return {
+            "hits": hits,
+            "misses": lookups - hits,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "ttfa_saved_seconds": round(metrics["ttfa_saved_seconds"], 3),
+        }
+
+    def get_time_to_first_audio(self) -> Optional[float]:
+        """Get the time from the start of the call until the bot first spoke,
+        or None if it hasn't spoken."""
+        if self._start_time is None or self._first_audio_time is None:
+            return None
+        return self._first_audio_time - self._start_time
+
     def get_call_duration(self) -> float:
         """Get call duration"""
         if self._start_time is None:
@@ -146,17 +220,30 @@ class PipelineMetricsAggregator(FrameProcessor):
                 "cache_creation_input_tokens": usage.cache_creation_input_tokens,
             }
 
-        return {
+        serialized = {
             "llm": serialized_llm,
             "tts": dict(self._tts_usage_metrics),
             "stt": dict(self._stt_usage_metrics),
             "call_duration_seconds": self.get_call_duration(),
         }
+        time_to_first_audio = self.get_time_to_first_audio()
+        if time_to_first_audio is not None:
+            serialized["time_to_first_audio_seconds"] = round(time_to_first_audio, 3)
+        if self._speculative_generation_metrics:
+            serialized["speculative_generation"] = (
+                self.get_speculative_generation_metrics()
+            )
+        if self._tts_phrase_cache_metrics:
+            serialized["tts_phrase_cache"] = self.get_tts_phrase_cache_metrics()
+        return serialized
 
     def reset_metrics(self):
         """Reset all aggregated metrics."""
         self._llm_usage_metrics.clear()
         self._tts_usage_metrics.clear()
         self._stt_usage_metrics.clear()
+        self._speculative_generation_metrics.clear()
+        self._tts_phrase_cache_metrics.clear()
         self._start_time = None
         self._stop_time = None
+        self._first_audio_time = None
@@ -4,9 +4,19 @@ This observer watches pipeline frames and sends relevant events (transcriptions,
 bot text, function calls, TTFB metrics) over WebSocket to provide real-time
 feedback in the UI.
 
+Observing a frame is kept off the pipeline's path: ``on_push_frame`` only
+records a compact event in a bounded ring (the oldest events are dropped if
+the ring is full) and wakes a background drainer. The drainer turns the events
+into UI messages, coalesces them (only the latest of consecutive interim
+transcriptions, consecutive bot text merged into one message) and sends at most
+one batch per ``send_interval``, so a slow browser socket only delays the UI.
+Messages go to the WebSocket sender registered for the workflow run, if any
+(the browser may disconnect mid-call), and always to the logs buffer. Without
+a logs buffer nor a sender when the observer is created, frames are ignored.
+
 For frames with presentation timestamps (pts), like TTSTextFrame, we respect
-the timing by queuing them and sending at the appropriate time, similar to
-how base_output.py handles timed frames.
+the timing by holding them until their time has come, similar to how
+base_output.py handles timed frames.
 
 Note: Node transition events are sent directly from PipecatEngine.set_node()
 rather than being observed here, to ensure precise timing at the moment of
@@ -14,13 +24,18 @@ node changes.
 """
 
 import asyncio
+import heapq
+import re
 import time
-from typing import TYPE_CHECKING, Awaitable, Callable, Optional, Set
+from collections import deque
+from typing import TYPE_CHECKING, Optional
 
 from loguru import logger
 
+from api.services.pipecat.ws_sender_registry import find_ws_sender, get_ws_sender
+
 if TYPE_CHECKING:
-    from api.services.pipecat.in_memory_buffers import InMemoryLogsBuffer
+    from api.services.pipecat.run_log import StreamingLogsBuffer
 
 from pipecat.frames.frames import (
     CancelFrame,
@@ -39,6 +54,106 @@ from pipecat.observers.base_observer import BaseObserver, FramePushed
 from pipecat.processors.frame_processor import FrameDirection
 from pipecat.utils.time import nanoseconds_to_seconds
 
+# Events waiting for the drainer; the oldest are dropped beyond this
+MAX_PENDING_EVENTS = 1024
+# Minimum time between two batches of UI messages
+SEND_INTERVAL_SECONDS = 0.05
+# Frame ids remembered to skip frames observed more than once
+SEEN_FRAMES_SIZE = 512
+
+_TERMINATION_FRAMES = (EndFrame, CancelFrame, StopFrame)
+_OBSERVED_FRAMES = (
+    InterruptionFrame,
+    TranscriptionFrame,
+    InterimTranscriptionFrame,
+    TTSTextFrame,
+    FunctionCallInProgressFrame,
+    FunctionCallResultFrame,
+    MetricsFrame,
+)
+
+# Event kinds, the first item of the event tuples in the ring
+_INTERRUPTION = 0
+_USER_TRANSCRIPTION = 1  # (kind, text, final, user_id, timestamp)
+_BOT_TEXT = 2  # (kind, text, pts, observed_at)
+_FUNCTION_CALL_START = 3  # (kind, function_name, tool_call_id)
+_FUNCTION_CALL_END = 4  # (kind, function_name, tool_call_id, result)
+_TTFB_METRIC = 5  # (kind, ttfb_seconds, processor, model)
+
+# Same rule as the UI when it appends bot text to the current message
+_NO_SPACE_BEFORE = re.compile(r"^[\s.,!?;:]")
+
+
+def _join_bot_text(text: str, more: str) -> str:
+    if not text or text.endswith(" ") or _NO_SPACE_BEFORE.match(more):
+        return text + more
+    return f"{text} {more}"
+
+
+def _coalesce(messages: list[dict]) -> list[dict]:
+    """Keep the latest of consecutive interim transcriptions and merge consecutive bot text."""
+    coalesced: list[dict] = []
+    for message in messages:
+        previous = coalesced[-1] if coalesced else None
+        if previous is not None and previous["type"] == message["type"]:
+            if message["type"] == "rtf-bot-text":
+                text = _join_bot_text(
+                    previous["payload"]["text"], message["payload"]["text"]
+                )
+                coalesced[-1] = {"type": "rtf-bot-text", "payload": {"text": text}}
+                continue
+            if (
+                message["type"] == "rtf-user-transcription"
+                and not previous["payload"]["final"]
+                and not message["payload"]["final"]
+            ):
+                coalesced[-1] = message
+                continue
+        coalesced.append(message)
+    return coalesced
+
+
+def _to_message(event: tuple) -> dict:
+    kind = event[0]
+    if kind == _USER_TRANSCRIPTION:
+        _, text, final, user_id, timestamp = event
+        return {
+            "type": "rtf-user-transcription",
+            "payload": {
+                "text": text,
+                "final": final,
+                "user_id": user_id,
+                "timestamp": timestamp,
+            },
+        }
+    if kind == _BOT_TEXT:
+        return {"type": "rtf-bot-text", "payload": {"text": event[1]}}
+    if kind == _FUNCTION_CALL_START:
+        _, function_name, tool_call_id = event
+        return {
+            "type": "rtf-function-call-start",
+            "payload": {"function_name": function_name, "tool_call_id": tool_call_id},
+        }
+    if kind == _FUNCTION_CALL_END:
+        _, function_name, tool_call_id, result = event
+        return {
+            "type": "rtf-function-call-end",
+            "payload": {
+                "function_name": function_name,
+                "tool_call_id": tool_call_id,
+                "result": str(result) if result else None,
+            },
+        }
+    _, ttfb_seconds, processor, model = event
+    return {
+        "type": "rtf-ttfb-metric",
+        "payload": {
+            "ttfb_seconds": ttfb_seconds,
+            "processor": processor,
+            "model": model,
+        },
+    }
+
 
 class RealtimeFeedbackObserver(BaseObserver):
     """Observer that sends real-time transcription, bot response, and metrics via WebSocket.
@@ -49,230 +164,222 @@ class RealtimeFeedbackObserver(BaseObserver):
     - Function calls (start/end)
     - TTFB metrics (LLM generation time only - filters to processors containing "LLM")
 
-    For frames with pts (presentation timestamp), we queue them and send at the
-    appropriate time to sync with audio playback.
+    Events are sent to the WebSocket sender registered for the workflow run (see
+    ws_sender_registry) by a background drainer, and appended to the logs buffer.
 
     Note: Node transitions are handled by PipecatEngine.set_node() callback.
     """
 
     def __init__(
         self,
-        ws_sender: Callable[[dict], Awaitable[None]],
-        logs_buffer: Optional["InMemoryLogsBuffer"] = None,
+        workflow_run_id: int,
+        logs_buffer: Optional["StreamingLogsBuffer"] = None,
+        max_pending_events: int = MAX_PENDING_EVENTS,
+        send_interval: float = SEND_INTERVAL_SECONDS,
     ):
         """
         Args:
-            ws_sender: Async function to send messages over WebSocket.
-                       Expected signature: async def send(message: dict) -> None
-            logs_buffer: Optional InMemoryLogsBuffer to persist events for post-call analysis.
+            workflow_run_id: The workflow run whose WebSocket sender receives the events.
+            logs_buffer: Optional StreamingLogsBuffer to persist events for post-call analysis.
+            max_pending_events: Size of the ring of events waiting for the drainer.
+            send_interval: Minimum time in seconds between two batches of UI messages.
         """
         super().__init__()
-        self._ws_sender = ws_sender
+        self._workflow_run_id = workflow_run_id
         self._logs_buffer = logs_buffer
-        self._frames_seen: Set[str] = set()
+        self._send_interval = send_interval
+        # Nobody to send events to, decided once
+        self._enabled = (
+            logs_buffer is not None or get_ws_sender(workflow_run_id) is not None
+        )
 
-        # Clock/timing for pts-based frames (similar to base_output.py)
-        self._clock_queue: Optional[asyncio.PriorityQueue] = None
-        self._clock_task: Optional[asyncio.Task] = None
+        self._events: deque[tuple] = deque(maxlen=max_pending_events)
+        self._dropped_events = 0
+        self._seen_ids: set[int] = set()
+        self._seen_order: deque[int] = deque()
+        self._wakeup = asyncio.Event()
+        self._drainer_task: Optional[asyncio.Task] = None
+        self._stopped = False
+
+        # Pending timed bot text (target time, order, text), owned by the drainer
+        self._timed_text: list[tuple[float, int, str]] = []
+        self._timed_count = 0
         self._clock_start_time: Optional[float] = (
             None  # Wall clock time when we started
         )
         self._pts_start_time: Optional[int] = None  # First pts value we saw
 
-    async def _ensure_clock_task(self):
-        """Create the clock task if it doesn't exist."""
-        if self._clock_queue is None:
-            self._clock_queue = asyncio.PriorityQueue()
-            self._clock_task = asyncio.create_task(self._clock_task_handler())
-
-    async def _cancel_clock_task(self):
-        """Cancel the clock task and clear the queue.
+    @property
+    def dropped_events(self) -> int:
+        """Events dropped because the ring was full."""
+        return self._dropped_events
 
-        Called on interruption to discard any pending bot text that
-        hasn't been sent yet.
-        """
-        if self._clock_task:
-            self._clock_task.cancel()
-            try:
-                await self._clock_task
-            except asyncio.CancelledError:
-                pass
-            self._clock_task = None
-        self._clock_queue = None
-        # Reset timing references so next bot response starts fresh
-        self._clock_start_time = None
-        self._pts_start_time = None
-
-    async def _handle_interruption(self):
-        """Handle interruption by clearing queued bot text.
+    async def on_push_frame(self, data: FramePushed):
+        """Record the events of relevant frames for the drainer."""
+        if not self._enabled:
+            return
 
-        Similar to base_output.py's handle_interruptions, we cancel the
-        clock task and recreate it to discard pending frames.
-        """
-        await self._cancel_clock_task()
+        frame = data.frame
+        if isinstance(frame, _TERMINATION_FRAMES):
+            if not self._stopped:
+                self._stopped = True
+                self._wakeup.set()
+            return
 
-    async def _clock_task_handler(self):
-        """Process timed frames from the queue, respecting their presentation timestamps.
+        if self._stopped or not isinstance(frame, _OBSERVED_FRAMES):
+            return
 
-        Similar to base_output.py's _clock_task_handler, we wait until the
-        frame's pts time has arrived before sending.
-        """
-        while True:
-            try:
-                pts, _frame_id, message = await self._clock_queue.get()
+        # Skip already processed frames (frames can be observed multiple times)
+        if frame.id in self._seen_ids:
+            return
+        self._seen_ids.add(frame.id)
+        self._seen_order.append(frame.id)
+        if len(self._seen_order) > SEEN_FRAMES_SIZE:
+            self._seen_ids.discard(self._seen_order.popleft())
 
-                # Calculate when to send based on pts relative to our start time
+        if isinstance(frame, InterruptionFrame):
+            self._record((_INTERRUPTION,))
+        elif isinstance(frame, (InterimTranscriptionFrame, TranscriptionFrame)):
+            self._record(
+                (
+                    _USER_TRANSCRIPTION,
+                    frame.text,
+                    isinstance(frame, TranscriptionFrame),
+                    frame.user_id,
+                    frame.timestamp,
+                )
+            )
+        elif isinstance(frame, TTSTextFrame):
+            self._record((_BOT_TEXT, frame.text, frame.pts, time.time()))
+        elif isinstance(frame, MetricsFrame):
+            for metric_data in frame.data:
+                # Only LLM generation time
                 if (
-                    self._clock_start_time is not None
-                    and self._pts_start_time is not None
+                    isinstance(metric_data, TTFBMetricsData)
+                    and metric_data.processor
+                    and "LLM" in metric_data.processor
                 ):
-                    # Target time = start wall time + (frame pts - start pts) in seconds
-                    target_time = self._clock_start_time + nanoseconds_to_seconds(
-                        pts - self._pts_start_time
+                    self._record(
+                        (
+                            _TTFB_METRIC,
+                            metric_data.value,
+                            metric_data.processor,
+                            metric_data.model,
+                        )
                     )
-                    current_time = time.time()
-                    if target_time > current_time:
-                        await asyncio.sleep(target_time - current_time)
-
-                # Send the message
-                await self._send_message(message)
-                self._clock_queue.task_done()
+        elif data.direction == FrameDirection.DOWNSTREAM:
+            if isinstance(frame, FunctionCallInProgressFrame):
+                self._record(
+                    (_FUNCTION_CALL_START, frame.function_name, frame.tool_call_id)
+                )
+            else:
+                self._record(
+                    (
+                        _FUNCTION_CALL_END,
+                        frame.function_name,
+                        frame.tool_call_id,
+                        frame.result,
+                    )
+                )
+
+    async def cleanup(self):
+        """Stop the drainer if the pipeline ended without a termination frame reaching us."""
+        await super().cleanup()
+        self._stopped = True
+        if self._drainer_task and not self._drainer_task.done():
+            self._drainer_task.cancel()
+            try:
+                await self._drainer_task
             except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.debug(f"Clock task error: {e}")
+                pass
 
-    async def on_push_frame(self, data: FramePushed):
-        """Process frames and send relevant ones to the client."""
-        frame = data.frame
-        frame_direction = data.direction
+    def _record(self, event: tuple):
+        if len(self._events) == self._events.maxlen:
+            self._dropped_events += 1
+        self._events.append(event)
+        self._wakeup.set()
+        if self._drainer_task is None:
+            self._drainer_task = asyncio.create_task(self._drain())
 
-        logger.trace(f"{self} Received Frame: {frame} Direction: {frame_direction}")
+    async def _drain(self):
+        """Send the recorded events as UI messages, one batch per send interval."""
+        while True:
+            timeout = None
+            if self._timed_text:
+                timeout = max(0.0, self._timed_text[0][0] - time.time())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
 
-        # Handle pipeline termination - stop clock task
-        if isinstance(frame, (EndFrame, CancelFrame, StopFrame)):
-            await self._cancel_clock_task()
-            return
+            messages = self._take_messages()
+            if self._stopped:
+                # Bot text that hasn't been spoken yet is dropped, as on interruptions
+                self._timed_text.clear()
+            if messages:
+                await self._send_messages(_coalesce(messages))
 
-        # Handle interruptions - clear any queued bot text
-        if isinstance(frame, InterruptionFrame):
-            await self._handle_interruption()
-            return
+            if self._stopped:
+                break
+            if messages:
+                await asyncio.sleep(self._send_interval)
 
-        # Skip already processed frames (frames can be observed multiple times)
-        if frame.id in self._frames_seen:
-            return
-        self._frames_seen.add(frame.id)
-
-        # Handle user transcriptions (interim)
-        if isinstance(frame, InterimTranscriptionFrame):
-            await self._send_message(
-                {
-                    "type": "rtf-user-transcription",
-                    "payload": {
-                        "text": frame.text,
-                        "final": False,
-                        "user_id": frame.user_id,
-                        "timestamp": frame.timestamp,
-                    },
-                }
+        if self._dropped_events:
+            logger.debug(
+                f"{self} dropped {self._dropped_events} real-time feedback events"
             )
-        # Handle user transcriptions (final)
-        elif isinstance(frame, TranscriptionFrame):
-            await self._send_message(
-                {
-                    "type": "rtf-user-transcription",
-                    "payload": {
-                        "text": frame.text,
-                        "final": True,
-                        "user_id": frame.user_id,
-                        "timestamp": frame.timestamp,
-                    },
-                }
-            )
-            # Increment turn counter on final user transcription
-            if self._logs_buffer:
-                self._logs_buffer.increment_turn()
-        # Handle bot TTS text - respect pts timing
-        elif isinstance(frame, TTSTextFrame):
-            message = {
-                "type": "rtf-bot-text",
-                "payload": {
-                    "text": frame.text,
-                },
-            }
-
-            # If frame has pts, queue it for timed delivery
-            if frame.pts:
+
+    def _take_messages(self) -> list[dict]:
+        """Turn the recorded events and the bot text now due into messages, in order."""
+        messages: list[dict] = []
+        while self._events:
+            event = self._events.popleft()
+            kind = event[0]
+            if kind == _INTERRUPTION:
+                # Discard pending bot text and start the next response fresh
+                self._timed_text.clear()
+                self._clock_start_time = None
+                self._pts_start_time = None
+            elif kind == _BOT_TEXT and event[2]:
+                _, text, pts, observed_at = event
                 # Initialize timing reference on first pts frame
                 if self._pts_start_time is None:
-                    self._pts_start_time = frame.pts
-                    self._clock_start_time = time.time()
-
-                await self._ensure_clock_task()
-                await self._clock_queue.put((frame.pts, frame.id, message))
+                    self._pts_start_time = pts
+                    self._clock_start_time = observed_at
+                target_time = self._clock_start_time + nanoseconds_to_seconds(
+                    pts - self._pts_start_time
+                )
+                self._timed_count += 1
+                heapq.heappush(self._timed_text, (target_time, self._timed_count, text))
             else:
-                # No pts, send immediately
-                await self._send_message(message)
-        # Handle function call in progress
-        elif (
-            isinstance(frame, FunctionCallInProgressFrame)
-            and frame_direction == FrameDirection.DOWNSTREAM
-        ):
-            await self._send_message(
-                {
-                    "type": "rtf-function-call-start",
-                    "payload": {
-                        "function_name": frame.function_name,
-                        "tool_call_id": frame.tool_call_id,
-                    },
-                }
-            )
-        # Handle function call result
-        elif (
-            isinstance(frame, FunctionCallResultFrame)
-            and frame_direction == FrameDirection.DOWNSTREAM
-        ):
-            await self._send_message(
-                {
-                    "type": "rtf-function-call-end",
-                    "payload": {
-                        "function_name": frame.function_name,
-                        "tool_call_id": frame.tool_call_id,
-                        "result": str(frame.result) if frame.result else None,
-                    },
-                }
-            )
-        # Handle TTFB metrics - capture LLM generation time only
-        elif isinstance(frame, MetricsFrame):
-            # Check if this MetricsFrame contains TTFB data from an LLM processor
-            for metric_data in frame.data:
-                if isinstance(metric_data, TTFBMetricsData):
-                    # Only send TTFB if it's from an LLM processor
-                    if metric_data.processor and "LLM" in metric_data.processor:
-                        await self._send_message(
-                            {
-                                "type": "rtf-ttfb-metric",
-                                "payload": {
-                                    "ttfb_seconds": metric_data.value,
-                                    "processor": metric_data.processor,
-                                    "model": metric_data.model,
-                                },
-                            }
-                        )
+                messages.append(_to_message(event))
+
+        now = time.time()
+        while self._timed_text and self._timed_text[0][0] <= now:
+            text = heapq.heappop(self._timed_text)[2]
+            messages.append({"type": "rtf-bot-text", "payload": {"text": text}})
+        return messages
+
+    async def _send_messages(self, messages: list[dict]):
+        """Send messages via WebSocket AND append them to the logs buffer."""
+        ws_sender = await find_ws_sender(self._workflow_run_id)
+        for message in messages:
+            if ws_sender:
+                try:
+                    await ws_sender(message)
+                except Exception as e:
+                    # Log but don't fail - feedback is non-critical
+                    logger.debug(f"Failed to send real-time feedback message: {e}")
 
-    async def _send_message(self, message: dict):
-        """Send message via WebSocket AND append to logs buffer, handling errors gracefully."""
-        # Send via WebSocket
-        try:
-            await self._ws_sender(message)
-        except Exception as e:
-            # Log but don't fail - feedback is non-critical
-            logger.debug(f"Failed to send real-time feedback message: {e}")
-
-        # Also append to logs buffer
-        if self._logs_buffer:
-            try:
-                await self._logs_buffer.append(message)
-            except Exception as e:
-                logger.error(f"Failed to append to logs buffer: {e}")
+            if self._logs_buffer:
+                try:
+                    await self._logs_buffer.append(message)
+                except Exception as e:
+                    logger.error(f"Failed to append to logs buffer: {e}")
+
+                # Increment turn counter on final user transcription
+                if message["type"] == "rtf-user-transcription" and message[
+                    "payload"
+                ].get("final"):
+                    self._logs_buffer.increment_turn()
@@ -0,0 +1,310 @@
+"""Append-only, streaming logs of a running call.
+
+The transcript and the real-time feedback events of a call are appended to a
+file per run as they happen instead of being held in memory until hangup, so
+memory stays bounded on long calls and what was said survives a worker that
+dies mid-call.
+
+Entries are buffered briefly and flushed every ``RUN_LOG_FLUSH_INTERVAL_SECONDS``
+(and on close), with the file I/O done in a worker thread so the event loop
+never waits on the disk. Each flush also mirrors the new entries to a capped
+Redis stream (``run_log:<run id>:<log name>``) so the UI or integrations can
+tail a call live with ``read_run_log``.
+
+At hangup the file already is the final artifact: the transcript file is
+uploaded as is, and the events log is stored as a JSON array assembled from its
+lines without re-serializing the events. Files of runs whose worker died before
+hangup are removed by ``remove_stale_run_logs`` once they stop being written to.
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import List, Optional, TextIO
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from api.constants import (
+    REDIS_URL,
+    RUN_LOG_DIR,
+    RUN_LOG_FLUSH_INTERVAL_SECONDS,
+    RUN_LOG_STREAM_ENABLED,
+    RUN_LOG_STREAM_MAXLEN,
+    RUN_LOG_STREAM_TTL_SECONDS,
+)
+
+TRANSCRIPT_LOG = "transcript"
+EVENTS_LOG = "events"
+
+# Entries flushed early once this many are pending
+_MAX_PENDING_ENTRIES = 200
+
+# Redis stream entry id, e.g. 1719664496789-0 (the sequence part is optional)
+_STREAM_ID_RE = re.compile(r"^\d+(-\d+)?$")
+
+_redis_client: Optional[aioredis.Redis] = None
+
+
+async def _get_redis() -> aioredis.Redis:
+    """Get or create the Redis connection shared by all run logs."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = await aioredis.from_url(REDIS_URL, decode_responses=True)
+    return _redis_client
+
+
+def stream_key(workflow_run_id: int, log_name: str) -> str:
+    """Redis stream mirroring a run's log."""
+    return f"run_log:{workflow_run_id}:{log_name}"
+
+
+def is_stream_id(value: str) -> bool:
+    """Check if a value is a well-formed Redis stream entry id."""
+    return bool(_STREAM_ID_RE.match(value))
+
+
+class RunLogWriter:
+    """Append-only log of one run, flushed periodically to a file and a stream.
+
+    Args:
+        workflow_run_id: The run the log belongs to
+        log_name: Name of the log, e.g. ``transcript`` or ``events``
+        suffix: File name suffix
+        directory: Directory of the log file (default: ``RUN_LOG_DIR``)
+        flush_interval: Seconds an entry may wait before being flushed
+        stream_enabled: Whether entries are mirrored to a Redis stream
+    """
+
+    def __init__(
+        self,
+        workflow_run_id: int,
+        log_name: str,
+        suffix: str,
+        directory: Optional[str] = None,
+        flush_interval: float = RUN_LOG_FLUSH_INTERVAL_SECONDS,
+        stream_enabled: bool = RUN_LOG_STREAM_ENABLED,
+    ):
+        self._workflow_run_id = workflow_run_id
+        self._log_name = log_name
+        self._flush_interval = flush_interval
+        self._stream_enabled = stream_enabled
+
+        self._log_dir = Path(directory or RUN_LOG_DIR)
+        self.path = str(self._log_dir / f"{workflow_run_id}-{log_name}{suffix}")
+        # Opened on the first flush, so runs that log nothing leave no file
+        self._file: Optional[TextIO] = None
+        self._closed = False
+
+        self._pending: List[str] = []
+        self._entries = 0
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if nothing was appended."""
+        return self._entries == 0
+
+    async def _append_entry(self, entry: str):
+        """Append one serialized entry (without trailing newline)."""
+        self._pending.append(entry)
+        self._entries += 1
+        if len(self._pending) >= _MAX_PENDING_ENTRIES:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self._flush_interval)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self):
+        """Write pending entries to the file and the Redis stream."""
+        async with self._flush_lock:
+            if not self._pending or self._closed:
+                return
+            entries, self._pending = self._pending, []
+            await asyncio.to_thread(
+                self._write_file, "".join(f"{entry}\n" for entry in entries)
+            )
+
+            if not self._stream_enabled:
+                return
+            key = stream_key(self._workflow_run_id, self._log_name)
+            try:
+                redis_client = await _get_redis()
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for entry in entries:
+                        pipe.xadd(
+                            key,
+                            {"entry": entry},
+                            maxlen=RUN_LOG_STREAM_MAXLEN,
+                            approximate=True,
+                        )
+                    pipe.expire(key, RUN_LOG_STREAM_TTL_SECONDS)
+                    await pipe.execute()
+            except Exception as e:
+                # Live tailing is best effort; the file is the source of truth
+                logger.debug(f"Failed to mirror {key} to Redis: {e}")
+
+    async def close(self):
+        """Flush remaining entries and close the file."""
+        self._cancel_flush_task()
+        await self.flush()
+        async with self._flush_lock:
+            self._closed = True
+            if self._file is not None:
+                await asyncio.to_thread(self._file.close)
+
+    async def read_entries(self) -> List[str]:
+        """Entries flushed to the file so far."""
+        if self._file is None:
+            return []
+        return await asyncio.to_thread(self._read_file)
+
+    async def discard(self):
+        """Close and delete the log file."""
+        self._cancel_flush_task()
+        async with self._flush_lock:
+            self._closed = True
+            if self._file is not None:
+                await asyncio.to_thread(self._remove_file)
+
+    def _cancel_flush_task(self):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+    # File I/O, run with asyncio.to_thread
+    def _write_file(self, data: str):
+        if self._file is None:
+            self._log_dir.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w", encoding="utf-8")
+        self._file.write(data)
+        self._file.flush()
+
+    def _read_file(self) -> List[str]:
+        with open(self.path, encoding="utf-8") as f:
+            return [line.rstrip("\n") for line in f if line.strip()]
+
+    def _remove_file(self):
+        self._file.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class StreamingTranscriptBuffer(RunLogWriter):
+    """Transcript of a call, streamed to a text file as turns complete."""
+
+    # Compiled regex to identify user speech lines, e.g.
+    # [2025-06-29T12:34:56.789+00:00] user: hello
+    _USER_SPEECH_RE: re.Pattern[str] = re.compile(
+        r"^\[\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}\+\d{2}:\d{2}\] user: .+"
+    )
+
+    def __init__(self, workflow_run_id: int, **kwargs):
+        super().__init__(workflow_run_id, TRANSCRIPT_LOG, ".txt", **kwargs)
+        self._has_user_speech = False
+
+    async def append(self, transcript: str):
+        """Append a transcript line (ending with a newline) to the log."""
+        if not self._has_user_speech and self._USER_SPEECH_RE.match(transcript):
+            self._has_user_speech = True
+        await self._append_entry(transcript.rstrip("\n"))
+
+    def contains_user_speech(self) -> bool:
+        """Return True if any transcript line matched the user speech pattern."""
+        return self._has_user_speech
+
+    async def write_to_temp_file(self) -> str:
+        """Close the transcript and return the path of its file."""
+        await self.close()
+        logger.info(
+            f"Transcript of workflow {self._workflow_run_id} streamed to {self.path}"
+        )
+        return self.path
+
+
+class StreamingLogsBuffer(RunLogWriter):
+    """Real-time feedback events of a call, streamed to a JSON lines file."""
+
+    def __init__(self, workflow_run_id: int, **kwargs):
+        super().__init__(workflow_run_id, EVENTS_LOG, ".jsonl", **kwargs)
+        self._turn_counter = 0
+
+    async def append(self, event: dict):
+        """Append a feedback event to the log with timestamp."""
+        # Add timestamp and turn tracking
+        timestamped_event = {
+            **event,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "turn": self._turn_counter,
+        }
+        await self._append_entry(json.dumps(timestamped_event, default=str))
+
+    def increment_turn(self):
+        """Increment turn counter (called on user transcription completion)."""
+        self._turn_counter += 1
+
+    async def get_events_json(self) -> str:
+        """All events as a JSON array, assembled from the already-serialized lines."""
+        await self.flush()
+        return f"[{','.join(await self.read_entries())}]"
+
+    async def get_events(self) -> List[dict]:
+        """All events, parsed."""
+        return json.loads(await self.get_events_json())
+
+
+async def read_run_log(
+    workflow_run_id: int, log_name: str, after: str = "0-0", count: int = 100
+) -> tuple[list[dict], str]:
+    """Read entries of a run's log streamed after the entry id ``after``.
+
+    Returns:
+        The entries as ``{"id", "entry"}`` dicts and the id to pass as ``after``
+        to continue tailing.
+    """
+    redis_client = await _get_redis()
+    start = f"({after}" if after and after != "0-0" else "-"
+    items = await redis_client.xrange(
+        stream_key(workflow_run_id, log_name), min=start, count=count
+    )
+    entries = [{"id": entry_id, "entry": fields["entry"]} for entry_id, fields in items]
+    return entries, (entries[-1]["id"] if entries else after)
+
+
+def remove_stale_run_logs(
+    max_age_seconds: float, directory: Optional[str] = None
+) -> int:
+    """Delete run log files not written to for ``max_age_seconds``.
+
+    A live run flushes its log at least every turn and a finished run's files
+    are deleted once stored, so files this old were left behind by a worker
+    that died mid-call.
+
+    Returns:
+        The number of files removed.
+    """
+    log_dir = Path(directory or RUN_LOG_DIR)
+    if not log_dir.is_dir():
+        return 0
+
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    for path in log_dir.iterdir():
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError as e:
+            logger.warning(f"Failed to remove stale run log {path}: {e}")
+    return removed
@@ -4,6 +4,12 @@ from typing import Optional
 from fastapi import HTTPException, WebSocket
 from loguru import logger
 
+from api.constants import (
+    ENABLE_SPECULATIVE_GENERATION,
+    STT_TTFS_ESTIMATION,
+    TTS_PHRASE_CACHE,
+    TTS_PRESYNTHESIS,
+)
 from api.db import db_client
 from api.db.models import WorkflowModel
 from api.enums import WorkflowRunMode
@@ -18,7 +24,6 @@ from api.services.pipecat.event_handlers import (
     register_event_handlers,
     register_transcript_handlers,
 )
-from api.services.pipecat.in_memory_buffers import InMemoryLogsBuffer
 from api.services.pipecat.pipeline_builder import (
     build_pipeline,
     create_pipeline_components,
@@ -29,11 +34,13 @@ from api.services.pipecat.pipeline_engine_callbacks_processor import (
 )
 from api.services.pipecat.pipeline_metrics_aggregator import PipelineMetricsAggregator
 from api.services.pipecat.realtime_feedback_observer import RealtimeFeedbackObserver
+from api.services.pipecat.run_log import StreamingLogsBuffer
 from api.services.pipecat.service_factory import (
     create_llm_service,
     create_stt_service,
     create_tts_service,
 )
+from api.services.pipecat.stt_latency_store import enable_ttfs_latency_estimation
 from api.services.pipecat.tracing_config import setup_pipeline_tracing
 from api.services.pipecat.transport_setup import (
     create_ari_transport,
@@ -43,7 +50,9 @@ from api.services.pipecat.transport_setup import (
     create_vonage_transport,
     create_webrtc_transport,
 )
-from api.services.pipecat.ws_sender_registry import get_ws_sender
+from api.services.pipecat.tts_phrase_cache import enable_tts_phrase_cache
+from api.services.pipecat.tts_presynthesis import start_workflow_presynthesis
+from api.services.pipecat.ws_sender_registry import find_ws_sender
 from api.services.workflow.dto import ReactFlowDTO
 from api.services.workflow.pipecat_engine import PipecatEngine
 from api.services.workflow.workflow import WorkflowGraph
@@ -514,19 +523,23 @@ async def _run_pipeline(
 
     # Create services based on user configuration
     stt = create_stt_service(user_config, audio_config, keyterms=keyterms)
+    if STT_TTFS_ESTIMATION:
+        enable_ttfs_latency_estimation(stt)
     tts = create_tts_service(user_config, audio_config)
+    if TTS_PHRASE_CACHE:
+        enable_tts_phrase_cache(tts)
     llm = create_llm_service(user_config)
 
     workflow_graph = WorkflowGraph(
         ReactFlowDTO.model_validate(workflow.workflow_definition_with_fallback)
     )
 
-    # Create in-memory logs buffer early so it can be used by engine callbacks
-    in_memory_logs_buffer = InMemoryLogsBuffer(workflow_run_id)
+    # Create the logs buffer early so it can be used by engine callbacks
+    in_memory_logs_buffer = StreamingLogsBuffer(workflow_run_id)
 
     # Create node transition callback if WebSocket sender is available
     node_transition_callback = None
-    ws_sender = get_ws_sender(workflow_run_id)
+    ws_sender = await find_ws_sender(workflow_run_id)
     if ws_sender:
 
         async def send_node_transition(
@@ -546,7 +559,7 @@ async def _run_pipeline(
             except Exception as e:
                 logger.debug(f"Failed to send node transition via WebSocket: {e}")
 
-            # Log to in-memory buffer
+            # Log to the streamed logs buffer
             try:
                 await in_memory_logs_buffer.append(message)
             except Exception as e:
@@ -647,6 +660,7 @@ async def _run_pipeline(
         user_mute_strategies=user_mute_strategies,
         user_idle_timeout=max_user_idle_timeout,
         vad_analyzer=SileroVADAnalyzer(params=vad_params),
+        enable_speculative_generation=ENABLE_SPECULATIVE_GENERATION,
     )
     context_aggregator = LLMContextAggregatorPair(
         context, assistant_params=assistant_params, user_params=user_params
@@ -722,11 +736,13 @@ async def _run_pipeline(
     # Initialize the engine to set the initial context
     await engine.initialize()
 
-    # Add real-time feedback observer if WebSocket sender is available
+    # Add real-time feedback observer if WebSocket sender is available. The
+    # observer looks the sender up again for every batch it sends, and ignores
+    # frames while none is registered.
     # Note: ws_sender was already fetched earlier for node_transition_callback
     if ws_sender:
         feedback_observer = RealtimeFeedbackObserver(
-            ws_sender=ws_sender,
+            workflow_run_id=workflow_run_id,
             logs_buffer=in_memory_logs_buffer,
         )
         task.add_observer(feedback_observer)
@@ -751,6 +767,17 @@ async def _run_pipeline(
         in_memory_transcript_buffer,
     )
 
+    # Synthesize the fixed messages of the workflow while the call starts
+    presynthesis_task = None
+    if TTS_PHRASE_CACHE and TTS_PRESYNTHESIS:
+        presynthesis_task = start_workflow_presynthesis(
+            task,
+            tts,
+            workflow_graph,
+            workflow_run_id,
+            tool_registry=engine.tool_registry,
+        )
+
     try:
         # Run the pipeline
         loop = asyncio.get_running_loop()
@@ -760,5 +787,7 @@ async def _run_pipeline(
     except asyncio.CancelledError:
         logger.warning("Received CancelledError in _run_pipeline")
     finally:
+        if presynthesis_task:
+            presynthesis_task.cancel()
         ContextProviderRegistry.remove_providers(str(workflow_run_id))
         logger.debug(f"Cleaned up context providers for workflow run {workflow_run_id}")
@@ -0,0 +1,79 @@
+"""Redis store for the STT time-to-final-segment (TTFS) sketches.
+
+Every worker records the TTFS of its calls' user turns into the process-wide
+``ttfs_latency_estimator`` of pipecat. This store merges the bucket counts of
+all workers in Redis, one hash per sketch and time window
+(``stt_ttfs:<provider:model>:<window>``), so a worker that just started uses
+the P99 observed by the whole fleet instead of the static per-provider value.
+"""
+
+from typing import List, Optional
+
+import redis.asyncio as aioredis
+
+from api.constants import (
+    REDIS_URL,
+    STT_TTFS_PERSIST_REDIS,
+    STT_TTFS_WINDOW_TTL_SECONDS,
+)
+from pipecat.services.stt_latency_estimator import (
+    BaseTTFSLatencyStore,
+    SketchCounts,
+    ttfs_latency_estimator,
+)
+from pipecat.services.stt_service import STTService
+
+_redis_client: Optional[aioredis.Redis] = None
+
+
+async def _get_redis() -> aioredis.Redis:
+    """Get or create the Redis connection shared by all sketches."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = await aioredis.from_url(REDIS_URL, decode_responses=True)
+    return _redis_client
+
+
+def sketch_key(key: str, window: int) -> str:
+    """Redis hash holding a sketch's bucket counts for one window."""
+    return f"stt_ttfs:{key}:{window}"
+
+
+class RedisTTFSLatencyStore(BaseTTFSLatencyStore):
+    """Merges TTFS sketches of all workers in Redis.
+
+    A merge is a single pipelined round trip: the local counts are added with
+    ``HINCRBY`` and the merged counts of the requested windows are read back.
+    Windows expire once they are no longer used by any worker.
+    """
+
+    def __init__(self, ttl_secs: int = STT_TTFS_WINDOW_TTL_SECONDS):
+        self._ttl = ttl_secs
+
+    async def merge(
+        self, key: str, pending: SketchCounts, windows: List[int]
+    ) -> SketchCounts:
+        redis = await _get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            for window, buckets in pending.items():
+                for bucket, count in buckets.items():
+                    pipe.hincrby(sketch_key(key, window), str(bucket), count)
+                pipe.expire(sketch_key(key, window), self._ttl)
+            for window in windows:
+                pipe.hgetall(sketch_key(key, window))
+            results = await pipe.execute()
+
+        merged = results[len(results) - len(windows) :]
+        return {
+            window: {int(bucket): int(count) for bucket, count in counts.items()}
+            for window, counts in zip(windows, merged)
+        }
+
+
+def enable_ttfs_latency_estimation(stt: STTService):
+    """Let the STT service publish the TTFS P99 estimated from recent calls."""
+    if STT_TTFS_PERSIST_REDIS and not isinstance(
+        ttfs_latency_estimator.store, RedisTTFSLatencyStore
+    ):
+        ttfs_latency_estimator.set_store(RedisTTFSLatencyStore())
+    stt.set_ttfs_estimator(ttfs_latency_estimator)
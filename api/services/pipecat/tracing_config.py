@@ -4,7 +4,17 @@ import os
 from loguru import logger
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 
-from api.constants import ENABLE_TRACING
+from api.constants import (
+    ENABLE_TRACING,
+    TRACING_CAPTURE_MODE,
+    TRACING_SAMPLE_RATE,
+    TRACING_TAIL_LATENCY_SECONDS,
+)
+from pipecat.utils.tracing.llm_span_capture import (
+    LLMSpanCaptureMode,
+    LLMSpanCaptureParams,
+    configure_llm_span_capture,
+)
 from pipecat.utils.tracing.setup import setup_tracing
 
 
@@ -38,5 +48,17 @@ def setup_pipeline_tracing():
             f"Authorization=Basic {LANGFUSE_AUTH}"
         )
 
+        configure_llm_span_capture(
+            LLMSpanCaptureParams(
+                mode=LLMSpanCaptureMode(TRACING_CAPTURE_MODE),
+                sample_rate=TRACING_SAMPLE_RATE,
+                tail_latency_threshold=(
+                    float(TRACING_TAIL_LATENCY_SECONDS)
+                    if TRACING_TAIL_LATENCY_SECONDS
+                    else None
+                ),
+            )
+        )
+
         otlp_exporter = OTLPSpanExporter()
         setup_tracing(service_name="dograh-pipeline", exporter=otlp_exporter)
@@ -2,7 +2,11 @@ import os
 
 from fastapi import WebSocket
 
-from api.constants import APP_ROOT_DIR
+from api.constants import (
+    APP_ROOT_DIR,
+    AUDIO_OUT_SEND_AHEAD_MS,
+    MEDIA_CLOCK_ENABLED,
+)
 from api.db import db_client
 from api.enums import OrganizationConfigurationKey
 from api.services.pipecat.audio_config import AudioConfig
@@ -25,6 +29,14 @@ librnnoise_path = os.path.normpath(
 )
 
 
+def _get_output_pacing_params() -> dict:
+    """Audio output pacing shared by the telephony websocket transports."""
+    return {
+        "audio_out_shared_clock": MEDIA_CLOCK_ENABLED,
+        "audio_out_send_ahead_secs": AUDIO_OUT_SEND_AHEAD_MS / 1000,
+    }
+
+
 def _get_ambience_mixer(audio_config: AudioConfig, config: dict | None):
     if not config or not config.get("enabled", False):
         return SilenceAudioMixer()
@@ -89,6 +101,7 @@ async def create_twilio_transport(
             audio_out_sample_rate=audio_config.transport_out_sample_rate,
             audio_out_mixer=_get_ambience_mixer(audio_config, ambient_noise_config),
             serializer=serializer,
+            **_get_output_pacing_params(),
         ),
     )
 
@@ -140,6 +153,7 @@ async def create_cloudonix_transport(
             audio_out_sample_rate=audio_config.transport_out_sample_rate,
             audio_out_mixer=_get_ambience_mixer(audio_config, ambient_noise_config),
             serializer=serializer,
+            **_get_output_pacing_params(),
             audio_out_10ms_chunks=2,
         ),
     )
@@ -193,6 +207,7 @@ async def create_ari_transport(
             audio_out_sample_rate=audio_config.transport_out_sample_rate,
             audio_out_mixer=_get_ambience_mixer(audio_config, ambient_noise_config),
             serializer=serializer,
+            **_get_output_pacing_params(),
         ),
     )
 
@@ -244,6 +259,7 @@ async def create_vonage_transport(
             audio_out_sample_rate=audio_config.transport_out_sample_rate,
             audio_out_mixer=_get_ambience_mixer(audio_config, ambient_noise_config),
             serializer=serializer,
+            **_get_output_pacing_params(),
         ),
     )
 
@@ -323,6 +339,7 @@ async def create_vobiz_transport(
             audio_out_sample_rate=audio_config.transport_out_sample_rate,
             audio_out_mixer=_get_ambience_mixer(audio_config, ambient_noise_config),
             serializer=serializer,
+            **_get_output_pacing_params(),
         ),
     )
 
@@ -0,0 +1,43 @@
+"""Process-wide TTS phrase cache.
+
+Greetings, hold lines, disclaimers and confirmations repeat on every call. All
+the TTS services of a worker share one ``TTSPhraseCache`` of pipecat: phrases
+are replayed from memory and only synthesized by the provider on a miss.
+Phrases spoken live are cached once they repeat, in this worker only;
+presynthesized workflow messages are also shared through Redis when
+``TTS_PHRASE_CACHE_PERSIST_REDIS`` is set.
+"""
+
+from typing import Optional
+
+from api.constants import (
+    REDIS_URL,
+    TTS_PHRASE_CACHE_MEMORY_MB,
+    TTS_PHRASE_CACHE_PERSIST_REDIS,
+    TTS_PHRASE_CACHE_TTL_SECONDS,
+)
+from pipecat.services.tts_cache import TTSCacheManager, TTSPhraseCache
+from pipecat.services.tts_service import TTSService
+
+_phrase_cache: Optional[TTSPhraseCache] = None
+
+
+def get_tts_phrase_cache() -> TTSPhraseCache:
+    """Get or create the phrase cache shared by all TTS services."""
+    global _phrase_cache
+    if _phrase_cache is None:
+        cache_manager = None
+        if TTS_PHRASE_CACHE_PERSIST_REDIS:
+            cache_manager = TTSCacheManager(
+                REDIS_URL, cache_ttl_seconds=TTS_PHRASE_CACHE_TTL_SECONDS
+            )
+        _phrase_cache = TTSPhraseCache(
+            memory_max_bytes=TTS_PHRASE_CACHE_MEMORY_MB * 1024 * 1024,
+            cache_manager=cache_manager,
+        )
+    return _phrase_cache
+
+
+def enable_tts_phrase_cache(tts: TTSService):
+    """Let the TTS service replay repeated phrases from the shared cache."""
+    tts.set_phrase_cache(get_tts_phrase_cache())
@@ -0,0 +1,155 @@
+"""Pre-synthesis of the fixed messages of a workflow at call setup.
+
+End call and transfer call tools speak a configured message (a goodbye, a
+transfer announcement) before acting. These are known as soon as the call is
+set up: the messages of the tools of the workflow are synthesized in the
+background into the TTS phrase cache, so they are replayed without waiting on
+the TTS provider when the tool runs. The messages are spoken as configured
+(they aren't rendered with the call context), so the cached audio is the one
+the tool asks for.
+
+Only TTS services that support it (``TTSService.supports_presynthesis``) are
+used. Websocket TTS services and those with word timestamps (e.g. Cartesia,
+ElevenLabs, Deepgram, Rime, Inworld and Dograh) don't: with them the messages
+are synthesized when spoken, as before.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+from loguru import logger
+
+from api.constants import TTS_PRESYNTHESIS_MAX_CONCURRENCY
+from api.db import db_client
+from api.enums import ToolCategory
+from api.services.workflow.call_tool_registry import (
+    CallToolRegistry,
+    get_workflow_tool_uuids,
+)
+from api.services.workflow.disposition_mapper import (
+    get_organization_id_from_workflow_run,
+)
+from api.services.workflow.workflow import WorkflowGraph
+from pipecat.pipeline.task import PipelineTask
+from pipecat.services.tts_service import TTSService
+
+# Tool categories that speak a configured message
+MESSAGE_TOOL_CATEGORIES = (
+    ToolCategory.END_CALL.value,
+    ToolCategory.TRANSFER_CALL.value,
+)
+
+
+def get_workflow_utterances(workflow: WorkflowGraph, tools: list[Any]) -> list[str]:
+    """Get the fixed messages spoken by the tools of the workflow.
+
+    Args:
+        workflow: The workflow of the call
+        tools: The tools of the workflow (``ToolModel`` instances)
+
+    Returns:
+        The messages without duplicates, those of the nodes closest
+        to the start node first
+    """
+    tools_by_uuid = {tool.tool_uuid: tool for tool in tools}
+    utterances: list[str] = []
+    for tool_uuid in get_workflow_tool_uuids(workflow):
+        tool = tools_by_uuid.get(tool_uuid)
+        if not tool or tool.category not in MESSAGE_TOOL_CATEGORIES:
+            continue
+        config = tool.definition.get("config", {})
+        message = config.get("customMessage", "")
+        if config.get("messageType", "none") != "custom" or not message.strip():
+            continue
+        if message not in utterances:
+            utterances.append(message)
+    return utterances
+
+
+async def presynthesize_utterances(tts: TTSService, utterances: list[str]) -> int:
+    """Synthesize the utterances into the phrase cache, a few at a time.
+
+    Returns:
+        The number of utterances in the phrase cache
+    """
+    semaphore = asyncio.Semaphore(TTS_PRESYNTHESIS_MAX_CONCURRENCY)
+
+    async def presynthesize(text: str) -> bool:
+        async with semaphore:
+            return await tts.presynthesize(text)
+
+    results = await asyncio.gather(*(presynthesize(text) for text in utterances))
+    return sum(results)
+
+
+async def _presynthesize_workflow(
+    tts: TTSService,
+    workflow: WorkflowGraph,
+    workflow_run_id: int,
+    pipeline_started: asyncio.Event,
+    tool_registry: Optional[CallToolRegistry],
+):
+    try:
+        if tool_registry is not None:
+            tools = list(tool_registry.tools.values())
+        else:
+            tool_uuids = get_workflow_tool_uuids(workflow)
+            if not tool_uuids:
+                return
+            organization_id = await get_organization_id_from_workflow_run(
+                workflow_run_id
+            )
+            if not organization_id:
+                return
+            tools = await db_client.get_tools_by_uuids(tool_uuids, organization_id)
+        utterances = get_workflow_utterances(workflow, tools)
+        if not utterances:
+            return
+
+        # The TTS service knows its sample rate once the pipeline has started.
+        await pipeline_started.wait()
+        cached = await presynthesize_utterances(tts, utterances)
+        logger.debug(
+            f"Presynthesized {cached}/{len(utterances)} workflow messages "
+            f"for workflow run {workflow_run_id}"
+        )
+    except Exception as e:
+        logger.warning(f"Failed to presynthesize workflow messages: {e}")
+
+
+def start_workflow_presynthesis(
+    task: PipelineTask,
+    tts: TTSService,
+    workflow: WorkflowGraph,
+    workflow_run_id: int,
+    tool_registry: Optional[CallToolRegistry] = None,
+) -> Optional[asyncio.Task]:
+    """Presynthesize the fixed messages of the workflow in the background.
+
+    The tools are taken from the call's *tool_registry* when it was prefetched
+    (fetched right away otherwise) and the messages synthesized once the
+    pipeline has started. The caller cancels the returned task when the call
+    ends.
+
+    Returns:
+        The background task, or None if the TTS service can't presynthesize
+    """
+    if not tts.supports_presynthesis:
+        logger.debug(f"{tts} doesn't support presynthesis")
+        return None
+
+    pipeline_started = asyncio.Event()
+
+    @task.event_handler("on_pipeline_started")
+    async def on_pipeline_started(_task, _frame):
+        pipeline_started.set()
+
+    return asyncio.create_task(
+        _presynthesize_workflow(
+            tts,
+            workflow,
+            workflow_run_id,
+            pipeline_started,
+            tool_registry,
+        )
+    )
@@ -2,27 +2,156 @@
 
 This allows the pipeline observer to send messages back through
 the signaling WebSocket without passing the WebSocket directly.
+
+Senders are registered in the process holding the WebSocket. Without media
+workers (``MEDIA_WORKERS=0``, the default) the pipeline always runs in that
+process too, so senders are only looked up in the local dict.
+
+With media workers, a run's pipeline may live in another process (e.g. the
+browser reconnected through a different worker), so every registered sender is
+also reachable over Redis: the registering process marks the run present and
+forwards the messages published on the run's channel to the sender, and
+``find_ws_sender`` returns a sender publishing to that channel when the run's
+WebSocket is in another process.
 """
 
-from typing import Awaitable, Callable, Dict, Optional
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from api.constants import MEDIA_WORKERS, REDIS_URL
+
+WsSender = Callable[[dict], Awaitable[None]]
+
+CHANNEL_PREFIX = "ws_sender:"
+PRESENCE_KEY_PREFIX = "ws_sender:present:"
+
+# The presence key of a run is refreshed this often while its sender is
+# registered, and expires after a few missed refreshes (e.g. a crashed worker)
+PRESENCE_REFRESH_SECONDS = 30
+PRESENCE_TTL_SECONDS = 90
+
+# How long a Redis presence lookup is reused by find_ws_sender
+PRESENCE_CACHE_SECONDS = 1.0
+
+_ws_senders: Dict[int, WsSender] = {}
+# Forwards the messages published for a run to its local sender
+_relay_tasks: Dict[int, asyncio.Task] = {}
+# workflow_run_id -> (registered in another process, lookup expiry)
+_remote_presence: Dict[int, Tuple[bool, float]] = {}
+
+_redis_client: Optional[aioredis.Redis] = None
 
-_ws_senders: Dict[int, Callable[[dict], Awaitable[None]]] = {}
 
+async def _get_redis() -> aioredis.Redis:
+    """Get or create the Redis connection shared by the registry."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = await aioredis.from_url(REDIS_URL, decode_responses=True)
+    return _redis_client
 
-def register_ws_sender(
-    workflow_run_id: int, sender: Callable[[dict], Awaitable[None]]
-) -> None:
+
+def register_ws_sender(workflow_run_id: int, sender: WsSender) -> None:
     """Register a WebSocket sender for a workflow run."""
     _ws_senders[workflow_run_id] = sender
+    if MEDIA_WORKERS <= 0:
+        return
+    # A running relay picks the new sender up
+    relay_task = _relay_tasks.get(workflow_run_id)
+    if relay_task is None or relay_task.done():
+        _relay_tasks[workflow_run_id] = asyncio.create_task(
+            _relay_published_messages(workflow_run_id)
+        )
 
 
 def unregister_ws_sender(workflow_run_id: int) -> None:
     """Unregister a WebSocket sender for a workflow run."""
     _ws_senders.pop(workflow_run_id, None)
+    relay_task = _relay_tasks.pop(workflow_run_id, None)
+    if relay_task is not None:
+        relay_task.cancel()
 
 
 def get_ws_sender(
     workflow_run_id: int,
-) -> Optional[Callable[[dict], Awaitable[None]]]:
-    """Get the WebSocket sender for a workflow run."""
+) -> Optional[WsSender]:
+    """Get the WebSocket sender registered for a workflow run in this process."""
     return _ws_senders.get(workflow_run_id)
+
+
+async def find_ws_sender(workflow_run_id: int) -> Optional[WsSender]:
+    """Get the WebSocket sender of a workflow run, in this process or another.
+
+    Other processes are only looked up with media workers. Redis lookups are
+    cached for ``PRESENCE_CACHE_SECONDS``, so this can be called for every
+    message batch.
+    """
+    sender = _ws_senders.get(workflow_run_id)
+    if sender is not None or MEDIA_WORKERS <= 0:
+        return sender
+
+    now = time.monotonic()
+    present, expires_at = _remote_presence.get(workflow_run_id, (False, 0.0))
+    if expires_at <= now:
+        try:
+            redis_client = await _get_redis()
+            present = bool(
+                await redis_client.exists(f"{PRESENCE_KEY_PREFIX}{workflow_run_id}")
+            )
+        except Exception as e:
+            logger.debug(f"WebSocket sender lookup failed: {e}")
+            present = False
+        for run_id in [k for k, v in _remote_presence.items() if v[1] <= now]:
+            del _remote_presence[run_id]
+        _remote_presence[workflow_run_id] = (present, now + PRESENCE_CACHE_SECONDS)
+
+    if not present:
+        return None
+
+    async def publish(message: dict) -> None:
+        redis_client = await _get_redis()
+        await redis_client.publish(
+            f"{CHANNEL_PREFIX}{workflow_run_id}", json.dumps(message)
+        )
+
+    return publish
+
+
+async def _relay_published_messages(workflow_run_id: int) -> None:
+    """Forward messages published for a run to its local sender until cancelled."""
+    presence_key = f"{PRESENCE_KEY_PREFIX}{workflow_run_id}"
+    pubsub = None
+    try:
+        redis_client = await _get_redis()
+        pubsub = redis_client.pubsub()
+        await pubsub.subscribe(f"{CHANNEL_PREFIX}{workflow_run_id}")
+        refresh_at = 0.0
+        while True:
+            if time.monotonic() >= refresh_at:
+                await redis_client.set(presence_key, "1", ex=PRESENCE_TTL_SECONDS)
+                refresh_at = time.monotonic() + PRESENCE_REFRESH_SECONDS
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=PRESENCE_REFRESH_SECONDS
+            )
+            sender = _ws_senders.get(workflow_run_id)
+            if message is None or sender is None:
+                continue
+            try:
+                await sender(json.loads(message["data"]))
+            except Exception as e:
+                logger.debug(f"Failed to forward message to WebSocket: {e}")
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.warning(f"WebSocket sender relay failed for {workflow_run_id}: {e}")
+    finally:
+        if pubsub is not None:
+            try:
+                await pubsub.aclose()
+                await redis_client.delete(presence_key)
+            except Exception:
+                pass
@@ -1,8 +1,9 @@
 from datetime import datetime, time
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from zoneinfo import ZoneInfo
 
 from api.db import db_client
+from api.db.rollups import DURATION_BUCKETS
 
 
 class DailyReportService:
@@ -34,33 +35,26 @@ class DailyReportService:
         start_utc = start_dt.astimezone(ZoneInfo("UTC"))
         end_utc = end_dt.astimezone(ZoneInfo("UTC"))
 
-        # Get workflow runs from database (optimized - only required fields)
-        runs = await db_client.get_workflow_runs_for_daily_report(
+        # Counts by disposition and duration bucket, aggregated in the database
+        # (from pre-aggregated rollups where available)
+        counts = await db_client.get_daily_report_counts(
             organization_id=organization_id,
             start_utc=start_utc,
             end_utc=end_utc,
             workflow_id=workflow_id,
         )
 
-        # Calculate metrics
-        total_runs = len(runs)
-        xfer_count = sum(
-            1
-            for run in runs
-            if run["gathered_context"]
-            and run["gathered_context"].get("mapped_call_disposition") == "XFER"
-        )
-
-        # Calculate disposition distribution
         disposition_counts = {}
-        for run in runs:
-            if run["gathered_context"]:
-                disposition = run["gathered_context"].get(
-                    "mapped_call_disposition", "UNKNOWN"
-                )
-                disposition_counts[disposition] = (
-                    disposition_counts.get(disposition, 0) + 1
-                )
+        bucket_counts = {}
+        for disposition, bucket, count in counts:
+            disposition_counts[disposition] = (
+                disposition_counts.get(disposition, 0) + count
+            )
+            bucket_counts[bucket] = bucket_counts.get(bucket, 0) + count
+
+        # Calculate metrics
+        total_runs = sum(disposition_counts.values())
+        xfer_count = disposition_counts.get("XFER", 0)
 
         # Sort dispositions by count and get top 5
         sorted_dispositions = sorted(
@@ -96,50 +90,22 @@ class DailyReportService:
                 }
             )
 
-        # Calculate call duration distribution
-        duration_buckets = {
-            "0-10": {"range_start": 0, "range_end": 10, "count": 0},
-            "10-30": {"range_start": 10, "range_end": 30, "count": 0},
-            "30-60": {"range_start": 30, "range_end": 60, "count": 0},
-            "60-120": {"range_start": 60, "range_end": 120, "count": 0},
-            "120-180": {"range_start": 120, "range_end": 180, "count": 0},
-            ">180": {"range_start": 180, "range_end": None, "count": 0},
-        }
-
-        for run in runs:
-            if run["usage_info"]:
-                duration_str = run["usage_info"].get("call_duration_seconds")
-                if duration_str:
-                    try:
-                        duration = float(duration_str)
-                        if duration < 10:
-                            duration_buckets["0-10"]["count"] += 1
-                        elif duration < 30:
-                            duration_buckets["10-30"]["count"] += 1
-                        elif duration < 60:
-                            duration_buckets["30-60"]["count"] += 1
-                        elif duration < 120:
-                            duration_buckets["60-120"]["count"] += 1
-                        elif duration < 180:
-                            duration_buckets["120-180"]["count"] += 1
-                        else:
-                            duration_buckets[">180"]["count"] += 1
-                    except (ValueError, TypeError):
-                        pass
-
         # Format duration distribution
         call_duration_distribution = []
-        total_calls_with_duration = sum(b["count"] for b in duration_buckets.values())
+        total_calls_with_duration = sum(
+            bucket_counts.get(name, 0) for name, _, _ in DURATION_BUCKETS
+        )
 
-        for bucket_name, bucket_data in duration_buckets.items():
+        for bucket_name, range_start, range_end in DURATION_BUCKETS:
+            count = bucket_counts.get(bucket_name, 0)
             call_duration_distribution.append(
                 {
                     "bucket": bucket_name,
-                    "range_start": bucket_data["range_start"],
-                    "range_end": bucket_data["range_end"],
-                    "count": bucket_data["count"],
+                    "range_start": range_start,
+                    "range_end": range_end,
+                    "count": count,
                     "percentage": round(
-                        (bucket_data["count"] / total_calls_with_duration * 100)
+                        (count / total_calls_with_duration * 100)
                         if total_calls_with_duration > 0
                         else 0,
                         2,
@@ -166,15 +132,15 @@ class DailyReportService:
 
         return [{"id": workflow.id, "name": workflow.name} for workflow in workflows]
 
-    async def get_daily_runs_detail(
+    async def stream_daily_runs_detail(
         self,
         organization_id: int,
         date: str,
         timezone: str,
         workflow_id: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Get detailed workflow runs for CSV export.
+        Stream detailed workflow runs for CSV export.
 
         Args:
             organization_id: The organization ID to filter by
@@ -194,44 +160,25 @@ class DailyReportService:
         start_utc = start_dt.astimezone(ZoneInfo("UTC"))
         end_utc = end_dt.astimezone(ZoneInfo("UTC"))
 
-        # Get workflow runs from database (optimized - only required fields)
-        runs = await db_client.get_workflow_runs_for_daily_report(
+        # Runs are streamed from a server-side cursor (only required fields)
+        async for run in db_client.stream_workflow_runs_for_daily_report(
             organization_id=organization_id,
             start_utc=start_utc,
             end_utc=end_utc,
             workflow_id=workflow_id,
-        )
-
-        # Format runs for CSV export
-        detailed_runs = []
-        for run in runs:
-            # Phone number is already extracted at the database level
-            # Try customer_phone_number first, then fall back to initial_context
-            phone_number = run["gathered_context"].get(
-                "customer_phone_number", ""
-            ) or run["initial_context"].get("phone_number", "")
-
-            # Disposition is already extracted at the database level
-            disposition = run["gathered_context"].get("mapped_call_disposition", "")
-
+        ):
             # Duration is already extracted at the database level
-            duration_seconds = 0
-            duration_str = run["usage_info"].get("call_duration_seconds", "0")
             try:
-                duration_seconds = float(duration_str)
+                duration_seconds = float(run["call_duration_seconds"])
             except (ValueError, TypeError):
                 duration_seconds = 0
 
-            detailed_runs.append(
-                {
-                    "phone_number": phone_number,
-                    "disposition": disposition,
-                    "duration_seconds": duration_seconds,
-                    "workflow_id": run["workflow_id"],
-                    "run_id": run["id"],
-                    "workflow_name": run["workflow_name"],
-                    "created_at": run["created_at"].isoformat(),
-                }
-            )
-
-        return detailed_runs
+            yield {
+                "phone_number": run["phone_number"],
+                "disposition": run["disposition"],
+                "duration_seconds": duration_seconds,
+                "workflow_id": run["workflow_id"],
+                "run_id": run["id"],
+                "workflow_name": run["workflow_name"],
+                "created_at": run["created_at"].isoformat(),
+            }
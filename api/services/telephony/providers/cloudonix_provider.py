@@ -11,6 +11,7 @@ from fastapi import HTTPException
 from loguru import logger
 
 from api.enums import WorkflowRunMode
+from api.services.media_workers.routing import media_stream_endpoint
 from api.services.telephony.base import (
     CallInitiationResult,
     NormalizedInboundData,
@@ -94,12 +95,15 @@ class CloudonixProvider(TelephonyProvider):
         # Prepare call data using Cloudonix callObject schema
         # Note: 'caller-id' is REQUIRED by Cloudonix API
         backend_endpoint, wss_backend_endpoint = await get_backend_endpoints()
+        stream_endpoint = await media_stream_endpoint(
+            workflow_run_id, wss_backend_endpoint
+        )
         data: Dict[str, Any] = {
             "destination": to_number,
             "cxml": f"""<?xml version="1.0" encoding="UTF-8"?>
 <Response>
     <Connect>
-        <Stream url="{wss_backend_endpoint}/api/v1/telephony/ws/{workflow_id}/{user_id}/{workflow_run_id}"></Stream>
+        <Stream url="{stream_endpoint}/api/v1/telephony/ws/{workflow_id}/{user_id}/{workflow_run_id}"></Stream>
     </Connect>
     <Pause length="40"/>
 </Response>""",
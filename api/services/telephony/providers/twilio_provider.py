@@ -12,6 +12,7 @@ from loguru import logger
 from twilio.request_validator import RequestValidator
 
 from api.enums import WorkflowRunMode
+from api.services.media_workers.routing import media_stream_endpoint
 from api.services.telephony.base import (
     CallInitiationResult,
     NormalizedInboundData,
@@ -165,11 +166,14 @@ class TwilioProvider(TelephonyProvider):
         Generate TwiML response for starting a call session.
         """
         _, wss_backend_endpoint = await get_backend_endpoints()
+        stream_endpoint = await media_stream_endpoint(
+            workflow_run_id, wss_backend_endpoint
+        )
 
         twiml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
 <Response>
     <Connect>
-        <Stream url="{wss_backend_endpoint}/api/v1/telephony/ws/{workflow_id}/{user_id}/{workflow_run_id}"></Stream>
+        <Stream url="{stream_endpoint}/api/v1/telephony/ws/{workflow_id}/{user_id}/{workflow_run_id}"></Stream>
     </Connect>
     <Pause length="40"/>
 </Response>"""
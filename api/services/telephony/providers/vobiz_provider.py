@@ -11,6 +11,7 @@ from fastapi import HTTPException
 from loguru import logger
 
 from api.enums import WorkflowRunMode
+from api.services.media_workers.routing import media_stream_endpoint
 from api.services.telephony.base import (
     CallInitiationResult,
     NormalizedInboundData,
@@ -263,10 +264,13 @@ class VobizProvider(TelephonyProvider):
         - contentType: audio/x-l16;rate=16000
         """
         _, wss_backend_endpoint = await get_backend_endpoints()
+        stream_endpoint = await media_stream_endpoint(
+            workflow_run_id, wss_backend_endpoint
+        )
 
         vobiz_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
 <Response>
-    <Stream bidirectional="true" keepCallAlive="true" contentType="audio/x-l16;rate=16000">{wss_backend_endpoint}/api/v1/telephony/ws/{workflow_id}/{user_id}/{workflow_run_id}</Stream>
+    <Stream bidirectional="true" keepCallAlive="true" contentType="audio/x-l16;rate=16000">{stream_endpoint}/api/v1/telephony/ws/{workflow_id}/{user_id}/{workflow_run_id}</Stream>
 </Response>"""
         return vobiz_xml
 
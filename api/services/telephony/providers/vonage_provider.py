@@ -13,6 +13,7 @@ from fastapi import HTTPException, Response
 from loguru import logger
 
 from api.enums import WorkflowRunMode
+from api.services.media_workers.routing import media_stream_endpoint
 from api.services.telephony.base import (
     CallInitiationResult,
     NormalizedInboundData,
@@ -207,6 +208,9 @@ class VonageProvider(TelephonyProvider):
         NCCO (Nexmo Call Control Objects) is JSON-based, unlike TwiML which is XML.
         """
         _, wss_backend_endpoint = await get_backend_endpoints()
+        stream_endpoint = await media_stream_endpoint(
+            workflow_run_id, wss_backend_endpoint
+        )
 
         # NCCO for WebSocket connection
         ncco = [
@@ -215,7 +219,7 @@ class VonageProvider(TelephonyProvider):
                 "endpoint": [
                     {
                         "type": "websocket",
-                        "uri": f"{wss_backend_endpoint}/api/v1/telephony/ws/{workflow_id}/{user_id}/{workflow_run_id}",
+                        "uri": f"{stream_endpoint}/api/v1/telephony/ws/{workflow_id}/{user_id}/{workflow_run_id}",
                         "content-type": "audio/l16;rate=16000",  # 16kHz Linear PCM
                         "headers": {},
                     }
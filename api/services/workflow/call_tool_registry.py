@@ -0,0 +1,127 @@
+"""Per-call registry of the custom tools of a workflow and their credentials.
+
+Every tool referenced by a node of the workflow, and the credential each one
+authenticates with, is resolved with a single query when the call is set up
+(``load_call_tool_registry``). Schema generation and tool execution then read
+the registry instead of going to Postgres in the middle of the conversation.
+The registry is read-only: a tool or credential edited during the call is
+picked up by the next call.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from loguru import logger
+
+from api.db import db_client
+from api.services.workflow.pipecat_engine_utils import get_function_schema
+from api.services.workflow.tools.custom_tool import tool_to_function_schema
+from api.services.workflow.workflow import Node, WorkflowGraph
+from pipecat.adapters.schemas.function_schema import FunctionSchema
+
+
+def _nodes_in_visit_order(workflow: WorkflowGraph) -> list[Node]:
+    """Nodes reachable from the start node first (breadth first), then the rest."""
+    start = workflow.nodes[workflow.start_node_id]
+    ordered = {start.id: start}
+    queue = deque([start])
+    while queue:
+        for node in queue.popleft().out.values():
+            if node.id not in ordered:
+                ordered[node.id] = node
+                queue.append(node)
+    for node in workflow.nodes.values():
+        ordered.setdefault(node.id, node)
+    return list(ordered.values())
+
+
+def get_workflow_tool_uuids(workflow: WorkflowGraph) -> list[str]:
+    """Get the tools of the workflow, in the order their nodes are reached."""
+    tool_uuids: list[str] = []
+    for node in _nodes_in_visit_order(workflow):
+        for tool_uuid in node.tool_uuids or []:
+            if tool_uuid not in tool_uuids:
+                tool_uuids.append(tool_uuid)
+    return tool_uuids
+
+
+@dataclass(frozen=True)
+class CallToolRegistry:
+    """The tools of a call (``ToolModel`` instances) and their credentials."""
+
+    tools: Mapping[str, Any] = field(default_factory=dict)
+    # credential UUID -> credential, None if the credential wasn't found
+    credentials: Mapping[str, Any] = field(default_factory=dict)
+    function_schemas: Mapping[str, FunctionSchema] = field(default_factory=dict)
+
+    def get_tools(self, tool_uuids: list[str]) -> list[Any]:
+        """Get the (active) tools among *tool_uuids*."""
+        return [self.tools[uuid] for uuid in tool_uuids if uuid in self.tools]
+
+    def get_function_schemas(self, tool_uuids: list[str]) -> list[FunctionSchema]:
+        """Get the LLM function schemas of the (active) tools among *tool_uuids*."""
+        return [
+            self.function_schemas[uuid]
+            for uuid in tool_uuids
+            if uuid in self.function_schemas
+        ]
+
+
+def build_call_tool_registry(
+    tools_with_credentials: list[tuple[Any, Any]],
+) -> CallToolRegistry:
+    """Build a registry from the (tool, credential) pairs of the workflow."""
+    tools: dict[str, Any] = {}
+    credentials: dict[str, Any] = {}
+    function_schemas: dict[str, FunctionSchema] = {}
+
+    for tool, credential in tools_with_credentials:
+        tools[tool.tool_uuid] = tool
+        credential_uuid = (
+            (tool.definition or {}).get("config", {}).get("credential_uuid")
+        )
+        if credential_uuid:
+            credentials[credential_uuid] = credential
+
+        function = tool_to_function_schema(tool)["function"]
+        function_schemas[tool.tool_uuid] = get_function_schema(
+            function["name"],
+            function["description"],
+            properties=function["parameters"].get("properties", {}),
+            required=function["parameters"].get("required", []),
+        )
+
+    return CallToolRegistry(
+        tools=MappingProxyType(tools),
+        credentials=MappingProxyType(credentials),
+        function_schemas=MappingProxyType(function_schemas),
+    )
+
+
+async def load_call_tool_registry(
+    workflow: WorkflowGraph, organization_id: Optional[int]
+) -> CallToolRegistry:
+    """Resolve every tool of the workflow and its credential with one query.
+
+    Args:
+        workflow: The workflow of the call
+        organization_id: The organization the tools belong to
+
+    Returns:
+        The registry of the call (empty if the workflow has no tools)
+    """
+    tool_uuids = get_workflow_tool_uuids(workflow)
+    if not tool_uuids or not organization_id:
+        return CallToolRegistry()
+
+    tools_with_credentials = await db_client.get_tools_with_credentials(
+        tool_uuids, organization_id
+    )
+    registry = build_call_tool_registry(tools_with_credentials)
+    logger.debug(
+        f"Prefetched {len(registry.tools)}/{len(tool_uuids)} tools and "
+        f"{len(registry.credentials)} credentials for the call"
+    )
+    return registry
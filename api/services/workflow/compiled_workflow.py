@@ -0,0 +1,117 @@
+"""Ahead-of-time compilation of workflows for PipecatEngine.
+
+Everything ``PipecatEngine.set_node`` needs that only depends on the workflow
+definition (the transition functions of each node and their schemas, the
+knowledge base tool schema, the parsed global and node prompts) is computed
+once per definition and shared by every call running it. Entering a node is
+then a lookup plus rendering the prompts with the call context.
+
+Compiled workflows are cached by ``WorkflowGraph.definition_hash`` in a bounded
+LRU, so a new version of a workflow compiles on its first call.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from api.services.workflow.pipecat_engine_utils import get_function_schema
+from api.services.workflow.tools.knowledge_base import get_knowledge_base_tool
+from api.services.workflow.workflow import Node, WorkflowGraph
+from api.utils.template_renderer import CompiledTemplate, compile_string
+from pipecat.adapters.schemas.function_schema import FunctionSchema
+
+# Distinct workflow definitions kept compiled per process
+COMPILED_WORKFLOW_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class CompiledTransition:
+    """A transition function of a node, called by the LLM to move to ``target``."""
+
+    function_name: str
+    target: str
+    schema: FunctionSchema
+
+
+@dataclass(frozen=True)
+class CompiledNode:
+    """The parts of a node's LLM setup that don't depend on the call."""
+
+    node_id: str
+    prompt_templates: tuple[CompiledTemplate, ...]
+    transitions: tuple[CompiledTransition, ...]
+    knowledge_base_schema: Optional[FunctionSchema]
+
+    def render_prompt(self, context: Dict[str, Any]) -> str:
+        """Render the system prompt (global prompt first) with the call context."""
+        rendered = (template.render(context) for template in self.prompt_templates)
+        return "\n\n".join(prompt for prompt in rendered if prompt)
+
+
+@dataclass(frozen=True)
+class CompiledWorkflow:
+    definition_hash: str
+    nodes: Dict[str, CompiledNode]
+
+
+def _compile_node(workflow: WorkflowGraph, node: Node) -> CompiledNode:
+    prompts = []
+    if workflow.global_node_id and node.add_global_prompt:
+        prompts.append(workflow.nodes[workflow.global_node_id].prompt)
+    prompts.append(node.prompt)
+
+    transitions = tuple(
+        CompiledTransition(
+            function_name=edge.get_function_name(),
+            target=edge.target,
+            schema=get_function_schema(edge.get_function_name(), edge.condition),
+        )
+        for edge in node.out_edges
+    )
+
+    knowledge_base_schema = None
+    if node.document_uuids:
+        kb_function = get_knowledge_base_tool(node.document_uuids)["function"]
+        knowledge_base_schema = get_function_schema(
+            kb_function["name"],
+            kb_function["description"],
+            properties=kb_function["parameters"].get("properties", {}),
+            required=kb_function["parameters"].get("required", []),
+        )
+
+    return CompiledNode(
+        node_id=node.id,
+        prompt_templates=tuple(compile_string(p) for p in prompts if p),
+        transitions=transitions,
+        knowledge_base_schema=knowledge_base_schema,
+    )
+
+
+_compiled_workflows: "OrderedDict[str, CompiledWorkflow]" = OrderedDict()
+
+
+def compile_workflow(workflow: WorkflowGraph) -> CompiledWorkflow:
+    """Get the compiled form of *workflow*, compiling it on the first call.
+
+    Args:
+        workflow: The workflow of the call
+
+    Returns:
+        The compiled workflow, shared by all workflows with the same definition
+    """
+    compiled = _compiled_workflows.get(workflow.definition_hash)
+    if compiled is not None:
+        _compiled_workflows.move_to_end(workflow.definition_hash)
+        return compiled
+
+    compiled = CompiledWorkflow(
+        definition_hash=workflow.definition_hash,
+        nodes={
+            node_id: _compile_node(workflow, node)
+            for node_id, node in workflow.nodes.items()
+        },
+    )
+    _compiled_workflows[workflow.definition_hash] = compiled
+    while len(_compiled_workflows) > COMPILED_WORKFLOW_CACHE_SIZE:
+        _compiled_workflows.popitem(last=False)
+    return compiled
@@ -41,6 +41,12 @@ class RetryConfigDTO(BaseModel):
     retry_delay_seconds: int = 5
 
 
+class WebhookBatchConfigDTO(BaseModel):
+    enabled: bool = False
+    max_events: int = Field(default=100, ge=1, le=1000)
+    window_seconds: int = Field(default=30, ge=1, le=3600)
+
+
 class NodeDataDTO(BaseModel):
     name: str = Field(..., min_length=1)
     prompt: Optional[str] = Field(default=None)
@@ -68,6 +74,7 @@ class NodeDataDTO(BaseModel):
     custom_headers: Optional[list[CustomHeaderDTO]] = None
     payload_template: Optional[dict] = None
     retry_config: Optional[RetryConfigDTO] = None
+    batch_config: Optional[WebhookBatchConfigDTO] = None
 
 
 class RFNodeDTO(BaseModel):
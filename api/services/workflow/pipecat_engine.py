@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Awaitable, Callable, Optional, Union
 
+from api.constants import CUSTOM_TOOL_PREFETCH
 from api.services.workflow.disposition_mapper import (
     apply_disposition_mapping,
     get_organization_id_from_workflow_run,
@@ -31,6 +32,11 @@ from datetime import UTC, datetime
 from loguru import logger
 
 from api.services.workflow import pipecat_engine_callbacks as engine_callbacks
+from api.services.workflow.call_tool_registry import CallToolRegistry
+from api.services.workflow.compiled_workflow import (
+    CompiledWorkflow,
+    compile_workflow,
+)
 from api.services.workflow.pipecat_engine_custom_tools import CustomToolManager
 from api.services.workflow.pipecat_engine_utils import (
     get_function_schema,
@@ -41,10 +47,7 @@ from api.services.workflow.pipecat_engine_variable_extractor import (
     VariableExtractionManager,
 )
 from api.services.workflow.tools.calculator import get_calculator_tools, safe_calculator
-from api.services.workflow.tools.knowledge_base import (
-    get_knowledge_base_tool,
-    retrieve_from_knowledge_base,
-)
+from api.services.workflow.tools.knowledge_base import retrieve_from_knowledge_base
 from api.services.workflow.tools.timezone import (
     convert_time,
     get_current_time,
@@ -91,6 +94,9 @@ class PipecatEngine:
         # Lazy loaded built-in function schemas
         self._builtin_function_schemas: Optional[list[dict]] = None
 
+        # Lazy loaded compiled workflow, shared with other calls of the workflow
+        self._compiled_workflow: Optional[CompiledWorkflow] = None
+
         # Track current LLM reference text for TTS aggregation correction
         self._current_llm_generation_reference_text: str = ""
 
@@ -111,6 +117,13 @@ class PipecatEngine:
         # Audio configuration (set via set_audio_config from _run_pipeline)
         self._audio_config = None
 
+    @property
+    def tool_registry(self) -> Optional[CallToolRegistry]:
+        """The custom tools of the call, if they were prefetched."""
+        if self._custom_tool_manager:
+            return self._custom_tool_manager.registry
+        return None
+
     async def _get_organization_id(self) -> Optional[int]:
         """Get and cache the organization ID from workflow run."""
         if self._custom_tool_manager:
@@ -148,6 +161,13 @@ class PipecatEngine:
 
         return self._builtin_function_schemas
 
+    @property
+    def compiled_workflow(self) -> CompiledWorkflow:
+        """Get the precomputed node prompts, transitions and schemas of the workflow."""
+        if self._compiled_workflow is None:
+            self._compiled_workflow = compile_workflow(self.workflow)
+        return self._compiled_workflow
+
     async def initialize(self):
         # TODO: May be set_node in a separate task so that we return from initialize immediately
         if self._initialized:
@@ -161,6 +181,8 @@ class PipecatEngine:
 
             # Helper that encapsulates custom tool management
             self._custom_tool_manager = CustomToolManager(self)
+            if CUSTOM_TOOL_PREFETCH:
+                await self._custom_tool_manager.prefetch()
 
             # Add current time in EST (America/New_York) to gathered context
             try:
@@ -174,6 +196,10 @@ class PipecatEngine:
             # Register built-in functions with the LLM
             await self._register_builtin_functions()
 
+            # Compile the workflow (or reuse its compiled form) before the
+            # first node, so node transitions don't have to
+            self._compiled_workflow = compile_workflow(self.workflow)
+
             await self.set_node(self.workflow.start_node_id)
 
             logger.debug(f"{self.__class__.__name__} initialized")
@@ -394,30 +420,23 @@ class PipecatEngine:
         extraction_prompt = self._format_prompt(node.extraction_prompt)
         extraction_variables = node.extraction_variables
 
-        async def _do_extraction():
-            try:
-                extracted_data = (
-                    await self._variable_extraction_manager._perform_extraction(
-                        extraction_variables, parent_context, extraction_prompt
-                    )
-                )
-                self._gathered_context.update(extracted_data)
-                logger.debug(
-                    f"Variable extraction completed. Extracted: {extracted_data}"
-                )
-            except Exception as e:
-                logger.error(f"Error during variable extraction: {str(e)}")
-
         if run_in_background:
             logger.debug(
                 f"Scheduling background variable extraction for node: {node.name}"
             )
-            asyncio.create_task(_do_extraction())
+            self._variable_extraction_manager.schedule(
+                extraction_variables, parent_context, extraction_prompt
+            )
         else:
             logger.debug(
                 f"Performing synchronous variable extraction for node: {node.name}"
             )
-            await _do_extraction()
+            try:
+                await self._variable_extraction_manager.extract_now(
+                    extraction_variables, parent_context, extraction_prompt
+                )
+            except Exception as e:
+                logger.error(f"Error during variable extraction: {str(e)}")
 
     async def _setup_llm_context(self, node: Node) -> None:
         """Common method to set up LLM context"""
@@ -429,9 +448,9 @@ class PipecatEngine:
 
         # Register transition functions if not an end node
         if not node.is_end:
-            for outgoing_edge in node.out_edges:
+            for transition in self.compiled_workflow.nodes[node.id].transitions:
                 await self._register_transition_function_with_llm(
-                    outgoing_edge.get_function_name(), outgoing_edge.target
+                    transition.function_name, transition.target
                 )
 
         # Register custom tool handlers for this node
@@ -607,10 +626,7 @@ class PipecatEngine:
         responsible for that.
         """
 
-        global_prompt = ""
-        if self.workflow.global_node_id and node.add_global_prompt:
-            global_node = self.workflow.nodes[self.workflow.global_node_id]
-            global_prompt = self._format_prompt(global_node.prompt)
+        compiled_node = self.compiled_workflow.nodes[node.id]
 
         functions: list[dict] = []
 
@@ -618,15 +634,8 @@ class PipecatEngine:
         functions.extend(self.builtin_function_schemas)
 
         # Add knowledge base retrieval tool if node has documents
-        if node.document_uuids:
-            kb_tool_def = get_knowledge_base_tool(node.document_uuids)
-            kb_schema = get_function_schema(
-                kb_tool_def["function"]["name"],
-                kb_tool_def["function"]["description"],
-                properties=kb_tool_def["function"]["parameters"].get("properties", {}),
-                required=kb_tool_def["function"]["parameters"].get("required", []),
-            )
-            functions.append(kb_schema)
+        if compiled_node.knowledge_base_schema:
+            functions.append(compiled_node.knowledge_base_schema)
 
         # Add custom tools from node.tool_uuids
         if node.tool_uuids and self._custom_tool_manager:
@@ -636,19 +645,11 @@ class PipecatEngine:
             functions.extend(custom_tool_schemas)
 
         # Transition functions (schema only; registration handled elsewhere)
-        for outgoing_edge in node.out_edges:
-            function_schema = self._get_function_schema(
-                outgoing_edge.get_function_name(), outgoing_edge.condition
-            )
-            functions.append(function_schema)
-
-        formatted_node_prompt = self._format_prompt(node.prompt)
+        functions.extend(t.schema for t in compiled_node.transitions)
 
         system_message = {
             "role": "system",
-            "content": "\n\n".join(
-                p for p in (global_prompt, formatted_node_prompt) if p
-            ),
+            "content": compiled_node.render_prompt(self._call_context_vars),
         }
 
         return system_message, functions
@@ -772,3 +773,7 @@ class PipecatEngine:
             and not self._user_response_timeout_task.done()
         ):
             self._user_response_timeout_task.cancel()
+
+        # Cancel a debounced variable extraction still waiting to run
+        if self._variable_extraction_manager:
+            await self._variable_extraction_manager.cleanup()
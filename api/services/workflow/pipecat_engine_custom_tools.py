@@ -20,6 +20,11 @@ from api.enums import ToolCategory, WorkflowRunMode
 from api.services.telephony.call_transfer_manager import get_call_transfer_manager
 from api.services.telephony.factory import get_telephony_provider
 from api.services.telephony.transfer_event_protocol import TransferContext
+from api.services.workflow.call_tool_registry import (
+    CallToolRegistry,
+    get_workflow_tool_uuids,
+    load_call_tool_registry,
+)
 from api.services.workflow.disposition_mapper import (
     get_organization_id_from_workflow_run,
 )
@@ -46,7 +51,8 @@ class CustomToolManager:
     """Manager for custom tool registration and execution.
 
     This class handles:
-      1. Fetching tools from the database based on tool UUIDs
+      1. Fetching tools from the database based on tool UUIDs (all at once
+         with their credentials, when prefetched at call setup)
       2. Converting tools to LLM function schemas
       3. Registering tool execution handlers with the LLM
       4. Executing tools when invoked by the LLM
@@ -55,6 +61,40 @@ class CustomToolManager:
     def __init__(self, engine: "PipecatEngine") -> None:
         self._engine = engine
         self._organization_id: Optional[int] = None
+        # Credentials resolved during this call, keyed by credential UUID
+        self._credential_cache: dict[str, Any] = {}
+        # Tools and credentials of the workflow, when prefetched
+        self._registry: Optional[CallToolRegistry] = None
+
+    @property
+    def registry(self) -> Optional[CallToolRegistry]:
+        """The prefetched tools of the call, None if they weren't prefetched."""
+        return self._registry
+
+    async def prefetch(self) -> None:
+        """Resolve every tool of the workflow and its credential up front.
+
+        Afterwards, schema generation and tool execution don't query the
+        database. If prefetching fails, tools are fetched when needed instead.
+        """
+        if not get_workflow_tool_uuids(self._engine.workflow):
+            self._registry = CallToolRegistry()
+            return
+
+        organization_id = await self.get_organization_id()
+        if not organization_id:
+            logger.warning(
+                "Cannot prefetch custom tools: organization_id not available"
+            )
+            return
+
+        try:
+            self._registry = await load_call_tool_registry(
+                self._engine.workflow, organization_id
+            )
+            self._credential_cache.update(self._registry.credentials)
+        except Exception as e:
+            logger.error(f"Failed to prefetch custom tools: {e}")
 
     async def get_organization_id(self) -> Optional[int]:
         """Get and cache the organization ID from workflow run."""
@@ -73,6 +113,9 @@ class CustomToolManager:
         Returns:
             List of FunctionSchema objects for LLM
         """
+        if self._registry is not None:
+            return self._registry.get_function_schemas(tool_uuids)
+
         organization_id = await self.get_organization_id()
         if not organization_id:
             logger.warning("Cannot fetch custom tools: organization_id not available")
@@ -121,7 +164,10 @@ class CustomToolManager:
             return
 
         try:
-            tools = await db_client.get_tools_by_uuids(tool_uuids, organization_id)
+            if self._registry is not None:
+                tools = self._registry.get_tools(tool_uuids)
+            else:
+                tools = await db_client.get_tools_by_uuids(tool_uuids, organization_id)
 
             for tool in tools:
                 schema = tool_to_function_schema(tool)
@@ -195,6 +241,7 @@ class CustomToolManager:
                     arguments=function_call_params.arguments,
                     call_context_vars=self._engine._call_context_vars,
                     organization_id=self._organization_id,
+                    credential_cache=self._credential_cache,
                 )
 
                 await function_call_params.result_callback(result)
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from loguru import logger
 from opentelemetry import trace
 
+from api.constants import (
+    VARIABLE_EXTRACTION_DEBOUNCE_MS,
+    VARIABLE_EXTRACTION_INCREMENTAL,
+)
 from api.services.gen_ai.json_parser import parse_llm_json
 from api.services.pipecat.tracing_config import is_tracing_enabled
 from api.services.workflow.dto import ExtractionVariableDTO
@@ -15,21 +22,227 @@ if TYPE_CHECKING:
     from api.services.workflow.pipecat_engine import PipecatEngine
 
 
+# Turns before the new ones included in incremental prompts, so references
+# like "yes, that one" can be resolved
+CONTEXT_OVERLAP_LINES = 4
+
+# A debounced extraction is flushed at most this many debounce periods after
+# the first pending request, even if nodes keep transitioning
+MAX_DEBOUNCE_PERIODS = 4
+
+
+def _get_role_and_content(msg: Any) -> tuple[str | None, str | None]:
+    """Return a pair of (role, content) for the given message.
+
+    The logic supports both OpenAI-style dict messages and Google
+    `Content` objects that expose ``role`` and ``parts`` attributes.
+    Only plain textual content is extracted – image parts, tool call
+    placeholders, etc. are ignored for the purpose of variable
+    extraction.
+    """
+
+    # --------------------------------------------------------------
+    # OpenAI format → simple dict with ``role`` and ``content`` keys
+    # --------------------------------------------------------------
+    if isinstance(msg, dict):
+        role = msg.get("role")
+        content_field = msg.get("content")
+
+        # Content can be a str, list of segments, or None.
+        if isinstance(content_field, str):
+            content = content_field
+        elif isinstance(content_field, list):
+            # Collapse all text parts into a single string.
+            texts = [
+                segment.get("text", "")
+                for segment in content_field
+                if isinstance(segment, dict) and segment.get("type") == "text"
+            ]
+            content = " ".join(texts) if texts else None
+        else:
+            content = None
+
+        return role, content
+
+    # --------------------------------------------------------------
+    # Google Gemini format → ``Content`` object with ``parts`` list
+    # --------------------------------------------------------------
+    role_attr = getattr(msg, "role", None)
+    parts_attr = getattr(msg, "parts", None)
+
+    if role_attr is None or parts_attr is None:
+        return None, None  # Unrecognised message format
+
+    role = "assistant" if role_attr == "model" else role_attr  # Normalise role name
+
+    # Collect textual parts only (ignore images, function calls, etc.)
+    texts: list[str] = []
+    for part in parts_attr:
+        text_val = getattr(part, "text", None)
+        if text_val:
+            texts.append(text_val)
+
+    content = " ".join(texts) if texts else None
+    return role, content
+
+
+def _conversation_lines(messages: List[Any]) -> list[str]:
+    """``role: content`` lines of the user and assistant turns in ``messages``."""
+    lines: list[str] = []
+    for msg in messages:
+        role, content = _get_role_and_content(msg)
+        if role in ("assistant", "user") and content:
+            lines.append(f"{role}: {content}")
+    return lines
+
+
+@dataclass
+class _ExtractionRequest:
+    """A node's extraction waiting to be batched with others."""
+
+    variables: List[ExtractionVariableDTO]
+    extraction_prompt: str
+    parent_ctx: Any
+
+
+def _merge_requests(
+    requests: List[_ExtractionRequest],
+) -> tuple[List[ExtractionVariableDTO], str, Any]:
+    """Combine pending extractions into one: variables by name (latest wins),
+    distinct prompts concatenated, and the latest tracing context."""
+    variables: Dict[str, ExtractionVariableDTO] = {}
+    prompts: list[str] = []
+    for request in requests:
+        for variable in request.variables:
+            variables.pop(variable.name, None)
+            variables[variable.name] = variable
+        if request.extraction_prompt and request.extraction_prompt not in prompts:
+            prompts.append(request.extraction_prompt)
+    return list(variables.values()), "\n\n".join(prompts), requests[-1].parent_ctx
+
+
 class VariableExtractionManager:
-    """Helper that registers and executes the \"extract_variables\" tool.
+    """Helper that runs variable extraction for workflow nodes.
 
-    The manager is responsible for two things:
-      1. Registering a callable with the LLM service so that the tool can be
-         invoked from within the model.
-      2. Executing the extraction in a background task while maintaining
-         correct bookkeeping and optional OpenTelemetry tracing.
+    The manager is responsible for:
+      1. Executing the extraction chat completion out of band and merging the
+         result into the engine's gathered context, with optional
+         OpenTelemetry tracing.
+      2. Incremental extraction: it remembers the values extracted so far and,
+         per variable, how much of the conversation they cover. Later
+         extractions send only the turns since then plus the current values.
+      3. Batching: background extractions requested by transitions within the
+         debounce window are combined into one LLM request.
     """
 
-    def __init__(self, engine: "PipecatEngine") -> None:  # noqa: F821
+    def __init__(
+        self,
+        engine: "PipecatEngine",  # noqa: F821
+        incremental: bool = VARIABLE_EXTRACTION_INCREMENTAL,
+        debounce_secs: float = VARIABLE_EXTRACTION_DEBOUNCE_MS / 1000,
+    ) -> None:
         # We keep a reference to the engine so we can reuse its context
         # and update internal counters / extracted variable state.
         self._engine = engine
         self._context = engine.context
+        self._incremental = incremental
+        self._debounce_secs = debounce_secs
+
+        # Incremental state: latest value per variable, and the number of
+        # context messages the value accounts for
+        self._values: Dict[str, Any] = {}
+        self._covered_messages: Dict[str, int] = {}
+
+        # Debounced background extractions
+        self._pending: List[_ExtractionRequest] = []
+        self._flush_at = 0.0
+        self._flush_deadline = 0.0
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Extractions run one at a time so the incremental state stays consistent
+        self._lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+    def schedule(
+        self,
+        extraction_variables: List[ExtractionVariableDTO],
+        parent_ctx: Any,
+        extraction_prompt: str = "",
+    ) -> None:
+        """Queue a background extraction.
+
+        The extraction runs after ``debounce_secs`` without new requests
+        (bounded by ``MAX_DEBOUNCE_PERIODS``), together with any other
+        extraction queued meanwhile.
+        """
+        self._pending.append(
+            _ExtractionRequest(extraction_variables, extraction_prompt, parent_ctx)
+        )
+        now = asyncio.get_running_loop().time()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_deadline = now + self._debounce_secs * MAX_DEBOUNCE_PERIODS
+            self._flush_task = asyncio.create_task(self._debounced_flush())
+        self._flush_at = min(now + self._debounce_secs, self._flush_deadline)
+
+    async def extract_now(
+        self,
+        extraction_variables: List[ExtractionVariableDTO],
+        parent_ctx: Any,
+        extraction_prompt: str = "",
+    ) -> dict:
+        """Run an extraction immediately, together with any queued ones.
+
+        Returns:
+            The extracted variables (already merged into the gathered context).
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+        self._pending.append(
+            _ExtractionRequest(extraction_variables, extraction_prompt, parent_ctx)
+        )
+        return await self._flush()
+
+    async def cleanup(self) -> None:
+        """Cancel the debounced extraction, if any, and drop queued requests."""
+        flush_task, self._flush_task = self._flush_task, None
+        self._pending = []
+        if flush_task is not None and not flush_task.done():
+            flush_task.cancel()
+            try:
+                await flush_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _debounced_flush(self) -> None:
+        loop = asyncio.get_running_loop()
+        while (delay := self._flush_at - loop.time()) > 0:
+            await asyncio.sleep(delay)
+        self._flush_task = None
+        try:
+            await self._flush()
+        except Exception as e:
+            logger.error(f"Error during variable extraction: {str(e)}")
+
+    async def _flush(self) -> dict:
+        requests, self._pending = self._pending, []
+        if not requests:
+            return {}
+        variables, extraction_prompt, parent_ctx = _merge_requests(requests)
+        if len(requests) > 1:
+            logger.debug(
+                f"Batching {len(requests)} variable extractions into one request"
+            )
+
+        async with self._lock:
+            extracted = await self._perform_extraction(
+                variables, parent_ctx, extraction_prompt
+            )
+        self._engine._gathered_context.update(extracted)
+        logger.debug(f"Variable extraction completed. Extracted: {extracted}")
+        return extracted
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -50,73 +263,33 @@ class VariableExtractionManager:
         )
 
         # ------------------------------------------------------------------
-        # Build a normalized representation of the existing conversation so the
+        # Build a normalized representation of the conversation so the
         # extractor works with both OpenAI-style (dict) messages and Google
-        # Gemini `Content` objects.
+        # Gemini `Content` objects. In incremental mode only the turns not yet
+        # covered by every requested variable are sent.
         # ------------------------------------------------------------------
-        def _get_role_and_content(msg: Any) -> tuple[str | None, str | None]:
-            """Return a pair of (role, content) for the given message.
-
-            The logic supports both OpenAI-style dict messages and Google
-            `Content` objects that expose ``role`` and ``parts`` attributes.
-            Only plain textual content is extracted – image parts, tool call
-            placeholders, etc. are ignored for the purpose of variable
-            extraction.
-            """
-
-            # --------------------------------------------------------------
-            # OpenAI format → simple dict with ``role`` and ``content`` keys
-            # --------------------------------------------------------------
-            if isinstance(msg, dict):
-                role = msg.get("role")
-                content_field = msg.get("content")
-
-                # Content can be a str, list of segments, or None.
-                if isinstance(content_field, str):
-                    content = content_field
-                elif isinstance(content_field, list):
-                    # Collapse all text parts into a single string.
-                    texts = [
-                        segment.get("text", "")
-                        for segment in content_field
-                        if isinstance(segment, dict) and segment.get("type") == "text"
-                    ]
-                    content = " ".join(texts) if texts else None
-                else:
-                    content = None
-
-                return role, content
-
-            # --------------------------------------------------------------
-            # Google Gemini format → ``Content`` object with ``parts`` list
-            # --------------------------------------------------------------
-            role_attr = getattr(msg, "role", None)
-            parts_attr = getattr(msg, "parts", None)
-
-            if role_attr is None or parts_attr is None:
-                return None, None  # Unrecognised message format
-
-            role = (
-                "assistant" if role_attr == "model" else role_attr
-            )  # Normalise role name
-
-            # Collect textual parts only (ignore images, function calls, etc.)
-            texts: list[str] = []
-            for part in parts_attr:
-                text_val = getattr(part, "text", None)
-                if text_val:
-                    texts.append(text_val)
-
-            content = " ".join(texts) if texts else None
-            return role, content
+        messages = list(self._context.messages)
+        message_count = len(messages)
+        if any(n > message_count for n in self._covered_messages.values()):
+            # The context was reset or trimmed; start over
+            self._covered_messages.clear()
 
-        conversation_lines: list[str] = []
-        for msg in self._context.messages:
-            role, content = _get_role_and_content(msg)
-            if role in ("assistant", "user") and content:
-                conversation_lines.append(f"{role}: {content}")
+        start = 0
+        current_values = {}
+        if self._incremental:
+            start = min(
+                self._covered_messages.get(v.name, 0) for v in extraction_variables
+            )
+            current_values = {
+                v.name: self._values[v.name]
+                for v in extraction_variables
+                if v.name in self._values
+            }
 
-        conversation_history = "\n".join(conversation_lines)
+        new_lines = _conversation_lines(messages[start:])
+        if start and not new_lines and len(current_values) == len(extraction_variables):
+            logger.debug("No new turns since the last extraction; reusing values")
+            return dict(current_values)
 
         system_prompt = (
             "You are an assistant tasked with extracting structured data from the conversation. "
@@ -129,12 +302,27 @@ class VariableExtractionManager:
             else system_prompt
         )
 
-        user_prompt = (
-            "\n\nVariables to extract:\n"
-            f"{vars_description}"
-            "\n\nConversation history:\n"
-            f"{conversation_history}"
-        )
+        if start:
+            earlier_lines = _conversation_lines(messages[:start])
+            earlier_lines = earlier_lines[-CONTEXT_OVERLAP_LINES:]
+            user_prompt = (
+                "\n\nVariables to extract:\n"
+                f"{vars_description}"
+                "\n\nCurrent values, extracted from the earlier conversation:\n"
+                f"{json.dumps(current_values, default=str)}"
+                "\n\nLast turns of the earlier conversation (for context):\n"
+                + "\n".join(earlier_lines)
+                + "\n\nNew conversation turns:\n"
+                + "\n".join(new_lines)
+                + "\n\nReturn every requested variable. Keep a current value unless "
+                "the new turns change or complete it."
+            )
+        else:
+            user_prompt = (
+                "\n\nVariables to extract:\n"
+                f"{vars_description}"
+                "\n\nConversation history:\n" + "\n".join(new_lines)
+            )
 
         extraction_context = LLMContext()
         extraction_messages = [
@@ -181,6 +369,13 @@ class VariableExtractionManager:
                 logger.warning(
                     "Extractor returned invalid JSON; storing raw content instead."
                 )
+            else:
+                # Variables the model left out are sent again with the next
+                # extraction, along with the turns they haven't covered yet
+                for variable in extraction_variables:
+                    if variable.name in extracted:
+                        self._values[variable.name] = extracted[variable.name]
+                        self._covered_messages[variable.name] = message_count
 
         logger.debug(f"Extracted variables: {extracted}")
         return extracted
@@ -7,6 +7,10 @@ import httpx
 from loguru import logger
 
 from api.db import db_client
+from api.services.workflow.tools.http_tool_engine import (
+    build_tool_result,
+    get_http_tool_engine,
+)
 from api.utils.credential_auth import build_auth_header
 
 # Map tool parameter types to JSON schema types
@@ -71,19 +75,43 @@ def tool_to_function_schema(tool: Any) -> Dict[str, Any]:
     }
 
 
+async def _get_credential(
+    credential_uuid: str,
+    organization_id: int,
+    credential_cache: Optional[Dict[str, Any]],
+) -> Any:
+    """Fetch a credential, using the per-call cache when one is provided."""
+    if credential_cache is not None and credential_uuid in credential_cache:
+        return credential_cache[credential_uuid]
+
+    credential = await db_client.get_credential_by_uuid(
+        credential_uuid, organization_id
+    )
+    if credential_cache is not None:
+        credential_cache[credential_uuid] = credential
+    return credential
+
+
 async def execute_http_tool(
     tool: Any,
     arguments: Dict[str, Any],
     call_context_vars: Optional[Dict[str, Any]] = None,
     organization_id: Optional[int] = None,
+    credential_cache: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """Execute an HTTP API tool.
 
+    Requests go through the process-wide HttpToolEngine, which keeps warm
+    connection pools per host and optionally caches GET responses
+    (``cache_ttl_seconds`` in the tool config).
+
     Args:
         tool: ToolModel instance
         arguments: Arguments passed by the LLM (parameter name -> value)
         call_context_vars: Additional context variables from the call (unused for now)
         organization_id: Organization ID for credential lookup
+        credential_cache: Optional per-call dict (credential_uuid -> credential)
+            so the credential is only fetched from the database once per call
 
     Returns:
         Result dict with response data or error
@@ -102,8 +130,8 @@ async def execute_http_tool(
     credential_uuid = config.get("credential_uuid")
     if credential_uuid and organization_id:
         try:
-            credential = await db_client.get_credential_by_uuid(
-                credential_uuid, organization_id
+            credential = await _get_credential(
+                credential_uuid, organization_id, credential_cache
             )
             if credential:
                 auth_header = build_auth_header(credential)
@@ -134,31 +162,22 @@ async def execute_http_tool(
     logger.debug(f"Request body: {body}, params: {params}")
 
     try:
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=body,
-                params=params,
-            )
-
-            # Try to parse JSON response
-            try:
-                response_data = response.json()
-            except Exception:
-                response_data = {"raw_response": response.text}
-
-            result = {
-                "status": "success",
-                "status_code": response.status_code,
-                "data": response_data,
-            }
-
-            logger.debug(
-                f"Custom tool '{tool.name}' completed with status {response.status_code}"
-            )
-            return result
+        response, timing = await get_http_tool_engine().request(
+            method=method,
+            url=url,
+            headers=headers,
+            json_body=body,
+            params=params,
+            timeout_seconds=timeout_seconds,
+            cache_ttl_seconds=config.get("cache_ttl_seconds"),
+        )
+        result = response if isinstance(response, dict) else build_tool_result(response)
+
+        logger.debug(
+            f"Custom tool '{tool.name}' completed with status {result['status_code']} "
+            f"timing={timing.as_dict()}"
+        )
+        return result
 
     except httpx.TimeoutException:
         logger.error(f"Custom tool '{tool.name}' timed out after {timeout_seconds}s")
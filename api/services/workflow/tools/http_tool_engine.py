@@ -0,0 +1,339 @@
+"""Per-process execution engine for HTTP API tools.
+
+Tool calls happen mid-conversation while the caller waits, so the engine keeps
+warm keep-alive connection pools per target host instead of opening a new
+client (and TCP/TLS handshake) per invocation. It also provides:
+
+- An opt-in TTL response cache for idempotent GET tools, with in-flight
+  de-duplication so parallel identical calls share one request.
+- Per-phase timing of each call: connect, TTFB and total.
+
+Connection pools are safe to use concurrently, so parallel function calls
+issued by the LLM run concurrently (up to ``max_connections_per_host``). At
+most ``max_pooled_hosts`` pools are kept; the least recently used one is
+closed once its in-flight requests finish.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+# Keep-alive pool settings per target host
+MAX_CONNECTIONS_PER_HOST = 20
+MAX_KEEPALIVE_PER_HOST = 10
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+# Upper bound on hosts with a connection pool per process
+MAX_POOLED_HOSTS = 64
+
+# Upper bound on cached GET responses per process
+MAX_CACHED_RESPONSES = 1024
+
+
+@dataclass
+class ToolCallTiming:
+    """Phase timings (milliseconds) of a single HTTP tool call.
+
+    ``connect_ms`` covers DNS resolution, TCP connect and TLS handshake and is
+    zero when a pooled connection is reused.
+    """
+
+    connect_ms: float = 0.0
+    ttfb_ms: float = 0.0
+    total_ms: float = 0.0
+    reused_connection: bool = True
+    cache_hit: bool = False
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            k: round(v, 2) if isinstance(v, float) else v
+            for k, v in asdict(self).items()
+        }
+
+
+@dataclass
+class _PhaseTracer:
+    """Collects httpcore trace events for a single request."""
+
+    started_at: float = field(default_factory=time.perf_counter)
+    connect_started: Optional[float] = None
+    connect_ms: float = 0.0
+    request_sent: Optional[float] = None
+    ttfb_ms: float = 0.0
+    new_connection: bool = False
+
+    async def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if event_name in (
+            "connection.connect_tcp.started",
+            "connection.start_tls.started",
+        ):
+            self.new_connection = True
+            self.connect_started = now
+        elif event_name in (
+            "connection.connect_tcp.complete",
+            "connection.start_tls.complete",
+        ):
+            if self.connect_started is not None:
+                self.connect_ms += (now - self.connect_started) * 1000
+                self.connect_started = None
+        elif event_name.endswith("send_request_body.complete"):
+            self.request_sent = now
+        elif event_name.endswith("receive_response_headers.complete"):
+            self.ttfb_ms = (now - (self.request_sent or self.started_at)) * 1000
+
+
+@dataclass
+class _CachedResponse:
+    expires_at: float
+    result: Dict[str, Any]
+
+
+@dataclass
+class _PooledClient:
+    client: httpx.AsyncClient
+    # Requests in flight, the client is closed when evicted once they finish
+    active: int = 0
+    evicted: bool = False
+
+
+class HttpToolEngine:
+    """Executes HTTP tool requests over pooled, keep-alive connections."""
+
+    def __init__(
+        self,
+        max_connections_per_host: int = MAX_CONNECTIONS_PER_HOST,
+        max_keepalive_per_host: int = MAX_KEEPALIVE_PER_HOST,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY_SECONDS,
+        max_pooled_hosts: int = MAX_POOLED_HOSTS,
+    ) -> None:
+        self._max_pooled_hosts = max_pooled_hosts
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._clients_lock: Optional[asyncio.Lock] = None
+        self._limits = httpx.Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_keepalive_per_host,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._clients: "OrderedDict[Tuple[str, str, Optional[int]], _PooledClient]" = (
+            OrderedDict()
+        )
+        self._response_cache: Dict[str, _CachedResponse] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def _get_client(self, url: str) -> _PooledClient:
+        """Get the pooled client for the URL's host, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Pooled connections are bound to the loop that opened them
+            stale = [pooled.client for pooled in self._clients.values()]
+            self._clients.clear()
+            self._clients_lock = asyncio.Lock()
+            self._loop = loop
+            for client in stale:
+                await _close_client(client)
+
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname or "", parts.port)
+        pooled = self._clients.get(key)
+        if pooled is not None and not pooled.client.is_closed:
+            self._clients.move_to_end(key)
+            return pooled
+
+        evicted = []
+        async with self._clients_lock:
+            # Another request may have created it while we waited
+            pooled = self._clients.get(key)
+            if pooled is None or pooled.client.is_closed:
+                pooled = _PooledClient(httpx.AsyncClient(limits=self._limits))
+                self._clients[key] = pooled
+                while len(self._clients) > self._max_pooled_hosts:
+                    _, oldest = self._clients.popitem(last=False)
+                    oldest.evicted = True
+                    if oldest.active == 0:
+                        evicted.append(oldest.client)
+            self._clients.move_to_end(key)
+
+        for client in evicted:
+            await _close_client(client)
+        return pooled
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        json_body: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        timeout_seconds: float,
+        cache_ttl_seconds: Optional[float] = None,
+    ) -> Tuple[httpx.Response | Dict[str, Any], ToolCallTiming]:
+        """Send a request through the host's connection pool.
+
+        Args:
+            method: HTTP method.
+            url: Target URL.
+            headers: Request headers (including auth).
+            json_body: JSON body for POST/PUT/PATCH.
+            params: Query parameters for GET/DELETE.
+            timeout_seconds: Request timeout.
+            cache_ttl_seconds: If set and the method is GET, successful results
+                are cached for this long and identical in-flight requests are
+                shared.
+
+        Returns:
+            The response (or a cached result dict) and the call timing.
+        """
+        if method != "GET" or not cache_ttl_seconds:
+            return await self._send(
+                method, url, headers, json_body, params, timeout_seconds
+            )
+
+        cache_key = self._cache_key(url, headers, params)
+        cached = self._response_cache.get(cache_key)
+        if cached and cached.expires_at > time.monotonic():
+            return cached.result, ToolCallTiming(cache_hit=True)
+
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            started = time.perf_counter()
+            result = await asyncio.shield(inflight)
+            timing = ToolCallTiming(
+                cache_hit=True, total_ms=(time.perf_counter() - started) * 1000
+            )
+            return result, timing
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            response, timing = await self._send(
+                method, url, headers, json_body, params, timeout_seconds
+            )
+            result = build_tool_result(response)
+            if response.is_success:
+                self._store(cache_key, result, cache_ttl_seconds)
+            future.set_result(result)
+            return result, timing
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved if nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        json_body: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        timeout_seconds: float,
+    ) -> Tuple[httpx.Response, ToolCallTiming]:
+        pooled = await self._get_client(url)
+        tracer = _PhaseTracer()
+        pooled.active += 1
+        try:
+            response = await pooled.client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=json_body,
+                params=params,
+                timeout=timeout_seconds,
+                extensions={"trace": tracer},
+            )
+        finally:
+            pooled.active -= 1
+            if pooled.evicted and pooled.active == 0:
+                await _close_client(pooled.client)
+        timing = ToolCallTiming(
+            connect_ms=tracer.connect_ms,
+            ttfb_ms=tracer.ttfb_ms,
+            total_ms=(time.perf_counter() - tracer.started_at) * 1000,
+            reused_connection=not tracer.new_connection,
+        )
+        return response, timing
+
+    def _store(self, cache_key: str, result: Dict[str, Any], ttl: float) -> None:
+        if len(self._response_cache) >= MAX_CACHED_RESPONSES:
+            now = time.monotonic()
+            for key in [
+                k for k, v in self._response_cache.items() if v.expires_at <= now
+            ]:
+                del self._response_cache[key]
+            if len(self._response_cache) >= MAX_CACHED_RESPONSES:
+                # Drop the oldest insertion
+                self._response_cache.pop(next(iter(self._response_cache)))
+        self._response_cache[cache_key] = _CachedResponse(
+            expires_at=time.monotonic() + ttl, result=result
+        )
+
+    @staticmethod
+    def _cache_key(
+        url: str, headers: Dict[str, str], params: Optional[Dict[str, Any]]
+    ) -> str:
+        # Headers are part of the key so responses for different credentials
+        # are never shared.
+        return json.dumps(
+            [url, sorted(headers.items()), sorted((params or {}).items())],
+            default=str,
+        )
+
+    async def close(self) -> None:
+        """Close every pooled client."""
+        clients = [pooled.client for pooled in self._clients.values()]
+        self._clients.clear()
+        self._response_cache.clear()
+        for client in clients:
+            await _close_client(client)
+
+
+async def _close_client(client: httpx.AsyncClient) -> None:
+    try:
+        await client.aclose()
+    except Exception as e:
+        logger.debug(f"Error closing tool HTTP client: {e}")
+
+
+def build_tool_result(response: httpx.Response) -> Dict[str, Any]:
+    """Convert an HTTP response to the result dict returned to the LLM."""
+    # Try to parse JSON response
+    try:
+        response_data = response.json()
+    except Exception:
+        response_data = {"raw_response": response.text}
+
+    return {
+        "status": "success",
+        "status_code": response.status_code,
+        "data": response_data,
+    }
+
+
+# Global HTTP tool engine instance
+_http_tool_engine: Optional[HttpToolEngine] = None
+
+
+def get_http_tool_engine() -> HttpToolEngine:
+    """Get or create the global HTTP tool engine instance."""
+    global _http_tool_engine
+    if _http_tool_engine is None:
+        _http_tool_engine = HttpToolEngine()
+    return _http_tool_engine
+
+
+async def close_http_tool_engine() -> None:
+    """Close the global HTTP tool engine, if it was created."""
+    global _http_tool_engine
+    if _http_tool_engine is not None:
+        await _http_tool_engine.close()
+        _http_tool_engine = None
@@ -1,3 +1,4 @@
+import hashlib
 import re
 from collections import Counter
 from typing import Dict, List
@@ -97,6 +98,11 @@ class WorkflowGraph:
         except IndexError:
             self.global_node_id = None
 
+        # Identifies the definition, e.g. to reuse its compiled form across calls
+        self.definition_hash = hashlib.sha256(
+            dto.model_dump_json().encode()
+        ).hexdigest()
+
     # -----------------------------------------------------------
     # validators
     # -----------------------------------------------------------
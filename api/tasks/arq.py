@@ -12,7 +12,7 @@ from api.tasks.function_names import FunctionNames
 setup_logging()
 
 # Now import ARQ and task dependencies
-from arq import create_pool
+from arq import create_pool, cron
 from arq.connections import ArqRedis, RedisSettings
 
 from api.tasks.workflow_run_cost import calculate_workflow_run_cost
@@ -41,16 +41,23 @@ REDIS_SETTINGS = RedisSettings(
     ssl_check_hostname=False if use_ssl else None,
 )
 
+from api.services.integrations.webhook_delivery import DELIVERY_POLL_SECONDS
 from api.tasks.campaign_tasks import (
     process_campaign_batch,
     sync_campaign_source,
 )
 from api.tasks.knowledge_base_processing import process_knowledge_base_document
-from api.tasks.run_integrations import run_integrations_post_workflow_run
+from api.tasks.report_rollups import REFRESH_INTERVAL_MINUTES, refresh_report_rollups
+from api.tasks.run_integrations import (
+    deliver_pending_webhooks,
+    run_integrations_post_workflow_run,
+)
+from api.tasks.run_log_cleanup import cleanup_stale_run_logs
 from api.tasks.s3_upload import (
     process_workflow_completion,
     upload_voicemail_audio_to_s3,
 )
+from api.tasks.usage_ledger import fold_usage_ledger
 
 
 class WorkerSettings:
@@ -63,7 +70,19 @@ class WorkerSettings:
         process_campaign_batch,
         process_knowledge_base_document,
     ]
-    cron_jobs = []
+    cron_jobs = [
+        cron(
+            refresh_report_rollups,
+            minute=set(range(0, 60, REFRESH_INTERVAL_MINUTES)),
+            run_at_startup=True,
+        ),
+        cron(
+            deliver_pending_webhooks,
+            second=set(range(0, 60, DELIVERY_POLL_SECONDS)),
+        ),
+        cron(fold_usage_ledger, second=30, run_at_startup=True),
+        cron(cleanup_stale_run_logs, minute=15, run_at_startup=True),
+    ]
     redis_settings = REDIS_SETTINGS
     max_jobs = 10
 
@@ -0,0 +1,74 @@
+import math
+from datetime import UTC, datetime, timedelta
+
+from loguru import logger
+
+from api.db import db_client
+from api.db.rollups import ROLLUP_SLOT, floor_to_rollup_slot
+
+# The refresh runs every this many minutes
+REFRESH_INTERVAL_MINUTES = 5
+
+# Recent slots are rebuilt on every refresh so late updates (dispositions,
+# durations written at call end) are picked up
+REFRESH_LOOKBACK = timedelta(hours=2)
+
+# Older covered slots are rebuilt one chunk per refresh, cycling through the
+# covered range, so edits to older runs are picked up within a sweep
+RESWEEP_CHUNK = timedelta(days=1)
+
+# History is backfilled one chunk per refresh until this far back
+BACKFILL_DAYS = 90
+BACKFILL_CHUNK = timedelta(days=1)
+
+
+async def refresh_report_rollups(ctx):
+    """Periodically extend and refresh the workflow run rollups.
+
+    Rebuilds the slots between the end of the covered range (minus a lookback)
+    and the current slot, rebuilds one chunk of the older covered range (a
+    different chunk each refresh) and backfills one chunk of older history.
+    """
+    now = datetime.now(UTC)
+    now_slot = floor_to_rollup_slot(now)
+    coverage = await db_client.get_rollup_coverage()
+
+    if coverage is None:
+        covered_from = now_slot - BACKFILL_CHUNK
+        await db_client.refresh_workflow_run_rollups(covered_from, now_slot)
+        await db_client.set_rollup_coverage(covered_from, now_slot)
+        logger.info(f"Initialized workflow run rollups from {covered_from}")
+        return
+
+    covered_from, covered_through = coverage
+    refresh_from = max(covered_from, covered_through - REFRESH_LOOKBACK)
+    if refresh_from < now_slot:
+        await db_client.refresh_workflow_run_rollups(refresh_from, now_slot)
+
+    chunks = math.ceil((refresh_from - covered_from) / RESWEEP_CHUNK)
+    if chunks > 0:
+        refresh_number = int(now.timestamp()) // (REFRESH_INTERVAL_MINUTES * 60)
+        resweep_to = refresh_from - (refresh_number % chunks) * RESWEEP_CHUNK
+        resweep_from = max(resweep_to - RESWEEP_CHUNK, covered_from)
+        await db_client.refresh_workflow_run_rollups(resweep_from, resweep_to)
+
+    backfill_limit = now_slot - timedelta(days=BACKFILL_DAYS)
+    if covered_from > backfill_limit:
+        backfill_from = max(covered_from - BACKFILL_CHUNK, backfill_limit)
+        await db_client.refresh_workflow_run_rollups(backfill_from, covered_from)
+        covered_from = backfill_from
+
+    await db_client.set_rollup_coverage(covered_from, max(covered_through, now_slot))
+    logger.debug(f"Refreshed workflow run rollups through {now_slot}")
+
+
+async def refresh_workflow_run_rollup_slot(workflow_id: int, created_at: datetime):
+    """Rebuild the rollup slot of a single run, e.g. once it has completed."""
+    slot = floor_to_rollup_slot(created_at)
+    try:
+        await db_client.refresh_workflow_run_rollups(
+            slot, slot + ROLLUP_SLOT, workflow_id=workflow_id
+        )
+    except Exception as e:
+        # The periodic refresh will pick the run up
+        logger.warning(f"Failed to refresh workflow run rollup: {e}")
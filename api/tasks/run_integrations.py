@@ -2,16 +2,21 @@
 
 from typing import Any, Dict, Optional
 
-import httpx
 from loguru import logger
 
 from api.constants import BACKEND_API_ENDPOINT
 from api.db import db_client
 from api.db.models import WorkflowRunModel
-from api.utils.credential_auth import build_auth_header
-from api.utils.template_renderer import render_template
+from api.services.integrations.webhook_delivery import (
+    DELIVERY_BATCH_LIMIT,
+    build_webhook_deliveries,
+    get_webhook_delivery_engine,
+)
 from pipecat.utils.run_context import set_current_run_id
 
+# Upper bound on delivery passes per cron run, so one run cannot hog the worker
+MAX_DELIVERY_PASSES = 10
+
 
 async def run_integrations_post_workflow_run(_ctx, workflow_run_id: int):
     """
@@ -20,7 +25,9 @@ async def run_integrations_post_workflow_run(_ctx, workflow_run_id: int):
     This function:
     1. Gets the workflow run and its contexts
     2. Extracts webhook nodes from workflow definition
-    3. Executes each enabled webhook node
+    3. Queues each enabled webhook node in the webhook delivery outbox
+    4. Sends the queued deliveries that are due now (batched webhooks wait for
+       their window); failures are retried by ``deliver_pending_webhooks``
     """
     set_current_run_id(workflow_run_id)
     logger.info("Running webhook integrations for workflow run")
@@ -68,26 +75,38 @@ async def run_integrations_post_workflow_run(_ctx, workflow_run_id: int):
         # Step 5: Build render context
         render_context = _build_render_context(workflow_run, public_token)
 
-        # Step 6: Execute each webhook node
-        for node in webhook_nodes:
-            webhook_data = node.get("data", {})
-            try:
-                await _execute_webhook_node(
-                    webhook_data=webhook_data,
-                    render_context=render_context,
-                    organization_id=organization_id,
-                )
-            except Exception as e:
-                # Log error but continue with other webhooks
-                logger.warning(
-                    f"Failed to execute webhook '{webhook_data.get('name', 'unknown')}': {e}"
-                )
+        # Step 6: Queue a delivery per webhook node
+        deliveries = build_webhook_deliveries(
+            webhook_nodes,
+            render_context,
+            organization_id,
+            workflow_run_id,
+            workflow_run.workflow_id,
+        )
+        delivery_ids = await db_client.enqueue_webhook_deliveries(deliveries)
+        if not delivery_ids:
+            return
+
+        # Step 7: Send what is due now
+        summary = await get_webhook_delivery_engine().deliver_due(ids=delivery_ids)
+        logger.info(f"Webhook deliveries for workflow run: {summary}")
 
     except Exception as e:
         logger.error(f"Error running webhook integrations: {e}", exc_info=True)
         raise
 
 
+async def deliver_pending_webhooks(ctx):
+    """Periodically send due webhook deliveries (retries and batches)."""
+    engine = get_webhook_delivery_engine()
+    for _ in range(MAX_DELIVERY_PASSES):
+        summary = await engine.deliver_due(limit=DELIVERY_BATCH_LIMIT)
+        if summary["claimed"]:
+            logger.info(f"Webhook delivery pass: {summary}")
+        if summary["claimed"] < DELIVERY_BATCH_LIMIT:
+            break
+
+
 def _build_render_context(
     workflow_run: WorkflowRunModel, public_token: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -128,100 +147,3 @@ def _build_render_context(
         context["transcript_url"] = workflow_run.transcript_url
 
     return context
-
-
-async def _execute_webhook_node(
-    webhook_data: Dict[str, Any],
-    render_context: Dict[str, Any],
-    organization_id: int,
-) -> bool:
-    """
-    Execute a single webhook node.
-
-    Args:
-        webhook_data: The webhook node's data dict from workflow definition
-        render_context: Context for template rendering
-        organization_id: For credential lookup
-
-    Returns:
-        True if successful, False otherwise
-    """
-    webhook_name = webhook_data.get("name", "Unnamed Webhook")
-
-    # 1. Check if enabled
-    if not webhook_data.get("enabled", True):
-        logger.debug(f"Webhook '{webhook_name}' is disabled, skipping")
-        return True
-
-    # 2. Validate endpoint URL
-    url = webhook_data.get("endpoint_url")
-    if not url:
-        logger.warning(f"Webhook '{webhook_name}' has no endpoint URL")
-        return False
-
-    # 3. Build headers
-    headers = {"Content-Type": "application/json"}
-
-    # 4. Add auth header if credential configured
-    credential_uuid = webhook_data.get("credential_uuid")
-    if credential_uuid:
-        credential = await db_client.get_credential_by_uuid(
-            credential_uuid, organization_id
-        )
-        if credential:
-            auth_header = build_auth_header(credential)
-            headers.update(auth_header)
-            logger.debug(f"Applied credential '{credential.name}' to webhook")
-        else:
-            logger.warning(
-                f"Credential {credential_uuid} not found for webhook '{webhook_name}'"
-            )
-
-    # 5. Add custom headers
-    custom_headers = webhook_data.get("custom_headers", [])
-    for h in custom_headers:
-        if h.get("key") and h.get("value"):
-            headers[h["key"]] = h["value"]
-
-    # 6. Render payload template
-    payload_template = webhook_data.get("payload_template", {})
-    payload = render_template(payload_template, render_context)
-
-    # 7. Make HTTP request
-    method = webhook_data.get("http_method", "POST").upper()
-
-    logger.info(f"Executing webhook '{webhook_name}': {method}")
-
-    try:
-        async with httpx.AsyncClient() as client:
-            if method in ("POST", "PUT", "PATCH"):
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0,
-                )
-            else:  # GET, DELETE
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    timeout=30.0,
-                )
-
-            response.raise_for_status()
-            logger.info(f"Webhook '{webhook_name}' succeeded: {response.status_code}")
-            return True
-
-    except httpx.HTTPStatusError as e:
-        logger.error(
-            f"Webhook '{webhook_name}' failed: {e.response.status_code} - {e.response.text[:200]}"
-        )
-        return False
-    except httpx.RequestError as e:
-        logger.error(f"Webhook '{webhook_name}' request error: {e}")
-        return False
-    except Exception as e:
-        logger.error(f"Webhook '{webhook_name}' unexpected error: {e}")
-        return False
@@ -0,0 +1,13 @@
+import asyncio
+
+from loguru import logger
+
+from api.constants import RUN_LOG_STALE_SECONDS
+from api.services.pipecat.run_log import remove_stale_run_logs
+
+
+async def cleanup_stale_run_logs(ctx):
+    """Periodically delete run log files left behind by crashed workers."""
+    removed = await asyncio.to_thread(remove_stale_run_logs, RUN_LOG_STALE_SECONDS)
+    if removed:
+        logger.info(f"Removed {removed} stale run log files")
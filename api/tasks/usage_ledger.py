@@ -0,0 +1,19 @@
+from loguru import logger
+
+from api.db import db_client
+
+# Events folded per statement; a run keeps folding while batches come back full
+FOLD_BATCH_SIZE = 10000
+MAX_FOLD_BATCHES = 20
+
+
+async def fold_usage_ledger(ctx):
+    """Periodically add usage ledger events to their usage cycle totals."""
+    total = 0
+    for _ in range(MAX_FOLD_BATCHES):
+        folded = await db_client.fold_usage_events(limit=FOLD_BATCH_SIZE)
+        total += folded
+        if folded < FOLD_BATCH_SIZE:
+            break
+    if total:
+        logger.info(f"Folded {total} usage events into usage cycles")
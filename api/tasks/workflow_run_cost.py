@@ -4,6 +4,7 @@ from api.db import db_client
 from api.enums import WorkflowRunMode
 from api.services.pricing.cost_calculator import cost_calculator
 from api.services.telephony.factory import get_telephony_provider
+from api.tasks.report_rollups import refresh_workflow_run_rollup_slot
 from pipecat.utils.run_context import set_current_run_id
 
 
@@ -152,6 +153,11 @@ async def calculate_workflow_run_cost(ctx, workflow_run_id: int):
             f"Calculated cost for workflow run: ${cost_breakdown['total']:.6f} USD ({dograh_tokens} Dograh Tokens)"
         )
 
+        # The run is final now; fold it into the report rollups right away
+        await refresh_workflow_run_rollup_slot(
+            workflow_run.workflow_id, workflow_run.created_at
+        )
+
     except Exception as e:
         logger.error(f"Error calculating cost for workflow run: {e}")
         raise
@@ -0,0 +1,195 @@
+"""
+Tests for the per-call prefetch of custom tools and their credentials.
+
+These tests verify:
+1. The registry holds the tools of the workflow, their credentials (None when
+   not found) and their function schemas, and can't be modified
+2. Once prefetched, schema generation, handler registration and tool
+   execution don't query the database
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from api.services.workflow.call_tool_registry import (
+    build_call_tool_registry,
+    load_call_tool_registry,
+)
+from api.services.workflow.dto import (
+    EdgeDataDTO,
+    NodeDataDTO,
+    NodeType,
+    Position,
+    ReactFlowDTO,
+    RFEdgeDTO,
+    RFNodeDTO,
+)
+from api.services.workflow.pipecat_engine_custom_tools import CustomToolManager
+from api.services.workflow.workflow import WorkflowGraph
+
+
+@dataclass
+class MockToolModel:
+    """Mock tool model for testing."""
+
+    tool_uuid: str
+    name: str
+    description: str
+    category: str
+    definition: Dict[str, Any]
+
+
+@dataclass
+class MockCredentialModel:
+    """Mock credential model for testing."""
+
+    credential_uuid: str
+    name: str
+    credential_type: str
+    credential_data: Dict[str, Any]
+
+
+def _http_tool(tool_uuid: str, name: str, credential_uuid: str = None):
+    config = {"method": "POST", "url": f"https://api.example.com/{tool_uuid}"}
+    if credential_uuid:
+        config["credential_uuid"] = credential_uuid
+    return MockToolModel(
+        tool_uuid=tool_uuid,
+        name=name,
+        description=f"{name} tool",
+        category="http_api",
+        definition={"schema_version": 1, "type": "http_api", "config": config},
+    )
+
+
+@pytest.fixture
+def workflow() -> WorkflowGraph:
+    """Start -> End, with tools on both nodes."""
+
+    def node(id: str, type: NodeType, tool_uuids: list[str], **kwargs) -> RFNodeDTO:
+        return RFNodeDTO(
+            id=id,
+            type=type,
+            position=Position(x=0, y=0),
+            data=NodeDataDTO(name=id, prompt="Prompt", tool_uuids=tool_uuids, **kwargs),
+        )
+
+    dto = ReactFlowDTO(
+        nodes=[
+            node("start", NodeType.startNode, ["lookup"], is_start=True),
+            node("end", NodeType.endNode, ["booking", "lookup"], is_end=True),
+        ],
+        edges=[
+            RFEdgeDTO(
+                id="start-end",
+                source="start",
+                target="end",
+                data=EdgeDataDTO(label="End", condition="Done"),
+            )
+        ],
+    )
+    return WorkflowGraph(dto)
+
+
+@pytest.fixture
+def credential():
+    return MockCredentialModel(
+        credential_uuid="cred-1",
+        name="Bookings API",
+        credential_type="bearer_token",
+        credential_data={"token": "secret"},
+    )
+
+
+@pytest.fixture
+def tools_with_credentials(credential):
+    return [
+        (_http_tool("lookup", "Customer Lookup", credential_uuid="cred-1"), credential),
+        (_http_tool("booking", "Book Appointment", credential_uuid="gone"), None),
+    ]
+
+
+class TestCallToolRegistry:
+    def test_registry_contents(self, tools_with_credentials, credential):
+        registry = build_call_tool_registry(tools_with_credentials)
+
+        tools = registry.get_tools(["booking", "missing", "lookup"])
+        assert [t.tool_uuid for t in tools] == ["booking", "lookup"]
+        assert registry.credentials == {"cred-1": credential, "gone": None}
+        schemas = registry.get_function_schemas(["lookup"])
+        assert [s.name for s in schemas] == ["customer_lookup"]
+
+        with pytest.raises(TypeError):
+            registry.tools["other"] = None
+
+    @pytest.mark.asyncio
+    async def test_loaded_with_one_query(self, workflow, tools_with_credentials):
+        with patch("api.services.workflow.call_tool_registry.db_client") as mock_db:
+            mock_db.get_tools_with_credentials = AsyncMock(
+                return_value=tools_with_credentials
+            )
+
+            registry = await load_call_tool_registry(workflow, organization_id=1)
+
+        mock_db.get_tools_with_credentials.assert_awaited_once_with(
+            ["lookup", "booking"], 1
+        )
+        assert set(registry.tools) == {"lookup", "booking"}
+
+
+class TestCustomToolManagerPrefetch:
+    @pytest.mark.asyncio
+    async def test_no_queries_after_prefetch(self, workflow, tools_with_credentials):
+        registered_handlers = {}
+        mock_engine = Mock()
+        mock_engine.workflow = workflow
+        mock_engine._workflow_run_id = 1
+        mock_engine._call_context_vars = {}
+        mock_engine.llm.register_function = (
+            lambda name, handler, **kwargs: registered_handlers.setdefault(
+                name, handler
+            )
+        )
+        manager = CustomToolManager(mock_engine)
+
+        with (
+            patch(
+                "api.services.workflow.pipecat_engine_custom_tools.get_organization_id_from_workflow_run",
+                AsyncMock(return_value=1),
+            ),
+            patch("api.services.workflow.call_tool_registry.db_client") as mock_db,
+        ):
+            mock_db.get_tools_with_credentials = AsyncMock(
+                return_value=tools_with_credentials
+            )
+            await manager.prefetch()
+
+        with (
+            patch(
+                "api.services.workflow.pipecat_engine_custom_tools.db_client"
+            ) as manager_db,
+            patch("api.services.workflow.tools.custom_tool.db_client") as tool_db,
+            patch(
+                "api.services.workflow.tools.custom_tool.get_http_tool_engine"
+            ) as mock_engine_factory,
+        ):
+            mock_engine_factory.return_value.request = AsyncMock(
+                return_value=({"status": "success", "status_code": 200}, Mock())
+            )
+
+            schemas = await manager.get_tool_schemas(["booking", "lookup"])
+            await manager.register_handlers(["booking", "lookup"])
+            params = Mock(arguments={}, result_callback=AsyncMock())
+            await registered_handlers["customer_lookup"](params)
+
+        assert [s.name for s in schemas] == ["book_appointment", "customer_lookup"]
+        assert manager_db.mock_calls == []
+        assert tool_db.mock_calls == []
+        request = mock_engine_factory.return_value.request.await_args
+        assert request.kwargs["headers"]["Authorization"] == "Bearer secret"
+        params.result_callback.assert_awaited_once_with(
+            {"status": "success", "status_code": 200}
+        )
@@ -5,6 +5,7 @@ These tests verify:
 1. Basic batch processing functionality
 2. Thread-safety via SELECT FOR UPDATE SKIP LOCKED
 3. Race condition handling when multiple workers process concurrently
+4. Rate limited waits interleaved with slot waits don't add up to a timeout
 """
 
 import asyncio
@@ -25,6 +26,7 @@ from api.db.models import (
     WorkflowRunModel,
 )
 from api.services.campaign.campaign_call_dispatcher import CampaignCallDispatcher
+from api.services.campaign.rate_limiter import DispatchAcquisition
 
 # =============================================================================
 # Test-specific fixtures
@@ -161,7 +163,7 @@ def mock_dispatch_call():
     """Mock dispatch_call to track which runs were processed."""
     processed_runs = []
 
-    async def mock_dispatch(queued_run, campaign, slot_id):
+    async def mock_dispatch(queued_run, campaign, slot_id, from_number):
         # Simulate some processing time
         await asyncio.sleep(0.01)
         processed_runs.append(queued_run.id)
@@ -213,6 +215,13 @@ def mock_rate_limiter():
     async def mock_delete_from_number_mapping(*args, **kwargs):
         return True
 
+    async def mock_acquire_dispatch_resources(*args, **kwargs):
+        return DispatchAcquisition(
+            DispatchAcquisition.ACQUIRED,
+            slot_id=f"slot-{uuid.uuid4().hex[:8]}",
+            from_number="+15551234567",
+        )
+
     return {
         "acquire_token": mock_acquire_token,
         "try_acquire_concurrent_slot": mock_try_acquire_slot,
@@ -226,6 +235,7 @@ def mock_rate_limiter():
         "store_workflow_from_number_mapping": mock_store_from_number_mapping,
         "get_workflow_from_number_mapping": mock_get_from_number_mapping,
         "delete_workflow_from_number_mapping": mock_delete_from_number_mapping,
+        "acquire_dispatch_resources": mock_acquire_dispatch_resources,
     }
 
 
@@ -284,6 +294,9 @@ class TestProcessBatchBasic:
             mock_rl.delete_workflow_from_number_mapping = AsyncMock(
                 side_effect=mock_rate_limiter["delete_workflow_from_number_mapping"]
             )
+            mock_rl.acquire_dispatch_resources = AsyncMock(
+                side_effect=mock_rate_limiter["acquire_dispatch_resources"]
+            )
 
             dispatcher = CampaignCallDispatcher()
 
@@ -367,6 +380,9 @@ class TestProcessBatchConcurrency:
                 mock_rl.delete_workflow_from_number_mapping = AsyncMock(
                     side_effect=mock_rate_limiter["delete_workflow_from_number_mapping"]
                 )
+                mock_rl.acquire_dispatch_resources = AsyncMock(
+                    side_effect=mock_rate_limiter["acquire_dispatch_resources"]
+                )
 
                 dispatcher = CampaignCallDispatcher()
 
@@ -457,6 +473,9 @@ class TestProcessBatchConcurrency:
                 mock_rl.delete_workflow_from_number_mapping = AsyncMock(
                     side_effect=mock_rate_limiter["delete_workflow_from_number_mapping"]
                 )
+                mock_rl.acquire_dispatch_resources = AsyncMock(
+                    side_effect=mock_rate_limiter["acquire_dispatch_resources"]
+                )
 
                 dispatcher = CampaignCallDispatcher()
 
@@ -546,6 +565,9 @@ class TestProcessBatchConcurrency:
                 mock_rl.delete_workflow_from_number_mapping = AsyncMock(
                     side_effect=mock_rate_limiter["delete_workflow_from_number_mapping"]
                 )
+                mock_rl.acquire_dispatch_resources = AsyncMock(
+                    side_effect=mock_rate_limiter["acquire_dispatch_resources"]
+                )
 
                 dispatcher = CampaignCallDispatcher()
 
@@ -627,6 +649,9 @@ class TestProcessBatchConcurrency:
             mock_rl.delete_workflow_from_number_mapping = AsyncMock(
                 side_effect=mock_rate_limiter["delete_workflow_from_number_mapping"]
             )
+            mock_rl.acquire_dispatch_resources = AsyncMock(
+                side_effect=mock_rate_limiter["acquire_dispatch_resources"]
+            )
 
             dispatcher = CampaignCallDispatcher()
 
@@ -715,3 +740,68 @@ class TestProcessBatchEdgeCases:
                     {"campaign_id": campaign_test_data.campaign_id},
                 )
                 await session.commit()
+
+
+class TestAcquireCallResources:
+    @pytest.mark.asyncio
+    async def test_rate_limit_wait_restarts_after_slot_wait(self):
+        rate_limited = DispatchAcquisition(
+            DispatchAcquisition.RATE_LIMITED, retry_after=0.6
+        )
+        no_slot = DispatchAcquisition(DispatchAcquisition.NO_CONCURRENT_SLOT)
+        acquired = DispatchAcquisition(
+            DispatchAcquisition.ACQUIRED, slot_id="slot-1", from_number="+15550001"
+        )
+        campaign = MagicMock(id=1, rate_limit_per_second=1)
+        dispatcher = CampaignCallDispatcher()
+        dispatcher.get_max_concurrent = AsyncMock(return_value=1)
+
+        with (
+            patch(
+                "api.services.campaign.campaign_call_dispatcher.rate_limiter"
+            ) as mock_rl,
+            patch(
+                "api.services.campaign.campaign_call_dispatcher.asyncio.sleep",
+                AsyncMock(),
+            ),
+            patch(
+                "api.services.campaign.campaign_call_dispatcher.time.time",
+                side_effect=[0.0, 0.6, 10.0, 11.0, 20.0, 20.6],
+            ),
+        ):
+            mock_rl.acquire_dispatch_resources = AsyncMock(
+                side_effect=[rate_limited, no_slot, rate_limited, acquired]
+            )
+
+            # 1.2s rate limited in total, but never 1s in a row
+            assert await dispatcher.acquire_call_resources(7, campaign) == (
+                "slot-1",
+                "+15550001",
+            )
+
+    @pytest.mark.asyncio
+    async def test_consecutive_rate_limit_wait_times_out(self):
+        rate_limited = DispatchAcquisition(
+            DispatchAcquisition.RATE_LIMITED, retry_after=0.6
+        )
+        campaign = MagicMock(id=1, rate_limit_per_second=1)
+        dispatcher = CampaignCallDispatcher()
+        dispatcher.get_max_concurrent = AsyncMock(return_value=1)
+
+        with (
+            patch(
+                "api.services.campaign.campaign_call_dispatcher.rate_limiter"
+            ) as mock_rl,
+            patch(
+                "api.services.campaign.campaign_call_dispatcher.asyncio.sleep",
+                AsyncMock(),
+            ),
+            patch(
+                "api.services.campaign.campaign_call_dispatcher.time.time",
+                side_effect=[0.0, 0.6],
+            ),
+        ):
+            mock_rl.acquire_dispatch_resources = AsyncMock(return_value=rate_limited)
+
+            with pytest.raises(TimeoutError):
+                await dispatcher.acquire_call_resources(7, campaign)
@@ -31,7 +31,7 @@ class TestCircuitBreakerRecordOutcome:
         # Mock Redis to simulate a window with 3 failures out of 3 total
         # (100% failure rate, but below min_calls=5)
         mock_redis = AsyncMock()
-        mock_redis.eval = AsyncMock(
+        mock_redis.evalsha = AsyncMock(
             return_value=[0, 3, 0, 3]  # [not_tripped, failures, successes, total]
         )
         cb.redis_client = mock_redis
@@ -52,7 +52,7 @@ class TestCircuitBreakerRecordOutcome:
 
         # Mock Redis to simulate: 4 failures out of 6 total = 66% > 50% threshold
         mock_redis = AsyncMock()
-        mock_redis.eval = AsyncMock(
+        mock_redis.evalsha = AsyncMock(
             return_value=[1, 4, 2, 6]  # [tripped, failures, successes, total]
         )
         cb.redis_client = mock_redis
@@ -74,7 +74,7 @@ class TestCircuitBreakerRecordOutcome:
 
         # Mock Redis: 2 failures out of 8 total = 25% < 50% threshold
         mock_redis = AsyncMock()
-        mock_redis.eval = AsyncMock(
+        mock_redis.evalsha = AsyncMock(
             return_value=[0, 2, 6, 8]  # [not_tripped, failures, successes, total]
         )
         cb.redis_client = mock_redis
@@ -102,7 +102,7 @@ class TestCircuitBreakerRecordOutcome:
         assert tripped is False
         assert stats is None
         # Redis should not have been called
-        mock_redis.eval.assert_not_called()
+        mock_redis.evalsha.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_custom_config_override(self):
@@ -113,7 +113,7 @@ class TestCircuitBreakerRecordOutcome:
 
         # With custom threshold of 0.8, 4/6 = 66% should NOT trip
         mock_redis = AsyncMock()
-        mock_redis.eval = AsyncMock(
+        mock_redis.evalsha = AsyncMock(
             return_value=[0, 4, 2, 6]  # Lua script respects the threshold we pass
         )
         cb.redis_client = mock_redis
@@ -134,7 +134,7 @@ class TestCircuitBreakerRecordOutcome:
         cb = CircuitBreaker()
 
         mock_redis = AsyncMock()
-        mock_redis.eval = AsyncMock(side_effect=Exception("Redis connection lost"))
+        mock_redis.evalsha = AsyncMock(side_effect=Exception("Redis connection lost"))
         cb.redis_client = mock_redis
 
         tripped, stats = await cb.record_call_outcome(campaign_id=1, is_failure=True)
@@ -154,7 +154,7 @@ class TestCircuitBreakerIsOpen:
         cb = CircuitBreaker()
 
         mock_redis = AsyncMock()
-        mock_redis.eval = AsyncMock(
+        mock_redis.evalsha = AsyncMock(
             return_value=[1, 5, 2, 7]  # [is_open, failures, successes, total]
         )
         cb.redis_client = mock_redis
@@ -172,7 +172,7 @@ class TestCircuitBreakerIsOpen:
         cb = CircuitBreaker()
 
         mock_redis = AsyncMock()
-        mock_redis.eval = AsyncMock(return_value=[0, 1, 9, 10])
+        mock_redis.evalsha = AsyncMock(return_value=[0, 1, 9, 10])
         cb.redis_client = mock_redis
 
         is_open, stats = await cb.is_circuit_open(campaign_id=1)
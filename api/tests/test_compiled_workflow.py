@@ -0,0 +1,127 @@
+"""
+Tests for the ahead-of-time compilation of workflows.
+
+These tests verify:
+1. Workflows with the same definition share their compiled form
+2. Compiled nodes carry the transitions, knowledge base schema and prompts
+   (global prompt first) used when entering the node
+3. The engine sets up the LLM context of a node from its compiled form
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from api.services.workflow.compiled_workflow import compile_workflow
+from api.services.workflow.dto import (
+    EdgeDataDTO,
+    NodeDataDTO,
+    NodeType,
+    Position,
+    ReactFlowDTO,
+    RFEdgeDTO,
+    RFNodeDTO,
+)
+from api.services.workflow.pipecat_engine import PipecatEngine
+from api.services.workflow.workflow import WorkflowGraph
+from pipecat.processors.aggregators.llm_context import LLMContext
+
+
+def _workflow_dto(agent_prompt: str = "Ask {{first_name}} for their order."):
+    def node(id: str, type: NodeType, prompt: str, **kwargs) -> RFNodeDTO:
+        return RFNodeDTO(
+            id=id,
+            type=type,
+            position=Position(x=0, y=0),
+            data=NodeDataDTO(name=id, prompt=prompt, **kwargs),
+        )
+
+    return ReactFlowDTO(
+        nodes=[
+            node("global", NodeType.globalNode, "You are {{agent_name}}."),
+            node(
+                "start",
+                NodeType.startNode,
+                "Greet the caller.",
+                is_start=True,
+                add_global_prompt=False,
+            ),
+            node(
+                "agent",
+                NodeType.agentNode,
+                agent_prompt,
+                add_global_prompt=True,
+                document_uuids=["doc-1"],
+            ),
+            node("end", NodeType.endNode, "Say goodbye.", is_end=True),
+        ],
+        edges=[
+            RFEdgeDTO(
+                id="start-agent",
+                source="start",
+                target="agent",
+                data=EdgeDataDTO(label="Take Order", condition="Caller is ready"),
+            ),
+            RFEdgeDTO(
+                id="agent-end",
+                source="agent",
+                target="end",
+                data=EdgeDataDTO(label="End Call", condition="Order is complete"),
+            ),
+        ],
+    )
+
+
+@pytest.fixture
+def workflow() -> WorkflowGraph:
+    return WorkflowGraph(_workflow_dto())
+
+
+class TestCompileWorkflow:
+    def test_compiled_once_per_definition(self, workflow):
+        compiled = compile_workflow(workflow)
+
+        assert compile_workflow(WorkflowGraph(_workflow_dto())) is compiled
+        changed = WorkflowGraph(_workflow_dto(agent_prompt="Take the order."))
+        assert compile_workflow(changed) is not compiled
+
+    def test_compiled_node(self, workflow):
+        agent = compile_workflow(workflow).nodes["agent"]
+
+        assert [(t.function_name, t.target) for t in agent.transitions] == [
+            ("end_call", "end")
+        ]
+        assert agent.transitions[0].schema.description == "Order is complete"
+        assert agent.knowledge_base_schema.name == "retrieve_from_knowledge_base"
+        assert agent.render_prompt({"agent_name": "Ava", "first_name": "Ada"}) == (
+            "You are Ava.\n\nAsk Ada for their order."
+        )
+
+        start = compile_workflow(workflow).nodes["start"]
+        assert start.knowledge_base_schema is None
+        assert start.render_prompt({}) == "Greet the caller."
+
+
+class TestEngineCompiledNode:
+    @pytest.mark.asyncio
+    async def test_system_message_and_functions(self, workflow):
+        engine = PipecatEngine(
+            llm=Mock(),
+            context=LLMContext(),
+            workflow=workflow,
+            call_context_vars={"agent_name": "Ava", "first_name": "Ada"},
+        )
+
+        (
+            system_message,
+            functions,
+        ) = await engine._compose_system_message_functions_for_node(
+            workflow.nodes["agent"]
+        )
+
+        assert system_message["content"] == "You are Ava.\n\nAsk Ada for their order."
+        assert [f.name for f in functions] == [
+            *(f.name for f in engine.builtin_function_schemas),
+            "retrieve_from_knowledge_base",
+            "end_call",
+        ]
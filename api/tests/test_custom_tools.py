@@ -3,10 +3,12 @@
 This module tests:
 1. tool_to_function_schema - converting tool models to LLM function schemas
 2. execute_http_tool - executing HTTP API tools
-3. CustomToolManager - tool registration and handler execution
-4. End-to-end LLM generation with custom tool calls
+3. HttpToolEngine - bounded per-host client pools
+4. CustomToolManager - tool registration and handler execution
+5. End-to-end LLM generation with custom tool calls
 """
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any, Dict
 from unittest.mock import AsyncMock, Mock, patch
@@ -17,6 +19,7 @@ from api.services.workflow.pipecat_engine_utils import (
     get_function_schema,
     update_llm_context,
 )
+from api.services.workflow.tools import http_tool_engine
 from api.services.workflow.tools.custom_tool import (
     execute_http_tool,
     tool_to_function_schema,
@@ -209,6 +212,14 @@ class TestToolToFunctionSchema:
         assert schema["function"]["description"] == "Execute My Tool tool"
 
 
+@pytest.fixture(autouse=True)
+def fresh_http_tool_engine(monkeypatch):
+    """Give each test its own tool engine (no pooled clients)."""
+    monkeypatch.setattr(
+        http_tool_engine, "_http_tool_engine", http_tool_engine.HttpToolEngine()
+    )
+
+
 class TestExecuteHttpTool:
     """Tests for execute_http_tool function."""
 
@@ -241,7 +252,7 @@ class TestExecuteHttpTool:
             mock_response.status_code = 201
             mock_response.json.return_value = {"id": 123, "name": "John"}
             mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             result = await execute_http_tool(tool, arguments)
 
@@ -286,7 +297,7 @@ class TestExecuteHttpTool:
             mock_response.status_code = 200
             mock_response.json.return_value = {"users": []}
             mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             result = await execute_http_tool(tool, arguments)
 
@@ -327,7 +338,7 @@ class TestExecuteHttpTool:
             mock_response.status_code = 204
             mock_response.json.return_value = {}
             mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             result = await execute_http_tool(tool, arguments)
 
@@ -364,7 +375,7 @@ class TestExecuteHttpTool:
             mock_client.request.side_effect = httpx.TimeoutException(
                 "Request timed out"
             )
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             result = await execute_http_tool(tool, {})
 
@@ -402,7 +413,7 @@ class TestExecuteHttpTool:
             mock_response.status_code = 200
             mock_response.json.return_value = {"success": True}
             mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             await execute_http_tool(tool, {"data": "test"})
 
@@ -444,7 +455,7 @@ class TestExecuteHttpTool:
             mock_response.status_code = 200
             mock_response.json.return_value = {"success": True}
             mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             with patch("api.services.workflow.tools.custom_tool.db_client") as mock_db:
                 mock_db.get_credential_by_uuid = AsyncMock(return_value=mock_credential)
@@ -490,7 +501,7 @@ class TestExecuteHttpTool:
             mock_response.status_code = 200
             mock_response.json.return_value = {"success": True}
             mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             with patch("api.services.workflow.tools.custom_tool.db_client") as mock_db:
                 # Call without organization_id
@@ -499,6 +510,184 @@ class TestExecuteHttpTool:
                 # Verify credential lookup was NOT called
                 mock_db.get_credential_by_uuid.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_credential_fetched_once_per_call(self):
+        """Test that the per-call credential cache avoids repeated DB lookups."""
+        tool = MockToolModel(
+            tool_uuid="test-uuid",
+            name="API with Credential",
+            description="API with credential configured",
+            category="http_api",
+            definition={
+                "schema_version": 1,
+                "type": "http_api",
+                "config": {
+                    "method": "POST",
+                    "url": "https://api.example.com/secure",
+                    "credential_uuid": "cred-uuid-123",
+                },
+            },
+        )
+
+        mock_credential = Mock()
+        mock_credential.name = "API Token"
+        mock_credential.credential_type = "bearer_token"
+        mock_credential.credential_data = {"token": "my-secret-token"}
+
+        with patch(
+            "api.services.workflow.tools.custom_tool.httpx.AsyncClient"
+        ) as mock_client_class:
+            mock_client = AsyncMock()
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {"success": True}
+            mock_client.request.return_value = mock_response
+            mock_client_class.return_value = mock_client
+
+            with patch("api.services.workflow.tools.custom_tool.db_client") as mock_db:
+                mock_db.get_credential_by_uuid = AsyncMock(return_value=mock_credential)
+
+                credential_cache = {}
+                for _ in range(3):
+                    await execute_http_tool(
+                        tool,
+                        {"data": "test"},
+                        organization_id=1,
+                        credential_cache=credential_cache,
+                    )
+
+                mock_db.get_credential_by_uuid.assert_called_once_with(
+                    "cred-uuid-123", 1
+                )
+                assert mock_client.request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_response_cache(self):
+        """Test that GET tools with cache_ttl_seconds reuse the cached response."""
+        tool = MockToolModel(
+            tool_uuid="test-uuid",
+            name="Get Plans",
+            description="List plans",
+            category="http_api",
+            definition={
+                "schema_version": 1,
+                "type": "http_api",
+                "config": {
+                    "method": "GET",
+                    "url": "https://api.example.com/plans",
+                    "cache_ttl_seconds": 60,
+                },
+            },
+        )
+
+        with patch(
+            "api.services.workflow.tools.custom_tool.httpx.AsyncClient"
+        ) as mock_client_class:
+            mock_client = AsyncMock()
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.is_success = True
+            mock_response.json.return_value = {"plans": ["basic"]}
+            mock_client.request.return_value = mock_response
+            mock_client_class.return_value = mock_client
+
+            first = await execute_http_tool(tool, {"region": "us"})
+            second = await execute_http_tool(tool, {"region": "us"})
+            other = await execute_http_tool(tool, {"region": "eu"})
+
+            assert first == second
+            assert other["data"] == {"plans": ["basic"]}
+            # Second call was served from the cache
+            assert mock_client.request.call_count == 2
+
+
+def _mock_http_client():
+    client = AsyncMock()
+    client.is_closed = False
+    client.request.return_value = Mock(status_code=200)
+    return client
+
+
+class TestHttpToolEngine:
+    """Tests for the per-host client pools of HttpToolEngine."""
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_host_closed(self):
+        """Test that pools beyond max_pooled_hosts are evicted and closed."""
+        engine = http_tool_engine.HttpToolEngine(max_pooled_hosts=2)
+
+        with patch(
+            "api.services.workflow.tools.http_tool_engine.httpx.AsyncClient",
+            side_effect=lambda **kwargs: _mock_http_client(),
+        ):
+            a = await engine._get_client("https://a.example.com/x")
+            b = await engine._get_client("https://b.example.com/x")
+            assert await engine._get_client("https://a.example.com/y") is a
+            await engine._get_client("https://c.example.com/x")
+
+        b.client.aclose.assert_awaited_once()
+        a.client.aclose.assert_not_awaited()
+        assert len(engine._clients) == 2
+
+    @pytest.mark.asyncio
+    async def test_evicted_host_closed_after_in_flight_request(self):
+        """Test that an evicted pool is closed once its requests finish."""
+        engine = http_tool_engine.HttpToolEngine(max_pooled_hosts=1)
+        release = asyncio.Event()
+        slow_client = _mock_http_client()
+
+        async def slow_request(**kwargs):
+            await release.wait()
+            return Mock(status_code=200)
+
+        slow_client.request.side_effect = slow_request
+
+        with patch(
+            "api.services.workflow.tools.http_tool_engine.httpx.AsyncClient",
+            side_effect=[slow_client, _mock_http_client()],
+        ):
+            pending = asyncio.create_task(
+                engine.request("GET", "https://a.example.com", {}, None, None, 5)
+            )
+            await asyncio.sleep(0)
+            await engine._get_client("https://b.example.com")
+
+            slow_client.aclose.assert_not_awaited()
+            release.set()
+            await pending
+
+        slow_client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_requests_share_client(self):
+        """Test that concurrent first requests to a host create one client."""
+        engine = http_tool_engine.HttpToolEngine()
+
+        with patch(
+            "api.services.workflow.tools.http_tool_engine.httpx.AsyncClient",
+            side_effect=lambda **kwargs: _mock_http_client(),
+        ) as client_class:
+            pooled = await asyncio.gather(
+                *(engine._get_client("https://a.example.com") for _ in range(5))
+            )
+
+        assert client_class.call_count == 1
+        assert all(p is pooled[0] for p in pooled)
+
+    def test_clients_closed_on_loop_change(self):
+        """Test that clients of a previous event loop are closed."""
+        engine = http_tool_engine.HttpToolEngine()
+
+        with patch(
+            "api.services.workflow.tools.http_tool_engine.httpx.AsyncClient",
+            side_effect=lambda **kwargs: _mock_http_client(),
+        ):
+            first = asyncio.run(engine._get_client("https://a.example.com"))
+            second = asyncio.run(engine._get_client("https://a.example.com"))
+
+        assert second is not first
+        first.client.aclose.assert_awaited_once()
+
 
 class TestAuthHeaders:
     """Tests for auth header building utilities."""
@@ -0,0 +1,197 @@
+"""
+Tests for rollup-backed daily reports.
+
+These tests verify:
+1. DailyReportService builds distributions from aggregated counts
+2. Report windows are split into rollup-covered and live ranges
+3. Each periodic refresh also rebuilds a different chunk of older rollups
+4. Daily usage attributes runs to the organization selected by the workflow's
+   owner, from rollups and raw runs alike
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from api.db.organization_usage_client import OrganizationUsageClient
+from api.db.rollups import (
+    ceil_to_rollup_slot,
+    floor_to_rollup_slot,
+    split_by_rollup_coverage,
+)
+
+
+def _session_with_coverage(covered_from, covered_through):
+    coverage = None
+    if covered_from is not None:
+        coverage = MagicMock(covered_from=covered_from, covered_through=covered_through)
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = coverage
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+class TestDailyReportFromCounts:
+    @pytest.mark.asyncio
+    async def test_distributions_from_counts(self):
+        from api.services.reports import DailyReportService
+
+        counts = [
+            ("XFER", "0-10", 3),
+            ("XFER", "30-60", 1),
+            ("NIBP", ">180", 2),
+            ("UNKNOWN", "none", 4),
+        ]
+        with patch("api.services.reports.daily_report.db_client") as mock_db:
+            mock_db.get_daily_report_counts = AsyncMock(return_value=counts)
+            report = await DailyReportService().get_daily_report(
+                organization_id=1, date="2026-03-01", timezone="Asia/Kolkata"
+            )
+
+        start_utc = mock_db.get_daily_report_counts.call_args.kwargs["start_utc"]
+        assert start_utc == datetime(2026, 2, 28, 18, 30, tzinfo=UTC)
+        assert report["metrics"] == {"total_runs": 10, "xfer_count": 4}
+        assert report["disposition_distribution"][0] == {
+            "disposition": "XFER",
+            "count": 4,
+            "percentage": 40.0,
+        }
+        buckets = {b["bucket"]: b for b in report["call_duration_distribution"]}
+        assert list(buckets) == ["0-10", "10-30", "30-60", "60-120", "120-180", ">180"]
+        # Runs without a numeric duration are left out of the distribution
+        assert buckets["0-10"]["count"] == 3
+        assert buckets["0-10"]["percentage"] == 50.0
+        assert buckets[">180"]["count"] == 2
+
+
+class TestRollupCoverageSplit:
+    def test_slot_rounding(self):
+        dt = datetime(2026, 3, 1, 10, 7, 30, tzinfo=UTC)
+
+        assert floor_to_rollup_slot(dt) == datetime(2026, 3, 1, 10, 0, tzinfo=UTC)
+        assert ceil_to_rollup_slot(dt) == datetime(2026, 3, 1, 10, 15, tzinfo=UTC)
+        assert ceil_to_rollup_slot(floor_to_rollup_slot(dt)) == floor_to_rollup_slot(dt)
+
+    @pytest.mark.asyncio
+    async def test_no_coverage_is_all_live(self):
+        start = datetime(2026, 3, 1, tzinfo=UTC)
+        stop = start + timedelta(days=1)
+
+        rollup_range, live = await split_by_rollup_coverage(
+            _session_with_coverage(None, None), start, stop
+        )
+
+        assert rollup_range is None
+        assert live == [(start, stop)]
+
+    @pytest.mark.asyncio
+    async def test_window_ending_after_coverage(self):
+        start = datetime(2026, 3, 1, tzinfo=UTC)
+        stop = start + timedelta(days=1)
+        covered_through = start + timedelta(hours=20)
+
+        rollup_range, live = await split_by_rollup_coverage(
+            _session_with_coverage(start - timedelta(days=7), covered_through),
+            start,
+            stop,
+        )
+
+        assert rollup_range == (start, covered_through)
+        assert live == [(covered_through, stop)]
+
+    @pytest.mark.asyncio
+    async def test_unaligned_window_edges_are_live(self):
+        start = datetime(2026, 3, 1, 0, 5, tzinfo=UTC)
+        stop = datetime(2026, 3, 1, 6, 10, tzinfo=UTC)
+
+        rollup_range, live = await split_by_rollup_coverage(
+            _session_with_coverage(start - timedelta(days=1), stop + timedelta(days=1)),
+            start,
+            stop,
+        )
+
+        assert rollup_range == (
+            datetime(2026, 3, 1, 0, 15, tzinfo=UTC),
+            datetime(2026, 3, 1, 6, 0, tzinfo=UTC),
+        )
+        assert live == [
+            (start, datetime(2026, 3, 1, 0, 15, tzinfo=UTC)),
+            (datetime(2026, 3, 1, 6, 0, tzinfo=UTC), stop),
+        ]
+
+
+class TestRollupRefresh:
+    @pytest.mark.asyncio
+    async def test_older_chunks_rebuilt_in_rotation(self):
+        from api.tasks import report_rollups
+
+        now_slot = datetime(2026, 3, 10, 12, 0, tzinfo=UTC)
+        covered_from = now_slot - timedelta(days=3)
+        db_client = MagicMock()
+        db_client.get_rollup_coverage = AsyncMock(return_value=(covered_from, now_slot))
+        db_client.refresh_workflow_run_rollups = AsyncMock()
+        db_client.set_rollup_coverage = AsyncMock()
+
+        resweeps = set()
+        for minutes in range(0, 15, report_rollups.REFRESH_INTERVAL_MINUTES):
+            now = now_slot + timedelta(minutes=minutes)
+            db_client.refresh_workflow_run_rollups.reset_mock()
+            with (
+                patch.object(report_rollups, "db_client", db_client),
+                patch.object(report_rollups, "datetime") as mock_datetime,
+            ):
+                mock_datetime.now.return_value = now
+                await report_rollups.refresh_report_rollups(None)
+            # Recent slots, an older chunk, then the backfill
+            recent, resweep, _ = [
+                call.args
+                for call in db_client.refresh_workflow_run_rollups.await_args_list
+            ]
+            assert recent == (now_slot - report_rollups.REFRESH_LOOKBACK, now_slot)
+            resweeps.add(resweep)
+
+        refresh_from = now_slot - report_rollups.REFRESH_LOOKBACK
+        day = timedelta(days=1)
+        assert resweeps == {
+            (refresh_from - day, refresh_from),
+            (refresh_from - 2 * day, refresh_from - day),
+            (covered_from, refresh_from - 2 * day),
+        }
+
+
+class TestDailyUsageAttribution:
+    @pytest.mark.asyncio
+    async def test_runs_attributed_to_workflow_owner_organization(self):
+        start = datetime(2026, 3, 1, tzinfo=UTC)
+        end = start + timedelta(days=2)
+        result = MagicMock()
+        result.__iter__.return_value = iter(())
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        client = OrganizationUsageClient.__new__(OrganizationUsageClient)
+        client.async_session = MagicMock()
+        client.async_session.return_value.__aenter__ = AsyncMock(return_value=session)
+        client.async_session.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with patch(
+            "api.db.organization_usage_client.split_by_rollup_coverage",
+            AsyncMock(
+                return_value=(
+                    (start, start + timedelta(days=1)),
+                    [(start + timedelta(days=1), end)],
+                )
+            ),
+        ):
+            await client.get_daily_usage_breakdown(7, start, end, 0.01)
+
+        queries = [
+            str(call.args[0].compile(dialect=postgresql.dialect()))
+            for call in session.execute.await_args_list
+        ]
+        assert len(queries) == 2
+        for query in queries:
+            assert "users.selected_organization_id = " in query
+            assert "workflows.organization_id" not in query
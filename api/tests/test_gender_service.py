@@ -0,0 +1,179 @@
+"""
+Tests for the gender prediction service.
+
+These tests verify:
+1. The compact model returns the same entries as model.txt and is compiled
+   once into the cache directory, and a corrupt compiled file is rebuilt
+2. batch_predict keeps the order of the input, serves names from the model
+   and from cached API results, and sends the rest to GenderAPI in bulk
+3. Names whose bulk request fails or returns an unexpected body fall back to
+   the model's best guess
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from api.services.gender.compact_model import (
+    CompactGenderModel,
+    compile_model,
+    load_compact_model,
+)
+from api.services.gender.gender_service import GenderService
+
+MODEL = {
+    "version": "1.0",
+    "metadata": {"total_names": 4},
+    "names": {
+        "john": [900, 10, 0.99],
+        "mary": [5, 800, 0.9938],
+        "taylor": [300, 500, 0.6],
+        "josé": [400, 2, 0.95],
+    },
+}
+
+
+class TestCompactGenderModel:
+    def test_lookups_match_model(self):
+        model = CompactGenderModel(compile_model(MODEL))
+
+        assert len(model) == 4
+        assert model.version == "1.0"
+        assert model.metadata == {"total_names": 4}
+        for name, entry in MODEL["names"].items():
+            assert model.get(name) == tuple(entry)
+        assert model.get("jo") is None
+        assert "xyz" not in model
+
+    def test_compiled_once_and_memory_mapped(self, tmp_path):
+        model_path = tmp_path / "model.txt"
+        model_path.write_text(json.dumps(MODEL))
+        cache_dir = tmp_path / "cache"
+
+        first = load_compact_model(model_path, cache_dir)
+        (compiled,) = cache_dir.iterdir()
+        with patch("api.services.gender.compact_model.compile_model") as compile_:
+            second = load_compact_model(model_path, cache_dir)
+        compile_.assert_not_called()
+
+        assert first.get("mary") == second.get("mary") == (5, 800, 0.9938)
+        assert compiled.suffix == ".bin"
+
+    @pytest.mark.parametrize("corrupt", [None, b"", b"GNDR", b"garbage" * 10])
+    def test_corrupt_compiled_file_rebuilt(self, tmp_path, corrupt):
+        model_path = tmp_path / "model.txt"
+        model_path.write_text(json.dumps(MODEL))
+        cache_dir = tmp_path / "cache"
+        load_compact_model(model_path, cache_dir)
+        (compiled,) = cache_dir.iterdir()
+        valid = compiled.read_bytes()
+        # None: truncated halfway
+        compiled.write_bytes(valid[: len(valid) // 2] if corrupt is None else corrupt)
+
+        model = load_compact_model(model_path, cache_dir)
+
+        assert model.get("john") == (900, 10, 0.99)
+        assert compiled.read_bytes() == valid
+
+
+def _service(tmp_path, redis_values=None, api_key="key", handler=None):
+    model_path = tmp_path / "model.txt"
+    model_path.write_text(json.dumps(MODEL))
+    with patch(
+        "api.services.gender.compact_model.COMPACT_MODEL_CACHE_DIR", tmp_path / "cache"
+    ):
+        service = GenderService(model_path=str(model_path), gender_api_key=api_key)
+
+    redis_values = redis_values or {}
+    redis_client = MagicMock()
+    redis_client.mget = AsyncMock(
+        side_effect=lambda keys: [redis_values.get(key) for key in keys]
+    )
+    redis_client.close = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis_client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    redis_client.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    service._redis_client = redis_client
+
+    requests = []
+
+    def default_handler(request):
+        body = json.loads(request.content)
+        requests.append(body)
+        return httpx.Response(
+            200,
+            json=[
+                {"input": item, "gender": "female", "probability": 0.97}
+                for item in body
+            ],
+        )
+
+    service._http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler or default_handler)
+    )
+    return service, redis_client, pipe, requests
+
+
+class TestBatchPredict:
+    @pytest.mark.asyncio
+    async def test_model_cache_and_bulk_api(self, tmp_path):
+        cached = json.dumps({"gender": "male", "confidence": 0.8})
+        service, redis_client, pipe, requests = _service(
+            tmp_path, {"genderservice:taylor": cached}
+        )
+
+        with patch("api.services.gender.gender_service.GENDER_API_BATCH_SIZE", 2):
+            results = await service.batch_predict(
+                ["John", "", "Priya", "taylor", "Aiko", "john ", "Olga"]
+            )
+
+        assert [(r.gender, r.source) for r in results] == [
+            ("male", "model"),
+            ("unknown", "model"),
+            ("female", "genderapi"),
+            ("male", "genderapi"),
+            ("female", "genderapi"),
+            ("male", "model"),
+            ("female", "genderapi"),
+        ]
+        redis_client.mget.assert_awaited_once()
+        assert sorted(redis_client.mget.await_args.args[0]) == [
+            "genderservice:aiko",
+            "genderservice:olga",
+            "genderservice:priya",
+            "genderservice:taylor",
+        ]
+        assert sorted(len(body) for body in requests) == [1, 2]
+        assert pipe.setex.call_count == 3
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_bulk_request_falls_back_to_model(self, tmp_path):
+        service, _, pipe, _ = _service(
+            tmp_path, handler=lambda request: httpx.Response(503)
+        )
+
+        results = await service.batch_predict(["Taylor", "Priya"])
+
+        assert [(r.gender, r.confidence, r.source) for r in results] == [
+            ("female", 0.6, "model"),
+            ("unknown", 0.0, "model"),
+        ]
+        pipe.setex.assert_not_called()
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_unexpected_bulk_response_falls_back_to_model(self, tmp_path):
+        service, _, pipe, _ = _service(
+            tmp_path,
+            handler=lambda request: httpx.Response(200, json={"error": "quota"}),
+        )
+
+        results = await service.batch_predict(["Taylor"])
+
+        assert [(r.gender, r.source) for r in results] == [("female", "model")]
+        pipe.setex.assert_not_called()
+        await service.close()
@@ -0,0 +1,266 @@
+"""
+Tests for media worker routing.
+
+These tests verify:
+1. Media websockets are keyed by workflow run (or embed session)
+2. Sessions stick to their worker and new sessions go to the least-loaded one
+3. The API process relays websocket messages to and from the chosen worker
+4. Telephony streams go straight to the worker's public URL when it has one
+5. With media workers, a run's WebSocket sender is reachable from other
+   processes through Redis; without them Redis isn't used
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from websockets.asyncio.server import serve
+
+from api.services.media_workers import routing
+from api.services.media_workers.registry import select_worker
+from api.services.media_workers.routing import (
+    MediaWorkerRouterMiddleware,
+    media_session_key,
+    media_stream_endpoint,
+)
+from api.services.pipecat import ws_sender_registry
+
+
+def _scope(path: str, query_string: bytes = b"") -> dict:
+    return {
+        "type": "websocket",
+        "path": path,
+        "query_string": query_string,
+        "headers": [(b"host", b"api.example.com"), (b"origin", b"https://app")],
+        "client": ("203.0.113.5", 5000),
+        "subprotocols": [],
+    }
+
+
+class TestMediaSessionKey:
+    def test_media_routes(self):
+        assert media_session_key(_scope("/api/v1/telephony/ws/3/7/42")) == "run:42"
+        assert media_session_key(_scope("/api/v1/ws/signaling/3/42")) == "run:42"
+        assert (
+            media_session_key(
+                _scope("/api/v1/telephony/ws/ari", b"workflow_id=3&workflow_run_id=42")
+            )
+            == "run:42"
+        )
+        assert (
+            media_session_key(_scope("/api/v1/ws/public/signaling/tok_abc"))
+            == "embed:tok_abc"
+        )
+
+    def test_other_websockets_are_not_routed(self):
+        assert (
+            media_session_key(_scope("/api/v1/looptalk/test-sessions/1/audio-stream"))
+            is None
+        )
+        assert media_session_key(_scope("/api/v1/telephony/ws/ari")) is None
+
+
+class TestSelectWorker:
+    def test_least_loaded_live_worker(self):
+        assert select_worker({0: 5, 1: 2, 2: 2}) == 1
+
+    def test_sticky_worker_wins_while_alive(self):
+        assert select_worker({0: 5, 1: 2}, sticky=0) == 0
+        # Dead sticky worker: pick again
+        assert select_worker({0: 5, 1: 2}, sticky=3) == 1
+
+    def test_no_live_worker(self):
+        assert select_worker({}) is None
+
+
+class TestRelay:
+    @pytest.mark.asyncio
+    async def test_messages_are_relayed_both_ways(self):
+        received_paths = []
+
+        async def worker_handler(ws):
+            received_paths.append(ws.request.path)
+            async for message in ws:
+                await ws.send(message)
+            # Client closed
+            received_paths.append("closed")
+
+        async with serve(worker_handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            registry = MagicMock()
+            registry.assign = AsyncMock(return_value=0)
+
+            incoming = asyncio.Queue()
+            for message in (
+                {"type": "websocket.connect"},
+                {"type": "websocket.receive", "bytes": b"\x00\x01audio"},
+                {"type": "websocket.receive", "text": '{"event": "media"}'},
+            ):
+                incoming.put_nowait(message)
+            sent = []
+
+            async def send(message):
+                sent.append(message)
+                if len([m for m in sent if m["type"] == "websocket.send"]) == 2:
+                    incoming.put_nowait({"type": "websocket.disconnect", "code": 1000})
+
+            app = AsyncMock()
+            middleware = MediaWorkerRouterMiddleware(app)
+            with (
+                patch(
+                    "api.services.media_workers.routing.get_media_worker_registry",
+                    return_value=registry,
+                ),
+                patch(
+                    "api.services.media_workers.routing.worker_url",
+                    return_value=f"ws://127.0.0.1:{port}",
+                ),
+            ):
+                await asyncio.wait_for(
+                    middleware(
+                        _scope("/api/v1/telephony/ws/3/7/42", b"x=1"),
+                        incoming.get,
+                        send,
+                    ),
+                    timeout=5,
+                )
+            await asyncio.sleep(0.05)
+
+        app.assert_not_awaited()
+        registry.assign.assert_awaited_once_with("run:42")
+        assert sent[0]["type"] == "websocket.accept"
+        assert sent[1] == {"type": "websocket.send", "bytes": b"\x00\x01audio"}
+        assert sent[2] == {"type": "websocket.send", "text": '{"event": "media"}'}
+        assert received_paths == ["/api/v1/telephony/ws/3/7/42?x=1", "closed"]
+
+    @pytest.mark.asyncio
+    async def test_served_locally_without_live_workers(self):
+        registry = MagicMock()
+        registry.assign = AsyncMock(return_value=None)
+        app = AsyncMock()
+        middleware = MediaWorkerRouterMiddleware(app)
+
+        with patch(
+            "api.services.media_workers.routing.get_media_worker_registry",
+            return_value=registry,
+        ):
+            await middleware(
+                _scope("/api/v1/ws/signaling/3/42"), AsyncMock(), AsyncMock()
+            )
+
+        app.assert_awaited_once()
+
+
+class TestMediaStreamEndpoint:
+    @pytest.mark.asyncio
+    async def test_worker_public_url(self, monkeypatch):
+        monkeypatch.setattr(routing, "MEDIA_WORKERS", 2)
+        monkeypatch.setattr(
+            routing, "MEDIA_WORKER_PUBLIC_URL", "wss://media.example.com:{port}"
+        )
+        registry = MagicMock()
+        registry.assign = AsyncMock(side_effect=[1, None])
+
+        with patch.object(routing, "get_media_worker_registry", return_value=registry):
+            direct = await media_stream_endpoint(42, "wss://api.example.com")
+            relayed = await media_stream_endpoint(43, "wss://api.example.com")
+
+        assert direct == "wss://media.example.com:8101"
+        assert relayed == "wss://api.example.com"
+        registry.assign.assert_any_await("run:42")
+
+    @pytest.mark.asyncio
+    async def test_api_endpoint_without_public_url(self, monkeypatch):
+        monkeypatch.setattr(routing, "MEDIA_WORKERS", 2)
+        monkeypatch.setattr(routing, "MEDIA_WORKER_PUBLIC_URL", "")
+
+        assert (
+            await media_stream_endpoint(42, "wss://api.example.com")
+            == "wss://api.example.com"
+        )
+
+
+class _PubSub:
+    def __init__(self, redis):
+        self._redis = redis
+        self._queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self._redis.channels[channel] = self._queue
+
+    async def get_message(self, ignore_subscribe_messages, timeout):
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        pass
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.keys = {}
+        self.channels = {}
+
+    async def set(self, key, value, ex=None):
+        self.keys[key] = value
+
+    async def delete(self, key):
+        self.keys.pop(key, None)
+
+    async def exists(self, key):
+        return int(key in self.keys)
+
+    async def publish(self, channel, data):
+        if channel in self.channels:
+            self.channels[channel].put_nowait({"type": "message", "data": data})
+
+    def pubsub(self):
+        return _PubSub(self)
+
+
+class TestWsSenderRegistry:
+    @pytest.mark.asyncio
+    async def test_sender_reachable_from_another_process(self, monkeypatch):
+        redis = _FakeRedis()
+        monkeypatch.setattr(ws_sender_registry, "MEDIA_WORKERS", 2)
+        monkeypatch.setattr(ws_sender_registry, "_redis_client", redis)
+        monkeypatch.setattr(ws_sender_registry, "_remote_presence", {})
+        sent = []
+
+        async def ws_sender(message):
+            sent.append(message)
+
+        # The signaling WebSocket of run 42 is held by this process
+        ws_sender_registry.register_ws_sender(42, ws_sender)
+        await asyncio.sleep(0.01)
+        assert await ws_sender_registry.find_ws_sender(43) is None
+
+        # The pipeline's process only sees the run through Redis
+        ws_sender_registry._ws_senders.pop(42)
+        remote_sender = await ws_sender_registry.find_ws_sender(42)
+        ws_sender_registry._ws_senders[42] = ws_sender
+        await remote_sender({"type": "rtf-bot-text", "payload": {"text": "Hi"}})
+        await asyncio.sleep(0.01)
+
+        ws_sender_registry.unregister_ws_sender(42)
+        await asyncio.sleep(0.01)
+
+        assert sent == [{"type": "rtf-bot-text", "payload": {"text": "Hi"}}]
+        assert redis.keys == {}
+
+    @pytest.mark.asyncio
+    async def test_in_process_without_media_workers(self, monkeypatch):
+        monkeypatch.setattr(ws_sender_registry, "MEDIA_WORKERS", 0)
+        get_redis = AsyncMock()
+        monkeypatch.setattr(ws_sender_registry, "_get_redis", get_redis)
+        ws_sender = AsyncMock()
+
+        ws_sender_registry.register_ws_sender(42, ws_sender)
+        assert await ws_sender_registry.find_ws_sender(42) is ws_sender
+        assert await ws_sender_registry.find_ws_sender(43) is None
+        ws_sender_registry.unregister_ws_sender(42)
+
+        assert ws_sender_registry._relay_tasks == {}
+        get_redis.assert_not_awaited()
@@ -0,0 +1,115 @@
+"""
+Tests for the pipeline metrics aggregator.
+
+These tests verify:
+1. Speculative generation outcomes are summed over the call
+2. The speculative_generation entry is only serialized when speculation happened
+3. TTS phrase cache hits, misses and time to first audio saved are summed
+4. The time to first audio of the call is measured until the bot first speaks
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from api.services.pipecat.pipeline_metrics_aggregator import PipelineMetricsAggregator
+from pipecat.frames.frames import BotStartedSpeakingFrame, MetricsFrame
+from pipecat.metrics.metrics import (
+    SpeculativeGenerationMetricsData,
+    TTSPhraseCacheMetricsData,
+)
+from pipecat.processors.frame_processor import FrameDirection
+
+
+def _speculation(committed: bool, **kwargs) -> MetricsFrame:
+    return MetricsFrame(
+        data=[
+            SpeculativeGenerationMetricsData(
+                processor="llm", model="gpt-4.1", committed=committed, **kwargs
+            )
+        ]
+    )
+
+
+class TestSpeculativeGenerationMetrics:
+    @pytest.mark.asyncio
+    async def test_aggregates_outcomes(self):
+        aggregator = PipelineMetricsAggregator()
+        aggregator.push_frame = AsyncMock()
+
+        for frame in [
+            _speculation(True, latency_saved=0.4),
+            _speculation(True, latency_saved=0.25),
+            _speculation(False, wasted_prompt_tokens=900, wasted_completion_tokens=12),
+        ]:
+            await aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
+
+        usage = aggregator.get_all_usage_metrics_serialized()
+        assert usage["speculative_generation"] == {
+            "committed": 2,
+            "discarded": 1,
+            "wasted_prompt_tokens": 900,
+            "wasted_completion_tokens": 12,
+            "latency_saved_seconds": 0.65,
+        }
+
+    def test_not_serialized_without_speculation(self):
+        aggregator = PipelineMetricsAggregator()
+
+        assert (
+            "speculative_generation"
+            not in aggregator.get_all_usage_metrics_serialized()
+        )
+
+
+class TestTTSPhraseCacheMetrics:
+    @pytest.mark.asyncio
+    async def test_aggregates_lookups(self):
+        aggregator = PipelineMetricsAggregator()
+        aggregator.push_frame = AsyncMock()
+
+        for data in [
+            TTSPhraseCacheMetricsData(processor="tts", hit=False),
+            TTSPhraseCacheMetricsData(
+                processor="tts", hit=True, tier="memory", ttfa_saved=0.3
+            ),
+            TTSPhraseCacheMetricsData(
+                processor="tts", hit=True, tier="redis", ttfa_saved=0.25
+            ),
+        ]:
+            await aggregator.process_frame(
+                MetricsFrame(data=[data]), FrameDirection.DOWNSTREAM
+            )
+
+        usage = aggregator.get_all_usage_metrics_serialized()
+        assert usage["tts_phrase_cache"] == {
+            "hits": 2,
+            "misses": 1,
+            "hit_rate": 0.667,
+            "ttfa_saved_seconds": 0.55,
+        }
+
+
+class TestTimeToFirstAudio:
+    @pytest.mark.asyncio
+    async def test_measured_until_bot_first_speaks(self, monkeypatch):
+        aggregator = PipelineMetricsAggregator()
+        aggregator.push_frame = AsyncMock()
+        assert "time_to_first_audio_seconds" not in (
+            aggregator.get_all_usage_metrics_serialized()
+        )
+
+        now = [1000.0]
+        monkeypatch.setattr(
+            "api.services.pipecat.pipeline_metrics_aggregator.time.time",
+            lambda: now[0],
+        )
+        await aggregator._start(None)
+        for elapsed in (1.25, 9.0):
+            now[0] = 1000.0 + elapsed
+            await aggregator.process_frame(
+                BotStartedSpeakingFrame(), FrameDirection.DOWNSTREAM
+            )
+
+        usage = aggregator.get_all_usage_metrics_serialized()
+        assert usage["time_to_first_audio_seconds"] == 1.25
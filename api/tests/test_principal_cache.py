@@ -0,0 +1,242 @@
+"""
+Tests for the authenticated principal cache.
+
+These tests verify:
+1. Repeated API key / token authentication resolves the user once
+2. Rejected credentials are negatively cached
+3. Invalidation (API key revocation, user changes) forces re-resolution
+4. Concurrent misses for the same credential share one resolution
+5. Invalidations reach the caches of other processes
+6. Token entries expire with the token and are keyed on its selected team
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from api.db.models import UserModel
+from api.services.auth import principal_cache
+from api.services.auth.principal_cache import (
+    PrincipalCache,
+    api_key_cache_key,
+    token_cache_key,
+    unverified_token_claims,
+)
+from api.utils.api_key import hash_api_key
+from api.utils.auth import create_jwt_token
+
+
+@pytest.fixture(autouse=True)
+def fresh_principal_cache(monkeypatch):
+    cache = PrincipalCache(
+        ttl_seconds=30,
+        negative_ttl_seconds=5,
+        use_redis=False,
+        broadcast_invalidations=False,
+    )
+    monkeypatch.setattr(principal_cache, "_principal_cache", cache)
+    return cache
+
+
+def _user(**overrides) -> UserModel:
+    values = dict(
+        id=7,
+        provider_id="user_7",
+        selected_organization_id=3,
+        is_superuser=False,
+        email="user@example.com",
+    )
+    values.update(overrides)
+    return UserModel(**values)
+
+
+class TestApiKeyAuth:
+    @pytest.mark.asyncio
+    async def test_api_key_resolved_once(self):
+        from api.services.auth.depends import get_user
+
+        api_key_model = MagicMock(
+            created_by=7, organization_id=3, key_prefix="dgr_abcd"
+        )
+        with patch("api.services.auth.depends.db_client") as mock_db:
+            mock_db.validate_api_key = AsyncMock(return_value=api_key_model)
+            mock_db.get_user_by_id = AsyncMock(return_value=_user())
+
+            first = await get_user(None, "dgr_secret")
+            second = await get_user(None, "dgr_secret")
+
+        assert first.id == second.id == 7
+        assert second.selected_organization_id == 3
+        # Each request gets its own instance
+        assert first is not second
+        mock_db.validate_api_key.assert_awaited_once()
+        mock_db.get_user_by_id.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalid_api_key_negatively_cached(self):
+        from api.services.auth.depends import get_user
+
+        with patch("api.services.auth.depends.db_client") as mock_db:
+            mock_db.validate_api_key = AsyncMock(return_value=None)
+
+            for _ in range(3):
+                with pytest.raises(HTTPException) as exc_info:
+                    await get_user(None, "dgr_bogus")
+                assert exc_info.value.status_code == 401
+
+        mock_db.validate_api_key.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_revoked_api_key_is_rejected_after_invalidation(
+        self, fresh_principal_cache
+    ):
+        from api.services.auth.depends import get_user
+
+        api_key_model = MagicMock(
+            created_by=7, organization_id=3, key_prefix="dgr_abcd"
+        )
+        with patch("api.services.auth.depends.db_client") as mock_db:
+            mock_db.validate_api_key = AsyncMock(return_value=api_key_model)
+            mock_db.get_user_by_id = AsyncMock(return_value=_user())
+            await get_user(None, "dgr_secret")
+
+            # Key archived: the route invalidates the cached principal
+            mock_db.validate_api_key = AsyncMock(return_value=None)
+            await fresh_principal_cache.invalidate(
+                api_key_cache_key(hash_api_key("dgr_secret"))
+            )
+
+            with pytest.raises(HTTPException) as exc_info:
+                await get_user(None, "dgr_secret")
+        assert exc_info.value.status_code == 401
+
+
+class TestPrincipalCache:
+    @pytest.mark.asyncio
+    async def test_invalidate_user_drops_all_tokens(self, fresh_principal_cache):
+        loader = AsyncMock(return_value=_user())
+
+        await fresh_principal_cache.get_or_load(token_cache_key("a"), loader)
+        await fresh_principal_cache.get_or_load(token_cache_key("b"), loader)
+        await fresh_principal_cache.invalidate_user(7)
+        await fresh_principal_cache.get_or_load(token_cache_key("a"), loader)
+
+        assert loader.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, fresh_principal_cache):
+        async def slow_loader():
+            await asyncio.sleep(0.01)
+            return _user()
+
+        loader = AsyncMock(side_effect=slow_loader)
+        users = await asyncio.gather(
+            *(
+                fresh_principal_cache.get_or_load(token_cache_key("t"), loader)
+                for _ in range(5)
+            )
+        )
+
+        assert loader.await_count == 1
+        assert {user.id for user in users} == {7}
+        stats = fresh_principal_cache.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 4
+        assert stats["hit_rate"] == 0.8
+
+    @pytest.mark.asyncio
+    async def test_server_errors_are_not_cached(self, fresh_principal_cache):
+        loader = AsyncMock(
+            side_effect=[HTTPException(status_code=500, detail="db down"), _user()]
+        )
+
+        with pytest.raises(HTTPException):
+            await fresh_principal_cache.get_or_load(token_cache_key("t"), loader)
+        user = await fresh_principal_cache.get_or_load(token_cache_key("t"), loader)
+
+        assert user.id == 7
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_loads(self):
+        cache = PrincipalCache(
+            ttl_seconds=0, use_redis=False, broadcast_invalidations=False
+        )
+        loader = AsyncMock(return_value=_user())
+
+        await cache.get_or_load(token_cache_key("t"), loader)
+        await cache.get_or_load(token_cache_key("t"), loader)
+
+        assert loader.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_not_cached_past_token_expiry(self, fresh_principal_cache):
+        loader = AsyncMock(return_value=_user())
+
+        for _ in range(2):
+            await fresh_principal_cache.get_or_load(
+                token_cache_key("t"), loader, expires_at=time.time() - 1
+            )
+
+        assert loader.await_count == 2
+
+    def test_token_key_scoped_to_selected_team(self):
+        token = create_jwt_token(7, "user@example.com")
+        claims = unverified_token_claims(token)
+
+        assert claims["exp"] > time.time()
+        assert unverified_token_claims("not-a-jwt") == {}
+        assert token_cache_key(token, "team_a") != token_cache_key(token, "team_b")
+
+
+class _PubSub:
+    def __init__(self, redis):
+        self._redis = redis
+        self._queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self._redis.subscribers.append(self._queue)
+
+    async def listen(self):
+        while True:
+            yield await self._queue.get()
+
+    async def aclose(self):
+        self._redis.subscribers.remove(self._queue)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.subscribers = []
+
+    async def publish(self, channel, data):
+        for queue in self.subscribers:
+            queue.put_nowait({"type": "message", "data": data})
+
+    def pubsub(self):
+        return _PubSub(self)
+
+
+class TestInvalidationBroadcast:
+    @pytest.mark.asyncio
+    async def test_invalidation_reaches_other_processes(self):
+        redis = _FakeRedis()
+        caches = [PrincipalCache(ttl_seconds=30, use_redis=False) for _ in range(2)]
+        for cache in caches:
+            cache._redis_client = redis
+        loaders = [AsyncMock(return_value=_user()) for _ in caches]
+        key = api_key_cache_key("hash")
+
+        for cache, loader in zip(caches, loaders):
+            await cache.get_or_load(key, loader)
+        await asyncio.sleep(0)
+        # The key is archived through the other worker
+        await caches[1].invalidate(key)
+        await asyncio.sleep(0)
+        for cache, loader in zip(caches, loaders):
+            await cache.get_or_load(key, loader)
+            cache._listener_task.cancel()
+
+        assert [loader.await_count for loader in loaders] == [2, 2]
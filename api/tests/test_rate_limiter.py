@@ -0,0 +1,167 @@
+"""
+Tests for the campaign rate limiter's dispatch methods.
+
+These tests verify:
+1. Scripts run by SHA1 and are loaded when Redis does not know them
+2. acquire_dispatch_resources maps the merged script's result to an outcome
+3. Workflow call mappings are written in one pipeline
+4. release_workflow_resources releases the slot and from_number of a run
+5. Concurrent first callers share a single campaign Redis connection
+6. Keyed rate limits don't share keys with organization rate limits
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import NoScriptError
+
+from api.services.campaign.rate_limiter import DispatchAcquisition, RateLimiter
+from api.services.campaign import redis_scripts
+from api.services.campaign.redis_scripts import RedisScript, get_campaign_redis
+
+
+def _pipeline(redis_client, results=None):
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=results or [])
+    redis_client.pipeline = MagicMock()
+    redis_client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    redis_client.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    return pipe
+
+
+class TestRedisScript:
+    @pytest.mark.asyncio
+    async def test_loads_script_on_noscript(self):
+        script = RedisScript("return ARGV[1]")
+        redis_client = AsyncMock()
+        redis_client.evalsha = AsyncMock(side_effect=[NoScriptError(), "ok"])
+
+        assert await script(redis_client, ["key"], ["ok"]) == "ok"
+
+        redis_client.script_load.assert_awaited_once_with("return ARGV[1]")
+        redis_client.evalsha.assert_awaited_with(script.sha, 1, "key", "ok")
+
+    @pytest.mark.asyncio
+    async def test_connection_created_once(self, monkeypatch):
+        created = []
+
+        async def from_url(url, **kwargs):
+            await asyncio.sleep(0.01)
+            redis_client = AsyncMock()
+            redis_client.pipeline = MagicMock(side_effect=Exception("down"))
+            created.append(redis_client)
+            return redis_client
+
+        monkeypatch.setattr(redis_scripts, "_redis_client", None)
+        monkeypatch.setattr(redis_scripts.aioredis, "from_url", from_url)
+
+        clients = await asyncio.gather(*(get_campaign_redis() for _ in range(5)))
+
+        assert len(created) == 1
+        assert all(client is created[0] for client in clients)
+
+
+class TestAcquireDispatchResources:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "result, status",
+        [
+            ([1, "slot-1", "+15550001"], DispatchAcquisition.ACQUIRED),
+            ([0, "0"], DispatchAcquisition.RATE_LIMITED),
+            ([-1], DispatchAcquisition.NO_CONCURRENT_SLOT),
+            ([-2], DispatchAcquisition.NO_FROM_NUMBER),
+        ],
+    )
+    async def test_outcomes(self, result, status):
+        limiter = RateLimiter()
+        limiter.redis_client = AsyncMock()
+        limiter.redis_client.evalsha = AsyncMock(return_value=result)
+
+        acquisition = await limiter.acquire_dispatch_resources(7, 2, 10)
+
+        assert acquisition.status == status
+        if status == DispatchAcquisition.ACQUIRED:
+            assert acquisition.slot_id == "slot-1"
+            assert acquisition.from_number == "+15550001"
+        limiter.redis_client.evalsha.assert_awaited_once()
+        keys = limiter.redis_client.evalsha.await_args.args[2:5]
+        assert keys == ("rate_limit:7", "concurrent_calls:7", "from_number_pool:7")
+
+    @pytest.mark.asyncio
+    async def test_redis_error_denies(self):
+        limiter = RateLimiter()
+        limiter.redis_client = AsyncMock()
+        limiter.redis_client.evalsha = AsyncMock(side_effect=Exception("down"))
+
+        acquisition = await limiter.acquire_dispatch_resources(7, 2, 10)
+
+        assert acquisition.status == DispatchAcquisition.RATE_LIMITED
+        assert acquisition.retry_after == 1.0
+
+
+class TestKeyedToken:
+    @pytest.mark.asyncio
+    async def test_separate_namespace(self):
+        limiter = RateLimiter()
+        limiter.redis_client = AsyncMock()
+        limiter.redis_client.evalsha = AsyncMock(return_value=1)
+
+        assert await limiter.acquire_keyed_token("webhook:crm.example.com", 20)
+        await limiter.acquire_token(7, 2)
+
+        keys = [call.args[2] for call in limiter.redis_client.evalsha.await_args_list]
+        assert keys == ["keyed_rate_limit:webhook:crm.example.com", "rate_limit:7"]
+
+
+class TestWorkflowCallMappings:
+    @pytest.mark.asyncio
+    async def test_store_in_one_pipeline(self):
+        limiter = RateLimiter()
+        limiter.redis_client = AsyncMock()
+        pipe = _pipeline(limiter.redis_client)
+
+        assert await limiter.store_workflow_call_mappings(42, 7, "slot-1", "+15550001")
+
+        limiter.redis_client.pipeline.assert_called_once_with(transaction=False)
+        pipe.execute.assert_awaited_once()
+        assert pipe.hset.call_count == 2
+        assert pipe.expire.call_count == 2
+        limiter.redis_client.hset.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_release_workflow_resources(self):
+        limiter = RateLimiter()
+        limiter.redis_client = AsyncMock()
+        _pipeline(
+            limiter.redis_client,
+            [
+                {"org_id": "7", "slot_id": "slot-1"},
+                {"org_id": "7", "from_number": "+15550001"},
+            ],
+        )
+        limiter.redis_client.evalsha = AsyncMock(return_value=[1, 1])
+
+        slot_released, from_number = await limiter.release_workflow_resources(42)
+
+        assert slot_released is True
+        assert from_number == "+15550001"
+        args = limiter.redis_client.evalsha.await_args.args
+        assert args[1:] == (
+            4,
+            "concurrent_calls:7",
+            "from_number_pool:7",
+            "workflow_slot_mapping:42",
+            "workflow_from_number:42",
+            "slot-1",
+            "+15550001",
+        )
+
+    @pytest.mark.asyncio
+    async def test_release_without_mappings(self):
+        limiter = RateLimiter()
+        limiter.redis_client = AsyncMock()
+        _pipeline(limiter.redis_client, [{}, {}])
+
+        assert await limiter.release_workflow_resources(42) == (False, None)
+        limiter.redis_client.evalsha.assert_not_called()
@@ -0,0 +1,141 @@
+"""
+Tests for the real-time feedback observer.
+
+These tests verify:
+1. Frames are ignored without a logs buffer nor a WebSocket sender, and the
+   logs buffer keeps receiving events after the sender is unregistered
+2. Events are coalesced before being sent (latest interim transcription, bot
+   text merged with the UI's spacing) and appended to the logs buffer, with a
+   frame observed several times sent once
+3. Bot text whose time hasn't come yet is dropped on interruption
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from api.services.pipecat.realtime_feedback_observer import RealtimeFeedbackObserver
+from api.services.pipecat.ws_sender_registry import (
+    register_ws_sender,
+    unregister_ws_sender,
+)
+from pipecat.frames.frames import (
+    EndFrame,
+    FunctionCallInProgressFrame,
+    InterimTranscriptionFrame,
+    InterruptionFrame,
+    TranscriptionFrame,
+    TTSTextFrame,
+)
+from pipecat.observers.base_observer import FramePushed
+from pipecat.processors.frame_processor import FrameDirection
+
+WORKFLOW_RUN_ID = 4242
+
+
+def _pushed(frame, direction=FrameDirection.DOWNSTREAM) -> FramePushed:
+    return FramePushed(
+        source=Mock(),
+        destination=Mock(),
+        frame=frame,
+        direction=direction,
+        timestamp=0,
+    )
+
+
+def _bot_text(text: str, pts: int = None) -> TTSTextFrame:
+    frame = TTSTextFrame(text=text, aggregated_by="word")
+    frame.pts = pts
+    return frame
+
+
+@pytest.fixture
+async def sent():
+    messages = []
+
+    async def ws_sender(message: dict):
+        messages.append(message)
+
+    register_ws_sender(WORKFLOW_RUN_ID, ws_sender)
+    yield messages
+    unregister_ws_sender(WORKFLOW_RUN_ID)
+
+
+@pytest.fixture
+def logs_buffer():
+    buffer = Mock()
+    buffer.append = AsyncMock()
+    return buffer
+
+
+class TestRealtimeFeedbackObserver:
+    @pytest.mark.asyncio
+    async def test_ignored_without_subscriber(self):
+        observer = RealtimeFeedbackObserver(WORKFLOW_RUN_ID)
+
+        await observer.on_push_frame(_pushed(_bot_text("Hello")))
+
+        assert observer._drainer_task is None
+
+    @pytest.mark.asyncio
+    async def test_logged_after_sender_unregistered(self, sent, logs_buffer):
+        observer = RealtimeFeedbackObserver(
+            WORKFLOW_RUN_ID, logs_buffer=logs_buffer, send_interval=0
+        )
+
+        await observer.on_push_frame(_pushed(_bot_text("Hello")))
+        await asyncio.sleep(0.01)
+        unregister_ws_sender(WORKFLOW_RUN_ID)
+        await observer.on_push_frame(_pushed(_bot_text("Goodbye")))
+        await observer.on_push_frame(_pushed(EndFrame()))
+        await observer._drainer_task
+
+        assert [m["payload"]["text"] for m in sent] == ["Hello"]
+        logged = [call.args[0] for call in logs_buffer.append.await_args_list]
+        assert [m["payload"]["text"] for m in logged] == ["Hello", "Goodbye"]
+
+    @pytest.mark.asyncio
+    async def test_events_coalesced(self, sent, logs_buffer):
+        observer = RealtimeFeedbackObserver(
+            WORKFLOW_RUN_ID, logs_buffer=logs_buffer, send_interval=0
+        )
+        interim = InterimTranscriptionFrame(text="I want", user_id="u", timestamp="t1")
+        frames = [
+            interim,
+            interim,
+            InterimTranscriptionFrame(text="I want to", user_id="u", timestamp="t2"),
+            TranscriptionFrame(text="I want to book", user_id="u", timestamp="t3"),
+            _bot_text("Sure"),
+            _bot_text(", what"),
+            _bot_text("day?"),
+            FunctionCallInProgressFrame(
+                function_name="lookup", tool_call_id="call-1", arguments={}
+            ),
+        ]
+        for frame in frames:
+            await observer.on_push_frame(_pushed(frame))
+        await observer.on_push_frame(_pushed(EndFrame()))
+        await observer._drainer_task
+
+        assert [(m["type"], m["payload"].get("text")) for m in sent] == [
+            ("rtf-user-transcription", "I want to"),
+            ("rtf-user-transcription", "I want to book"),
+            ("rtf-bot-text", "Sure, what day?"),
+            ("rtf-function-call-start", None),
+        ]
+        assert [call.args[0] for call in logs_buffer.append.await_args_list] == sent
+        logs_buffer.increment_turn.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_pending_bot_text_dropped_on_interruption(self, sent):
+        observer = RealtimeFeedbackObserver(WORKFLOW_RUN_ID, send_interval=0)
+
+        await observer.on_push_frame(_pushed(_bot_text("Hello", pts=1_000_000_000)))
+        await asyncio.sleep(0.01)
+        await observer.on_push_frame(_pushed(_bot_text("later", pts=60_000_000_000)))
+        await observer.on_push_frame(_pushed(InterruptionFrame()))
+        await observer.on_push_frame(_pushed(EndFrame()))
+        await observer._drainer_task
+
+        assert sent == [{"type": "rtf-bot-text", "payload": {"text": "Hello"}}]
@@ -0,0 +1,171 @@
+"""
+Tests for the streamed run logs.
+
+These tests verify:
+1. Transcript lines are flushed to the run's file (and mirrored to a Redis
+   stream) without waiting for the end of the call
+2. User speech is detected as lines are appended
+3. Feedback events are stored as JSON lines and assembled into a JSON array
+4. Runs that log nothing leave no file behind
+5. A run's live log is only served under the workflow the run belongs to
+6. Malformed entry ids are rejected before reaching Redis
+7. Files left behind by crashed workers are removed once stale
+"""
+
+import asyncio
+import json
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from api.routes.workflow import get_workflow_run_live_log
+from api.services.pipecat.run_log import (
+    StreamingLogsBuffer,
+    StreamingTranscriptBuffer,
+    remove_stale_run_logs,
+    stream_key,
+)
+
+
+def _redis():
+    redis_client = MagicMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis_client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    redis_client.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    return redis_client, pipe
+
+
+class TestStreamingTranscriptBuffer:
+    @pytest.mark.asyncio
+    async def test_lines_flushed_during_call(self, tmp_path):
+        redis_client, pipe = _redis()
+        buffer = StreamingTranscriptBuffer(
+            7, directory=str(tmp_path), flush_interval=0.01
+        )
+
+        with patch(
+            "api.services.pipecat.run_log._get_redis",
+            AsyncMock(return_value=redis_client),
+        ):
+            await buffer.append("[2025-06-29T12:34:56.789+00:00] assistant: Hi\n")
+            assert not buffer.contains_user_speech()
+            await buffer.append("[2025-06-29T12:34:58.120+00:00] user: Hello\n")
+            await asyncio.sleep(0.05)
+
+            with open(buffer.path) as f:
+                assert f.read().splitlines() == [
+                    "[2025-06-29T12:34:56.789+00:00] assistant: Hi",
+                    "[2025-06-29T12:34:58.120+00:00] user: Hello",
+                ]
+            assert buffer.contains_user_speech()
+            assert pipe.xadd.call_count == 2
+            assert pipe.xadd.call_args.args[0] == stream_key(7, "transcript")
+
+            path = await buffer.write_to_temp_file()
+
+        assert path == buffer.path
+        assert not buffer.is_empty
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_does_not_lose_lines(self, tmp_path):
+        buffer = StreamingTranscriptBuffer(8, directory=str(tmp_path))
+
+        with patch(
+            "api.services.pipecat.run_log._get_redis",
+            AsyncMock(side_effect=ConnectionError("redis down")),
+        ):
+            await buffer.append("assistant: Hi\n")
+            path = await buffer.write_to_temp_file()
+
+        with open(path) as f:
+            assert f.read() == "assistant: Hi\n"
+
+
+class TestStreamingLogsBuffer:
+    @pytest.mark.asyncio
+    async def test_events_assembled_as_json_array(self, tmp_path):
+        buffer = StreamingLogsBuffer(9, directory=str(tmp_path), stream_enabled=False)
+
+        await buffer.append({"type": "rtf-user-transcription", "payload": {"a": 1}})
+        buffer.increment_turn()
+        await buffer.append({"type": "rtf-bot-text", "payload": {"text": "ok"}})
+
+        events = json.loads(await buffer.get_events_json())
+        assert [(e["type"], e["turn"]) for e in events] == [
+            ("rtf-user-transcription", 0),
+            ("rtf-bot-text", 1),
+        ]
+        assert events[1]["payload"] == {"text": "ok"}
+        assert "timestamp" in events[0]
+
+        await buffer.discard()
+        assert not list(tmp_path.iterdir())
+
+    @pytest.mark.asyncio
+    async def test_nothing_logged_leaves_no_file(self, tmp_path):
+        buffer = StreamingLogsBuffer(10, directory=str(tmp_path), stream_enabled=False)
+
+        assert buffer.is_empty
+        assert await buffer.get_events() == []
+        await buffer.close()
+        assert not list(tmp_path.iterdir())
+
+
+class TestStaleRunLogs:
+    def test_stale_files_removed(self, tmp_path):
+        stale = tmp_path / "11-transcript.txt"
+        stale.write_text("left by a crashed worker\n")
+        old = time.time() - 7200
+        os.utime(stale, (old, old))
+        live = tmp_path / "12-transcript.txt"
+        live.write_text("still being written\n")
+
+        assert remove_stale_run_logs(3600, directory=str(tmp_path)) == 1
+        assert [path.name for path in tmp_path.iterdir()] == ["12-transcript.txt"]
+        assert remove_stale_run_logs(3600, directory=str(tmp_path / "none")) == 0
+
+
+class TestLiveLogRoute:
+    @pytest.mark.asyncio
+    async def test_run_of_another_workflow_not_found(self):
+        user = SimpleNamespace(selected_organization_id=1)
+        read_run_log = AsyncMock(return_value=([], "0-0"))
+
+        with (
+            patch(
+                "api.routes.workflow.db_client.get_workflow_run",
+                AsyncMock(return_value=SimpleNamespace(workflow_id=3)),
+            ),
+            patch("api.routes.workflow.read_run_log", read_run_log),
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_workflow_run_live_log(
+                    4, 11, after="0-0", limit=100, user=user
+                )
+            response = await get_workflow_run_live_log(
+                3, 11, after="0-0", limit=100, user=user
+            )
+
+        assert exc_info.value.status_code == 404
+        read_run_log.assert_awaited_once()
+        assert response.entries == []
+
+    @pytest.mark.asyncio
+    async def test_malformed_after_rejected(self):
+        user = SimpleNamespace(selected_organization_id=1)
+        read_run_log = AsyncMock(return_value=([], "0-0"))
+
+        with patch("api.routes.workflow.read_run_log", read_run_log):
+            for after in ("abc", "1-", "1-2-3", "(5", ""):
+                with pytest.raises(HTTPException) as exc_info:
+                    await get_workflow_run_live_log(
+                        3, 11, after=after, limit=100, user=user
+                    )
+                assert exc_info.value.status_code == 400
+
+        read_run_log.assert_not_awaited()
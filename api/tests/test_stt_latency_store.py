@@ -0,0 +1,66 @@
+"""
+Tests for the Redis store of STT time-to-final-segment sketches.
+
+These tests verify:
+1. A merge adds the local counts and reads the merged windows in one pipeline
+2. The estimator uses the counts merged by all workers
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from api.services.pipecat.stt_latency_store import RedisTTFSLatencyStore
+from pipecat.services.stt_latency_estimator import TTFSLatencyEstimator
+
+
+def _redis(results):
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=results)
+    redis_client = MagicMock()
+    redis_client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    redis_client.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    return redis_client, pipe
+
+
+class TestRedisTTFSLatencyStore:
+    @pytest.mark.asyncio
+    async def test_merge_in_one_pipeline(self):
+        redis_client, pipe = _redis([3, 1, True, {"5": "3", "6": "2"}, {}])
+        store = RedisTTFSLatencyStore(ttl_secs=1800)
+
+        with patch(
+            "api.services.pipecat.stt_latency_store._get_redis",
+            AsyncMock(return_value=redis_client),
+        ):
+            merged = await store.merge(
+                "DeepgramSTTService:nova-3", {11: {5: 2, 6: 1}}, [10, 11]
+            )
+
+        redis_client.pipeline.assert_called_once_with(transaction=False)
+        pipe.execute.assert_awaited_once()
+        pipe.hincrby.assert_any_call("stt_ttfs:DeepgramSTTService:nova-3:11", "5", 2)
+        pipe.hincrby.assert_any_call("stt_ttfs:DeepgramSTTService:nova-3:11", "6", 1)
+        pipe.expire.assert_called_once_with(
+            "stt_ttfs:DeepgramSTTService:nova-3:11", 1800
+        )
+        assert pipe.hgetall.call_count == 2
+        assert merged == {10: {5: 3, 6: 2}, 11: {}}
+
+    @pytest.mark.asyncio
+    async def test_estimator_uses_merged_counts(self):
+        estimator = TTFSLatencyEstimator(
+            store=RedisTTFSLatencyStore(), min_samples=3, window_secs=600.0
+        )
+        # Another worker already recorded two slow turns in the current window.
+        redis_client, _ = _redis([1, True, {}, {"40": "2", "10": "1"}])
+
+        estimator.add("stt", 0.4)
+        with patch(
+            "api.services.pipecat.stt_latency_store._get_redis",
+            AsyncMock(return_value=redis_client),
+        ):
+            await estimator.sync("stt")
+
+        assert estimator.sketch("stt").count() == 3
+        assert estimator.p99("stt") > 4.0
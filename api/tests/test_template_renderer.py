@@ -0,0 +1,66 @@
+"""
+Tests for template rendering.
+
+These tests verify:
+1. Placeholders resolve nested paths and the fallback filter
+2. Dict and list templates are rendered recursively, including dict keys
+3. String templates are compiled once and reused from the cache
+"""
+
+from api.utils.template_renderer import compile_string, render_template
+
+CONTEXT = {
+    "name": "Ada",
+    "initial_context": {"phone": "+15550100", "empty": ""},
+    "gathered_context": {"customer": {"address": {"city": "Paris"}}},
+    "tags": ["a", "b"],
+    "count": 0,
+}
+
+
+class TestRenderTemplate:
+    def test_nested_paths(self):
+        assert (
+            render_template(
+                "{{name}} from {{ gathered_context.customer.address.city }}", CONTEXT
+            )
+            == "Ada from Paris"
+        )
+
+    def test_missing_values_and_fallbacks(self):
+        assert render_template("[{{missing}}]", CONTEXT) == "[]"
+        assert render_template("{{missing | fallback:n/a}}", CONTEXT) == "n/a"
+        assert render_template("{{initial_context.empty|fallback:none}}", CONTEXT) == (
+            "none"
+        )
+        assert render_template("{{first_name | fallback}}", CONTEXT) == "First_Name"
+        # Falsy values other than None/"" are kept
+        assert render_template("{{count | fallback:1}}", CONTEXT) == "0"
+
+    def test_values_are_serialized(self):
+        assert render_template("{{tags}}", CONTEXT) == '["a", "b"]'
+        assert render_template("Line\\nbreak", CONTEXT) == "Line\nbreak"
+
+    def test_structured_templates(self):
+        template = {
+            "{{name}}": ["{{initial_context.phone}}", {"n": 5}],
+            "none": None,
+        }
+        assert render_template(template, CONTEXT) == {
+            "Ada": ["+15550100", {"n": 5}],
+            "none": None,
+        }
+
+
+class TestCompiledTemplateCache:
+    def test_template_is_parsed_once(self):
+        template = "Cached {{name}} {{ initial_context.phone | fallback:none }}"
+        compile_string.cache_clear()
+
+        first = render_template(template, CONTEXT)
+        second = render_template(template, {"name": "Bob"})
+
+        assert first == "Cached Ada +15550100"
+        assert second == "Cached Bob none"
+        info = compile_string.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
@@ -0,0 +1,173 @@
+"""
+Tests for the pre-synthesis of the fixed messages of a workflow.
+
+These tests verify:
+1. The messages of end call and transfer call tools are taken as configured,
+   in the order their nodes are reached
+2. Synthesis waits for the pipeline to start and goes to the TTS service
+3. The tools are taken from the call's prefetched tool registry, if any
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from api.services.pipecat.tts_presynthesis import (
+    get_workflow_tool_uuids,
+    get_workflow_utterances,
+    start_workflow_presynthesis,
+)
+from api.services.workflow.call_tool_registry import CallToolRegistry
+from api.services.workflow.dto import (
+    EdgeDataDTO,
+    NodeDataDTO,
+    NodeType,
+    Position,
+    ReactFlowDTO,
+    RFEdgeDTO,
+    RFNodeDTO,
+)
+from api.services.workflow.workflow import WorkflowGraph
+
+
+@dataclass
+class MockToolModel:
+    """Mock tool model for testing."""
+
+    tool_uuid: str
+    category: str
+    definition: Dict[str, Any]
+
+
+def _message_tool(tool_uuid: str, category: str, message: str, message_type="custom"):
+    return MockToolModel(
+        tool_uuid=tool_uuid,
+        category=category,
+        definition={"config": {"messageType": message_type, "customMessage": message}},
+    )
+
+
+@pytest.fixture
+def workflow() -> WorkflowGraph:
+    """Start -> Agent -> End, with tools on every node."""
+
+    def node(id: str, type: NodeType, tool_uuids: list[str], **kwargs) -> RFNodeDTO:
+        return RFNodeDTO(
+            id=id,
+            type=type,
+            position=Position(x=0, y=0),
+            data=NodeDataDTO(name=id, prompt="Prompt", tool_uuids=tool_uuids, **kwargs),
+        )
+
+    def edge(source: str, target: str) -> RFEdgeDTO:
+        return RFEdgeDTO(
+            id=f"{source}-{target}",
+            source=source,
+            target=target,
+            data=EdgeDataDTO(label=target, condition=f"Go to {target}"),
+        )
+
+    dto = ReactFlowDTO(
+        nodes=[
+            node("end", NodeType.endNode, ["goodbye", "transfer"], is_end=True),
+            node("agent", NodeType.agentNode, ["transfer", "weather", "silent"]),
+            node("start", NodeType.startNode, ["lookup"], is_start=True),
+        ],
+        edges=[edge("start", "agent"), edge("agent", "end")],
+    )
+    return WorkflowGraph(dto)
+
+
+@pytest.fixture
+def tools():
+    return [
+        _message_tool("goodbye", "end_call", "Thanks for calling, have a great day!"),
+        _message_tool("transfer", "transfer_call", "Transferring you to billing."),
+        _message_tool("silent", "end_call", "Bye!", message_type="none"),
+        _message_tool("weather", "http_api", "Not spoken."),
+    ]
+
+
+class TestWorkflowUtterances:
+    def test_tools_in_visit_order(self, workflow):
+        assert get_workflow_tool_uuids(workflow) == [
+            "lookup",
+            "transfer",
+            "weather",
+            "silent",
+            "goodbye",
+        ]
+
+    def test_messages_in_visit_order(self, workflow, tools):
+        utterances = get_workflow_utterances(workflow, tools)
+
+        assert utterances == [
+            "Transferring you to billing.",
+            "Thanks for calling, have a great day!",
+        ]
+
+
+class TestWorkflowPresynthesis:
+    @pytest.mark.asyncio
+    async def test_presynthesized_once_pipeline_started(self, workflow, tools):
+        task = Mock()
+        handlers = {}
+        task.event_handler = lambda name: lambda handler: handlers.setdefault(
+            name, handler
+        )
+        tts = Mock(supports_presynthesis=True)
+        tts.presynthesize = AsyncMock(return_value=True)
+
+        with (
+            patch(
+                "api.services.pipecat.tts_presynthesis.get_organization_id_from_workflow_run",
+                AsyncMock(return_value=1),
+            ),
+            patch(
+                "api.services.pipecat.tts_presynthesis.db_client.get_tools_by_uuids",
+                AsyncMock(return_value=tools),
+            ) as get_tools,
+        ):
+            background = start_workflow_presynthesis(
+                task, tts, workflow, workflow_run_id=7
+            )
+            await asyncio.sleep(0.01)
+            get_tools.assert_awaited_once()
+            tts.presynthesize.assert_not_awaited()
+
+            await handlers["on_pipeline_started"](task, None)
+            await background
+
+        assert [c.args[0] for c in tts.presynthesize.await_args_list] == [
+            "Transferring you to billing.",
+            "Thanks for calling, have a great day!",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_tools_taken_from_prefetched_registry(self, workflow, tools):
+        task = Mock()
+        handlers = {}
+        task.event_handler = lambda name: lambda handler: handlers.setdefault(
+            name, handler
+        )
+        tts = Mock(supports_presynthesis=True)
+        tts.presynthesize = AsyncMock(return_value=True)
+        registry = CallToolRegistry(tools={tool.tool_uuid: tool for tool in tools})
+
+        with patch("api.services.pipecat.tts_presynthesis.db_client") as mock_db:
+            background = start_workflow_presynthesis(
+                task, tts, workflow, 7, tool_registry=registry
+            )
+            await handlers["on_pipeline_started"](task, None)
+            await background
+
+        assert mock_db.mock_calls == []
+        assert tts.presynthesize.await_count == 2
+
+    def test_unsupported_tts_service(self, workflow):
+        tts = Mock(supports_presynthesis=False)
+
+        assert start_workflow_presynthesis(Mock(), tts, workflow, 7) is None
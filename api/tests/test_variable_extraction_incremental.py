@@ -0,0 +1,164 @@
+"""
+Tests for incremental and batched variable extraction.
+
+These tests verify:
+1. Later extractions send only the turns since the previous one plus the
+   values extracted so far
+2. No LLM request is made when nothing was said since the last extraction
+3. A variable the model left out is asked again with the turns it missed
+4. Background extractions requested in quick succession share one request
+5. A synchronous extraction also flushes queued background ones
+6. Cleanup cancels a debounced extraction
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from api.services.workflow.dto import ExtractionVariableDTO
+from api.services.workflow.pipecat_engine_variable_extractor import (
+    VariableExtractionManager,
+)
+from pipecat.processors.aggregators.llm_context import LLMContext
+
+NAME = ExtractionVariableDTO(name="name", type="string", prompt="Caller name")
+CITY = ExtractionVariableDTO(name="city", type="string", prompt="Caller city")
+
+
+def _engine(*responses):
+    return SimpleNamespace(
+        context=LLMContext(),
+        llm=SimpleNamespace(run_inference=AsyncMock(side_effect=list(responses))),
+        _gathered_context={},
+    )
+
+
+def _say(engine, *turns):
+    for role, content in turns:
+        engine.context.add_message({"role": role, "content": content})
+
+
+def _user_prompt(engine, call_index=-1):
+    context = engine.llm.run_inference.await_args_list[call_index].args[0]
+    return context.messages[1]["content"]
+
+
+class TestIncrementalExtraction:
+    @pytest.mark.asyncio
+    async def test_sends_only_new_turns_with_current_values(self):
+        engine = _engine(
+            json.dumps({"name": "Ada"}),
+            json.dumps({"name": "Ada", "city": "Paris"}),
+        )
+        manager = VariableExtractionManager(engine, incremental=True)
+        _say(engine, ("assistant", "Hi, who is calling?"), ("user", "This is Ada"))
+
+        await manager.extract_now([NAME], None)
+        _say(engine, ("assistant", "Where are you?"), ("user", "In Paris"))
+        await manager.extract_now([NAME], None)
+
+        second = _user_prompt(engine)
+        assert '{"name": "Ada"}' in second
+        assert "New conversation turns:\nassistant: Where are you?\nuser: In Paris" in (
+            second
+        )
+        assert engine._gathered_context == {"name": "Ada", "city": "Paris"}
+
+    @pytest.mark.asyncio
+    async def test_new_variables_get_the_full_history(self):
+        engine = _engine(json.dumps({"name": "Ada"}), json.dumps({"city": "Paris"}))
+        manager = VariableExtractionManager(engine, incremental=True)
+        _say(engine, ("user", "Ada from Paris"))
+
+        await manager.extract_now([NAME], None)
+        await manager.extract_now([CITY], None)
+
+        assert "Conversation history:\nuser: Ada from Paris" in _user_prompt(engine)
+
+    @pytest.mark.asyncio
+    async def test_no_new_turns_skips_the_llm(self):
+        engine = _engine(json.dumps({"name": "Ada"}))
+        manager = VariableExtractionManager(engine, incremental=True)
+        _say(engine, ("user", "This is Ada"))
+
+        await manager.extract_now([NAME], None)
+        extracted = await manager.extract_now([NAME], None)
+
+        assert extracted == {"name": "Ada"}
+        assert engine.llm.run_inference.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_variable_keeps_its_turns(self):
+        engine = _engine(json.dumps({"name": "Ada"}), json.dumps({"city": "Paris"}))
+        manager = VariableExtractionManager(engine, incremental=True)
+        _say(engine, ("user", "This is Ada"))
+
+        await manager.extract_now([NAME, CITY], None)
+        _say(engine, ("user", "From Paris"))
+        await manager.extract_now([NAME, CITY], None)
+
+        assert "Conversation history:\nuser: This is Ada\nuser: From Paris" in (
+            _user_prompt(engine)
+        )
+
+    @pytest.mark.asyncio
+    async def test_full_mode_always_sends_the_whole_conversation(self):
+        engine = _engine(json.dumps({"name": "Ada"}), json.dumps({"name": "Ada"}))
+        manager = VariableExtractionManager(engine, incremental=False)
+        _say(engine, ("user", "This is Ada"))
+
+        await manager.extract_now([NAME], None)
+        _say(engine, ("user", "Bye"))
+        await manager.extract_now([NAME], None)
+
+        assert "Conversation history:\nuser: This is Ada\nuser: Bye" in _user_prompt(
+            engine
+        )
+
+
+class TestBatchedExtraction:
+    @pytest.mark.asyncio
+    async def test_rapid_transitions_share_one_request(self):
+        engine = _engine(json.dumps({"name": "Ada", "city": "Paris"}))
+        manager = VariableExtractionManager(engine, debounce_secs=0.05)
+        _say(engine, ("user", "Ada from Paris"))
+
+        manager.schedule([NAME], None, "Node A rules")
+        await asyncio.sleep(0.01)
+        manager.schedule([CITY], None, "Node B rules")
+        await asyncio.sleep(0.15)
+
+        assert engine.llm.run_inference.await_count == 1
+        context = engine.llm.run_inference.await_args.args[0]
+        assert "Node A rules\n\nNode B rules" in context.messages[0]["content"]
+        assert "- name (" in context.messages[1]["content"]
+        assert "- city (" in context.messages[1]["content"]
+        assert engine._gathered_context == {"name": "Ada", "city": "Paris"}
+
+    @pytest.mark.asyncio
+    async def test_synchronous_extraction_flushes_queued_ones(self):
+        engine = _engine(json.dumps({"name": "Ada", "city": "Paris"}))
+        manager = VariableExtractionManager(engine, debounce_secs=10)
+        _say(engine, ("user", "Ada from Paris"))
+
+        manager.schedule([NAME], None)
+        extracted = await manager.extract_now([CITY], None)
+
+        assert extracted == {"name": "Ada", "city": "Paris"}
+        assert engine.llm.run_inference.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cleanup_cancels_debounced_extraction(self):
+        engine = _engine(json.dumps({"name": "Ada"}))
+        manager = VariableExtractionManager(engine, debounce_secs=0.05)
+        _say(engine, ("user", "This is Ada"))
+
+        manager.schedule([NAME], None)
+        await manager.cleanup()
+        await asyncio.sleep(0.1)
+
+        engine.llm.run_inference.assert_not_awaited()
+        assert manager._flush_task is None
@@ -0,0 +1,295 @@
+"""
+Tests for post-call webhook delivery.
+
+These tests verify:
+1. Webhook nodes are rendered into outbox rows with stable idempotency keys
+2. Retries back off exponentially and honour Retry-After
+3. Responses are classified into delivered / retrying / failed, and deliveries
+   over the destination rate limit wait for it, then are deferred to the next
+   delivery pass without using an attempt
+4. Batched deliveries are sent as one {"events": [...]} request, with their
+   members fixed on the first request
+"""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from api.services.integrations.webhook_delivery import (
+    DELIVERY_POLL_SECONDS,
+    PINNED_BATCH_PREFIX,
+    WebhookDeliveryEngine,
+    build_webhook_deliveries,
+    group_deliveries,
+    parse_retry_after,
+    retry_delay,
+)
+
+MODULE = "api.services.integrations.webhook_delivery"
+
+
+def _node(node_id="1", **data):
+    base = {
+        "name": "CRM",
+        "endpoint_url": "https://crm.example.com/hook",
+        "payload_template": {"run": "{{workflow_run_id}}"},
+    }
+    base.update(data)
+    return {"id": node_id, "type": "webhook", "data": base}
+
+
+def _row(id=1, **overrides):
+    row = {
+        "id": id,
+        "organization_id": 7,
+        "webhook_name": "CRM",
+        "http_method": "POST",
+        "endpoint_url": "https://crm.example.com/hook",
+        "destination_host": "crm.example.com",
+        "custom_headers": {"X-Source": "calls"},
+        "credential_uuid": None,
+        "payload": {"run": id},
+        "idempotency_key": f"run-{id}-node-1",
+        "batch_key": None,
+        "batch_max_size": None,
+        "attempts": 0,
+        "max_attempts": 3,
+        "retry_base_seconds": 30.0,
+    }
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+class TestBuildWebhookDeliveries:
+    def test_renders_enabled_nodes(self):
+        deliveries = build_webhook_deliveries(
+            [
+                _node("a", custom_headers=[{"key": "X-Team", "value": "sales"}]),
+                _node("b", enabled=False),
+                _node("c", endpoint_url=""),
+            ],
+            {"workflow_run_id": 42},
+            organization_id=7,
+            workflow_run_id=42,
+            workflow_id=3,
+        )
+
+        assert len(deliveries) == 1
+        delivery = deliveries[0]
+        assert delivery["payload"] == {"run": "42"}
+        assert delivery["idempotency_key"] == "run-42-node-a"
+        assert delivery["destination_host"] == "crm.example.com"
+        assert delivery["custom_headers"] == {"X-Team": "sales"}
+        assert delivery["batch_key"] is None
+
+    def test_node_retry_config_overrides_defaults(self):
+        (delivery,) = build_webhook_deliveries(
+            [
+                _node(
+                    retry_config={
+                        "enabled": True,
+                        "max_retries": 2,
+                        "retry_delay_seconds": 10,
+                    }
+                )
+            ],
+            {},
+            organization_id=7,
+            workflow_run_id=42,
+            workflow_id=3,
+        )
+        assert delivery["max_attempts"] == 3
+        assert delivery["retry_base_seconds"] == 10
+
+    def test_batched_node_waits_for_window(self):
+        nodes = [
+            _node(
+                batch_config={"enabled": True, "max_events": 50, "window_seconds": 60}
+            )
+        ]
+        (first,) = build_webhook_deliveries(nodes, {}, 7, 42, 3)
+        (second,) = build_webhook_deliveries(nodes, {}, 7, 43, 3)
+
+        assert first["batch_key"] == second["batch_key"] is not None
+        assert first["batch_max_size"] == 50
+        assert (first["next_attempt_at"] - first["created_at"]).total_seconds() == 60
+
+    def test_batch_key_per_workflow_and_request_config(self):
+        batch_config = {"enabled": True}
+        (delivery,) = build_webhook_deliveries(
+            [_node(batch_config=batch_config)], {}, 7, 42, 3
+        )
+        (other_workflow,) = build_webhook_deliveries(
+            [_node(batch_config=batch_config)], {}, 7, 43, 4
+        )
+        (other_credential,) = build_webhook_deliveries(
+            [_node(batch_config=batch_config, credential_uuid="cred-2")], {}, 7, 44, 3
+        )
+
+        keys = {d["batch_key"] for d in (delivery, other_workflow, other_credential)}
+        assert len(keys) == 3
+
+    def test_get_webhooks_are_not_batched(self):
+        (delivery,) = build_webhook_deliveries(
+            [_node(http_method="GET", batch_config={"enabled": True})], {}, 7, 42, 3
+        )
+        assert delivery["batch_key"] is None
+
+
+class TestRetryPolicy:
+    def test_exponential_backoff_with_jitter(self):
+        for attempts, expected in ((1, 30), (2, 60), (4, 240)):
+            delay = retry_delay(attempts, 30)
+            assert expected * 0.8 <= delay <= expected * 1.2
+
+    def test_backoff_is_capped(self):
+        assert retry_delay(20, 30, max_seconds=600) <= 600 * 1.2
+
+    def test_retry_after_is_a_lower_bound(self):
+        assert retry_delay(1, 1, retry_after=120) == 120
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("30") == 30
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestGroupDeliveries:
+    def test_batches_are_split_by_max_size(self):
+        rows = [_row(1), _row(2, batch_key="k", batch_max_size=2)]
+        rows += [_row(i, batch_key="k", batch_max_size=2) for i in (3, 4)]
+
+        groups = group_deliveries(rows)
+
+        assert [[row.id for row in group] for group in groups] == [[1], [2, 3], [4]]
+
+
+def _response(status_code, headers=None):
+    return httpx.Response(
+        status_code,
+        headers=headers,
+        request=httpx.Request("POST", "https://crm.example.com/hook"),
+    )
+
+
+class TestWebhookDeliveryEngine:
+    async def _deliver(self, rows, response=None, error=None, allowed=(True,)):
+        http_engine = MagicMock()
+        if error is not None:
+            http_engine.request = AsyncMock(side_effect=error)
+        else:
+            http_engine.request = AsyncMock(
+                return_value=(response, SimpleNamespace(total_ms=12.0))
+            )
+        db = MagicMock()
+        db.claim_due_webhook_deliveries = AsyncMock(return_value=rows)
+        db.record_webhook_delivery_attempt = AsyncMock()
+        db.pin_webhook_batch = AsyncMock()
+        self.db = db
+        limiter = MagicMock()
+        limiter.acquire_keyed_token = AsyncMock(side_effect=allowed)
+
+        with (
+            patch(f"{MODULE}.db_client", db),
+            patch(f"{MODULE}.rate_limiter", limiter),
+            patch(f"{MODULE}.get_http_tool_engine", return_value=http_engine),
+            patch(f"{MODULE}.RATE_LIMIT_WAIT_SECONDS", 0.2),
+        ):
+            engine = WebhookDeliveryEngine(concurrency=4, rate_limit_per_host=50)
+            summary = await engine.deliver_due(limit=10)
+        return summary, http_engine.request, db.record_webhook_delivery_attempt
+
+    @pytest.mark.asyncio
+    async def test_success_is_recorded_as_delivered(self):
+        summary, request, record = await self._deliver([_row(1)], _response(200))
+
+        assert summary["delivered"] == 1
+        method, url, headers, body, _, _ = request.await_args.args
+        assert (method, url, body) == (
+            "POST",
+            "https://crm.example.com/hook",
+            {"run": 1},
+        )
+        assert headers["Idempotency-Key"] == "run-1-node-1"
+        assert headers["X-Source"] == "calls"
+        record.assert_awaited_once_with([1], "delivered", status_code=200)
+
+    @pytest.mark.asyncio
+    async def test_server_errors_are_retried(self):
+        summary, _, record = await self._deliver(
+            [_row(1)], _response(503, {"Retry-After": "90"})
+        )
+
+        assert summary["retrying"] == 1
+        args, kwargs = record.await_args
+        assert args == ([1], "pending")
+        assert kwargs["status_code"] == 503
+
+    @pytest.mark.asyncio
+    async def test_network_errors_are_retried(self):
+        summary, _, _ = await self._deliver(
+            [_row(1)], error=httpx.ConnectTimeout("timed out")
+        )
+        assert summary["retrying"] == 1
+
+    @pytest.mark.asyncio
+    async def test_client_errors_and_exhausted_retries_fail(self):
+        summary, _, record = await self._deliver([_row(1)], _response(400))
+        assert summary["failed"] == 1
+        assert record.await_args.args == ([1], "failed")
+
+        summary, _, _ = await self._deliver([_row(1, attempts=2)], _response(500))
+        assert summary["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_delivery_waits_for_a_token(self):
+        summary, request, _ = await self._deliver(
+            [_row(1)], _response(200), allowed=(False, False, True)
+        )
+
+        assert summary["delivered"] == 1
+        request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_delivery_is_deferred(self):
+        summary, request, record = await self._deliver(
+            [_row(1)], _response(200), allowed=[False] * 100
+        )
+
+        assert summary["deferred"] == 1
+        request.assert_not_awaited()
+        assert record.await_args.kwargs["count_attempt"] is False
+        delay = record.await_args.kwargs["next_attempt_at"] - datetime.now(UTC)
+        assert (
+            DELIVERY_POLL_SECONDS - 1 < delay.total_seconds() <= DELIVERY_POLL_SECONDS
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_is_sent_as_one_request(self):
+        rows = [_row(i, batch_key="k", batch_max_size=10) for i in (1, 2, 3)]
+        summary, request, record = await self._deliver(rows, _response(202))
+
+        assert summary["delivered"] == 1
+        request.assert_awaited_once()
+        body = request.await_args.args[3]
+        assert body == {"events": [{"run": 1}, {"run": 2}, {"run": 3}]}
+        assert record.await_args.args == ([1, 2, 3], "delivered")
+
+        # The members are fixed, and the retries use the same idempotency key.
+        ids, batch_key = self.db.pin_webhook_batch.await_args.args
+        assert ids == [1, 2, 3]
+        assert batch_key.startswith(PINNED_BATCH_PREFIX)
+        idempotency_key = request.await_args.args[2]["Idempotency-Key"]
+        assert idempotency_key.startswith("batch-")
+
+        pinned = [
+            _row(i, batch_key=batch_key, batch_max_size=10, attempts=1)
+            for i in (1, 2, 3)
+        ]
+        _, request, _ = await self._deliver(pinned, _response(202))
+        self.db.pin_webhook_batch.assert_not_awaited()
+        assert request.await_args.args[2]["Idempotency-Key"] == idempotency_key
@@ -0,0 +1,79 @@
+"""
+Tests for keyset pagination of workflow run listings.
+"""
+
+import base64
+import json
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from api.db.filters import (
+    decode_workflow_run_cursor,
+    encode_workflow_run_cursor,
+    get_workflow_run_keyset_condition,
+)
+
+
+def _compile(condition) -> str:
+    return str(
+        condition.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+class TestWorkflowRunCursor:
+    def test_created_at_cursor_round_trip(self):
+        created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        cursor = encode_workflow_run_cursor(None, created_at, 42)
+
+        assert decode_workflow_run_cursor(cursor, "created_at") == (created_at, 42)
+
+    def test_duration_cursor_round_trip_with_null(self):
+        cursor = encode_workflow_run_cursor("duration", None, 7)
+
+        assert decode_workflow_run_cursor(cursor, "duration") == (None, 7)
+
+    def test_cursor_for_other_sort_rejected(self):
+        cursor = encode_workflow_run_cursor("duration", 12.5, 7)
+
+        with pytest.raises(ValueError):
+            decode_workflow_run_cursor(cursor, None)
+
+    def test_malformed_cursor_rejected(self):
+        with pytest.raises(ValueError):
+            decode_workflow_run_cursor("not-a-cursor", None)
+
+    @pytest.mark.parametrize(
+        "sort_by, sort_value",
+        [
+            (None, 12.5),
+            (None, ["2026-01-02"]),
+            ("duration", "12.5"),
+            ("duration", True),
+        ],
+    )
+    def test_tampered_sort_value_rejected(self, sort_by, sort_value):
+        payload = {"s": sort_by or "created_at", "v": sort_value, "id": 7}
+        cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        with pytest.raises(ValueError):
+            decode_workflow_run_cursor(cursor, sort_by)
+
+
+class TestWorkflowRunKeysetCondition:
+    def test_descending_condition_includes_tie_breaker_and_nulls(self):
+        sql = _compile(get_workflow_run_keyset_condition("duration", "desc", 30.0, 9))
+
+        assert "< 30.0" in sql
+        assert "workflow_runs.id < 9" in sql
+        assert "IS NULL" in sql
+
+    def test_null_section_only_pages_by_id(self):
+        sql = _compile(get_workflow_run_keyset_condition("duration", "asc", None, 9))
+
+        assert "IS NULL" in sql
+        assert "workflow_runs.id > 9" in sql
+        assert " OR " not in sql
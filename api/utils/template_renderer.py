@@ -2,7 +2,8 @@
 
 import json
 import re
-from typing import Any, Dict, Union
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
 
 
 def get_nested_value(obj: Any, path: str) -> Any:
@@ -42,7 +43,7 @@ def get_nested_value(obj: Any, path: str) -> Any:
 def render_template(
     template: Union[str, dict, list, None],
     context: Dict[str, Any],
-) -> Union[str, dict, list, None]:  # noqa: C901 – complex but self-contained
+) -> Union[str, dict, list, None]:
     """
     Render a template with variable substitution supporting nested paths.
 
@@ -53,6 +54,9 @@ def render_template(
     - Deep nesting: "{{gathered_context.customer.address.city}}"
     - Fallback: "{{name | fallback:Unknown}}"
 
+    String templates are parsed once and cached (see ``compile_string``), so
+    re-rendering the same prompt or payload only substitutes values.
+
     Args:
         template: String, dict, list, or None with {{variable}} placeholders
         context: Dict containing all available variables
@@ -66,7 +70,7 @@ def render_template(
     # Handle dict templates recursively
     if isinstance(template, dict):
         return {
-            _render_string(str(k), context)
+            compile_string(k).render(context)
             if isinstance(k, str)
             else k: render_template(v, context)
             for k, v in template.items()
@@ -80,52 +84,106 @@ def render_template(
     if not isinstance(template, str):
         return template
 
-    return _render_string(template, context)
-
+    return compile_string(template).render(context)
 
-def _render_string(template_str: str, context: Dict[str, Any]) -> str:
-    """
-    Render a string template with variable substitution.
 
-    Args:
-        template_str: String with {{variable}} placeholders
-        context: Dict containing all available variables
+# Pattern: {{ path }} or {{ path | filter }} or {{ path | filter:default }}
+_PLACEHOLDER_PATTERN = re.compile(
+    r"\{\{\s*([^|\s}]+)(?:\s*\|\s*([^:}]+)(?::([^}]+))?)?\s*\}\}"
+)
 
-    Returns:
-        Rendered string with variables replaced
-    """
-    if not template_str:
-        return template_str
+# Distinct template strings kept compiled per process
+TEMPLATE_CACHE_SIZE = 4096
 
-    # Pattern: {{ path }} or {{ path | filter }} or {{ path | filter:default }}
-    pattern = r"\{\{\s*([^|\s}]+)(?:\s*\|\s*([^:}]+)(?::([^}]+))?)?\s*\}\}"
 
-    def _replace(match: re.Match[str]) -> str:  # type: ignore[type-arg]
-        variable_path = match.group(1).strip()
-        filter_name = match.group(2).strip() if match.group(2) else None
-        filter_value = match.group(3).strip() if match.group(3) else None
+class _Placeholder:
+    """A parsed ``{{path | filter:value}}`` placeholder."""
 
-        # Get value using nested path lookup
-        value = get_nested_value(context, variable_path)
+    __slots__ = ("keys", "fallback")
 
-        # Apply filters
+    def __init__(
+        self, path: str, filter_name: Optional[str], filter_value: Optional[str]
+    ):
+        self.keys = tuple(path.split("."))
+        # Only the fallback filter is supported; other filters are ignored
+        self.fallback = None
         if filter_name == "fallback":
-            if value is None or value == "":
-                value = (
-                    filter_value if filter_value is not None else variable_path.title()
-                )
+            self.fallback = filter_value if filter_value is not None else path.title()
+
+    def render(self, context: Dict[str, Any]) -> str:
+        # Same lookup as get_nested_value, over the path split at compile time
+        value = context
+        for key in self.keys:
+            if not isinstance(value, dict):
+                value = None
+                break
+            value = value.get(key)
+            if value is None:
+                break
+
+        if self.fallback is not None and (value is None or value == ""):
+            value = self.fallback
 
         # Convert to string for substitution
         if value is None:
             return ""
+        if isinstance(value, str):
+            return value
         if isinstance(value, (dict, list)):
             return json.dumps(value)
         return str(value)
 
-    # Replace template variables
-    result = re.sub(pattern, _replace, template_str)
 
-    # Handle line breaks (convert literal \n to actual newlines)
-    result = result.replace("\\n", "\n")
+class CompiledTemplate:
+    """A string template split into literal text and placeholders."""
+
+    __slots__ = ("segments", "static")
+
+    def __init__(self, segments: Tuple[Union[str, _Placeholder], ...]):
+        self.segments = segments
+        # Rendered value of templates without placeholders
+        self.static: Optional[str] = None
+        if not any(isinstance(segment, _Placeholder) for segment in segments):
+            self.static = "".join(segments).replace("\\n", "\n")
 
-    return result
+    def render(self, context: Dict[str, Any]) -> str:
+        """Render in a single pass over the segments."""
+        if self.static is not None:
+            return self.static
+        result = "".join(
+            segment if isinstance(segment, str) else segment.render(context)
+            for segment in self.segments
+        )
+        # Handle line breaks (convert literal \n to actual newlines). Applied
+        # after substitution, as substituted values may contain them too.
+        return result.replace("\\n", "\n")
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_string(template_str: str) -> CompiledTemplate:
+    """
+    Parse a string template once; results are cached by template content in a
+    bounded LRU.
+
+    Args:
+        template_str: String with {{variable}} placeholders
+
+    Returns:
+        The compiled template
+    """
+    segments = []
+    position = 0
+    for match in _PLACEHOLDER_PATTERN.finditer(template_str):
+        if match.start() > position:
+            segments.append(template_str[position : match.start()])
+        segments.append(
+            _Placeholder(
+                match.group(1).strip(),
+                match.group(2).strip() if match.group(2) else None,
+                match.group(3).strip() if match.group(3) else None,
+            )
+        )
+        position = match.end()
+    if position < len(template_str):
+        segments.append(template_str[position:])
+    return CompiledTemplate(tuple(segments))
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Campaign Dispatch Redis Benchmark.
+
+Measures the Redis work of dispatching a campaign call and releasing it when
+the call completes, comparing the previous sequence of commands (``legacy``:
+``EVAL`` of each script with its body, one command per mapping write and read)
+with the shared script layer (``merged``: one ``EVALSHA`` taking the rate
+token, concurrent slot and from_number, pipelined mapping writes, and a
+pipelined read plus one script on release).
+
+Redis is an in-process fake with a fixed round-trip time that answers each
+script with its success result, so the benchmark reports round trips, request
+bytes and Redis latency per dispatched call, not Redis CPU time.
+
+Usage:
+    python -m evals.perf.campaign_dispatch
+    python -m evals.perf.campaign_dispatch --calls 1000 --rtt-ms 0.5 2
+"""
+
+import argparse
+import asyncio
+import time
+
+from api.services.campaign.rate_limiter import (
+    _ACQUIRE_DISPATCH_SCRIPT,
+    _ACQUIRE_FROM_NUMBER_SCRIPT,
+    _CONCURRENT_SLOT_SCRIPT,
+    _RATE_TOKEN_SCRIPT,
+    _RELEASE_DISPATCH_SCRIPT,
+    _RELEASE_FROM_NUMBER_SCRIPT,
+    RateLimiter,
+)
+
+ORG_ID = 7
+SCRIPTS = {
+    _RATE_TOKEN_SCRIPT: lambda args: 1,
+    _CONCURRENT_SLOT_SCRIPT: lambda args: args[3],
+    _ACQUIRE_FROM_NUMBER_SCRIPT: lambda args: "+15550001",
+    _RELEASE_FROM_NUMBER_SCRIPT: lambda args: 1,
+    _ACQUIRE_DISPATCH_SCRIPT: lambda args: [1, args[5], "+15550001"],
+    _RELEASE_DISPATCH_SCRIPT: lambda args: [1, 1],
+}
+
+
+class FakeRedis:
+    """Counts round trips and request bytes; each round trip costs ``rtt``."""
+
+    def __init__(self, rtt_ms: float):
+        self.rtt = rtt_ms / 1000
+        self.round_trips = 0
+        self.request_bytes = 0
+        self.by_source = {script.source: handler for script, handler in SCRIPTS.items()}
+        self.by_sha = {script.sha: handler for script, handler in SCRIPTS.items()}
+        self.hashes = {}
+
+    async def _round_trip(self, *args):
+        self.round_trips += 1
+        self.request_bytes += sum(len(str(arg)) for arg in args)
+        await asyncio.sleep(self.rtt)
+
+    async def eval(self, source, numkeys, *keys_and_args):
+        await self._round_trip(source, numkeys, *keys_and_args)
+        return self.by_source[source](keys_and_args[numkeys:])
+
+    async def evalsha(self, sha, numkeys, *keys_and_args):
+        await self._round_trip(sha, numkeys, *keys_and_args)
+        return self.by_sha[sha](keys_and_args[numkeys:])
+
+    async def hset(self, key, mapping):
+        await self._round_trip(key, *mapping.items())
+        self.hashes[key] = {k: str(v) for k, v in mapping.items()}
+
+    async def expire(self, key, ttl):
+        await self._round_trip(key, ttl)
+
+    async def hgetall(self, key):
+        await self._round_trip(key)
+        return self.hashes.get(key, {})
+
+    async def zrem(self, key, member):
+        await self._round_trip(key, member)
+        return 1
+
+    async def delete(self, *keys):
+        await self._round_trip(*keys)
+        for key in keys:
+            self.hashes.pop(key, None)
+        return len(keys)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def hset(self, key, mapping):
+        self.commands.append(("hset", key, mapping))
+
+    def expire(self, key, ttl):
+        self.commands.append(("expire", key, ttl))
+
+    def hgetall(self, key):
+        self.commands.append(("hgetall", key))
+
+    async def execute(self):
+        await self.redis._round_trip(*[arg for command in self.commands for arg in command])
+        results = []
+        for name, key, *rest in self.commands:
+            if name == "hset":
+                self.redis.hashes[key] = {k: str(v) for k, v in rest[0].items()}
+                results.append(len(rest[0]))
+            elif name == "expire":
+                results.append(True)
+            else:
+                results.append(self.redis.hashes.get(key, {}))
+        return results
+
+
+async def legacy_dispatch(redis: FakeRedis, run_id: int):
+    """The commands the dispatcher sent before, issued the same way."""
+    now = time.time()
+    await redis.eval(_RATE_TOKEN_SCRIPT.source, 1, f"rate_limit:{ORG_ID}", now, now - 1, 5)
+    slot_id = await redis.eval(
+        _CONCURRENT_SLOT_SCRIPT.source,
+        1,
+        f"concurrent_calls:{ORG_ID}",
+        now,
+        20,
+        now - 300,
+        f"{int(now * 1000)}_abcdef12",
+    )
+    from_number = await redis.eval(
+        _ACQUIRE_FROM_NUMBER_SCRIPT.source,
+        1,
+        f"from_number_pool:{ORG_ID}",
+        now,
+        now - 300,
+    )
+    await redis.hset(
+        f"workflow_slot_mapping:{run_id}", mapping={"org_id": ORG_ID, "slot_id": slot_id}
+    )
+    await redis.expire(f"workflow_slot_mapping:{run_id}", 300)
+    await redis.hset(
+        f"workflow_from_number:{run_id}",
+        mapping={"org_id": ORG_ID, "from_number": from_number},
+    )
+    await redis.expire(f"workflow_from_number:{run_id}", 1800)
+
+
+async def legacy_release(redis: FakeRedis, run_id: int):
+    mapping = await redis.hgetall(f"workflow_slot_mapping:{run_id}")
+    await redis.zrem(f"concurrent_calls:{ORG_ID}", mapping["slot_id"])
+    await redis.delete(f"workflow_slot_mapping:{run_id}")
+    mapping = await redis.hgetall(f"workflow_from_number:{run_id}")
+    await redis.eval(
+        _RELEASE_FROM_NUMBER_SCRIPT.source,
+        1,
+        f"from_number_pool:{ORG_ID}",
+        mapping["from_number"],
+    )
+    await redis.delete(f"workflow_from_number:{run_id}")
+
+
+async def merged_dispatch(limiter: RateLimiter, run_id: int):
+    acquisition = await limiter.acquire_dispatch_resources(ORG_ID, 5, 20)
+    await limiter.store_workflow_call_mappings(
+        run_id, ORG_ID, acquisition.slot_id, acquisition.from_number
+    )
+
+
+async def merged_release(limiter: RateLimiter, run_id: int):
+    await limiter.release_workflow_resources(run_id)
+
+
+async def run_mode(mode: str, calls: int, rtt_ms: float) -> dict:
+    redis = FakeRedis(rtt_ms)
+    limiter = RateLimiter()
+    limiter.redis_client = redis
+
+    dispatch_seconds = 0.0
+    release_seconds = 0.0
+    for run_id in range(calls):
+        started = time.perf_counter()
+        if mode == "legacy":
+            await legacy_dispatch(redis, run_id)
+        else:
+            await merged_dispatch(limiter, run_id)
+        dispatch_seconds += time.perf_counter() - started
+
+        started = time.perf_counter()
+        if mode == "legacy":
+            await legacy_release(redis, run_id)
+        else:
+            await merged_release(limiter, run_id)
+        release_seconds += time.perf_counter() - started
+
+    return {
+        "mode": mode,
+        "rtt_ms": rtt_ms,
+        "round_trips": redis.round_trips / calls,
+        "request_bytes": redis.request_bytes / calls,
+        "dispatch_ms": dispatch_seconds / calls * 1000,
+        "release_ms": release_seconds / calls * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark campaign dispatch Redis access")
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--rtt-ms", type=float, nargs="+", default=[0.5, 2.0])
+    args = parser.parse_args()
+
+    results = []
+    for rtt_ms in args.rtt_ms:
+        for mode in ("legacy", "merged"):
+            results.append(await run_mode(mode, args.calls, rtt_ms))
+
+    print(f"\nRedis work per dispatched campaign call (dispatch + release), {args.calls} calls")
+    print(
+        f"{'mode':<7} {'rtt ms':>6} {'round trips':>11} {'req bytes':>9} {'dispatch ms':>11} "
+        f"{'release ms':>10}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<7} {r['rtt_ms']:>6.1f} {r['round_trips']:>11.1f} "
+            f"{r['request_bytes']:>9.0f} {r['dispatch_ms']:>11.2f} {r['release_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
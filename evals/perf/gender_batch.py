@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Gender Batch Prediction Benchmark.
+
+Predicts salutations for a synthetic lead list, as done when personalizing a
+campaign, and compares predicting one name at a time (``sequential``, the
+previous ``batch_predict``) with the batched ``GenderService.batch_predict``
+(chunked Redis MGET, bulk GenderAPI requests with a concurrency cap).
+
+Names are drawn from the model weighted by frequency, plus a share of names
+missing from the model, some of which were cached from earlier GenderAPI calls.
+Redis and GenderAPI are in-process fakes with a fixed round-trip latency. The
+sequential mode only predicts the first ``--sequential-limit`` leads.
+
+It also reports the per-process Python heap used by the model: the JSON dict
+loaded before, and the memory-mapped compact model (whose pages are shared by
+all processes through the OS page cache).
+
+Usage:
+    python -m evals.perf.gender_batch
+    python -m evals.perf.gender_batch --names 100000 --api-latency-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import tracemalloc
+from pathlib import Path
+
+import httpx
+
+import api.services.gender.gender_service as gender_service_module
+from api.services.gender.compact_model import load_compact_model
+from api.services.gender.constants import REDIS_KEY_PREFIX
+from api.services.gender.gender_service import GenderService
+
+MODEL_PATH = Path(gender_service_module.__file__).parent / "model.txt"
+
+
+class FakeRedis:
+    """In-memory Redis with a fixed round-trip latency per command."""
+
+    def __init__(self, rtt_ms: float):
+        self.rtt = rtt_ms / 1000
+        self.data = {}
+        self.commands = 0
+
+    async def _round_trip(self):
+        self.commands += 1
+        await asyncio.sleep(self.rtt)
+
+    async def get(self, key):
+        await self._round_trip()
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        await self._round_trip()
+        return [self.data.get(key) for key in keys]
+
+    async def setex(self, key, ttl, value):
+        await self._round_trip()
+        self.data[key] = value
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.writes = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def setex(self, key, ttl, value):
+        self.writes.append((key, value))
+
+    async def execute(self):
+        await self.redis._round_trip()
+        self.redis.data.update(self.writes)
+
+
+def fake_gender_api(latency_ms: float):
+    """GenderAPI fake answering single and multiple-name requests."""
+    stats = {"requests": 0}
+
+    def result(name):
+        return {
+            "input": {"first_name": name, "id": name},
+            "gender": "female" if len(name) % 2 else "male",
+            "probability": 0.9,
+        }
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        stats["requests"] += 1
+        await asyncio.sleep(latency_ms / 1000)
+        body = json.loads(request.content)
+        if isinstance(body, list):
+            return httpx.Response(200, json=[result(item["id"]) for item in body])
+        return httpx.Response(200, json=result(body["first_name"]))
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), stats
+
+
+def build_leads(model: dict, count: int, unknown_share: float, seed: int = 7):
+    """Lead first names: frequent names dominate, plus names missing from the model."""
+    rng = random.Random(seed)
+    names = list(model["names"])
+    weights = [male + female for male, female, _ in model["names"].values()]
+    known = rng.choices(names, weights=weights, k=int(count * (1 - unknown_share)))
+    unknown_pool = [f"Lead{i:05d}" for i in range(max(1, int(count * unknown_share / 20)))]
+    unknown = rng.choices(unknown_pool, k=count - len(known))
+    leads = [name.capitalize() for name in known] + unknown
+    rng.shuffle(leads)
+    return leads, unknown_pool
+
+
+async def run_mode(mode: str, leads, unknown_pool, args) -> dict:
+    service = GenderService(gender_api_key="test-key")
+    redis = FakeRedis(args.redis_rtt_ms)
+    # Half of the names missing from the model were fetched before
+    for name in unknown_pool[::2]:
+        redis.data[f"{REDIS_KEY_PREFIX}{name.lower()}"] = json.dumps(
+            {"gender": "male", "confidence": 0.9}
+        )
+    service._redis_client = redis
+    service._http_client, api_stats = fake_gender_api(args.api_latency_ms)
+
+    started = time.perf_counter()
+    if mode == "sequential":
+        for name in leads:
+            await service.predict(name)
+    else:
+        await service.batch_predict(leads)
+    elapsed = time.perf_counter() - started
+    await service._http_client.aclose()
+
+    return {
+        "mode": mode,
+        "leads": len(leads),
+        "seconds": elapsed,
+        "names_per_sec": len(leads) / elapsed,
+        "redis_commands": redis.commands,
+        "api_requests": api_stats["requests"],
+    }
+
+
+def heap_mb(load) -> float:
+    tracemalloc.start()
+    model = load()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del model
+    return current / (1024 * 1024)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched gender prediction")
+    parser.add_argument("--names", type=int, default=100_000, help="Leads per batch")
+    parser.add_argument("--unknown-share", type=float, default=0.1)
+    parser.add_argument("--redis-rtt-ms", type=float, default=0.2)
+    parser.add_argument("--api-latency-ms", type=float, default=20)
+    parser.add_argument(
+        "--sequential-limit",
+        type=int,
+        default=10_000,
+        help="Leads predicted one at a time (the sequential mode takes minutes at 100k)",
+    )
+    args = parser.parse_args()
+
+    with open(MODEL_PATH, encoding="utf-8") as f:
+        model = json.load(f)
+    leads, unknown_pool = build_leads(model, args.names, args.unknown_share)
+
+    def load_json():
+        with open(MODEL_PATH, encoding="utf-8") as f:
+            return json.load(f)
+
+    load_compact_model(MODEL_PATH)  # compile once, as the first process would
+    json_mb = heap_mb(load_json)
+    compact_mb = heap_mb(lambda: load_compact_model(MODEL_PATH))
+
+    results = [
+        await run_mode("sequential", leads[: args.sequential_limit], unknown_pool, args),
+        await run_mode("batched", leads, unknown_pool, args),
+    ]
+
+    print(
+        f"\nModel heap per process: JSON dict {json_mb:.1f} MB, compact (mmap) {compact_mb:.2f} MB"
+    )
+    print(
+        f"\nGender prediction, {args.names:,} leads ({len(set(leads)):,} distinct), "
+        f"Redis RTT {args.redis_rtt_ms}ms, GenderAPI latency {args.api_latency_ms}ms"
+    )
+    print(
+        f"{'mode':<11} {'leads':>7} {'seconds':>8} {'names/s':>9} {'redis cmds':>10} "
+        f"{'api reqs':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<11} {r['leads']:>7} {r['seconds']:>8.2f} {r['names_per_sec']:>9.0f} "
+            f"{r['redis_commands']:>10} {r['api_requests']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""LLM Context Conversion Benchmark.
+
+Grows a synthetic call context turn by turn (user turns, tool calls with large
+JSON results and knowledge-base chunks) and, after every turn, has each adapter
+build its invocation params and the messages it logs, as an LLM service does on
+every inference.
+
+Compares converting every message on every invocation (``uncached``) with the
+per-context conversion cache, which only converts messages added since the
+previous invocation (``cached``).
+
+For every adapter and call length it reports the mean and last-turn conversion
+time per invocation.
+
+Usage:
+    python -m evals.perf.llm_context_conversion
+    python -m evals.perf.llm_context_conversion --turns 20 40 80
+"""
+
+import argparse
+import json
+import time
+
+from pipecat.adapters.services.anthropic_adapter import AnthropicLLMAdapter
+from pipecat.adapters.services.bedrock_adapter import AWSBedrockLLMAdapter
+from pipecat.adapters.services.open_ai_adapter import OpenAILLMAdapter
+from pipecat.processors.aggregators.llm_context import LLMContext, MessageConversionCache
+
+CHUNK = (
+    "Policy holders can add a named driver at any time. The premium is recalculated "
+    "from the driver's age, licence history and claims over the last five years. "
+)
+
+
+def turn_messages(turn: int) -> list:
+    """Messages added to the context by one turn of the call."""
+    tool_call_id = f"call_{turn}"
+    result = {
+        "policy_id": f"POL-{turn:05d}",
+        "drivers": [{"name": f"Driver {i}", "age": 30 + i, "claims": i % 3} for i in range(10)],
+        "notes": CHUNK * 4,
+    }
+    return [
+        {"role": "user", "content": f"Can you check my policy, turn {turn}?"},
+        {"role": "system", "content": f"Relevant knowledge base excerpts:\n{CHUNK * 8}"},
+        {
+            "role": "assistant",
+            "tool_calls": [
+                {
+                    "id": tool_call_id,
+                    "type": "function",
+                    "function": {
+                        "name": "lookup_policy",
+                        "arguments": json.dumps({"policy_id": f"POL-{turn:05d}"}),
+                    },
+                }
+            ],
+        },
+        {"role": "tool", "tool_call_id": tool_call_id, "content": json.dumps(result)},
+        {"role": "assistant", "content": f"Your policy has 10 drivers, turn {turn}."},
+    ]
+
+
+def _invoke(adapter, context: LLMContext):
+    if isinstance(adapter, AnthropicLLMAdapter):
+        adapter.get_llm_invocation_params(context, enable_prompt_caching=True)
+    else:
+        adapter.get_llm_invocation_params(context)
+    adapter.get_messages_for_logging(context)
+
+
+def run_config(adapter_cls, turns: int, cached: bool) -> dict:
+    adapter = adapter_cls()
+    if not cached:
+        # A fresh cache per invocation converts every message, as before
+        adapter.get_conversion_cache = lambda context: MessageConversionCache()
+
+    context = LLMContext(messages=[{"role": "system", "content": CHUNK * 20}])
+    timings = []
+    for turn in range(turns):
+        context.add_messages(turn_messages(turn))
+        started = time.perf_counter()
+        _invoke(adapter, context)
+        timings.append(time.perf_counter() - started)
+
+    return {
+        "adapter": adapter_cls.__name__.removesuffix("LLMAdapter"),
+        "turns": turns,
+        "mode": "cached" if cached else "uncached",
+        "messages": len(context.messages),
+        "mean_ms": sum(timings) / len(timings) * 1000,
+        "last_ms": timings[-1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LLM context conversion")
+    parser.add_argument("--turns", type=int, nargs="+", default=[20, 40, 80])
+    args = parser.parse_args()
+
+    results = []
+    for adapter_cls in (OpenAILLMAdapter, AnthropicLLMAdapter, AWSBedrockLLMAdapter):
+        for turns in args.turns:
+            for cached in (False, True):
+                results.append(run_config(adapter_cls, turns, cached))
+
+    print("\nLLM context conversion per invocation (params + messages for logging)")
+    print(
+        f"{'adapter':<10} {'turns':>5} {'msgs':>5} {'mode':<9} {'mean ms':>8} {'last ms':>8} "
+        f"{'speedup':>8}"
+    )
+    uncached = {}
+    for r in results:
+        key = (r["adapter"], r["turns"])
+        if r["mode"] == "uncached":
+            uncached[key] = r
+            speedup = ""
+        else:
+            speedup = f"{uncached[key]['last_ms'] / r['last_ms']:.1f}x"
+        print(
+            f"{r['adapter']:<10} {r['turns']:>5} {r['messages']:>5} {r['mode']:<9} "
+            f"{r['mean_ms']:>8.3f} {r['last_ms']:>8.3f} {speedup:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Output Pacing Benchmark.
+
+Simulates many concurrent calls streaming bot audio through a network output
+transport in one process, and compares pacing each call with its own
+``asyncio.sleep`` per chunk against the shared per-process ``MediaClock``.
+
+For every configuration it reports:
+- event loop lag: how late a 10 ms probe timer fires (mean / p99 / max)
+- drift: how far each call's sent audio falls behind wall-clock time at the
+  end of the run (mean / max), i.e. audio the receiver is starved of
+- timer wakeups per second on the event loop
+
+Usage:
+    python -m evals.perf.media_clock
+    python -m evals.perf.media_clock --calls 50 200 500 --seconds 5 --send-ahead-ms 60
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from pipecat.utils.media_clock import MediaPacer, get_media_clock
+
+
+async def _call(
+    pacer: MediaPacer,
+    chunk_secs: float,
+    work_secs: float,
+    stop_at: float,
+    drifts: list,
+):
+    pacer.set_interval(chunk_secs)
+    started = time.monotonic()
+    sent = 0
+    while time.monotonic() < stop_at:
+        # Serializing and sending a chunk
+        if work_secs:
+            busy_until = time.perf_counter() + work_secs
+            while time.perf_counter() < busy_until:
+                pass
+        sent += 1
+        await pacer.wait()
+    drifts.append(max(0.0, (time.monotonic() - started) - sent * chunk_secs))
+
+
+async def _probe(stop_at: float, lags: list):
+    while time.monotonic() < stop_at:
+        expected = time.monotonic() + 0.01
+        await asyncio.sleep(0.01)
+        lags.append(max(0.0, time.monotonic() - expected))
+
+
+async def run_config(
+    calls: int,
+    shared_clock: bool,
+    send_ahead_secs: float,
+    seconds: float,
+    chunk_secs: float,
+    work_secs: float,
+):
+    loop = asyncio.get_running_loop()
+    timers = 0
+    call_later = loop.call_at
+
+    def counting_call_at(*args, **kwargs):
+        nonlocal timers
+        timers += 1
+        return call_later(*args, **kwargs)
+
+    loop.call_at = counting_call_at
+    try:
+        pacers = [
+            MediaPacer(send_ahead_secs=send_ahead_secs, use_shared_clock=shared_clock)
+            for _ in range(calls)
+        ]
+        lags, drifts = [], []
+        stop_at = time.monotonic() + seconds
+        await asyncio.gather(
+            _probe(stop_at, lags),
+            *(_call(p, chunk_secs, work_secs, stop_at, drifts) for p in pacers),
+        )
+        for pacer in pacers:
+            await pacer.close()
+    finally:
+        loop.call_at = call_later
+
+    lags.sort()
+    return {
+        "calls": calls,
+        "pacing": "shared clock" if shared_clock else "per-call sleep",
+        "send_ahead_ms": send_ahead_secs * 1000,
+        "lag_mean_ms": statistics.mean(lags) * 1000,
+        "lag_p99_ms": lags[int(len(lags) * 0.99)] * 1000,
+        "lag_max_ms": lags[-1] * 1000,
+        "drift_mean_ms": statistics.mean(drifts) * 1000,
+        "drift_max_ms": max(drifts) * 1000,
+        "timers_per_sec": timers / seconds,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark audio output pacing")
+    parser.add_argument("--calls", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration per config")
+    parser.add_argument("--chunk-ms", type=float, default=20.0, help="Audio chunk duration")
+    parser.add_argument(
+        "--work-us", type=float, default=20.0, help="CPU time spent sending each chunk"
+    )
+    parser.add_argument("--send-ahead-ms", type=float, default=60.0)
+    args = parser.parse_args()
+
+    configs = [
+        (False, 0.0),
+        (True, 0.0),
+        (True, args.send_ahead_ms / 1000),
+    ]
+    results = []
+    for calls in args.calls:
+        for shared_clock, send_ahead_secs in configs:
+            results.append(
+                await run_config(
+                    calls,
+                    shared_clock,
+                    send_ahead_secs,
+                    args.seconds,
+                    args.chunk_ms / 1000,
+                    args.work_us / 1_000_000,
+                )
+            )
+
+    tick_ms = get_media_clock().tick_secs * 1000
+    print(
+        f"\nOutput pacing, {args.chunk_ms:.0f} ms chunks, {args.seconds:.0f} s per config "
+        f"(shared clock tick {tick_ms:.0f} ms)"
+    )
+    print(
+        f"{'calls':>5} {'pacing':<15} {'ahead ms':>8} {'lag mean':>9} {'lag p99':>8} "
+        f"{'lag max':>8} {'drift mean':>11} {'drift max':>10} {'timers/s':>9}"
+    )
+    for r in results:
+        print(
+            f"{r['calls']:>5} {r['pacing']:<15} {r['send_ahead_ms']:>8.0f} "
+            f"{r['lag_mean_ms']:>9.2f} {r['lag_p99_ms']:>8.2f} {r['lag_max_ms']:>8.2f} "
+            f"{r['drift_mean_ms']:>11.2f} {r['drift_max_ms']:>10.2f} {r['timers_per_sec']:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Real-time Feedback Observer Benchmark.
+
+Feeds the frames of a simulated conversation (20ms input audio, output audio
+while the bot speaks, interim and final user transcriptions, TTS words, LLM
+TTFB metrics), each observed at ``--hops`` processors, through a pipeline
+task's ``TaskObserver`` and compares sending every UI event from
+``on_push_frame`` (``inline``, as done before the event ring) with
+``RealtimeFeedbackObserver`` recording events in a ring drained in the
+background, with nobody watching (``ring-idle``: no WebSocket sender
+registered for the run and no logs buffer) and with a dashboard attached
+(``ring``).
+
+Each mode runs with a fast browser socket and with one taking
+``--slow-send-ms`` per message. Frames are fed as fast as the observer task
+keeps up with them (TTS words have no pts, so bot text is sent as it comes).
+
+It reports the time spent in ``on_push_frame`` per observed frame, the most
+frames queued behind the observer, the UI messages sent and how long after the
+last frame the UI caught up.
+
+Usage:
+    python -m evals.perf.realtime_feedback
+    python -m evals.perf.realtime_feedback --turns 40 --slow-send-ms 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from loguru import logger
+
+from api.services.pipecat.realtime_feedback_observer import RealtimeFeedbackObserver
+from api.services.pipecat.ws_sender_registry import register_ws_sender, unregister_ws_sender
+from pipecat.frames.frames import (
+    EndFrame,
+    InputAudioRawFrame,
+    InterimTranscriptionFrame,
+    MetricsFrame,
+    OutputAudioRawFrame,
+    TranscriptionFrame,
+    TTSTextFrame,
+)
+from pipecat.metrics.metrics import TTFBMetricsData
+from pipecat.observers.base_observer import BaseObserver, FramePushed
+from pipecat.pipeline.task_observer import TaskObserver
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.utils.asyncio.task_manager import TaskManager, TaskManagerParams
+
+WORKFLOW_RUN_ID = 1
+AUDIO = b"\x00" * 640  # 20ms at 16kHz
+
+
+class InlineFeedbackObserver(BaseObserver):
+    """The observer as it was before the event ring: every event sent from on_push_frame."""
+
+    def __init__(self, ws_sender, logs_buffer):
+        super().__init__()
+        self._ws_sender = ws_sender
+        self._logs_buffer = logs_buffer
+        self._frames_seen = set()
+
+    async def on_push_frame(self, data: FramePushed):
+        frame = data.frame
+        if isinstance(frame, EndFrame) or frame.id in self._frames_seen:
+            return
+        self._frames_seen.add(frame.id)
+        if isinstance(frame, (InterimTranscriptionFrame, TranscriptionFrame)):
+            final = isinstance(frame, TranscriptionFrame)
+            await self._send({"type": "rtf-user-transcription", "text": frame.text})
+            if final:
+                self._logs_buffer.increment_turn()
+        elif isinstance(frame, TTSTextFrame):
+            await self._send({"type": "rtf-bot-text", "text": frame.text})
+        elif isinstance(frame, MetricsFrame):
+            for metric_data in frame.data:
+                if isinstance(metric_data, TTFBMetricsData) and "LLM" in metric_data.processor:
+                    await self._send({"type": "rtf-ttfb-metric", "value": metric_data.value})
+
+    async def _send(self, message: dict):
+        await self._ws_sender(message)
+        await self._logs_buffer.append(message)
+
+
+class StubLogsBuffer:
+    def __init__(self):
+        self.events = 0
+
+    async def append(self, event: dict):
+        self.events += 1
+
+    def increment_turn(self):
+        pass
+
+
+class Socket:
+    def __init__(self, send_ms: float):
+        self.messages = 0
+        self.last_sent_at = 0.0
+        self._send_seconds = send_ms / 1000
+
+    async def send(self, message: dict):
+        if self._send_seconds:
+            await asyncio.sleep(self._send_seconds)
+        self.messages += 1
+        self.last_sent_at = time.perf_counter()
+
+
+def conversation(turns: int):
+    """Frames of the conversation, 20ms at a time."""
+    for turn in range(turns):
+        words = [f"word{i}" for i in range(12)]
+        # User turn: 3s, an interim transcription every 200ms
+        for tick in range(150):
+            frames = [InputAudioRawFrame(audio=AUDIO, sample_rate=16000, num_channels=1)]
+            if tick % 10 == 9:
+                frames.append(
+                    InterimTranscriptionFrame(
+                        text=" ".join(words[: tick // 12 + 1]), user_id="u", timestamp=""
+                    )
+                )
+            yield frames
+        yield [TranscriptionFrame(text=" ".join(words), user_id="u", timestamp="")]
+        yield [MetricsFrame(data=[TTFBMetricsData(processor="OpenAILLMService#0", value=0.4)])]
+        # Bot turn: 4s, a word every 300ms
+        for tick in range(200):
+            frames = [
+                InputAudioRawFrame(audio=AUDIO, sample_rate=16000, num_channels=1),
+                OutputAudioRawFrame(audio=AUDIO, sample_rate=16000, num_channels=1),
+            ]
+            if tick % 15 == 0:
+                frames.append(TTSTextFrame(text=f"reply{turn}-{tick}", aggregated_by="word"))
+            yield frames
+    yield [EndFrame()]
+
+
+async def run_mode(mode: str, send_ms: float, args) -> dict:
+    socket = Socket(send_ms)
+    logs_buffer = StubLogsBuffer()
+    if mode == "inline":
+        observer = InlineFeedbackObserver(socket.send, logs_buffer)
+    else:
+        observer = RealtimeFeedbackObserver(
+            WORKFLOW_RUN_ID, logs_buffer=logs_buffer if mode == "ring" else None
+        )
+        if mode == "ring":
+            register_ws_sender(WORKFLOW_RUN_ID, socket.send)
+
+    observed = 0
+    observer_time = 0.0
+    on_push_frame = observer.on_push_frame
+
+    async def timed_on_push_frame(data: FramePushed):
+        nonlocal observed, observer_time
+        started = time.perf_counter()
+        await on_push_frame(data)
+        observer_time += time.perf_counter() - started
+        observed += 1
+
+    observer.on_push_frame = timed_on_push_frame
+
+    task_manager = TaskManager()
+    task_manager.setup(TaskManagerParams(loop=asyncio.get_running_loop()))
+    task_observer = TaskObserver(observers=[observer], task_manager=task_manager)
+    await task_observer.start()
+    queue = next(iter(task_observer._proxies.values())).queue
+
+    peak_queued = 0
+    for frames in conversation(args.turns):
+        for frame in frames:
+            for _ in range(args.hops):
+                await task_observer.on_push_frame(
+                    FramePushed(None, None, frame, FrameDirection.DOWNSTREAM, 0)
+                )
+        peak_queued = max(peak_queued, queue.qsize())
+        await asyncio.sleep(0)
+    fed_at = time.perf_counter()
+
+    await queue.join()
+    drainer = getattr(observer, "_drainer_task", None)
+    if drainer:
+        await drainer
+    caught_up = max(0.0, socket.last_sent_at - fed_at) if socket.messages else 0.0
+
+    await task_observer.stop()
+    unregister_ws_sender(WORKFLOW_RUN_ID)
+    return {
+        "mode": mode,
+        "socket": f"{send_ms:g}ms",
+        "us_per_frame": observer_time / observed * 1e6,
+        "peak_queued": peak_queued,
+        "messages": socket.messages,
+        "caught_up_ms": caught_up * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark the real-time feedback observer")
+    parser.add_argument("--turns", type=int, default=20, help="User/bot turn pairs")
+    parser.add_argument("--hops", type=int, default=8, help="Processors observing each frame")
+    parser.add_argument("--slow-send-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    logger.remove()
+
+    results = []
+    for send_ms in (0.0, args.slow_send_ms):
+        for mode in ("inline", "ring-idle", "ring"):
+            results.append(await run_mode(mode, send_ms, args))
+
+    print(
+        f"\nReal-time feedback over {args.turns} turn pairs ({args.turns * 7}s of conversation), "
+        f"each frame observed at {args.hops} processors"
+    )
+    print(
+        f"{'mode':<10} {'socket':>7} {'us/frame':>9} {'peak queued':>11} "
+        f"{'UI messages':>11} {'UI caught up ms':>15}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<10} {r['socket']:>7} {r['us_per_frame']:>9.2f} "
+            f"{r['peak_queued']:>11} {r['messages']:>11} {r['caught_up_ms']:>15.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Run Log Benchmark.
+
+Simulates the transcript and real-time feedback events of a long call (a few
+feedback events per turn, including large function call results) and compares
+holding both in memory until hangup (``in-memory``, the previous buffers) with
+streaming them to the run's log files (``streamed``).
+
+For each call length it reports the Python heap held by the buffers just
+before hangup, the time spent appending during the call, and the hangup work
+done on the event loop: writing the transcript file and serializing the
+feedback events for the workflow run's ``logs`` column.
+
+The Redis stream mirror is disabled, so only the file side is measured.
+
+Usage:
+    python -m evals.perf.run_log
+    python -m evals.perf.run_log --turns 100 500 2000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import UTC, datetime
+
+from api.services.pipecat.run_log import StreamingLogsBuffer, StreamingTranscriptBuffer
+
+RESULT = json.dumps(
+    {"orders": [{"id": f"ORD-{i:04d}", "status": "shipped", "items": i % 5} for i in range(30)]}
+)
+
+
+class InMemoryTranscriptBuffer:
+    """The transcript buffer as it was before streaming: lines held until hangup."""
+
+    def __init__(self, workflow_run_id: int):
+        self._lines = []
+        self._lock = asyncio.Lock()
+
+    async def append(self, transcript: str):
+        async with self._lock:
+            self._lines.append(transcript)
+
+    async def write_to_temp_file(self) -> str:
+        async with self._lock:
+            with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+                f.write("".join(self._lines))
+            return f.name
+
+    def contains_user_speech(self) -> bool:
+        return any(StreamingTranscriptBuffer._USER_SPEECH_RE.match(line) for line in self._lines)
+
+
+class InMemoryLogsBuffer:
+    """The feedback events buffer as it was before streaming: events held until hangup."""
+
+    def __init__(self, workflow_run_id: int):
+        self._events = []
+        self._turn_counter = 0
+
+    async def append(self, event: dict):
+        self._events.append(
+            {**event, "timestamp": datetime.now(UTC).isoformat(), "turn": self._turn_counter}
+        )
+
+    def increment_turn(self):
+        self._turn_counter += 1
+
+    def get_events(self) -> list:
+        return self._events
+
+
+def turn_events(turn: int) -> list:
+    """Feedback events and transcript lines produced by one turn."""
+    user = f"I want to check the status of order number {turn} placed last week please"
+    bot = "Sure, let me look that up. Your order has shipped and should arrive on Monday."
+    events = [
+        {"type": "rtf-user-transcription", "payload": {"text": user, "final": True}},
+        {"type": "rtf-function-call-start", "payload": {"function_name": "lookup_orders"}},
+        {"type": "rtf-function-call-end", "payload": {"result": RESULT}},
+        {"type": "rtf-bot-text", "payload": {"text": bot}},
+        {"type": "rtf-ttfb-metric", "payload": {"processor": "llm", "ttfb": 0.42}},
+    ]
+    lines = [
+        f"[2025-06-29T12:{turn % 60:02d}:56.789+00:00] user: {user}\n",
+        f"[2025-06-29T12:{turn % 60:02d}:58.120+00:00] assistant: {bot}\n",
+    ]
+    return events, lines
+
+
+async def run_mode(mode: str, turns: int, log_dir: str) -> dict:
+    tracemalloc.start()
+    if mode == "in-memory":
+        transcript = InMemoryTranscriptBuffer(1)
+        logs = InMemoryLogsBuffer(1)
+    else:
+        transcript = StreamingTranscriptBuffer(1, directory=log_dir, stream_enabled=False)
+        logs = StreamingLogsBuffer(1, directory=log_dir, stream_enabled=False)
+
+    append_seconds = 0.0
+    for turn in range(turns):
+        events, lines = turn_events(turn)
+        started = time.perf_counter()
+        for event in events:
+            await logs.append(event)
+        logs.increment_turn()
+        for line in lines:
+            await transcript.append(line)
+        append_seconds += time.perf_counter() - started
+        # Let periodic flushes run, as they would between turns
+        await asyncio.sleep(0)
+
+    heap_mb = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    transcript.contains_user_speech()
+    path = await transcript.write_to_temp_file()
+    if mode == "in-memory":
+        # The JSON column serializes the events when the run is updated
+        logs_json = json.dumps({"realtime_feedback_events": logs.get_events()})
+    else:
+        logs_json = await logs.get_events_json()
+        await logs.discard()
+    hangup_ms = (time.perf_counter() - started) * 1000
+    os.remove(path)
+
+    return {
+        "mode": mode,
+        "turns": turns,
+        "heap_mb": heap_mb,
+        "append_ms": append_seconds * 1000,
+        "hangup_ms": hangup_ms,
+        "logs_kb": len(logs_json) / 1024,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark streamed run logs")
+    parser.add_argument("--turns", type=int, nargs="+", default=[100, 500, 2000])
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as log_dir:
+        for turns in args.turns:
+            for mode in ("in-memory", "streamed"):
+                results.append(await run_mode(mode, turns, log_dir))
+
+    print("\nRun logs of a call (5 feedback events and 2 transcript lines per turn)")
+    print(
+        f"{'mode':<10} {'turns':>6} {'heap MB':>8} {'append ms':>10} {'hangup ms':>10} "
+        f"{'logs KB':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<10} {r['turns']:>6} {r['heap_mb']:>8.2f} {r['append_ms']:>10.1f} "
+            f"{r['hangup_ms']:>10.1f} {r['logs_kb']:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Sentence Aggregation Benchmark.
+
+Streams LLM responses, split into small tokens, through the text aggregator
+that feeds TTS and compares the previous aggregator (``per-char``: every
+character appended and checked on its own, NLTK run over the whole pending
+buffer at each candidate boundary) with the chunk-level aggregator
+(``chunked``: text between candidate boundaries appended at once, cached
+per-token boundary decisions) and with the first-clause early flush enabled
+(``first-clause``).
+
+It reports aggregation throughput in tokens/s, the number of NLTK tokenizer
+calls per response and the first-sentence latency: the time from the first LLM
+token until the first aggregation is released to TTS, with tokens arriving
+every ``--token-ms``.
+
+Needs the NLTK ``punkt_tab`` tokenizer data.
+
+Usage:
+    python -m evals.perf.sentence_aggregation
+    python -m evals.perf.sentence_aggregation --responses 200 --token-ms 15
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+import pipecat.utils.string as string_utils
+from pipecat.utils.string import SENTENCE_ENDING_PUNCTUATION, match_endofsentence
+from pipecat.utils.text.base_text_aggregator import Aggregation, AggregationType
+from pipecat.utils.text.simple_text_aggregator import SimpleTextAggregator
+
+SENTENCES = [
+    "Sure, I can help you with that.",
+    "Your current plan costs $29.95/month and renews on the 3rd.",
+    "Dr. Smith will call you back at 4:30 p.m. tomorrow.",
+    "The order number is 1,024, and it shipped via U.S. mail.",
+    "Is there anything else I can help you with today?",
+    "Great! I have updated your address to 221B Baker St.",
+    "Hmm... let me check that for you.",
+    "You can also reach us at support@example.com.",
+]
+
+
+class PerCharTextAggregator(SimpleTextAggregator):
+    """The previous aggregator: one character at a time, NLTK over the buffer."""
+
+    async def aggregate(self, text: str):
+        for char in text:
+            self._text += char
+            result = await self._check_sentence_with_lookahead(char)
+            if result:
+                yield result
+
+    async def _check_sentence_with_lookahead(self, char: str):
+        if self._needs_lookahead:
+            if char.strip():
+                self._needs_lookahead = False
+                eos_marker = match_endofsentence(self._text)
+                if eos_marker:
+                    result = self._text[:eos_marker]
+                    self._text = self._text[eos_marker:]
+                    return Aggregation(text=result.strip(" "), type=AggregationType.SENTENCE)
+            return None
+        if self._text and self._text[-1] in SENTENCE_ENDING_PUNCTUATION:
+            self._needs_lookahead = True
+        return None
+
+
+def make_responses(count: int, sentences: int) -> list:
+    """Build LLM responses split into 2-6 character tokens."""
+    rng = random.Random(7)
+    responses = []
+    for _ in range(count):
+        text = " ".join(rng.choice(SENTENCES) for _ in range(sentences))
+        tokens = []
+        pos = 0
+        while pos < len(text):
+            size = rng.randint(2, 6)
+            tokens.append(text[pos : pos + size])
+            pos += size
+        responses.append(tokens)
+    return responses
+
+
+def make_aggregator(mode: str) -> SimpleTextAggregator:
+    if mode == "per-char":
+        return PerCharTextAggregator()
+    if mode == "first-clause":
+        return SimpleTextAggregator(first_clause_min_words=2)
+    return SimpleTextAggregator()
+
+
+async def run_mode(mode: str, responses: list, token_ms: float) -> dict:
+    calls = 0
+    sent_tokenize = string_utils.sent_tokenize
+
+    def counting_sent_tokenize(text):
+        nonlocal calls
+        calls += 1
+        return sent_tokenize(text)
+
+    string_utils.sent_tokenize = counting_sent_tokenize
+    string_utils.match_sentence_boundary.cache_clear()
+    aggregator = make_aggregator(mode)
+    tokens = 0
+    aggregate_seconds = 0.0
+    first_latencies = []
+    try:
+        for response in responses:
+            first_latency = None
+            for index, token in enumerate(response):
+                started = time.perf_counter()
+                results = [agg async for agg in aggregator.aggregate(token)]
+                elapsed = time.perf_counter() - started
+                aggregate_seconds += elapsed
+                if results and first_latency is None:
+                    first_latency = index * token_ms + elapsed * 1000
+            started = time.perf_counter()
+            await aggregator.flush()
+            aggregate_seconds += time.perf_counter() - started
+            if first_latency is None:
+                first_latency = len(response) * token_ms
+            first_latencies.append(first_latency)
+            tokens += len(response)
+    finally:
+        string_utils.sent_tokenize = sent_tokenize
+
+    first_latencies.sort()
+    return {
+        "mode": mode,
+        "tokens_per_s": tokens / aggregate_seconds,
+        "nltk_calls": calls / len(responses),
+        "first_p50_ms": first_latencies[len(first_latencies) // 2],
+        "first_p90_ms": first_latencies[int(len(first_latencies) * 0.9)],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark LLM to TTS sentence aggregation")
+    parser.add_argument("--responses", type=int, default=500)
+    parser.add_argument("--sentences", type=int, default=4, help="Sentences per response")
+    parser.add_argument("--token-ms", type=float, default=20.0, help="LLM inter-token time")
+    args = parser.parse_args()
+
+    responses = make_responses(args.responses, args.sentences)
+    results = []
+    for mode in ("per-char", "chunked", "first-clause"):
+        results.append(await run_mode(mode, responses, args.token_ms))
+
+    print(
+        f"\nSentence aggregation over {args.responses} responses of {args.sentences} sentences, "
+        f"{args.token_ms:.0f}ms per LLM token"
+    )
+    print(
+        f"{'mode':<13} {'tokens/s':>10} {'nltk calls':>10} {'first p50 ms':>12} "
+        f"{'first p90 ms':>12}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<13} {r['tokens_per_s']:>10.0f} {r['nltk_calls']:>10.1f} "
+            f"{r['first_p50_ms']:>12.1f} {r['first_p90_ms']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
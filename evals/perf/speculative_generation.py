@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Speculative LLM Generation Benchmark.
+
+Plays simulated user turns through the user aggregator and a mock LLM and
+compares waiting for the user turn stop strategy before running the LLM
+(``confirmed``) with starting inference as soon as the user pauses with a final
+transcript (``speculative``).
+
+Each turn ends with the user falling silent; in a share of the turns
+(``--resume-rate``) the user pauses mid-turn first and keeps talking before the
+stop strategy fires, so the speculative response is discarded. The LLM has a
+fixed time to first token (``--ttfb-ms``).
+
+It reports the response latency (from the user's final VAD stop until the
+first LLM text leaves the LLM service) and the completion tokens wasted on
+discarded speculations per turn.
+
+Usage:
+    python -m evals.perf.speculative_generation
+    python -m evals.perf.speculative_generation --turns 40 --ttfb-ms 400 --resume-rate 0.5
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from pipecat.frames.frames import (
+    Frame,
+    LLMTextFrame,
+    MetricsFrame,
+    TranscriptionFrame,
+    VADUserStartedSpeakingFrame,
+    VADUserStoppedSpeakingFrame,
+)
+from pipecat.metrics.metrics import SpeculativeGenerationMetricsData
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.aggregators.llm_context import LLMContext
+from pipecat.processors.aggregators.llm_response_universal import (
+    LLMUserAggregator,
+    LLMUserAggregatorParams,
+)
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.tests import MockLLMService
+from pipecat.turns.user_stop import SpeechTimeoutUserTurnStopStrategy
+from pipecat.turns.user_turn_strategies import UserTurnStrategies
+
+RESPONSE = "Sure, I can help you with that. What date would you like to travel?"
+
+
+class DelayedMockLLMService(MockLLMService):
+    """Mock LLM that waits ``ttfb`` seconds before streaming."""
+
+    def __init__(self, *, ttfb: float, **kwargs):
+        super().__init__(**kwargs)
+        self._ttfb = ttfb
+
+    async def _stream_chat_completions_universal_context(self, context):
+        await asyncio.sleep(self._ttfb)
+        return await super()._stream_chat_completions_universal_context(context)
+
+
+class ResponseRecorder(FrameProcessor):
+    """Records when LLM text is released and collects speculation metrics."""
+
+    def __init__(self):
+        super().__init__()
+        self.first_text_at = None
+        self.speculations = []
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, LLMTextFrame) and self.first_text_at is None:
+            self.first_text_at = time.perf_counter()
+        elif isinstance(frame, MetricsFrame):
+            self.speculations.extend(
+                data for data in frame.data if isinstance(data, SpeculativeGenerationMetricsData)
+            )
+        await self.push_frame(frame, direction)
+
+
+async def play_turn(task: PipelineTask, recorder: ResponseRecorder, args, resume: bool) -> float:
+    """Play one user turn and return the response latency in seconds."""
+    stt = args.stt_ms / 1000
+    if resume:
+        # The user pauses long enough for a final transcript, then keeps going.
+        await task.queue_frame(VADUserStartedSpeakingFrame())
+        await asyncio.sleep(0.3)
+        await task.queue_frame(VADUserStoppedSpeakingFrame())
+        await asyncio.sleep(stt)
+        await task.queue_frame(TranscriptionFrame(text="I want to", user_id="", timestamp=""))
+        await asyncio.sleep(args.user_speech_timeout_ms / 2000)
+
+    await task.queue_frame(VADUserStartedSpeakingFrame())
+    await asyncio.sleep(0.3)
+    recorder.first_text_at = None
+    stopped_at = time.perf_counter()
+    await task.queue_frame(VADUserStoppedSpeakingFrame())
+    await asyncio.sleep(stt)
+    await task.queue_frame(
+        TranscriptionFrame(text="book a flight to Lisbon.", user_id="", timestamp="")
+    )
+
+    deadline = stopped_at + args.user_speech_timeout_ms / 1000 + args.ttfb_ms / 1000 + 2
+    while recorder.first_text_at is None and time.perf_counter() < deadline:
+        await asyncio.sleep(0.005)
+    latency = (recorder.first_text_at or deadline) - stopped_at
+    # Let the response finish before the next turn.
+    await asyncio.sleep(0.3)
+    return latency
+
+
+async def run_mode(mode: str, args) -> dict:
+    user_aggregator = LLMUserAggregator(
+        LLMContext(),
+        params=LLMUserAggregatorParams(
+            user_turn_strategies=UserTurnStrategies(
+                stop=[
+                    SpeechTimeoutUserTurnStopStrategy(
+                        user_speech_timeout=args.user_speech_timeout_ms / 1000
+                    )
+                ],
+            ),
+            enable_speculative_generation=mode == "speculative",
+        ),
+    )
+    llm = DelayedMockLLMService(
+        ttfb=args.ttfb_ms / 1000,
+        mock_chunks=MockLLMService.create_text_chunks(RESPONSE, chunk_size=4),
+        chunk_delay=0.005,
+    )
+    recorder = ResponseRecorder()
+    task = PipelineTask(
+        Pipeline([user_aggregator, llm, recorder]),
+        params=PipelineParams(enable_metrics=True),
+        cancel_on_idle_timeout=False,
+    )
+
+    rng = random.Random(7)
+    latencies = []
+
+    async def play():
+        await asyncio.sleep(0.05)
+        for _ in range(args.turns):
+            latencies.append(await play_turn(task, recorder, args, rng.random() < args.resume_rate))
+        await task.stop_when_done()
+
+    await asyncio.gather(PipelineRunner(handle_sigint=False).run(task), play())
+
+    latencies.sort()
+    wasted = sum(s.wasted_completion_tokens for s in recorder.speculations if not s.committed)
+    return {
+        "mode": mode,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p90_ms": latencies[int(len(latencies) * 0.9)] * 1000,
+        "committed": sum(1 for s in recorder.speculations if s.committed),
+        "discarded": sum(1 for s in recorder.speculations if not s.committed),
+        "wasted_tokens": wasted / args.turns,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark speculative LLM generation")
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--ttfb-ms", type=float, default=350.0, help="LLM time to first token")
+    parser.add_argument("--stt-ms", type=float, default=150.0, help="STT finalization delay")
+    parser.add_argument("--user-speech-timeout-ms", type=float, default=600.0)
+    parser.add_argument("--resume-rate", type=float, default=0.3)
+    args = parser.parse_args()
+
+    results = []
+    for mode in ("confirmed", "speculative"):
+        results.append(await run_mode(mode, args))
+
+    print(
+        f"\nResponse latency over {args.turns} user turns, {args.ttfb_ms:.0f}ms LLM TTFB, "
+        f"{args.user_speech_timeout_ms:.0f}ms user speech timeout, "
+        f"{args.resume_rate:.0%} of turns resumed after a pause"
+    )
+    print(
+        f"{'mode':<12} {'p50 ms':>8} {'p90 ms':>8} {'committed':>9} {'discarded':>9} "
+        f"{'wasted tok/turn':>15}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<12} {r['p50_ms']:>8.0f} {r['p90_ms']:>8.0f} {r['committed']:>9} "
+            f"{r['discarded']:>9} {r['wasted_tokens']:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Template Rendering Benchmark.
+
+Renders large node prompts with many ``{{variable}}`` placeholders (as done on
+every workflow node transition) and compares parsing the template on every
+call with rendering the cached compiled template.
+
+For every prompt size it reports the mean render time per call and the
+speedup of the cached path.
+
+Usage:
+    python -m evals.perf.template_rendering
+    python -m evals.perf.template_rendering --variables 10 100 500 --iterations 2000
+"""
+
+import argparse
+import time
+
+from api.utils.template_renderer import compile_string, render_template
+
+PARAGRAPH = (
+    "You are a helpful voice agent for an insurance company. Keep answers short, "
+    "confirm details back to the caller and never invent policy information. "
+)
+
+
+def build_prompt(variables: int) -> tuple[str, dict]:
+    """A prompt with ``variables`` placeholders and a matching context."""
+    parts = []
+    initial_context = {}
+    gathered_context = {"customer": {}}
+    for i in range(variables):
+        parts.append(PARAGRAPH)
+        if i % 3 == 0:
+            parts.append(f"Caller field {i}: {{{{initial_context.field_{i}}}}}.\n")
+            initial_context[f"field_{i}"] = f"value {i}"
+        elif i % 3 == 1:
+            parts.append(
+                f"Known detail {i}: {{{{gathered_context.customer.detail_{i} | fallback:unknown}}}}.\n"
+            )
+            gathered_context["customer"][f"detail_{i}"] = i
+        else:
+            parts.append(f"Missing {i}: {{{{missing_{i} | fallback:not provided}}}}.\n")
+    context = {
+        "initial_context": initial_context,
+        "gathered_context": gathered_context,
+        "workflow_run_id": 42,
+    }
+    return "".join(parts), context
+
+
+def _time_per_call(render, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    return (time.perf_counter() - started) / iterations
+
+
+def run_config(variables: int, iterations: int) -> dict:
+    prompt, context = build_prompt(variables)
+    parse_each_call = compile_string.__wrapped__
+
+    uncached = _time_per_call(lambda: parse_each_call(prompt).render(context), iterations)
+    render_template(prompt, context)  # warm the cache
+    cached = _time_per_call(lambda: render_template(prompt, context), iterations)
+    assert parse_each_call(prompt).render(context) == render_template(prompt, context)
+
+    return {
+        "variables": variables,
+        "prompt_kb": len(prompt) / 1024,
+        "uncached_us": uncached * 1e6,
+        "cached_us": cached * 1e6,
+        "speedup": uncached / cached,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark prompt template rendering")
+    parser.add_argument("--variables", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    results = [run_config(variables, args.iterations) for variables in args.variables]
+
+    print(f"\nTemplate rendering, {args.iterations} renders per config")
+    print(
+        f"{'variables':>9} {'prompt KB':>9} {'parse+render us':>15} {'cached us':>10} "
+        f"{'speedup':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['variables']:>9} {r['prompt_kb']:>9.1f} {r['uncached_us']:>15.1f} "
+            f"{r['cached_us']:>10.1f} {r['speedup']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""Custom Tool Prefetch Benchmark.
+
+Walks simulated calls through a workflow whose nodes use custom HTTP tools
+(authenticated with a few shared credentials) and end call/transfer call
+tools, and compares loading the tools and credentials when they're needed
+(``lazy``: the tools of a node when it's entered, a credential when a tool
+first uses it) with resolving all of them with one query at call setup
+(``prefetch``, ``CUSTOM_TOOL_PREFETCH``).
+
+Postgres is an in-memory stand-in with ``--db-rtt-ms`` of round trip time per
+query. Each call sets up the engine and the presynthesis of the tool messages,
+enters ``--nodes`` nodes and runs ``--tool-calls`` HTTP tools in each (the
+HTTP requests themselves are stubbed).
+
+It reports the database queries per call at setup and during the
+conversation, and the time spent waiting on the database during the
+conversation.
+
+Usage:
+    python -m evals.perf.tool_prefetch
+    python -m evals.perf.tool_prefetch --nodes 12 --db-rtt-ms 5
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict
+from unittest.mock import patch
+
+from loguru import logger
+
+from api.db import db_client
+from api.services.pipecat.tts_presynthesis import start_workflow_presynthesis
+from api.services.workflow import pipecat_engine
+from api.services.workflow.dto import (
+    EdgeDataDTO,
+    NodeDataDTO,
+    NodeType,
+    Position,
+    ReactFlowDTO,
+    RFEdgeDTO,
+    RFNodeDTO,
+)
+from api.services.workflow.pipecat_engine import PipecatEngine
+from api.services.workflow.tools import custom_tool
+from api.services.workflow.workflow import WorkflowGraph
+from pipecat.processors.aggregators.llm_context import LLMContext
+
+CREDENTIALS = 3
+
+
+@dataclass
+class Tool:
+    tool_uuid: str
+    name: str
+    description: str
+    category: str
+    definition: Dict[str, Any]
+
+
+@dataclass
+class Credential:
+    credential_uuid: str
+    name: str
+    credential_type: str = "bearer_token"
+    credential_data: Dict[str, Any] = field(default_factory=lambda: {"token": "secret"})
+
+
+@dataclass
+class WorkflowRun:
+    workflow: Any
+    mode: str = "twilio"
+
+
+@dataclass
+class Phase:
+    name: str = "setup"
+    queries: Counter = field(default_factory=Counter)
+    call_wait: float = 0.0
+
+
+class SimulatedDB:
+    """Stand-in for the database queries of a call, with a round trip time."""
+
+    def __init__(self, rtt: float, tools: Dict[str, Tool], phase: Phase):
+        self._rtt = rtt
+        self._tools = tools
+        self._credentials = {
+            f"cred-{i}": Credential(f"cred-{i}", f"API {i}") for i in range(CREDENTIALS)
+        }
+        self._phase = phase
+
+    async def _query(self):
+        self._phase.queries[self._phase.name] += 1
+        started = time.perf_counter()
+        await asyncio.sleep(self._rtt)
+        if self._phase.name == "call":
+            self._phase.call_wait += time.perf_counter() - started
+
+    async def get_workflow_run_by_id(self, workflow_run_id: int):
+        await self._query()
+        user = type("User", (), {"selected_organization_id": 1})
+        return WorkflowRun(workflow=type("Workflow", (), {"user": user}))
+
+    async def get_tools_by_uuids(self, tool_uuids, organization_id):
+        await self._query()
+        return [self._tools[uuid] for uuid in tool_uuids if uuid in self._tools]
+
+    async def get_credential_by_uuid(self, credential_uuid, organization_id):
+        await self._query()
+        return self._credentials.get(credential_uuid)
+
+    async def get_tools_with_credentials(self, tool_uuids, organization_id):
+        await self._query()
+        return [
+            (tool, self._credentials.get(tool.definition["config"].get("credential_uuid")))
+            for tool in (self._tools[uuid] for uuid in tool_uuids if uuid in self._tools)
+        ]
+
+
+class StubHTTPToolEngine:
+    async def request(self, **kwargs):
+        return {"status": "success", "status_code": 200}, None
+
+
+class StubLLM:
+    def __init__(self):
+        self.functions = {}
+
+    def register_function(self, name, handler, **kwargs):
+        self.functions[name] = handler
+
+
+class StubTTS:
+    supports_presynthesis = True
+
+    async def presynthesize(self, text: str) -> bool:
+        return True
+
+
+class StubTask:
+    def __init__(self):
+        self.handlers = {}
+
+    def event_handler(self, name):
+        def register(handler):
+            self.handlers[name] = handler
+            return handler
+
+        return register
+
+
+class Params:
+    def __init__(self):
+        self.arguments = {}
+
+    async def result_callback(self, result, properties=None):
+        pass
+
+
+def build_workflow(args) -> tuple[ReactFlowDTO, Dict[str, Tool]]:
+    tools: Dict[str, Tool] = {}
+    for node in range(args.nodes):
+        for i in range(args.tools_per_node):
+            uuid = f"http-{node}-{i}"
+            config = {"method": "POST", "url": f"https://api.example.com/{uuid}"}
+            config["credential_uuid"] = f"cred-{(node + i) % CREDENTIALS}"
+            tools[uuid] = Tool(uuid, f"Step {node} Action {i}", "", "http_api", {"config": config})
+    for uuid, category in (("end-call", "end_call"), ("transfer", "transfer_call")):
+        config = {"messageType": "custom", "customMessage": f"{category} message"}
+        tools[uuid] = Tool(uuid, uuid, "", category, {"config": config})
+
+    nodes, edges = [], []
+    for index in range(args.nodes):
+        tool_uuids = [f"http-{index}-{i}" for i in range(args.tools_per_node)]
+        nodes.append(
+            RFNodeDTO(
+                id=f"n{index}",
+                type=NodeType.startNode if index == 0 else NodeType.agentNode,
+                position=Position(x=0, y=index * 100),
+                data=NodeDataDTO(
+                    name=f"Step {index}",
+                    prompt=f"Handle step {index}.",
+                    is_start=index == 0,
+                    tool_uuids=tool_uuids + ["end-call", "transfer"],
+                ),
+            )
+        )
+        target = f"n{index + 1}" if index + 1 < args.nodes else "end"
+        edges.append(
+            RFEdgeDTO(
+                id=f"n{index}-{target}",
+                source=f"n{index}",
+                target=target,
+                data=EdgeDataDTO(label=f"Next {index}", condition="Step is done"),
+            )
+        )
+    nodes.append(
+        RFNodeDTO(
+            id="end",
+            type=NodeType.endNode,
+            position=Position(x=0, y=args.nodes * 100),
+            data=NodeDataDTO(name="End", prompt="Say goodbye.", is_end=True),
+        )
+    )
+    return ReactFlowDTO(nodes=nodes, edges=edges), tools
+
+
+async def run_call(dto: ReactFlowDTO, tools: Dict[str, Tool], args, rng) -> Phase:
+    phase = Phase()
+    db = SimulatedDB(args.db_rtt_ms / 1000, tools, phase)
+    methods = [
+        "get_workflow_run_by_id",
+        "get_tools_by_uuids",
+        "get_credential_by_uuid",
+        "get_tools_with_credentials",
+    ]
+    patches = [patch.object(db_client, name, getattr(db, name)) for name in methods]
+    for p in patches:
+        p.start()
+    try:
+        llm = StubLLM()
+        workflow = WorkflowGraph(dto)
+        engine = PipecatEngine(
+            llm=llm,
+            context=LLMContext(),
+            workflow=workflow,
+            call_context_vars={},
+            workflow_run_id=1,
+        )
+        await engine.initialize()
+        task = StubTask()
+        presynthesis = start_workflow_presynthesis(
+            task, StubTTS(), workflow, {}, 1, tool_registry=engine.tool_registry
+        )
+        await task.handlers["on_pipeline_started"](task, None)
+        await presynthesis
+
+        phase.name = "call"
+        for index in range(args.nodes):
+            node = workflow.nodes[f"n{index}"]
+            if index:
+                await engine.set_node(node.id)
+            for i in rng.sample(range(args.tools_per_node), args.tool_calls):
+                await llm.functions[f"step_{index}_action_{i}"](Params())
+        return phase
+    finally:
+        for p in patches:
+            p.stop()
+
+
+async def run_mode(mode: str, dto: ReactFlowDTO, tools: Dict[str, Tool], args) -> dict:
+    pipecat_engine.CUSTOM_TOOL_PREFETCH = mode == "prefetch"
+    phases = [await run_call(dto, tools, args, random.Random(call)) for call in range(args.calls)]
+    return {
+        "mode": mode,
+        "setup_queries": sum(p.queries["setup"] for p in phases) / len(phases),
+        "call_queries": sum(p.queries["call"] for p in phases) / len(phases),
+        "call_wait_ms": sum(p.call_wait for p in phases) / len(phases) * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark custom tool prefetch")
+    parser.add_argument("--nodes", type=int, default=6)
+    parser.add_argument("--tools-per-node", type=int, default=3)
+    parser.add_argument("--tool-calls", type=int, default=2, help="HTTP tool calls per node")
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--db-rtt-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    # The engine's debug logs would dominate the output.
+    logger.remove()
+    custom_tool.get_http_tool_engine = lambda: StubHTTPToolEngine()
+
+    dto, tools = build_workflow(args)
+    results = [await run_mode(mode, dto, tools, args) for mode in ("lazy", "prefetch")]
+
+    print(
+        f"\nCustom tool prefetch over {args.calls} calls of {args.nodes} nodes "
+        f"({args.tools_per_node} HTTP tools per node, {CREDENTIALS} credentials, "
+        f"{args.tool_calls} tool calls per node), {args.db_rtt_ms:.1f}ms DB RTT"
+    )
+    print(f"{'mode':<9} {'setup queries':>13} {'mid-call queries':>16} {'mid-call DB ms':>14}")
+    for r in results:
+        print(
+            f"{r['mode']:<9} {r['setup_queries']:>13.1f} {r['call_queries']:>16.1f} "
+            f"{r['call_wait_ms']:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""LLM Tracing Overhead Benchmark.
+
+Measures the per-turn cost that ``traced_llm`` adds to an LLM invocation over
+a long call, for each capture mode, with the span input serialized inline or
+on the background serializer thread.
+
+Usage:
+    python -m evals.perf.tracing_overhead
+    python -m evals.perf.tracing_overhead --turns 80 --tool-output-chars 4000
+"""
+
+import os
+
+# Tracing decorators are resolved at import time
+os.environ["ENABLE_TRACING"] = "true"
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from pipecat.processors.aggregators.llm_context import LLMContext
+from pipecat.utils.tracing.deferred_span_processor import DeferredAttributeSpanProcessor
+from pipecat.utils.tracing.llm_span_capture import (
+    LLMSpanCaptureMode,
+    LLMSpanCaptureParams,
+    configure_llm_span_capture,
+)
+from pipecat.utils.tracing.service_decorators import traced_llm
+
+
+class FakeLLMService:
+    """Minimal stand-in for an LLM service as seen by ``traced_llm``."""
+
+    def __init__(self):
+        self._tracing_enabled = True
+        self._settings = {"temperature": 0.7}
+        self.model_name = "fake-model"
+
+    async def push_frame(self, frame, direction=None):
+        pass
+
+    @traced_llm
+    async def process_context(self, context):
+        pass
+
+
+def _build_turn(turn: int, tool_output_chars: int):
+    return [
+        {"role": "user", "content": f"User turn {turn}: can you check my order status?"},
+        {"role": "assistant", "content": f"Sure, checking order {turn} for you now."},
+        {"role": "tool", "tool_call_id": f"call_{turn}", "content": "x" * tool_output_chars},
+    ]
+
+
+async def run_mode(mode: LLMSpanCaptureMode, deferred: bool, turns: int, tool_output_chars: int):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    processor = SimpleSpanProcessor(exporter)
+    if deferred:
+        processor = DeferredAttributeSpanProcessor(processor)
+    provider.add_span_processor(processor)
+    trace._TRACER_PROVIDER = None
+    trace._TRACER_PROVIDER_SET_ONCE._done = False
+    trace.set_tracer_provider(provider)
+
+    configure_llm_span_capture(LLMSpanCaptureParams(mode=mode))
+
+    service = FakeLLMService()
+    context = LLMContext(messages=[{"role": "system", "content": "You are a helpful agent."}])
+    per_turn = []
+    for turn in range(turns):
+        context.add_messages(_build_turn(turn, tool_output_chars))
+        start = time.perf_counter()
+        await service.process_context(context)
+        per_turn.append(time.perf_counter() - start)
+
+    provider.force_flush()
+    input_bytes = sum(len(s.attributes.get("input", "")) for s in exporter.get_finished_spans())
+    provider.shutdown()
+
+    return {
+        "mode": mode.value,
+        "serialization": "background" if deferred else "inline",
+        "mean_ms": statistics.mean(per_turn) * 1000,
+        "last_10_ms": statistics.mean(per_turn[-10:]) * 1000,
+        "input_kb": input_bytes / 1024,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark LLM span tracing overhead")
+    parser.add_argument("--turns", type=int, default=40, help="LLM invocations per call")
+    parser.add_argument(
+        "--tool-output-chars", type=int, default=2000, help="Size of each tool result message"
+    )
+    args = parser.parse_args()
+
+    results = []
+    for mode in (LLMSpanCaptureMode.FULL, LLMSpanCaptureMode.DELTA, LLMSpanCaptureMode.METADATA):
+        for deferred in (False, True):
+            results.append(await run_mode(mode, deferred, args.turns, args.tool_output_chars))
+
+    print(f"\nTracing overhead over {args.turns} turns ({args.tool_output_chars} char tool outputs)")
+    print(f"{'mode':<10} {'serialization':<14} {'mean ms':>9} {'last10 ms':>10} {'input KB':>10}")
+    for r in results:
+        print(
+            f"{r['mode']:<10} {r['serialization']:<14} {r['mean_ms']:>9.3f} "
+            f"{r['last_10_ms']:>10.3f} {r['input_kb']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""TTS Phrase Cache Benchmark.
+
+Plays simulated calls through a TTS service and compares synthesizing every
+phrase (``off``) with the phrase cache of ``TTSService`` on one worker whose
+calls share the cache (``worker``: the fixed lines of the script are
+presynthesized at startup and shared through Redis, other phrases are cached
+once they repeat) and on a freshly started worker (``new-worker``: its
+in-process tier is empty and the fixed lines are loaded from the Redis tier
+populated by the first one).
+
+Each call speaks a greeting, a disclaimer, confirmations and hold lines that
+repeat across calls, plus answers that are mostly unique. The simulated
+provider has a time to first audio of ``--ttfa-ms`` (with jitter) and Redis is
+an in-memory stand-in with ``--redis-rtt-ms`` of round trip time.
+
+It reports the hit rate, the fixed lines loaded from Redis, the time to first
+audio (from the text reaching the TTS service until its first audio frame
+leaves it) over all phrases, the characters sent to the provider (including
+presynthesis) and the memory held by the cache.
+
+Usage:
+    python -m evals.perf.tts_phrase_cache
+    python -m evals.perf.tts_phrase_cache --calls 100 --concurrency 20 --ttfa-ms 300
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import AsyncGenerator, Dict, Optional
+
+from pipecat.frames.frames import (
+    AggregatedTextFrame,
+    Frame,
+    TTSAudioRawFrame,
+    TTSSpeakFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.tts_cache import CachedTTSData, TTSCacheManager, TTSPhraseCache
+from pipecat.services.tts_service import TTSService
+
+SAMPLE_RATE = 16000
+
+GREETING = "Hi, this is Ava from Acme Health. How can I help you today?"
+DISCLAIMER = "This call may be recorded for quality and training purposes."
+CONFIRMATIONS = ["Got it.", "Sure, one moment.", "Thanks, let me check that for you."]
+HOLD = "Please hold while I look that up."
+GOODBYE = "Thanks for calling, have a great day!"
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+FIXED_LINES = [GREETING, DISCLAIMER, HOLD, GOODBYE]
+
+
+def call_script(rng: random.Random) -> list:
+    def answer() -> str:
+        minutes = rng.choice(["00", "15", "30", "45"])
+        return f"Your appointment is on {rng.choice(DAYS)} at {rng.randint(8, 17)}:{minutes}."
+
+    return [
+        GREETING,
+        DISCLAIMER,
+        rng.choice(CONFIRMATIONS),
+        HOLD,
+        answer(),
+        rng.choice(CONFIRMATIONS),
+        answer(),
+        GOODBYE,
+    ]
+
+
+class SimulatedRedisCacheManager(TTSCacheManager):
+    """Stand-in for Redis keeping entries in a dict, with a round trip time."""
+
+    def __init__(self, rtt: float, entries: Optional[Dict[str, CachedTTSData]] = None):
+        super().__init__(redis_url="redis://simulated")
+        self._rtt = rtt
+        self.entries = entries if entries is not None else {}
+
+    async def connect(self):
+        pass
+
+    async def get(self, cache_key: str) -> Optional[CachedTTSData]:
+        await asyncio.sleep(self._rtt)
+        return self.entries.get(cache_key)
+
+    async def set(self, cache_key: str, data: CachedTTSData) -> bool:
+        await asyncio.sleep(self._rtt)
+        self.entries[cache_key] = data
+        return True
+
+
+class SimulatedTTSService(TTSService):
+    """Provider with a jittered time to first audio, 60ms of speech per character."""
+
+    def __init__(self, *, ttfa: float, rng: random.Random, **kwargs):
+        super().__init__(sample_rate=SAMPLE_RATE, **kwargs)
+        self._ttfa = ttfa
+        self._rng = rng
+        self.characters = 0
+
+    async def run_tts(self, text: str, context_id: str) -> AsyncGenerator[Frame, None]:
+        self.characters += len(text)
+        yield TTSStartedFrame(context_id=context_id)
+        await asyncio.sleep(self._ttfa * self._rng.uniform(0.7, 1.6))
+        num_bytes = int(len(text) * 0.06 * SAMPLE_RATE) * 2
+        chunk = SAMPLE_RATE // 5 * 2
+        for offset in range(0, num_bytes, chunk):
+            audio = b"\x01" * min(chunk, num_bytes - offset)
+            yield TTSAudioRawFrame(audio, SAMPLE_RATE, 1, context_id=context_id)
+        yield TTSStoppedFrame(context_id=context_id)
+
+
+class TTFARecorder(FrameProcessor):
+    """Records the time to first audio of each phrase."""
+
+    def __init__(self):
+        super().__init__()
+        self._requested_at: Dict[str, float] = {}
+        self.ttfas = []
+        self.stopped = asyncio.Event()
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, AggregatedTextFrame) and frame.context_id:
+            self._requested_at[frame.context_id] = time.perf_counter()
+        elif isinstance(frame, TTSAudioRawFrame) and frame.context_id in self._requested_at:
+            self.ttfas.append(time.perf_counter() - self._requested_at.pop(frame.context_id))
+        elif isinstance(frame, TTSStoppedFrame):
+            self.stopped.set()
+        await self.push_frame(frame, direction)
+
+
+async def run_call(script: list, cache: Optional[TTSPhraseCache], args, rng) -> tuple:
+    tts = SimulatedTTSService(ttfa=args.ttfa_ms / 1000, rng=rng, phrase_cache=cache)
+    recorder = TTFARecorder()
+    task = PipelineTask(
+        Pipeline([tts, recorder]), params=PipelineParams(), cancel_on_idle_timeout=False
+    )
+
+    async def play():
+        await asyncio.sleep(0.01)
+        for text in script:
+            recorder.stopped.clear()
+            await task.queue_frame(TTSSpeakFrame(text))
+            await recorder.stopped.wait()
+        await task.stop_when_done()
+
+    await asyncio.gather(PipelineRunner(handle_sigint=False).run(task), play())
+    return recorder.ttfas, tts.characters
+
+
+async def run_mode(mode: str, args, redis_entries: Dict[str, CachedTTSData]) -> dict:
+    cache = None
+    if mode != "off":
+        cache = TTSPhraseCache(
+            memory_max_bytes=args.memory_mb * 1024 * 1024,
+            cache_manager=SimulatedRedisCacheManager(args.redis_rtt_ms / 1000, redis_entries),
+        )
+
+    # Same calls in every mode.
+    rng = random.Random(7)
+    scripts = [call_script(rng) for _ in range(args.calls)]
+    ttfas, characters = [], 0
+
+    if cache:
+        tts = SimulatedTTSService(ttfa=args.ttfa_ms / 1000, rng=rng, phrase_cache=cache)
+        tts._sample_rate = SAMPLE_RATE
+        await asyncio.gather(*(tts.presynthesize(text) for text in FIXED_LINES))
+        characters += tts.characters
+    for start in range(0, args.calls, args.concurrency):
+        results = await asyncio.gather(
+            *(
+                run_call(script, cache, args, random.Random(start + i))
+                for i, script in enumerate(scripts[start : start + args.concurrency])
+            )
+        )
+        for call_ttfas, call_characters in results:
+            ttfas.extend(call_ttfas)
+            characters += call_characters
+
+    ttfas.sort()
+    stats = {}
+    if cache:
+        # Let the writes to Redis finish for the next worker.
+        await cache.disconnect()
+        stats = cache.stats
+    return {
+        "mode": mode,
+        "phrases": len(ttfas),
+        "hit_rate": stats.get("hit_rate", 0.0),
+        "redis_loads": stats.get("redis_loads", 0),
+        "p50_ms": ttfas[len(ttfas) // 2] * 1000,
+        "p90_ms": ttfas[int(len(ttfas) * 0.9)] * 1000,
+        "characters": characters,
+        "ttfa_saved_s": stats.get("ttfa_saved_seconds", 0.0),
+        "memory_mb": stats.get("memory_bytes", 0) / 1e6,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark the TTS phrase cache")
+    parser.add_argument("--calls", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--ttfa-ms", type=float, default=250.0, help="Provider time to first audio")
+    parser.add_argument("--redis-rtt-ms", type=float, default=1.0)
+    parser.add_argument("--memory-mb", type=int, default=64)
+    args = parser.parse_args()
+
+    redis_entries: Dict[str, CachedTTSData] = {}
+    results = []
+    for mode in ("off", "worker", "new-worker"):
+        results.append(await run_mode(mode, args, redis_entries))
+
+    print(
+        f"\nTTS phrase cache over {args.calls} calls ({args.concurrency} concurrent), "
+        f"{args.ttfa_ms:.0f}ms provider TTFA, {args.redis_rtt_ms:.1f}ms Redis RTT"
+    )
+    print(
+        f"{'mode':<10} {'phrases':>7} {'hit rate':>8} {'redis loads':>11} {'p50 ms':>7} "
+        f"{'p90 ms':>7} {'provider chars':>14} {'TTFA saved s':>12} {'memory MB':>9}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<10} {r['phrases']:>7} {r['hit_rate']:>8.0%} {r['redis_loads']:>11} "
+            f"{r['p50_ms']:>7.0f} {r['p90_ms']:>7.0f} "
+            f"{r['characters']:>14} {r['ttfa_saved_s']:>12.1f} {r['memory_mb']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Workflow TTS Pre-synthesis Benchmark.
+
+Plays simulated calls through a TTS service with the phrase cache and compares
+synthesizing the fixed messages of the workflow when they're spoken
+(``phrase-cache``) with synthesizing them in the background at call setup
+(``presynthesis``, as ``start_workflow_presynthesis`` does).
+
+Each call speaks a greeting as soon as it starts and, after ``--call-secs``
+(with jitter), the goodbye of its end call tool ("Thanks {{first_name}}, ...",
+rendered for each caller) or, for ``--transfer-rate`` of the calls, the
+announcement of its transfer call tool. The simulated provider has a time to
+first audio of ``--ttfa-ms`` (with jitter).
+
+It reports the time to first audio (from the text reaching the TTS service
+until its first audio frame leaves it) of the call start and of the tool
+messages and the characters sent to the provider (which include the messages
+presynthesized but not spoken).
+
+Usage:
+    python -m evals.perf.tts_presynthesis
+    python -m evals.perf.tts_presynthesis --calls 100 --concurrency 20 --ttfa-ms 300
+"""
+
+import argparse
+import asyncio
+import random
+from typing import Optional
+
+from api.services.pipecat.tts_presynthesis import presynthesize_utterances
+from api.utils.template_renderer import render_template
+from evals.perf.tts_phrase_cache import GREETING, SimulatedTTSService, TTFARecorder
+from pipecat.frames.frames import TTSSpeakFrame
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.services.tts_cache import TTSPhraseCache
+
+GOODBYE = "Thanks {{first_name}}, have a great rest of your day!"
+TRANSFER = "Please hold while I transfer you to a specialist."
+NAMES = ["Ada", "Grace", "Alan", "Edsger", "Barbara", "Donald", "Frances", "Ken", "Leslie"]
+
+
+async def run_call(index: int, cache: TTSPhraseCache, presynthesis: bool, args) -> dict:
+    rng = random.Random(index)
+    context = {"first_name": f"{rng.choice(NAMES)} {index}"}
+    messages = [render_template(GOODBYE, context), render_template(TRANSFER, context)]
+    spoken = messages[1] if rng.random() < args.transfer_rate else messages[0]
+
+    tts = SimulatedTTSService(ttfa=args.ttfa_ms / 1000, rng=rng, phrase_cache=cache)
+    recorder = TTFARecorder()
+    task = PipelineTask(
+        Pipeline([tts, recorder]), params=PipelineParams(), cancel_on_idle_timeout=False
+    )
+    background: Optional[asyncio.Task] = None
+
+    async def speak(text: str):
+        recorder.stopped.clear()
+        await task.queue_frame(TTSSpeakFrame(text))
+        await recorder.stopped.wait()
+
+    @task.event_handler("on_pipeline_started")
+    async def on_pipeline_started(_task, _frame):
+        nonlocal background
+        if presynthesis:
+            background = asyncio.create_task(presynthesize_utterances(tts, messages))
+
+    async def play():
+        await asyncio.sleep(0.01)
+        await speak(GREETING)
+        await asyncio.sleep(args.call_secs * rng.uniform(0.5, 1.5))
+        await speak(spoken)
+        if background:
+            await background
+        await task.stop_when_done()
+
+    await asyncio.gather(PipelineRunner(handle_sigint=False).run(task), play())
+    return {
+        "start_ttfa": recorder.ttfas[0],
+        "message_ttfa": recorder.ttfas[1],
+        "characters": tts.characters,
+    }
+
+
+async def run_mode(mode: str, args) -> dict:
+    cache = TTSPhraseCache(memory_max_bytes=args.memory_mb * 1024 * 1024)
+    results = []
+    for start in range(0, args.calls, args.concurrency):
+        results.extend(
+            await asyncio.gather(
+                *(
+                    run_call(i, cache, mode == "presynthesis", args)
+                    for i in range(start, min(args.calls, start + args.concurrency))
+                )
+            )
+        )
+
+    def p(key: str, q: float) -> float:
+        values = sorted(r[key] for r in results)
+        return values[min(len(values) - 1, int(len(values) * q))] * 1000
+
+    return {
+        "mode": mode,
+        "start_p50_ms": p("start_ttfa", 0.5),
+        "message_p50_ms": p("message_ttfa", 0.5),
+        "message_p90_ms": p("message_ttfa", 0.9),
+        "characters": sum(r["characters"] for r in results),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark workflow TTS pre-synthesis")
+    parser.add_argument("--calls", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--ttfa-ms", type=float, default=250.0, help="Provider time to first audio")
+    parser.add_argument("--call-secs", type=float, default=1.0, help="Time until the tool runs")
+    parser.add_argument("--transfer-rate", type=float, default=0.3)
+    parser.add_argument("--memory-mb", type=int, default=64)
+    args = parser.parse_args()
+
+    results = [await run_mode(mode, args) for mode in ("phrase-cache", "presynthesis")]
+
+    print(
+        f"\nWorkflow TTS pre-synthesis over {args.calls} calls ({args.concurrency} concurrent), "
+        f"{args.ttfa_ms:.0f}ms provider TTFA, {args.transfer_rate:.0%} transfers"
+    )
+    print(
+        f"{'mode':<13} {'start p50 ms':>12} {'message p50 ms':>14} {'message p90 ms':>14} "
+        f"{'provider chars':>14}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<13} {r['start_p50_ms']:>12.0f} {r['message_p50_ms']:>14.0f} "
+            f"{r['message_p90_ms']:>14.0f} {r['characters']:>14}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""Turn-Taking Benchmark.
+
+Replays labeled user audio in real time through the VAD and the user turn
+strategies the voice pipeline uses (``VADProcessor`` and ``UserTurnProcessor``
+with ``UserTurnStrategies``), with a mock STT that returns the transcript of
+each speech segment ``--stt-ms`` after the VAD stops, and compares the stop
+strategies: ``speech-timeout`` (``SpeechTimeoutUserTurnStopStrategy``) and
+``smart-turn`` (``TurnAnalyzerUserTurnStopStrategy`` with
+``LocalSmartTurnAnalyzerV3``).
+
+Each stream plays the same seeded session of user turns: single utterances,
+turns with a pause mid-turn (``--pause-rate``) and barge-ins while the bot is
+speaking (``--barge-in-rate``). Utterances are the short clips in
+``evals/stt/audio`` (``--source clips``, needs ``ffmpeg``) or synthetic tone
+bursts (``--source tones``, to be used with ``--vad energy``).
+
+It reports the end-of-turn latency (from the end of the user's last word until
+the user turn stops), false cut-offs (turns stopped during a mid-turn pause),
+missed end of turns, missed interruptions (barge-ins that never started a user
+turn) and the CPU used per stream as a share of one core. Use ``--json`` to
+save the results with their parameters to compare them across commits.
+
+Usage:
+    python -m evals.perf.turn_taking
+    python -m evals.perf.turn_taking --vad-stop-secs 0.3 --smart-turn-stop-secs 2 --streams 8
+    python -m evals.perf.turn_taking --source tones --vad energy --stop speech-timeout
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from pipecat.audio.turn.smart_turn.base_smart_turn import SmartTurnParams
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams
+from pipecat.frames.frames import (
+    BotStartedSpeakingFrame,
+    BotStoppedSpeakingFrame,
+    Frame,
+    InputAudioRawFrame,
+    TranscriptionFrame,
+    VADUserStoppedSpeakingFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.audio.vad_processor import VADProcessor
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.turns.user_start import (
+    MinWordsUserTurnStartStrategy,
+    TranscriptionUserTurnStartStrategy,
+    VADUserTurnStartStrategy,
+)
+from pipecat.turns.user_stop import (
+    SpeechTimeoutUserTurnStopStrategy,
+    TurnAnalyzerUserTurnStopStrategy,
+)
+from pipecat.turns.user_turn_processor import UserTurnProcessor
+from pipecat.turns.user_turn_strategies import UserTurnStrategies
+
+AUDIO_DIR = Path(__file__).parent.parent / "stt" / "audio"
+# Short single-utterance clips and their transcripts.
+CLIPS = {"yes.m4a": "Yes.", "nope.m4a": "Nope.", "not_so_sure.m4a": "Not so sure."}
+CHUNK_SECS = 0.02
+
+
+@dataclass
+class Utterance:
+    audio: bytes
+    text: str
+
+
+@dataclass
+class Turn:
+    """A labeled user turn: speech segments separated by mid-turn pauses."""
+
+    start: float
+    end: float
+    segments: list = field(default_factory=list)  # (start, end, text)
+    barge_in: bool = False
+
+
+@dataclass
+class Session:
+    audio: bytes
+    duration: float
+    turns: list
+    bot_speaking: list  # (start, end)
+
+
+class EnergyVADAnalyzer(VADAnalyzer):
+    """Energy threshold VAD, for synthetic audio and machines without onnxruntime."""
+
+    def num_frames_required(self) -> int:
+        return int(self.sample_rate * 0.02)
+
+    def voice_confidence(self, buffer: bytes) -> float:
+        samples = np.frombuffer(buffer, dtype=np.int16).astype(np.float32) / 32768
+        rms = float(np.sqrt(np.mean(samples**2))) if samples.size else 0.0
+        return 1.0 if rms > 0.02 else 0.0
+
+
+def trim_silence(pcm: bytes, sample_rate: int) -> bytes:
+    """Drop leading and trailing silence so labels match the spoken words."""
+    samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+    window = int(sample_rate * 0.02)
+    count = len(samples) // window
+    rms = np.sqrt(np.mean(samples[: count * window].reshape(count, window) ** 2, axis=1))
+    voiced = np.nonzero(rms > rms.max() * 0.1)[0]
+    return samples[voiced[0] * window : (voiced[-1] + 1) * window].astype(np.int16).tobytes()
+
+
+def load_clips(sample_rate: int) -> list:
+    from evals.stt.audio_streamer import AudioConfig, AudioStreamer
+
+    streamer = AudioStreamer(AudioConfig(sample_rate=sample_rate))
+    return [
+        Utterance(trim_silence(streamer.convert_to_pcm16(AUDIO_DIR / name), sample_rate), text)
+        for name, text in CLIPS.items()
+    ]
+
+
+def make_tones(sample_rate: int, rng: random.Random) -> list:
+    """Voiced-like harmonic bursts with a syllable-rate envelope."""
+    utterances = []
+    for _ in range(6):
+        duration = rng.uniform(0.4, 1.6)
+        t = np.arange(int(duration * sample_rate)) / sample_rate
+        f0 = rng.uniform(100, 220)
+        voice = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 5))
+        envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 4 * t) ** 2
+        samples = voice * envelope / np.abs(voice).max() * 0.3 * 32767
+        words = " ".join(["word"] * max(1, round(duration * 3)))
+        utterances.append(Utterance(samples.astype(np.int16).tobytes(), f"{words}."))
+    return utterances
+
+
+def make_session(utterances: list, args) -> Session:
+    """Build the labeled session played by every stream."""
+    rng = random.Random(args.seed)
+    rate = args.sample_rate
+    noise = np.random.default_rng(args.seed)
+
+    chunks = []
+    pos = 0.0
+
+    def silence(secs: float):
+        nonlocal pos
+        samples = noise.normal(0, 30, int(secs * rate)).astype(np.int16)
+        chunks.append(samples.tobytes())
+        pos += len(samples) / rate
+
+    def speak(utterance: Utterance, turn: Turn):
+        nonlocal pos
+        start = pos
+        chunks.append(utterance.audio)
+        pos += len(utterance.audio) / 2 / rate
+        turn.segments.append((start, pos, utterance.text))
+
+    turns = []
+    bot_speaking = []
+    silence(1.0)
+    for _ in range(args.turns):
+        barge_in = rng.random() < args.barge_in_rate
+        if barge_in:
+            # The bot has been talking for a while when the user cuts in.
+            bot_start = pos
+            silence(rng.uniform(0.8, 2.0))
+        turn = Turn(start=pos, end=pos, barge_in=barge_in)
+        speak(rng.choice(utterances), turn)
+        if rng.random() < args.pause_rate:
+            silence(rng.uniform(args.pause_min_secs, args.pause_max_secs))
+            speak(rng.choice(utterances), turn)
+        turn.end = pos
+        if barge_in:
+            bot_speaking.append((bot_start, turn.end))
+        turns.append(turn)
+        silence(args.turn_gap_secs)
+
+    audio = b"".join(chunks)
+    return Session(
+        audio=audio, duration=len(audio) / 2 / rate, turns=turns, bot_speaking=bot_speaking
+    )
+
+
+class MockSTTService(FrameProcessor):
+    """Returns the transcript of the segments that ended when the VAD stops."""
+
+    def __init__(self, session: Session, clock, stt_secs: float):
+        super().__init__()
+        self._segments = [segment for turn in session.turns for segment in turn.segments]
+        self._audio_clock = clock
+        self._stt_secs = stt_secs
+        self._next_segment = 0
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        await self.push_frame(frame, direction)
+        if (
+            isinstance(frame, VADUserStoppedSpeakingFrame)
+            and direction == FrameDirection.DOWNSTREAM
+        ):
+            now = self._audio_clock()
+            texts = []
+            while (
+                self._next_segment < len(self._segments)
+                and self._segments[self._next_segment][1] <= now
+            ):
+                texts.append(self._segments[self._next_segment][2])
+                self._next_segment += 1
+            if texts:
+                self.create_task(self._transcribe(" ".join(texts)))
+
+    async def _transcribe(self, text: str):
+        await asyncio.sleep(self._stt_secs)
+        await self.push_frame(
+            TranscriptionFrame(text=text, user_id="", timestamp="", finalized=True)
+        )
+
+
+def make_vad(args) -> VADAnalyzer:
+    params = VADParams(
+        confidence=args.vad_confidence,
+        start_secs=args.vad_start_secs,
+        stop_secs=args.vad_stop_secs,
+        min_volume=args.vad_min_volume,
+    )
+    if args.vad == "energy":
+        return EnergyVADAnalyzer(params=params)
+    from pipecat.audio.vad.silero import SileroVADAnalyzer
+
+    return SileroVADAnalyzer(params=params)
+
+
+def make_strategies(stop: str, args) -> UserTurnStrategies:
+    if args.min_words:
+        start = [MinWordsUserTurnStartStrategy(min_words=args.min_words)]
+    else:
+        start = [VADUserTurnStartStrategy(), TranscriptionUserTurnStartStrategy()]
+    if stop == "smart-turn":
+        from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
+
+        analyzer = LocalSmartTurnAnalyzerV3(
+            params=SmartTurnParams(stop_secs=args.smart_turn_stop_secs)
+        )
+        return UserTurnStrategies(
+            start=start, stop=[TurnAnalyzerUserTurnStopStrategy(turn_analyzer=analyzer)]
+        )
+    return UserTurnStrategies(
+        start=start,
+        stop=[SpeechTimeoutUserTurnStopStrategy(user_speech_timeout=args.user_speech_timeout)],
+    )
+
+
+async def run_stream(stop: str, session: Session, args) -> tuple:
+    """Play the session through one pipeline and return the turn start/stop times."""
+    started_at = None
+    starts, stops = [], []
+
+    def clock() -> float:
+        return time.monotonic() - started_at
+
+    turns = UserTurnProcessor(user_turn_strategies=make_strategies(stop, args))
+
+    @turns.event_handler("on_user_turn_started")
+    async def on_user_turn_started(processor, strategy):
+        starts.append(clock())
+
+    @turns.event_handler("on_user_turn_stopped")
+    async def on_user_turn_stopped(processor, strategy):
+        stops.append(clock())
+
+    task = PipelineTask(
+        Pipeline(
+            [
+                VADProcessor(vad_analyzer=make_vad(args)),
+                MockSTTService(session, clock, args.stt_ms / 1000),
+                turns,
+            ]
+        ),
+        params=PipelineParams(audio_in_sample_rate=args.sample_rate),
+        cancel_on_idle_timeout=False,
+    )
+
+    async def play():
+        nonlocal started_at
+        await asyncio.sleep(0.1)
+        chunk_bytes = int(args.sample_rate * CHUNK_SECS) * 2
+        bot_events = sorted(
+            [(start, BotStartedSpeakingFrame) for start, _ in session.bot_speaking]
+            + [(end, BotStoppedSpeakingFrame) for _, end in session.bot_speaking]
+        )
+        started_at = time.monotonic()
+        for index, offset in enumerate(range(0, len(session.audio), chunk_bytes)):
+            audio_time = index * CHUNK_SECS
+            while bot_events and bot_events[0][0] <= audio_time:
+                await task.queue_frame(bot_events.pop(0)[1]())
+            await task.queue_frame(
+                InputAudioRawFrame(
+                    audio=session.audio[offset : offset + chunk_bytes],
+                    sample_rate=args.sample_rate,
+                    num_channels=1,
+                )
+            )
+            await asyncio.sleep(max(0.0, started_at + audio_time + CHUNK_SECS - time.monotonic()))
+        await task.stop_when_done()
+
+    await asyncio.gather(PipelineRunner(handle_sigint=False).run(task), play())
+    return starts, stops
+
+
+def score(session: Session, starts: list, stops: list) -> dict:
+    """Match turn start/stop times against the session labels."""
+    latencies = []
+    cut_offs = missed_ends = barge_ins = missed_interruptions = 0
+    for index, turn in enumerate(session.turns):
+        next_start = (
+            session.turns[index + 1].start if index + 1 < len(session.turns) else session.duration
+        )
+        turn_stops = [t for t in stops if turn.start < t < next_start]
+        if any(t < turn.end for t in turn_stops):
+            cut_offs += 1
+        late_stops = [t for t in turn_stops if t >= turn.end]
+        if late_stops:
+            latencies.append(late_stops[0] - turn.end)
+        else:
+            missed_ends += 1
+        if turn.barge_in:
+            barge_ins += 1
+            if not any(turn.start <= t <= turn.end for t in starts):
+                missed_interruptions += 1
+    return {
+        "latencies": latencies,
+        "cut_offs": cut_offs,
+        "missed_ends": missed_ends,
+        "barge_ins": barge_ins,
+        "missed_interruptions": missed_interruptions,
+    }
+
+
+async def run_mode(stop: str, session: Session, args) -> dict:
+    cpu_started = time.process_time()
+    streams = await asyncio.gather(*(run_stream(stop, session, args) for _ in range(args.streams)))
+    cpu_seconds = time.process_time() - cpu_started
+
+    scores = [score(session, starts, stops) for starts, stops in streams]
+    latencies = sorted(latency for s in scores for latency in s["latencies"])
+    turns = len(session.turns) * args.streams
+
+    def percentile(q: float) -> float:
+        return (
+            latencies[min(len(latencies) - 1, int(len(latencies) * q))] * 1000 if latencies else 0.0
+        )
+
+    return {
+        "mode": stop,
+        "turns": turns,
+        "eot_p50_ms": percentile(0.5),
+        "eot_p90_ms": percentile(0.9),
+        "false_cut_offs": sum(s["cut_offs"] for s in scores),
+        "missed_ends": sum(s["missed_ends"] for s in scores),
+        "barge_ins": sum(s["barge_ins"] for s in scores),
+        "missed_interruptions": sum(s["missed_interruptions"] for s in scores),
+        "cpu_pct_per_stream": cpu_seconds / args.streams / session.duration * 100,
+    }
+
+
+def git_commit() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark VAD and user turn stop strategies")
+    parser.add_argument("--stop", nargs="+", default=["speech-timeout", "smart-turn"])
+    parser.add_argument("--source", choices=["clips", "tones"], default="clips")
+    parser.add_argument("--vad", choices=["silero", "energy"], default="silero")
+    parser.add_argument("--turns", type=int, default=10, help="User turns per session")
+    parser.add_argument("--streams", type=int, default=4, help="Concurrent sessions")
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--pause-rate", type=float, default=0.4)
+    parser.add_argument("--pause-min-secs", type=float, default=0.3)
+    parser.add_argument("--pause-max-secs", type=float, default=1.2)
+    parser.add_argument("--barge-in-rate", type=float, default=0.3)
+    parser.add_argument("--turn-gap-secs", type=float, default=4.0)
+    parser.add_argument("--stt-ms", type=float, default=150.0, help="Mock STT finalization delay")
+    parser.add_argument("--vad-confidence", type=float, default=0.7)
+    parser.add_argument("--vad-start-secs", type=float, default=0.2)
+    parser.add_argument("--vad-stop-secs", type=float, default=0.2)
+    parser.add_argument("--vad-min-volume", type=float, default=0.6)
+    parser.add_argument("--user-speech-timeout", type=float, default=0.6)
+    parser.add_argument("--smart-turn-stop-secs", type=float, default=3.0)
+    parser.add_argument("--min-words", type=int, default=0, help="Use MinWords turn start")
+    parser.add_argument("--json", type=Path, help="Save parameters and results to this file")
+    args = parser.parse_args()
+
+    if args.source == "clips":
+        utterances = load_clips(args.sample_rate)
+    else:
+        utterances = make_tones(args.sample_rate, random.Random(args.seed))
+    session = make_session(utterances, args)
+
+    results = []
+    for stop in args.stop:
+        try:
+            make_strategies(stop, args)
+        except Exception as e:
+            print(f"Skipping {stop}: {e}")
+            continue
+        results.append(await run_mode(stop, session, args))
+
+    print(
+        f"\nTurn taking over {args.streams} streams of {len(session.turns)} turns "
+        f"({session.duration:.0f}s, {args.source}, {args.vad} VAD, stop_secs {args.vad_stop_secs})"
+    )
+    print(
+        f"{'mode':<15} {'turns':>5} {'eot p50 ms':>10} {'eot p90 ms':>10} {'cut-offs':>8} "
+        f"{'missed eot':>10} {'missed int':>10} {'cpu %/stream':>12}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<15} {r['turns']:>5} {r['eot_p50_ms']:>10.0f} {r['eot_p90_ms']:>10.0f} "
+            f"{r['false_cut_offs']:>8} {r['missed_ends']:>10} "
+            f"{r['missed_interruptions']:>4}/{r['barge_ins']:<5} {r['cpu_pct_per_stream']:>12.2f}"
+        )
+
+    if args.json:
+        params = {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()}
+        args.json.write_text(
+            json.dumps({"commit": git_commit(), "params": params, "results": results}, indent=2)
+        )
+        print(f"\nSaved to {args.json}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
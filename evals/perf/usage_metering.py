@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Usage Metering Benchmark.
+
+Records many concurrent run completions for one organization and compares the
+previous row-locked update of the organization's usage cycle (``SELECT ... FOR
+UPDATE`` then increment, one transaction per completion) with appending to the
+usage ledger (``OrganizationUsageClient.update_usage_after_run``).
+
+For every concurrency level it reports completions per second and per-completion
+latency (p50 / p99), and for the ledger the time taken to fold the appended
+events into the cycle row.
+
+Needs a PostgreSQL database with the current schema (``alembic upgrade head``)
+at ``DATABASE_URL``. A scratch organization is created and deleted.
+
+Usage:
+    python -m evals.perf.usage_metering
+    python -m evals.perf.usage_metering --concurrency 50 100 --completions 2000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from api.constants import DATABASE_URL
+from api.db.models import (
+    OrganizationModel,
+    OrganizationUsageCycleModel,
+    OrganizationUsageEventModel,
+)
+from api.db.organization_usage_client import OrganizationUsageClient
+
+
+async def _locked_update(client: OrganizationUsageClient, organization_id: int):
+    """The cycle update as done before the ledger: one row lock per completion."""
+    async with client.async_session() as session:
+        cycle = await client._get_or_create_current_cycle_impl(
+            organization_id, session, commit=False
+        )
+        result = await session.execute(
+            select(OrganizationUsageCycleModel)
+            .where(OrganizationUsageCycleModel.id == cycle.id)
+            .with_for_update(skip_locked=False)
+        )
+        cycle_locked = result.scalar_one()
+        cycle_locked.used_dograh_tokens += 10
+        cycle_locked.total_duration_seconds += 60
+        cycle_locked.used_amount_usd = (cycle_locked.used_amount_usd or 0) + 0.1
+        await session.commit()
+
+
+async def _ledger_update(client: OrganizationUsageClient, organization_id: int):
+    await client.update_usage_after_run(organization_id, 10, 60, 0.1)
+
+
+async def run_config(
+    client: OrganizationUsageClient,
+    organization_id: int,
+    mode: str,
+    concurrency: int,
+    completions: int,
+) -> dict:
+    record = _locked_update if mode == "row lock" else _ledger_update
+    latencies = []
+    remaining = iter(range(completions))
+
+    async def worker():
+        for _ in remaining:
+            started = time.perf_counter()
+            await record(client, organization_id)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    fold_ms = 0.0
+    if mode == "ledger":
+        fold_started = time.perf_counter()
+        while await client.fold_usage_events():
+            pass
+        fold_ms = (time.perf_counter() - fold_started) * 1000
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "mode": mode,
+        "per_sec": completions / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+        "fold_ms": fold_ms,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark organization usage metering")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[50, 100])
+    parser.add_argument("--completions", type=int, default=2000, help="Completions per config")
+    args = parser.parse_args()
+
+    client = OrganizationUsageClient()
+    # One connection per concurrent completion, so the database is the bottleneck
+    client.engine = create_async_engine(
+        DATABASE_URL, pool_size=max(args.concurrency), max_overflow=0
+    )
+    client.async_session = async_sessionmaker(bind=client.engine)
+
+    async with client.async_session() as session:
+        org = OrganizationModel(provider_id=f"perf-usage-{uuid.uuid4()}")
+        session.add(org)
+        await session.flush()
+        organization_id = org.id
+        await session.commit()
+
+    results = []
+    try:
+        for concurrency in args.concurrency:
+            for mode in ("row lock", "ledger"):
+                results.append(
+                    await run_config(client, organization_id, mode, concurrency, args.completions)
+                )
+    finally:
+        async with client.async_session() as session:
+            for model in (OrganizationUsageEventModel, OrganizationUsageCycleModel):
+                await session.execute(delete(model).where(model.organization_id == organization_id))
+            await session.execute(
+                delete(OrganizationModel).where(OrganizationModel.id == organization_id)
+            )
+            await session.commit()
+        await client.engine.dispose()
+
+    print(f"\nUsage metering, {args.completions} completions per config, one organization")
+    print(
+        f"{'conc':>5} {'mode':<9} {'completions/s':>13} {'p50 ms':>8} {'p99 ms':>8} {'fold ms':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['concurrency']:>5} {r['mode']:<9} {r['per_sec']:>13.0f} {r['p50_ms']:>8.2f} "
+            f"{r['p99_ms']:>8.2f} {r['fold_ms']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
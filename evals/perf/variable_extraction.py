@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Variable Extraction Benchmark.
+
+Replays a synthetic long call through ``VariableExtractionManager`` with a fake
+LLM and compares:
+
+- ``full``: every node transition re-sends the whole conversation (previous
+  behavior)
+- ``incremental``: only the turns since the previous extraction plus the
+  current values are sent
+- ``incremental+batched``: background extractions of rapid transitions are
+  debounced into one request
+
+The call has ``--nodes`` extraction-enabled nodes with ``--turns`` exchanges
+each. Every node extracts the shared variables (e.g. caller name, disposition)
+plus its own; variables seen for the first time need the whole conversation
+even in incremental mode. Every ``--rapid-every``-th node is left right away (no conversation in
+between), as happens with routing nodes.
+
+It reports LLM requests, prompt tokens (estimated as characters / 4) and the
+extraction latency of the modeled LLM (``--base-ms`` + ``--ms-per-1k-tokens``
+per request).
+
+Usage:
+    python -m evals.perf.variable_extraction
+    python -m evals.perf.variable_extraction --nodes 20 --turns 10
+"""
+
+import argparse
+import asyncio
+import json
+from types import SimpleNamespace
+
+from api.services.workflow.dto import ExtractionVariableDTO
+from api.services.workflow.pipecat_engine_variable_extractor import (
+    VariableExtractionManager,
+)
+from pipecat.processors.aggregators.llm_context import LLMContext
+
+UTTERANCE = (
+    "I would like to check the status of my claim, the one I opened after the storm "
+    "last month, and also update the phone number on file."
+)
+
+
+class FakeLLM:
+    """Counts prompt tokens and models latency; answers with fixed values."""
+
+    def __init__(self, base_ms: float, ms_per_1k_tokens: float):
+        self.base_ms = base_ms
+        self.ms_per_1k_tokens = ms_per_1k_tokens
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.latency_ms = 0.0
+
+    async def run_inference(self, context: LLMContext):
+        tokens = sum(len(m["content"]) for m in context.messages) // 4
+        self.requests += 1
+        self.prompt_tokens += tokens
+        self.latency_ms += self.base_ms + tokens / 1000 * self.ms_per_1k_tokens
+        names = [
+            line[2:].split(" ")[0]
+            for line in context.messages[1]["content"].splitlines()
+            if line.startswith("- ")
+        ]
+        return json.dumps({name: f"value of {name}" for name in names})
+
+
+async def run_mode(mode: str, args) -> dict:
+    llm = FakeLLM(args.base_ms, args.ms_per_1k_tokens)
+    engine = SimpleNamespace(context=LLMContext(), llm=llm, _gathered_context={})
+    manager = VariableExtractionManager(engine, incremental=mode != "full", debounce_secs=0.01)
+
+    for node in range(args.nodes):
+        rapid = args.rapid_every and node % args.rapid_every == args.rapid_every - 1
+        if not rapid:
+            for turn in range(args.turns):
+                engine.context.add_message(
+                    {"role": "assistant", "content": f"Node {node} question {turn}?"}
+                )
+                engine.context.add_message({"role": "user", "content": UTTERANCE})
+
+        variables = [
+            ExtractionVariableDTO(name=f"shared_var{i}", type="string", prompt="A detail")
+            for i in range(args.shared_variables)
+        ] + [
+            ExtractionVariableDTO(name=f"node{node}_var{i}", type="string", prompt="A detail")
+            for i in range(args.node_variables)
+        ]
+        if mode == "incremental+batched":
+            manager.schedule(variables, None)
+            if not rapid:
+                # The next node's conversation takes longer than the debounce
+                await asyncio.sleep(0.02)
+        else:
+            await manager.extract_now(variables, None)
+
+    # Final extraction at the end of the call
+    await manager.extract_now(variables, None)
+
+    return {
+        "mode": mode,
+        "requests": llm.requests,
+        "prompt_tokens": llm.prompt_tokens,
+        "latency_ms": llm.latency_ms,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark variable extraction")
+    parser.add_argument("--nodes", type=int, default=12, help="Extraction-enabled nodes")
+    parser.add_argument("--turns", type=int, default=8, help="Exchanges per node")
+    parser.add_argument(
+        "--shared-variables", type=int, default=2, help="Variables extracted at every node"
+    )
+    parser.add_argument(
+        "--node-variables", type=int, default=1, help="Variables specific to each node"
+    )
+    parser.add_argument("--rapid-every", type=int, default=3)
+    parser.add_argument("--base-ms", type=float, default=300.0)
+    parser.add_argument("--ms-per-1k-tokens", type=float, default=150.0)
+    args = parser.parse_args()
+
+    results = [
+        await run_mode(mode, args) for mode in ("full", "incremental", "incremental+batched")
+    ]
+
+    baseline = results[0]
+    print(
+        f"\nVariable extraction, {args.nodes} nodes x {args.turns} exchanges, "
+        f"{args.shared_variables} shared + {args.node_variables} node-specific variables"
+    )
+    print(
+        f"{'mode':<20} {'requests':>8} {'prompt tokens':>13} {'tokens vs full':>14} "
+        f"{'LLM ms':>8} {'ms vs full':>10}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<20} {r['requests']:>8} {r['prompt_tokens']:>13} "
+            f"{r['prompt_tokens'] / baseline['prompt_tokens']:>13.0%} "
+            f"{r['latency_ms']:>8.0f} {r['latency_ms'] / baseline['latency_ms']:>9.0%}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
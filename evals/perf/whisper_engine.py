@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Local Whisper Concurrency Benchmark.
+
+Simulates concurrent calls transcribing user segments with Faster Whisper on
+CPU and compares the previous service behavior (``per-call``: one
+``WhisperModel`` per call, each segment transcribed on its own with the
+decoding loop run on the event loop) with the shared engine (``shared``: one
+model for the process, concurrent segments decoded in batches).
+
+Each call sends ``--segments`` user segments of ``--segment-secs`` seconds, one
+every ``--turn-secs`` seconds with a random offset, so segments of different
+calls overlap. It reports the models loaded and the resident memory they
+added, segments/s, the segment latency (from the end of the segment until its
+transcript), the time spent waiting for the engine vs decoding, and the event
+loop lag.
+
+Needs ``faster-whisper``; ``--audio`` needs ``ffmpeg`` (otherwise a synthetic
+voiced signal is used).
+
+Usage:
+    python -m evals.perf.whisper_engine
+    python -m evals.perf.whisper_engine --model base --calls 4 16 --compute-type int8
+    python -m evals.perf.whisper_engine --audio evals/stt/audio/billing_department.m4a
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from pathlib import Path
+
+import numpy as np
+
+from pipecat.services.whisper.engine import SAMPLE_RATE, WhisperEngine, WhisperEngineParams
+
+
+def rss_mb() -> float:
+    """Resident memory of the process (Linux only, 0 elsewhere)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except OSError:
+        return 0.0
+
+
+def load_audio(args) -> np.ndarray:
+    if args.audio:
+        from evals.stt.audio_streamer import AudioConfig, AudioStreamer
+
+        pcm = AudioStreamer(AudioConfig(sample_rate=SAMPLE_RATE)).convert_to_pcm16(args.audio)
+        return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+    t = np.arange(int(30 * SAMPLE_RATE)) / SAMPLE_RATE
+    voice = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 5))
+    return (voice * (0.6 + 0.4 * np.sin(2 * np.pi * 4 * t) ** 2) * 0.1).astype(np.float32)
+
+
+def make_segments(audio: np.ndarray, args, rng: random.Random) -> list:
+    samples = int(args.segment_secs * SAMPLE_RATE)
+    segments = []
+    for _ in range(args.segments):
+        start = rng.randrange(0, max(1, len(audio) - samples))
+        segments.append(audio[start : start + samples])
+    return segments
+
+
+async def measure_loop_lag(stop: asyncio.Event, lags: list):
+    while not stop.is_set():
+        started = time.monotonic()
+        await asyncio.sleep(0.01)
+        lags.append(time.monotonic() - started - 0.01)
+
+
+async def run_mode(mode: str, calls: int, audio: np.ndarray, args) -> dict:
+    from faster_whisper import WhisperModel
+
+    rss_before = rss_mb()
+    if mode == "per-call":
+        models = [
+            WhisperModel(args.model, device="cpu", compute_type=args.compute_type)
+            for _ in range(calls)
+        ]
+        engine = None
+    else:
+        engine = WhisperEngine(
+            args.model,
+            device="cpu",
+            compute_type=args.compute_type,
+            params=WhisperEngineParams(max_batch_size=args.max_batch_size),
+        )
+        models = [engine.model]
+    rss_added = rss_mb() - rss_before
+
+    rng = random.Random(7)
+    latencies, waits, decodes = [], [], []
+
+    async def call(index: int):
+        model = models[index] if mode == "per-call" else None
+        for i, segment in enumerate(make_segments(audio, args, rng)):
+            await asyncio.sleep(
+                max(0.0, start + i * args.turn_secs + rng.uniform(0, 0.5) - time.monotonic())
+            )
+            ended = time.monotonic()
+            if mode == "per-call":
+                segments, _ = await asyncio.to_thread(model.transcribe, segment, language="en")
+                # Segments are decoded lazily, here on the event loop as the service did.
+                text = ""
+                for s in segments:
+                    text += f"{s.text} "
+            else:
+                result = await engine.transcribe(segment, language="en", no_speech_prob=0.4)
+                waits.append(result.queue_wait)
+                decodes.append(result.decode_time)
+            latencies.append(time.monotonic() - ended)
+
+    stop = asyncio.Event()
+    lags = []
+    lag_task = asyncio.create_task(measure_loop_lag(stop, lags))
+    start = time.monotonic() + 0.1
+    await asyncio.gather(*(call(i) for i in range(calls)))
+    elapsed = time.monotonic() - start
+    stop.set()
+    await lag_task
+
+    def p(values: list, q: float) -> float:
+        values = sorted(values)
+        return values[min(len(values) - 1, int(len(values) * q))] * 1000 if values else 0.0
+
+    return {
+        "mode": mode,
+        "calls": calls,
+        "models": len(models),
+        "rss_mb": rss_added,
+        "segments_per_s": len(latencies) / elapsed,
+        "p50_ms": p(latencies, 0.5),
+        "p90_ms": p(latencies, 0.9),
+        "wait_p50_ms": p(waits, 0.5),
+        "decode_p50_ms": p(decodes, 0.5),
+        "loop_lag_max_ms": max(lags, default=0.0) * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark local Whisper under concurrent calls")
+    parser.add_argument("--model", default="tiny")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--calls", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--segments", type=int, default=5, help="Segments per call")
+    parser.add_argument("--segment-secs", type=float, default=2.5)
+    parser.add_argument("--turn-secs", type=float, default=3.0, help="Time between segments")
+    parser.add_argument("--max-batch-size", type=int, default=8)
+    parser.add_argument("--audio", type=Path)
+    args = parser.parse_args()
+
+    audio = load_audio(args)
+    results = []
+    for calls in args.calls:
+        for mode in ("per-call", "shared"):
+            results.append(await run_mode(mode, calls, audio, args))
+
+    print(
+        f"\nLocal Whisper ({args.model}, {args.compute_type}) on CPU, {args.segments} segments of "
+        f"{args.segment_secs}s per call"
+    )
+    print(
+        f"{'mode':<9} {'calls':>5} {'models':>6} {'rss MB':>7} {'seg/s':>6} {'p50 ms':>7} "
+        f"{'p90 ms':>7} {'wait ms':>7} {'decode ms':>9} {'loop lag ms':>11}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<9} {r['calls']:>5} {r['models']:>6} {r['rss_mb']:>7.0f} "
+            f"{r['segments_per_s']:>6.2f} {r['p50_ms']:>7.0f} {r['p90_ms']:>7.0f} "
+            f"{r['wait_p50_ms']:>7.0f} {r['decode_p50_ms']:>9.0f} {r['loop_lag_max_ms']:>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Workflow Compilation Benchmark.
+
+Walks simulated calls through a ``--nodes`` node workflow with
+``PipecatEngine`` and compares building the LLM setup of each node when it's
+entered (``per-transition``: transition function schemas, knowledge base tool
+schema and prompt formatting on every ``set_node``, as done before workflows
+were compiled) with the compiled workflow shared by all calls
+(``compiled``: a lookup plus rendering the prompts with the call context).
+
+Every node has ``--edges`` transitions to later nodes, a prompt with
+``--variables`` placeholders, half of them knowledge base documents and all but
+the start node the global prompt. Each call enters ``--transitions`` nodes
+after the start node. Custom tools aren't used (their schemas come from the
+database either way).
+
+It reports the time to compile the workflow on its first call, and the
+transition latency (``set_node``, from the LLM's transition function call until
+the context of the next node is set).
+
+Usage:
+    python -m evals.perf.workflow_compilation
+    python -m evals.perf.workflow_compilation --nodes 100 --calls 500
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from loguru import logger
+
+from api.services.workflow import compiled_workflow
+from api.services.workflow.compiled_workflow import compile_workflow
+from api.services.workflow.dto import (
+    EdgeDataDTO,
+    NodeDataDTO,
+    NodeType,
+    Position,
+    ReactFlowDTO,
+    RFEdgeDTO,
+    RFNodeDTO,
+)
+from api.services.workflow.pipecat_engine import PipecatEngine
+from api.services.workflow.pipecat_engine_utils import get_function_schema
+from api.services.workflow.tools.knowledge_base import get_knowledge_base_tool
+from api.services.workflow.workflow import Node, WorkflowGraph
+from pipecat.processors.aggregators.llm_context import LLMContext
+
+PARAGRAPH = (
+    "Keep answers short, confirm details back to the caller and never invent policy "
+    "information. If the caller asks something out of scope, offer a callback. "
+)
+
+
+class PerTransitionEngine(PipecatEngine):
+    """The LLM setup of a node as done before workflows were compiled."""
+
+    async def _setup_llm_context(self, node: Node) -> None:
+        self.context.set_node_name(node.name)
+        if not node.is_end:
+            for edge in node.out_edges:
+                await self._register_transition_function_with_llm(
+                    edge.get_function_name(), edge.target
+                )
+        if node.document_uuids:
+            await self._register_knowledge_base_function(node.document_uuids)
+        system_message, functions = await self._compose_system_message_functions_for_node(node)
+        await self._update_llm_context(system_message, functions)
+
+    async def _compose_system_message_functions_for_node(self, node: Node):
+        global_prompt = ""
+        if self.workflow.global_node_id and node.add_global_prompt:
+            global_node = self.workflow.nodes[self.workflow.global_node_id]
+            global_prompt = self._format_prompt(global_node.prompt)
+
+        functions = list(self.builtin_function_schemas)
+        if node.document_uuids:
+            kb_function = get_knowledge_base_tool(node.document_uuids)["function"]
+            functions.append(
+                get_function_schema(
+                    kb_function["name"],
+                    kb_function["description"],
+                    properties=kb_function["parameters"].get("properties", {}),
+                    required=kb_function["parameters"].get("required", []),
+                )
+            )
+        for edge in node.out_edges:
+            functions.append(self._get_function_schema(edge.get_function_name(), edge.condition))
+
+        formatted_node_prompt = self._format_prompt(node.prompt)
+        content = "\n\n".join(p for p in (global_prompt, formatted_node_prompt) if p)
+        return {"role": "system", "content": content}, functions
+
+
+class StubLLM:
+    def __init__(self):
+        self.functions = {}
+
+    def register_function(self, name, handler, **kwargs):
+        self.functions[name] = handler
+
+
+def build_workflow(args) -> ReactFlowDTO:
+    rng = random.Random(7)
+
+    def prompt(index: int) -> str:
+        parts = [f"You are handling step {index} of the call with {{{{first_name}}}}. "]
+        for i in range(args.variables):
+            parts.append(PARAGRAPH)
+            parts.append(f"Detail {i}: {{{{initial_context.detail_{i} | fallback:unknown}}}}.\n")
+        return "".join(parts)
+
+    nodes = [
+        RFNodeDTO(
+            id="global",
+            type=NodeType.globalNode,
+            position=Position(x=0, y=0),
+            data=NodeDataDTO(name="Global", prompt="You are Ava from Acme. " + PARAGRAPH * 4),
+        )
+    ]
+    for index in range(args.nodes):
+        is_start, is_end = index == 0, index == args.nodes - 1
+        node_type = NodeType.startNode if is_start else NodeType.agentNode
+        nodes.append(
+            RFNodeDTO(
+                id=f"n{index}",
+                type=NodeType.endNode if is_end else node_type,
+                position=Position(x=0, y=index * 100),
+                data=NodeDataDTO(
+                    name=f"Step {index}",
+                    prompt=prompt(index),
+                    is_start=is_start,
+                    is_end=is_end,
+                    add_global_prompt=not is_start,
+                    document_uuids=[f"doc-{index}"] if index % 2 else None,
+                ),
+            )
+        )
+
+    edges = []
+    for index in range(args.nodes - 1):
+        later = range(index + 1, args.nodes)
+        targets = {index + 1, *rng.sample(later, min(args.edges, len(later)))}
+        for target in sorted(targets)[: args.edges]:
+            edges.append(
+                RFEdgeDTO(
+                    id=f"n{index}-n{target}",
+                    source=f"n{index}",
+                    target=f"n{target}",
+                    data=EdgeDataDTO(
+                        label=f"Go To Step {target}",
+                        condition=f"When step {index} is done and the caller needs step {target}",
+                    ),
+                )
+            )
+    return ReactFlowDTO(nodes=nodes, edges=edges)
+
+
+async def run_call(engine_class, dto: ReactFlowDTO, args, rng: random.Random) -> list:
+    engine = engine_class(
+        llm=StubLLM(),
+        context=LLMContext(),
+        workflow=WorkflowGraph(dto),
+        call_context_vars={
+            "first_name": "Ada",
+            "initial_context": {f"detail_{i}": f"value {i}" for i in range(0, args.variables, 2)},
+        },
+    )
+    await engine.initialize()
+
+    latencies = []
+    node = engine.workflow.nodes[engine.workflow.start_node_id]
+    for _ in range(args.transitions):
+        if not node.out_edges:
+            break
+        target = rng.choice(node.out_edges[:2]).target
+        started = time.perf_counter()
+        await engine.set_node(target)
+        latencies.append(time.perf_counter() - started)
+        node = engine.workflow.nodes[target]
+    return latencies
+
+
+async def run_mode(mode: str, dto: ReactFlowDTO, args) -> dict:
+    engine_class = PerTransitionEngine if mode == "per-transition" else PipecatEngine
+    latencies = []
+    for call in range(args.calls):
+        latencies.extend(await run_call(engine_class, dto, args, random.Random(call)))
+    latencies.sort()
+    return {
+        "mode": mode,
+        "transitions": len(latencies),
+        "mean_us": sum(latencies) / len(latencies) * 1e6,
+        "p50_us": latencies[len(latencies) // 2] * 1e6,
+        "p99_us": latencies[int(len(latencies) * 0.99)] * 1e6,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark workflow compilation")
+    parser.add_argument("--nodes", type=int, default=50)
+    parser.add_argument("--edges", type=int, default=3, help="Transitions per node")
+    parser.add_argument("--variables", type=int, default=10, help="Placeholders per prompt")
+    parser.add_argument("--transitions", type=int, default=20, help="Transitions per call")
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    # The engine's debug logs would dominate the timings.
+    logger.remove()
+
+    dto = build_workflow(args)
+    started = time.perf_counter()
+    compile_workflow(WorkflowGraph(dto))
+    compile_ms = (time.perf_counter() - started) * 1000
+    compiled_workflow._compiled_workflows.clear()
+
+    results = [await run_mode(mode, dto, args) for mode in ("per-transition", "compiled")]
+
+    print(
+        f"\nWorkflow compilation over {args.calls} calls of a {args.nodes} node workflow "
+        f"({args.edges} transitions per node, {args.variables} placeholders per prompt); "
+        f"compiling it takes {compile_ms:.1f}ms"
+    )
+    print(f"{'mode':<15} {'transitions':>11} {'mean us':>8} {'p50 us':>8} {'p99 us':>8}")
+    for r in results:
+        print(
+            f"{r['mode']:<15} {r['transitions']:>11} {r['mean_us']:>8.0f} "
+            f"{r['p50_us']:>8.0f} {r['p99_us']:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
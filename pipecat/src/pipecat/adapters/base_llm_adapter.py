@@ -11,7 +11,7 @@ adapters that handle tool format conversion and standardization.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, TypeVar
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
 
 from loguru import logger
 
@@ -20,6 +20,7 @@ from pipecat.processors.aggregators.llm_context import (
     LLMContext,
     LLMContextMessage,
     LLMSpecificMessage,
+    MessageConversionCache,
     NotGiven,
 )
 
@@ -113,6 +114,28 @@ class BaseLLMAdapter(ABC, Generic[TLLMInvocationParams]):
         """
         return context.get_messages(self.id_for_llm_specific_messages)
 
+    def get_conversion_cache(self, context: LLMContext) -> MessageConversionCache:
+        """Get this adapter's cache of converted messages for the given context.
+
+        Args:
+            context: The LLM context whose messages are converted.
+
+        Returns:
+            The per-context conversion cache.
+        """
+        return context.get_conversion_cache(type(self).__name__)
+
+    def _convert_messages(
+        self,
+        messages: List[LLMContextMessage],
+        convert: Callable[[LLMContextMessage], Any],
+        cache: Optional[MessageConversionCache] = None,
+    ) -> List[Any]:
+        """Convert messages one by one, through the cache if one is given."""
+        if cache is None:
+            return [convert(m) for m in messages]
+        return cache.convert(messages, convert)
+
     def from_standard_tools(self, tools: Any) -> List[Any] | NotGiven:
         """Convert tools from standard format to provider format.
 
@@ -9,7 +9,7 @@
 import copy
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from anthropic import NOT_GIVEN, NotGiven
 from anthropic.types.message_param import MessageParam
@@ -24,9 +24,17 @@ from pipecat.processors.aggregators.llm_context import (
     LLMContextMessage,
     LLMSpecificMessage,
     LLMStandardMessage,
+    MessageConversionCache,
 )
 
 
+def _content_as_list(content: str | List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Return message content as a new list of content blocks."""
+    if isinstance(content, str):
+        return [{"type": "text", "text": content}]
+    return list(content)
+
+
 class AnthropicLLMInvocationParams(TypedDict):
     """Context-based parameters for invoking Anthropic's LLM API."""
 
@@ -59,7 +67,9 @@ class AnthropicLLMAdapter(BaseLLMAdapter[AnthropicLLMInvocationParams]):
         Returns:
             Dictionary of parameters for invoking Anthropic's LLM API.
         """
-        messages = self._from_universal_context_messages(self.get_messages(context))
+        messages = self._from_universal_context_messages(
+            self.get_messages(context), self.get_conversion_cache(context)
+        )
         return {
             "system": messages.system,
             "messages": (
@@ -83,20 +93,24 @@ class AnthropicLLMAdapter(BaseLLMAdapter[AnthropicLLMInvocationParams]):
             List of messages in a format ready for logging about Anthropic.
         """
         # Get messages in Anthropic's format
-        messages = self._from_universal_context_messages(self.get_messages(context)).messages
+        messages = self._from_universal_context_messages(
+            self.get_messages(context), self.get_conversion_cache(context)
+        ).messages
 
-        # Sanitize messages for logging
+        # Sanitize messages for logging, copying only the ones that need it
         messages_for_logging = []
         for message in messages:
-            msg = copy.deepcopy(message)
-            if "content" in msg:
-                if isinstance(msg["content"], list):
-                    for item in msg["content"]:
-                        if item["type"] == "image":
-                            item["source"]["data"] = "..."
-                        if item["type"] == "thinking" and item.get("signature"):
-                            item["signature"] = "..."
-            messages_for_logging.append(msg)
+            if isinstance(message.get("content"), list) and any(
+                item["type"] == "image" or (item["type"] == "thinking" and item.get("signature"))
+                for item in message["content"]
+            ):
+                message = copy.deepcopy(message)
+                for item in message["content"]:
+                    if item["type"] == "image":
+                        item["source"]["data"] = "..."
+                    if item["type"] == "thinking" and item.get("signature"):
+                        item["signature"] = "..."
+            messages_for_logging.append(message)
         return messages_for_logging
 
     @dataclass
@@ -107,14 +121,20 @@ class AnthropicLLMAdapter(BaseLLMAdapter[AnthropicLLMInvocationParams]):
         system: str | NotGiven
 
     def _from_universal_context_messages(
-        self, universal_context_messages: List[LLMContextMessage]
+        self,
+        universal_context_messages: List[LLMContextMessage],
+        cache: Optional[MessageConversionCache] = None,
     ) -> ConvertedMessages:
         system = NOT_GIVEN
         messages = []
 
-        # First, map messages using self._from_universal_context_message(m)
+        # First, map messages using self._from_universal_context_message(m).
+        # Converted messages may be shared with the cache, so below they are
+        # replaced with updated copies rather than modified.
         try:
-            messages = [self._from_universal_context_message(m) for m in universal_context_messages]
+            messages = self._convert_messages(
+                universal_context_messages, self._from_universal_context_message, cache
+            )
         except Exception as e:
             logger.error(f"Error mapping messages: {e}")
 
@@ -123,7 +143,7 @@ class AnthropicLLMAdapter(BaseLLMAdapter[AnthropicLLMInvocationParams]):
             if len(messages) == 1:
                 # If we have only have a system message in the list, all we can really do
                 # without introducing too much magic is change the role to "user".
-                messages[0]["role"] = "user"
+                messages[0] = {**messages[0], "role": "user"}
             else:
                 # If we have more than one message, we'll pull the system message out of the
                 # list.
@@ -132,9 +152,10 @@ class AnthropicLLMAdapter(BaseLLMAdapter[AnthropicLLMInvocationParams]):
 
         # Convert any subsequent "system"-role messages to "user"-role
         # messages, as Anthropic doesn't support system input messages.
-        for message in messages:
-            if message["role"] == "system":
-                message["role"] = "user"
+        messages = [
+            {**message, "role": "user"} if message["role"] == "system" else message
+            for message in messages
+        ]
 
         # Merge consecutive messages with the same role.
         i = 0
@@ -142,26 +163,23 @@ class AnthropicLLMAdapter(BaseLLMAdapter[AnthropicLLMInvocationParams]):
             current_message = messages[i]
             next_message = messages[i + 1]
             if current_message["role"] == next_message["role"]:
-                # Convert content to list of dictionaries if it's a string
-                if isinstance(current_message["content"], str):
-                    current_message["content"] = [
-                        {"type": "text", "text": current_message["content"]}
-                    ]
-                if isinstance(next_message["content"], str):
-                    next_message["content"] = [{"type": "text", "text": next_message["content"]}]
-                # Concatenate the content
-                current_message["content"].extend(next_message["content"])
+                # Concatenate the content, as lists of dictionaries
+                messages[i] = {
+                    **current_message,
+                    "content": _content_as_list(current_message["content"])
+                    + _content_as_list(next_message["content"]),
+                }
                 # Remove the next message from the list
                 messages.pop(i + 1)
             else:
                 i += 1
 
         # Avoid empty content in messages
-        for message in messages:
+        for i, message in enumerate(messages):
             if isinstance(message["content"], str) and message["content"] == "":
-                message["content"] = "(empty)"
+                messages[i] = {**message, "content": "(empty)"}
             elif isinstance(message["content"], list) and len(message["content"]) == 0:
-                message["content"] = [{"type": "text", "text": "(empty)"}]
+                messages[i] = {**message, "content": [{"type": "text", "text": "(empty)"}]}
 
         return self.ConvertedMessages(messages=messages, system=system)
 
@@ -330,10 +348,14 @@ class AnthropicLLMAdapter(BaseLLMAdapter[AnthropicLLMInvocationParams]):
             List of messages with cache control markers added.
         """
 
-        def add_cache_control_marker(message: MessageParam):
-            if isinstance(message["content"], str):
-                message["content"] = [{"type": "text", "text": message["content"]}]
-            message["content"][-1]["cache_control"] = {"type": "ephemeral"}
+        def with_cache_control_marker(message: MessageParam) -> MessageParam:
+            content = _content_as_list(message["content"])
+            content[-1] = {**content[-1], "cache_control": {"type": "ephemeral"}}
+            return {**message, "content": content}
+
+        # Messages may be shared with the conversion cache, so the marked ones
+        # are replaced with copies instead of being modified
+        messages_with_markers = list(messages)
 
         try:
             # Add cache control markers to the most recent two user messages.
@@ -348,8 +370,6 @@ class AnthropicLLMAdapter(BaseLLMAdapter[AnthropicLLMInvocationParams]):
             # inference as soon as user turns come in. In Anthropic, turns
             # strictly alternate between user and assistant.
 
-            messages_with_markers = copy.deepcopy(messages)
-
             # Find the most recent two user messages
             user_message_indices = []
             for i in range(len(messages_with_markers) - 1, -1, -1):
@@ -360,7 +380,9 @@ class AnthropicLLMAdapter(BaseLLMAdapter[AnthropicLLMInvocationParams]):
 
             # Add cache control markers to the identified user messages
             for index in user_message_indices:
-                add_cache_control_marker(messages_with_markers[index])
+                messages_with_markers[index] = with_cache_control_marker(
+                    messages_with_markers[index]
+                )
 
             return messages_with_markers
         except Exception as e:
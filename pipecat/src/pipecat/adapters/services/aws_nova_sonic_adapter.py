@@ -6,7 +6,6 @@
 
 """AWS Nova Sonic LLM adapter for Pipecat."""
 
-import copy
 import json
 from dataclasses import dataclass
 from enum import Enum
@@ -123,7 +122,8 @@ class AWSNovaSonicLLMAdapter(BaseLLMAdapter[AWSNovaSonicLLMInvocationParams]):
         if not universal_context_messages:
             return self.ConvertedMessages()
 
-        universal_context_messages = copy.deepcopy(universal_context_messages)
+        # Only the list is modified below, so the messages needn't be copied
+        universal_context_messages = list(universal_context_messages)
 
         # If we have a "system" message as our first message, let's pull that out into "instruction"
         if universal_context_messages[0].get("role") == "system":
@@ -23,9 +23,17 @@ from pipecat.processors.aggregators.llm_context import (
     LLMContextToolChoice,
     LLMSpecificMessage,
     LLMStandardMessage,
+    MessageConversionCache,
 )
 
 
+def _content_as_list(content: str | List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Return message content as a new list of content blocks."""
+    if isinstance(content, str):
+        return [{"type": "text", "text": content}]
+    return list(content)
+
+
 class AWSBedrockLLMInvocationParams(TypedDict):
     """Context-based parameters for invoking AWS Bedrock's LLM API."""
 
@@ -56,7 +64,9 @@ class AWSBedrockLLMAdapter(BaseLLMAdapter[AWSBedrockLLMInvocationParams]):
         Returns:
             Dictionary of parameters for invoking AWS Bedrock's LLM API.
         """
-        messages = self._from_universal_context_messages(self.get_messages(context))
+        messages = self._from_universal_context_messages(
+            self.get_messages(context), self.get_conversion_cache(context)
+        )
         return {
             "system": messages.system,
             "messages": messages.messages,
@@ -80,18 +90,21 @@ class AWSBedrockLLMAdapter(BaseLLMAdapter[AWSBedrockLLMInvocationParams]):
             List of messages in a format ready for logging about AWS Bedrock.
         """
         # Get messages in Anthropic's format
-        messages = self._from_universal_context_messages(self.get_messages(context)).messages
+        messages = self._from_universal_context_messages(
+            self.get_messages(context), self.get_conversion_cache(context)
+        ).messages
 
-        # Sanitize messages for logging
+        # Sanitize messages for logging, copying only the ones that need it
         messages_for_logging = []
         for message in messages:
-            msg = copy.deepcopy(message)
-            if "content" in msg:
-                if isinstance(msg["content"], list):
-                    for item in msg["content"]:
-                        if item.get("image"):
-                            item["image"]["source"]["bytes"] = "..."
-            messages_for_logging.append(msg)
+            if isinstance(message.get("content"), list) and any(
+                item.get("image") for item in message["content"]
+            ):
+                message = copy.deepcopy(message)
+                for item in message["content"]:
+                    if item.get("image"):
+                        item["image"]["source"]["bytes"] = "..."
+            messages_for_logging.append(message)
         return messages_for_logging
 
     @dataclass
@@ -102,14 +115,20 @@ class AWSBedrockLLMAdapter(BaseLLMAdapter[AWSBedrockLLMInvocationParams]):
         system: Optional[str]
 
     def _from_universal_context_messages(
-        self, universal_context_messages: List[LLMContextMessage]
+        self,
+        universal_context_messages: List[LLMContextMessage],
+        cache: Optional[MessageConversionCache] = None,
     ) -> ConvertedMessages:
         system = None
         messages = []
 
-        # First, map messages using self._from_universal_context_message(m)
+        # First, map messages using self._from_universal_context_message(m).
+        # Converted messages may be shared with the cache, so below they are
+        # replaced with updated copies rather than modified.
         try:
-            messages = [self._from_universal_context_message(m) for m in universal_context_messages]
+            messages = self._convert_messages(
+                universal_context_messages, self._from_universal_context_message, cache
+            )
         except Exception as e:
             logger.error(f"Error mapping messages: {e}")
 
@@ -120,9 +139,10 @@ class AWSBedrockLLMAdapter(BaseLLMAdapter[AWSBedrockLLMInvocationParams]):
 
         # Convert any subsequent "system"-role messages to "user"-role
         # messages, as AWS Bedrock doesn't support system input messages.
-        for message in messages:
-            if message["role"] == "system":
-                message["role"] = "user"
+        messages = [
+            {**message, "role": "user"} if message["role"] == "system" else message
+            for message in messages
+        ]
 
         # Merge consecutive messages with the same role.
         i = 0
@@ -130,26 +150,23 @@ class AWSBedrockLLMAdapter(BaseLLMAdapter[AWSBedrockLLMInvocationParams]):
             current_message = messages[i]
             next_message = messages[i + 1]
             if current_message["role"] == next_message["role"]:
-                # Convert content to list of dictionaries if it's a string
-                if isinstance(current_message["content"], str):
-                    current_message["content"] = [
-                        {"type": "text", "text": current_message["content"]}
-                    ]
-                if isinstance(next_message["content"], str):
-                    next_message["content"] = [{"type": "text", "text": next_message["content"]}]
-                # Concatenate the content
-                current_message["content"].extend(next_message["content"])
+                # Concatenate the content, as lists of dictionaries
+                messages[i] = {
+                    **current_message,
+                    "content": _content_as_list(current_message["content"])
+                    + _content_as_list(next_message["content"]),
+                }
                 # Remove the next message from the list
                 messages.pop(i + 1)
             else:
                 i += 1
 
         # Avoid empty content in messages
-        for message in messages:
+        for i, message in enumerate(messages):
             if isinstance(message["content"], str) and message["content"] == "":
-                message["content"] = "(empty)"
+                messages[i] = {**message, "content": "(empty)"}
             elif isinstance(message["content"], list) and len(message["content"]) == 0:
-                message["content"] = [{"type": "text", "text": "(empty)"}]
+                messages[i] = {**message, "content": [{"type": "text", "text": "(empty)"}]}
 
         return self.ConvertedMessages(messages=messages, system=system)
 
@@ -79,6 +79,12 @@ class GrokRealtimeLLMAdapter(BaseLLMAdapter):
         """
         msgs = []
         for message in self.get_messages(context):
+            # Only messages carrying audio are copied; the rest are logged as is
+            if not isinstance(message.get("content"), list) or not any(
+                item.get("type") in ("input_audio", "audio") for item in message["content"]
+            ):
+                msgs.append(message)
+                continue
             msg = copy.deepcopy(message)
             if "content" in msg:
                 if isinstance(msg["content"], list):
@@ -114,7 +120,8 @@ class GrokRealtimeLLMAdapter(BaseLLMAdapter):
         if not universal_context_messages:
             return self.ConvertedMessages(messages=[])
 
-        messages = copy.deepcopy(universal_context_messages)
+        # Only the list is modified below, so the messages needn't be copied
+        messages = list(universal_context_messages)
         system_instruction = None
 
         # Extract system message as session instructions
@@ -96,6 +96,14 @@ class OpenAILLMAdapter(BaseLLMAdapter[OpenAILLMInvocationParams]):
         """
         msgs = []
         for message in self.get_messages(context):
+            # Only messages carrying media are copied; the rest are logged as is
+            has_media = "mime_type" in message or (
+                isinstance(message.get("content"), list)
+                and any(item["type"] in ("image_url", "input_audio") for item in message["content"])
+            )
+            if not has_media:
+                msgs.append(message)
+                continue
             msg = copy.deepcopy(message)
             if "content" in msg:
                 if isinstance(msg["content"], list):
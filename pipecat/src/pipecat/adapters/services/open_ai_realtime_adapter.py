@@ -62,7 +62,9 @@ class OpenAIRealtimeLLMAdapter(BaseLLMAdapter):
             "tools": self.from_standard_tools(context.tools) or [],
         }
 
-    def get_messages_for_logging(self, context) -> List[Dict[str, Any]]:
+    def get_messages_for_logging(
+        self, context, start: int = 0, end: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """Get messages from a universal LLM context in a format ready for logging about OpenAI Realtime.
 
         Removes or truncates sensitive data like image content for safe logging.
@@ -71,6 +73,8 @@ class OpenAIRealtimeLLMAdapter(BaseLLMAdapter):
 
         Args:
             context: The LLM context containing messages.
+            start: Index of the first message (of ``get_messages(context)``) to include.
+            end: Index past the last message to include. Defaults to all.
 
         Returns:
             List of messages in a format ready for logging about OpenAI Realtime.
@@ -80,7 +84,15 @@ class OpenAIRealtimeLLMAdapter(BaseLLMAdapter):
         # specifically, not everything handled here is necessarily supported
         # (or supported yet).
         msgs = []
-        for message in self.get_messages(context):
+        for message in self.get_messages(context)[start:end]:
+            # Only messages carrying media are copied; the rest are logged as is
+            has_media = "mime_type" in message or (
+                isinstance(message.get("content"), list)
+                and any(item["type"] in ("image_url", "input_audio") for item in message["content"])
+            )
+            if not has_media:
+                msgs.append(message)
+                continue
             msg = copy.deepcopy(message)
             if "content" in msg:
                 if isinstance(msg["content"], list):
@@ -113,7 +125,8 @@ class OpenAIRealtimeLLMAdapter(BaseLLMAdapter):
         if not universal_context_messages:
             return self.ConvertedMessages(messages=[])
 
-        messages = copy.deepcopy(universal_context_messages)
+        # Only the list is modified below, so the messages needn't be copied
+        messages = list(universal_context_messages)
         system_instruction = None
 
         # If we have a "system" message as our first message, let's pull that out into session
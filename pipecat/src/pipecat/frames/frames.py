@@ -688,6 +688,20 @@ class LLMContextFrame(Frame):
     context: "LLMContext"
 
 
+@dataclass
+class LLMSpeculativeContextFrame(LLMContextFrame):
+    """Frame containing a tentative LLM context for a user turn not yet confirmed.
+
+    Pushed by the user aggregator when the user pauses before the user turn
+    stop strategies have confirmed the end of the turn. LLM services start
+    generating right away but hold the response, and any function calls, until
+    an `LLMSpeculationCommitFrame` releases it. An `InterruptionFrame`
+    discards it.
+    """
+
+    pass
+
+
 @dataclass
 class LLMThoughtStartFrame(ControlFrame):
     """Frame indicating the start of an LLM thought.
@@ -1134,6 +1148,20 @@ class FrameProcessorResumeUrgentFrame(SystemFrame):
     processor: "FrameProcessor"
 
 
+@dataclass
+class LLMSpeculationCommitFrame(SystemFrame):
+    """Frame releasing a speculative LLM response once the user turn is confirmed.
+
+    A system frame, so it reaches the LLM service while the speculative
+    response is still being generated.
+
+    Parameters:
+        speculation_id: Id of the `LLMSpeculativeContextFrame` to commit.
+    """
+
+    speculation_id: int
+
+
 @dataclass
 class InterruptionFrame(SystemFrame):
     """Frame pushed to interrupt the pipeline.
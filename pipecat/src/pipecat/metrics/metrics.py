@@ -93,6 +93,37 @@ class STTUsageMetricsData(MetricsData):
     value: float
 
 
+class STTInferenceMetricsData(MetricsData):
+    """Metrics data for a segment transcribed by a shared local STT engine.
+
+    Parameters:
+        queue_wait: Seconds the segment waited for the engine.
+        decode_time: Seconds spent decoding the segment's batch.
+        batch_size: Number of segments decoded in the same batch.
+    """
+
+    queue_wait: float
+    decode_time: float
+    batch_size: int
+
+
+class TTSPhraseCacheMetricsData(MetricsData):
+    """Metrics data for a phrase looked up in the TTS phrase cache.
+
+    Parameters:
+        hit: Whether the phrase was replayed from the cache.
+        tier: Cache tier of a hit (phrases spoken live are only looked up in
+            "memory").
+        ttfa_saved: Seconds of time to first audio saved by a hit: the time
+            to first audio of the live synthesis that produced the entry minus
+            the lookup time.
+    """
+
+    hit: bool
+    tier: Optional[str] = None
+    ttfa_saved: float = 0.0
+
+
 class SmartTurnMetricsData(MetricsData):
     """Metrics data for smart turn predictions.
 
@@ -109,3 +140,22 @@ class SmartTurnMetricsData(MetricsData):
     inference_time_ms: float
     server_total_time_ms: float
     e2e_processing_time_ms: float
+
+
+class SpeculativeGenerationMetricsData(MetricsData):
+    """Metrics data for the outcome of a speculative LLM generation.
+
+    Parameters:
+        committed: Whether the user turn was confirmed and the response released.
+        latency_saved: Seconds the response was available earlier than it would
+            have been without speculation. Zero when discarded.
+        wasted_prompt_tokens: Prompt tokens of a discarded generation, if the
+            LLM reported them before it was cancelled.
+        wasted_completion_tokens: Completion tokens of a discarded generation.
+            Counted from streamed text chunks if the LLM didn't report usage.
+    """
+
+    committed: bool
+    latency_saved: float = 0.0
+    wasted_prompt_tokens: int = 0
+    wasted_completion_tokens: int = 0
@@ -11,7 +11,9 @@ that supports a union of known Pipecat LLM service functionality.
 
 Whenever an LLM service needs to access context, it does a just-in-time
 translation from this universal context into whatever format it needs, using a
-service-specific adapter.
+service-specific adapter. Adapters cache the translation of each message in the
+context, so only messages added or replaced since the previous invocation are
+translated again.
 """
 
 import asyncio
@@ -19,7 +21,7 @@ import base64
 import io
 import wave
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, List, Optional, TypeAlias, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeAlias, Union
 
 from loguru import logger
 from openai._types import NOT_GIVEN as OPEN_AI_NOT_GIVEN
@@ -62,6 +64,73 @@ class LLMSpecificMessage:
 LLMContextMessage: TypeAlias = Union[LLMStandardMessage, LLMSpecificMessage]
 
 
+class MessageConversionCache:
+    """Cache of per-message conversions of an LLMContext's messages.
+
+    Entries are keyed by message identity. Messages in a context are treated as
+    copy-on-write: code that changes a message should replace it (see
+    `LLMContext.replace_message()`) rather than mutate it. As a safety net, a
+    message whose keys or top-level ``content`` were reassigned, or whose
+    ``content`` list changed length, is converted again. Changes nested deeper
+    inside a message are not detected.
+
+    Converted messages are shared between invocations, so they must not be
+    mutated by their users.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        # id(message) -> (message, fingerprint, converted message)
+        self._entries: Dict[int, tuple] = {}
+
+    @staticmethod
+    def _fingerprint(message: LLMContextMessage) -> tuple:
+        if isinstance(message, LLMSpecificMessage):
+            return (message.llm, message.message)
+        content = message.get("content")
+        return (len(message), content, len(content) if isinstance(content, list) else -1)
+
+    @staticmethod
+    def _same_fingerprint(a: tuple, b: tuple) -> bool:
+        return all(x is y or x == y for x, y in zip(a, b))
+
+    def convert(
+        self,
+        messages: List[LLMContextMessage],
+        convert: Callable[[LLMContextMessage], Any],
+    ) -> List[Any]:
+        """Convert messages, reusing the conversions of unchanged messages.
+
+        Entries for messages no longer passed in are dropped.
+
+        Args:
+            messages: The messages to convert.
+            convert: Function converting a single message.
+
+        Returns:
+            The converted messages, in order.
+        """
+        entries = {}
+        converted = []
+        for message in messages:
+            fingerprint = self._fingerprint(message)
+            entry = self._entries.get(id(message))
+            if (
+                entry is None
+                or entry[0] is not message
+                or not self._same_fingerprint(entry[1], fingerprint)
+            ):
+                entry = (message, fingerprint, convert(message))
+            entries[id(message)] = entry
+            converted.append(entry[2])
+        self._entries = entries
+        return converted
+
+    def clear(self):
+        """Drop all cached conversions."""
+        self._entries = {}
+
+
 class LLMContext:
     """Manages conversation context for LLM interactions.
 
@@ -131,6 +200,7 @@ class LLMContext:
         self._messages: List[LLMContextMessage] = messages if messages else []
         self._tools: ToolsSchema | NotGiven = LLMContext._normalize_and_validate_tools(tools)
         self._tool_choice: LLMContextToolChoice | NotGiven = tool_choice
+        self._conversion_caches: Dict[str, MessageConversionCache] = {}
 
     @staticmethod
     def create_image_url_message(
@@ -344,6 +414,33 @@ class LLMContext:
         """
         self._messages[:] = messages
 
+    def replace_message(self, index: int, message: LLMContextMessage):
+        """Replace the message at the given position in the context.
+
+        Messages in the context are copy-on-write: to change a message, replace
+        it with an updated copy instead of mutating it in place, so that cached
+        conversions of the old message are not reused.
+
+        Args:
+            index: Position of the message to replace.
+            message: The new message.
+        """
+        self._messages[index] = message
+
+    def get_conversion_cache(self, key: str) -> MessageConversionCache:
+        """Get the message conversion cache for the given adapter.
+
+        Args:
+            key: Identifies the conversion (typically the adapter class).
+
+        Returns:
+            The cache, created on first use.
+        """
+        cache = self._conversion_caches.get(key)
+        if cache is None:
+            cache = self._conversion_caches[key] = MessageConversionCache()
+        return cache
+
     def set_tools(self, tools: ToolsSchema | NotGiven = NOT_GIVEN):
         """Set the available tools for the LLM.
 
@@ -25,6 +25,8 @@ from pipecat.audio.vad.vad_analyzer import VADAnalyzer
 from pipecat.audio.vad.vad_controller import VADController
 from pipecat.frames.frames import (
     AssistantImageRawFrame,
+    BotStartedSpeakingFrame,
+    BotStoppedSpeakingFrame,
     CancelFrame,
     EndFrame,
     Frame,
@@ -45,6 +47,8 @@ from pipecat.frames.frames import (
     LLMRunFrame,
     LLMSetToolChoiceFrame,
     LLMSetToolsFrame,
+    LLMSpeculationCommitFrame,
+    LLMSpeculativeContextFrame,
     LLMThoughtEndFrame,
     LLMThoughtStartFrame,
     LLMThoughtTextFrame,
@@ -104,6 +108,11 @@ class LLMUserAggregatorParams:
         user_turn_completion_config: Configuration for turn completion behavior including
             custom instructions, timeouts, and prompts. Only used when
             filter_incomplete_user_turns is True.
+        enable_speculative_generation: Whether to start LLM inference as soon as
+            the user pauses with a final transcription, before the user turn
+            stop strategies confirm the end of the turn. The LLM holds the
+            response until the turn is confirmed and discards it if the user
+            keeps talking.
     """
 
     user_turn_strategies: Optional[UserTurnStrategies] = None
@@ -113,6 +122,7 @@ class LLMUserAggregatorParams:
     vad_analyzer: Optional[VADAnalyzer] = None
     filter_incomplete_user_turns: bool = False
     user_turn_completion_config: Optional[UserTurnCompletionConfig] = None
+    enable_speculative_generation: bool = False
 
 
 @dataclass
@@ -325,6 +335,12 @@ class LLMUserAggregator(LLMContextAggregator):
     occur while a user turn is active and pushes the final aggregation when the
     user turn is finished.
 
+    With speculative generation enabled, the aggregation is also pushed as an
+    `LLMSpeculativeContextFrame` when the user pauses mid-turn. If the turn
+    then ends with the same aggregation, an `LLMSpeculationCommitFrame`
+    releases the response the LLM has been holding; otherwise the speculative
+    response is discarded with an interruption.
+
     Event handlers available:
 
     - on_user_turn_started: Called when the user turn starts
@@ -391,6 +407,13 @@ class LLMUserAggregator(LLMContextAggregator):
         self._user_is_muted = False
         self._user_turn_start_timestamp = ""
 
+        self._bot_speaking = False
+        self._user_turn_paused = False
+        # Whether the user's latest stretch of speech has been transcribed.
+        self._user_speech_transcribed = False
+        self._speculative_frame: Optional[LLMSpeculativeContextFrame] = None
+        self._speculative_message: Optional[LLMContextMessage] = None
+
         self._user_turn_controller = UserTurnController(
             user_turn_strategies=user_turn_strategies,
             user_turn_stop_timeout=self._params.user_turn_stop_timeout,
@@ -406,6 +429,12 @@ class LLMUserAggregator(LLMContextAggregator):
         self._user_turn_controller.add_event_handler(
             "on_user_turn_stop_timeout", self._on_user_turn_stop_timeout
         )
+        self._user_turn_controller.add_event_handler(
+            "on_user_turn_paused", self._on_user_turn_paused
+        )
+        self._user_turn_controller.add_event_handler(
+            "on_user_turn_resumed", self._on_user_turn_resumed
+        )
 
         # Optional user idle controller
         self._user_idle_controller: Optional[UserIdleController] = None
@@ -487,6 +516,12 @@ class LLMUserAggregator(LLMContextAggregator):
             self.set_tool_choice(frame.tool_choice)
         elif isinstance(frame, SpeechControlParamsFrame):
             await self._handle_speech_control_params(frame)
+        elif isinstance(frame, BotStartedSpeakingFrame):
+            self._bot_speaking = True
+            await self.push_frame(frame, direction)
+        elif isinstance(frame, BotStoppedSpeakingFrame):
+            self._bot_speaking = False
+            await self.push_frame(frame, direction)
         else:
             await self.push_frame(frame, direction)
 
@@ -502,6 +537,16 @@ class LLMUserAggregator(LLMContextAggregator):
 
         aggregation = self.aggregation_string()
         await self.reset()
+
+        speculative_frame = self._speculative_frame
+        if speculative_frame and self._speculative_message["content"] == aggregation:
+            # The LLM is already answering this exact message, release it.
+            self._speculative_frame = None
+            self._speculative_message = None
+            await self.push_frame(LLMSpeculationCommitFrame(speculation_id=speculative_frame.id))
+            return aggregation
+
+        await self._discard_speculation()
         self._context.add_message({"role": self.role, "content": aggregation})
         await self.push_context_frame()
 
@@ -535,10 +580,13 @@ class LLMUserAggregator(LLMContextAggregator):
             self._context.add_message({"role": "system", "content": config.completion_instructions})
 
     async def _stop(self, frame: EndFrame):
+        # The pipeline is going away, nothing downstream needs interrupting.
+        self._drop_speculation()
         await self._maybe_emit_user_turn_stopped(on_session_end=True)
         await self._cleanup()
 
     async def _cancel(self, frame: CancelFrame):
+        self._drop_speculation()
         await self._maybe_emit_user_turn_stopped(on_session_end=True)
         await self._cleanup()
 
@@ -630,6 +678,54 @@ class LLMUserAggregator(LLMContextAggregator):
             )
         )
 
+        self._user_speech_transcribed = True
+
+        # The user paused before this transcription arrived, speculate on it.
+        if self._user_turn_paused:
+            await self._maybe_speculate()
+
+    async def _maybe_speculate(self):
+        """Start a speculative LLM generation for the current aggregation."""
+        if not self._params.enable_speculative_generation or self._bot_speaking:
+            return
+
+        # Wait for the final transcription of what the user just said.
+        if len(self._aggregation) == 0 or not self._user_speech_transcribed:
+            return
+
+        aggregation = self.aggregation_string()
+        if self._speculative_message and self._speculative_message["content"] == aggregation:
+            return
+
+        await self._discard_speculation()
+
+        logger.debug(f"{self}: Speculating on user turn [{aggregation}]")
+        self._speculative_message = {"role": self.role, "content": aggregation}
+        self._context.add_message(self._speculative_message)
+        self._speculative_frame = LLMSpeculativeContextFrame(context=self._context)
+        await self.push_frame(self._speculative_frame)
+
+    async def _discard_speculation(self):
+        """Discard the current speculative generation, if any."""
+        if not self._speculative_frame:
+            return
+
+        logger.debug(f"{self}: Discarding speculative user turn")
+        self._drop_speculation()
+
+        # Stop the generation and drop the response the LLM is holding.
+        await self.push_interruption_task_frame_and_wait()
+
+    def _drop_speculation(self):
+        """Remove the speculative user message from the context."""
+        if not self._speculative_frame:
+            return
+
+        message = self._speculative_message
+        self._context.set_messages([m for m in self._context.get_messages() if m is not message])
+        self._speculative_frame = None
+        self._speculative_message = None
+
     async def _internal_queue_frame(
         self,
         frame: Frame,
@@ -687,6 +783,8 @@ class LLMUserAggregator(LLMContextAggregator):
         logger.debug(f"{self}: User started speaking (strategy: {strategy})")
 
         self._user_turn_start_timestamp = time_now_iso8601()
+        self._user_turn_paused = False
+        await self._discard_speculation()
 
         if params.enable_user_speaking_frames:
             await self.broadcast_frame(UserStartedSpeakingFrame)
@@ -704,11 +802,23 @@ class LLMUserAggregator(LLMContextAggregator):
     ):
         logger.debug(f"{self}: User stopped speaking (strategy: {strategy})")
 
+        self._user_turn_paused = False
+        self._user_speech_transcribed = False
+
         if params.enable_user_speaking_frames:
             await self.broadcast_frame(UserStoppedSpeakingFrame)
 
         await self._maybe_emit_user_turn_stopped(strategy)
 
+    async def _on_user_turn_paused(self, controller):
+        self._user_turn_paused = True
+        await self._maybe_speculate()
+
+    async def _on_user_turn_resumed(self, controller):
+        self._user_turn_paused = False
+        self._user_speech_transcribed = False
+        await self._discard_speculation()
+
     async def _on_user_turn_stop_timeout(self, controller):
         await self._call_event_handler("on_user_turn_stop_timeout")
 
@@ -1188,14 +1298,14 @@ class LLMAssistantAggregator(LLMContextAggregator):
         return True
 
     def _update_function_call_result(self, function_name: str, tool_call_id: str, result: Any):
-        for message in self._context.get_messages():
+        for index, message in enumerate(self._context.get_messages()):
             if (
                 not isinstance(message, LLMSpecificMessage)
                 and message["role"] == "tool"
                 and message["tool_call_id"]
                 and message["tool_call_id"] == tool_call_id
             ):
-                message["content"] = result
+                self._context.replace_message(index, {**message, "content": result})
 
     def _context_updated_task_finished(self, task: asyncio.Task):
         self._context_updated_tasks.discard(task)
@@ -216,16 +216,22 @@ class OpenAILLMContext:
         """
         return json.dumps(self._messages, cls=CustomEncoder, ensure_ascii=False, indent=2)
 
-    def get_messages_for_logging(self) -> List[Dict[str, Any]]:
+    def get_messages_for_logging(
+        self, start: int = 0, end: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """Get sanitized messages suitable for logging.
 
         Removes or truncates sensitive data like image content for safe logging.
 
+        Args:
+            start: Index of the first message to include.
+            end: Index past the last message to include. Defaults to all.
+
         Returns:
             List of messages in a format ready for logging.
         """
         msgs = []
-        for message in self.messages:
+        for message in self.messages[start:end]:
             msg = copy.deepcopy(message)
             if "content" in msg:
                 if isinstance(msg["content"], list):
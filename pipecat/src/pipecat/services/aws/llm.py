@@ -577,14 +577,20 @@ class AWSBedrockLLMContext(OpenAILLMContext):
             messages.insert(0, {"role": "system", "content": self.system})
         return messages
 
-    def get_messages_for_logging(self) -> List[Dict[str, Any]]:
+    def get_messages_for_logging(
+        self, start: int = 0, end: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """Get messages formatted for logging with sensitive data redacted.
 
+        Args:
+            start: Index of the first message to include.
+            end: Index past the last message to include. Defaults to all.
+
         Returns:
             List of messages in a format ready for logging.
         """
         msgs = []
-        for message in self.messages:
+        for message in self.messages[start:end]:
             msg = copy.deepcopy(message)
             if "content" in msg:
                 if isinstance(msg["content"], list):
@@ -8,13 +8,15 @@
 
 import asyncio
 import inspect
+import time
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import (
     Any,
     Awaitable,
     Callable,
     Dict,
+    List,
     Mapping,
     Optional,
     Protocol,
@@ -43,10 +45,15 @@ from pipecat.frames.frames import (
     LLMContextSummaryResultFrame,
     LLMFullResponseEndFrame,
     LLMFullResponseStartFrame,
+    LLMSpeculationCommitFrame,
+    LLMSpeculativeContextFrame,
     LLMTextFrame,
+    MetricsFrame,
     StartFrame,
+    SystemFrame,
     UserImageRequestFrame,
 )
+from pipecat.metrics.metrics import LLMTokenUsage, SpeculativeGenerationMetricsData
 from pipecat.processors.aggregators.llm_context import (
     LLMContext,
     LLMSpecificMessage,
@@ -157,6 +164,32 @@ class FunctionCallRunnerItem:
     run_llm: Optional[bool] = None
 
 
+@dataclass
+class _SpeculativeResponse:
+    """A speculative LLM response held back until its user turn is confirmed.
+
+    Parameters:
+        frame_id: Id of the `LLMSpeculativeContextFrame` that started it.
+        started_at: Monotonic time the generation started.
+        frames: Downstream frames generated and not yet released.
+        function_calls: Function calls requested and not yet run.
+        first_output_at: Monotonic time of the first generated text.
+        usage: Token usage reported by the LLM for this generation.
+        text_chunks: Number of text frames generated.
+        generating: Whether the response is still being generated. Frames
+            pushed after its `LLMFullResponseEndFrame` are not part of it.
+    """
+
+    frame_id: int
+    started_at: float
+    frames: List[Frame] = field(default_factory=list)
+    function_calls: List[FunctionCallFromLLM] = field(default_factory=list)
+    first_output_at: Optional[float] = None
+    usage: Optional[LLMTokenUsage] = None
+    text_chunks: int = 0
+    generating: bool = True
+
+
 class LLMService(UserTurnCompletionLLMServiceMixin, AIService):
     """Base class for all LLM services.
 
@@ -164,6 +197,11 @@ class LLMService(UserTurnCompletionLLMServiceMixin, AIService):
     parallel and sequential execution modes. Provides event handlers for
     completion timeouts and function call lifecycle events.
 
+    Responses to an `LLMSpeculativeContextFrame` are generated right away but
+    held, together with their function calls, until an
+    `LLMSpeculationCommitFrame` releases them. An `InterruptionFrame` discards
+    them. The outcome is reported as `SpeculativeGenerationMetricsData`.
+
     The service supports the following event handlers:
 
     - on_completion_timeout: Called when an LLM completion timeout occurs
@@ -210,6 +248,8 @@ class LLMService(UserTurnCompletionLLMServiceMixin, AIService):
         self._tracing_enabled: bool = False
         self._skip_tts: Optional[bool] = None
         self._summary_task: Optional[asyncio.Task] = None
+        self._speculation: Optional[_SpeculativeResponse] = None
+        self._early_commits: set[int] = set()
 
         self._register_event_handler("on_function_calls_started")
         self._register_event_handler("on_completion_timeout")
@@ -357,7 +397,12 @@ class LLMService(UserTurnCompletionLLMServiceMixin, AIService):
         await super().process_frame(frame, direction)
 
         if isinstance(frame, InterruptionFrame):
+            await self._discard_speculation()
             await self._handle_interruptions(frame)
+        elif isinstance(frame, LLMSpeculativeContextFrame):
+            self._start_speculation(frame)
+        elif isinstance(frame, LLMSpeculationCommitFrame):
+            await self._commit_speculation(frame)
         elif isinstance(frame, LLMConfigureOutputFrame):
             self._skip_tts = frame.skip_tts
         elif isinstance(frame, LLMContextSummaryRequestFrame):
@@ -374,8 +419,38 @@ class LLMService(UserTurnCompletionLLMServiceMixin, AIService):
             if self._skip_tts is not None:
                 frame.skip_tts = self._skip_tts
 
+        # Only the response generated for the speculative context is held;
+        # frames passing through the service once it is generated are not.
+        if (
+            self._speculation
+            and self._speculation.generating
+            and direction == FrameDirection.DOWNSTREAM
+            and not isinstance(frame, SystemFrame)
+        ):
+            if isinstance(frame, LLMTextFrame):
+                self._speculation.text_chunks += 1
+                if self._speculation.first_output_at is None:
+                    self._speculation.first_output_at = time.monotonic()
+            elif isinstance(frame, LLMFullResponseEndFrame):
+                self._speculation.generating = False
+            self._speculation.frames.append(frame)
+            return
+
         await super().push_frame(frame, direction)
 
+    async def start_llm_usage_metrics(self, tokens: LLMTokenUsage):
+        """Start LLM usage metrics collection.
+
+        Token usage of a speculative response is also recorded, so it can be
+        reported as wasted if the response is discarded.
+
+        Args:
+            tokens: Token usage information for the LLM.
+        """
+        if self._speculation:
+            self._speculation.usage = tokens
+        await super().start_llm_usage_metrics(tokens)
+
     async def _push_llm_text(self, text: str):
         """Push LLM text, using turn completion detection if enabled.
 
@@ -390,6 +465,76 @@ class LLMService(UserTurnCompletionLLMServiceMixin, AIService):
         else:
             await self.push_frame(LLMTextFrame(text))
 
+    def _start_speculation(self, frame: LLMSpeculativeContextFrame):
+        if frame.id in self._early_commits:
+            # The turn was confirmed before we got to generate, so there is
+            # nothing to hold back.
+            self._early_commits.discard(frame.id)
+            return
+        self._speculation = _SpeculativeResponse(frame_id=frame.id, started_at=time.monotonic())
+
+    async def _commit_speculation(self, frame: LLMSpeculationCommitFrame):
+        speculation = self._speculation
+        if not speculation or speculation.frame_id != frame.speculation_id:
+            # The speculative context frame is still queued behind other frames.
+            self._early_commits.add(frame.speculation_id)
+            return
+
+        committed_at = time.monotonic()
+        # Frames generated while we flush are appended to the list and
+        # released here as well, so the response keeps its order.
+        while speculation.frames:
+            await super().push_frame(speculation.frames.pop(0))
+        self._speculation = None
+
+        latency_saved = committed_at - speculation.started_at
+        if speculation.first_output_at is not None:
+            latency_saved = min(latency_saved, speculation.first_output_at - speculation.started_at)
+        logger.debug(f"{self}: Committed speculative response ({latency_saved:.3f}s saved)")
+        await self._push_speculation_metrics(
+            SpeculativeGenerationMetricsData(
+                processor=self.name,
+                model=self.model_name,
+                committed=True,
+                latency_saved=latency_saved,
+            )
+        )
+
+        if speculation.function_calls:
+            await self.run_function_calls(speculation.function_calls)
+
+    async def _discard_speculation(self):
+        self._early_commits.clear()
+        speculation = self._speculation
+        if not speculation:
+            return
+        self._speculation = None
+
+        if speculation.usage:
+            prompt_tokens = speculation.usage.prompt_tokens
+            completion_tokens = speculation.usage.completion_tokens
+        else:
+            # The generation was cancelled before the LLM reported usage.
+            prompt_tokens = 0
+            completion_tokens = speculation.text_chunks
+        logger.debug(
+            f"{self}: Discarded speculative response "
+            f"({prompt_tokens} prompt, {completion_tokens} completion tokens wasted)"
+        )
+        await self._push_speculation_metrics(
+            SpeculativeGenerationMetricsData(
+                processor=self.name,
+                model=self.model_name,
+                committed=False,
+                wasted_prompt_tokens=prompt_tokens,
+                wasted_completion_tokens=completion_tokens,
+            )
+        )
+
+    async def _push_speculation_metrics(self, data: SpeculativeGenerationMetricsData):
+        if self.metrics_enabled or self.usage_metrics_enabled:
+            await super().push_frame(MetricsFrame(data=[data]))
+
     async def _handle_interruptions(self, _: InterruptionFrame):
         for function_name, entry in self._functions.items():
             if entry.cancel_on_interruption:
@@ -638,6 +783,11 @@ class LLMService(UserTurnCompletionLLMServiceMixin, AIService):
         if len(function_calls) == 0:
             return
 
+        if self._speculation:
+            # Don't run functions on behalf of a user turn that may not be over.
+            self._speculation.function_calls.extend(function_calls)
+            return
+
         await self._call_event_handler("on_function_calls_started", function_calls)
 
         await self.broadcast_frame(FunctionCallsStartedFrame, function_calls=function_calls)
@@ -649,7 +799,9 @@ class LLMService(UserTurnCompletionLLMServiceMixin, AIService):
             elif None in self._functions.keys():
                 item = self._functions[None]
             else:
-                message = f"{self} is calling '{function_call.function_name}', but it's not registered."
+                message = (
+                    f"{self} is calling '{function_call.function_name}', but it's not registered."
+                )
                 logger.warning(message)
                 self._trace_function_call_span(
                     function_name=function_call.function_name,
@@ -833,7 +985,9 @@ class LLMService(UserTurnCompletionLLMServiceMixin, AIService):
                 )
                 logger.warning(message)
                 if current_span is not None:
-                    current_span.set_attribute("tool.timeout_seconds", self._function_call_timeout_secs)
+                    current_span.set_attribute(
+                        "tool.timeout_seconds", self._function_call_timeout_secs
+                    )
                     current_span.set_status(trace.Status(trace.StatusCode.ERROR, message))
                 await function_call_result_callback(None)
             except asyncio.CancelledError:
@@ -359,7 +359,11 @@ class BaseOpenAILLMService(LLMService):
                 if "content" in message and isinstance(message["content"], str):
                     words = message["content"].split()
                     if len(words) > 120:
-                        message["content"] = " ".join(words[:20] + ["......"] + words[-100:])
+                        # Copy, as unredacted messages are shared with the context
+                        message = {
+                            **message,
+                            "content": " ".join(words[:20] + ["......"] + words[-100:]),
+                        }
                     messages_for_log[i] = message
             elif isinstance(message, str):
                 words = message.split()
@@ -0,0 +1,264 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Online estimation of STT time-to-final-segment (TTFS) latency.
+
+The static values in `pipecat.services.stt_latency` are measured once per
+provider, but real latency depends on region, model and load. STT services can
+instead record the TTFS of every user turn (from the end of speech to the final
+transcript) into a sketch shared by all the calls of the process and publish
+the resulting P99 to turn stop strategies.
+
+Each sketch is a histogram with logarithmic buckets (a fixed relative error)
+kept per time window, so the estimate follows current conditions: only the
+current and the previous window are used. Sketches can be shared across
+processes through a `BaseTTFSLatencyStore`, which merges the bucket counts of
+every process (e.g. in Redis).
+"""
+
+import asyncio
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+
+from loguru import logger
+
+# Bucket counts of a sketch, keyed by window index and then by bucket index.
+SketchCounts = Dict[int, Dict[int, int]]
+
+
+class BaseTTFSLatencyStore(ABC):
+    """Base class for stores that share TTFS sketches between processes."""
+
+    @abstractmethod
+    async def merge(self, key: str, pending: SketchCounts, windows: List[int]) -> SketchCounts:
+        """Add local bucket counts to the store and return the merged counts.
+
+        Args:
+            key: Sketch key (provider and model).
+            pending: Bucket counts recorded locally since the last merge.
+            windows: Window indexes to return the merged counts for.
+
+        Returns:
+            The bucket counts of all processes for the requested windows.
+        """
+        pass
+
+
+class TTFSLatencySketch:
+    """Rolling quantile sketch of TTFS latencies.
+
+    Latencies are counted in logarithmic buckets, so quantiles have a bounded
+    relative error, and in windows of `window_secs` aligned to wall-clock time,
+    so sketches of different processes can be merged. Quantiles are computed
+    over the current and the previous window.
+    """
+
+    def __init__(
+        self,
+        *,
+        relative_accuracy: float = 0.02,
+        window_secs: float = 600.0,
+        min_samples: int = 100,
+    ):
+        """Initialize the sketch.
+
+        Args:
+            relative_accuracy: Relative error of the returned quantiles.
+            window_secs: Length of a window in seconds.
+            min_samples: Samples needed before quantiles are returned. A P99
+                over fewer samples is little more than their maximum.
+        """
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._window_secs = window_secs
+        self._min_samples = min_samples
+        self._counts: SketchCounts = {}
+        self._pending: SketchCounts = {}
+
+    def _window(self, now: Optional[float] = None) -> int:
+        return int((now if now is not None else time.time()) // self._window_secs)
+
+    def windows(self, now: Optional[float] = None) -> List[int]:
+        """Window indexes quantiles are computed over (previous and current)."""
+        window = self._window(now)
+        return [window - 1, window]
+
+    def add(self, latency: float, *, now: Optional[float] = None, pending: bool = False):
+        """Record a latency.
+
+        Args:
+            latency: Latency in seconds.
+            now: Wall-clock time of the sample. Defaults to the current time.
+            pending: Whether to keep the sample for the next merge with a store.
+        """
+        bucket = math.ceil(math.log(max(latency, 0.001)) / self._log_gamma)
+        counts = self._pending if pending else self._counts
+        window = counts.setdefault(self._window(now), defaultdict(int))
+        window[bucket] += 1
+        self._expire(now)
+
+    def count(self, *, now: Optional[float] = None) -> int:
+        """Number of samples in the current and previous windows."""
+        return sum(sum(counts.values()) for counts in self._merged(now).values())
+
+    def quantile(self, q: float, *, now: Optional[float] = None) -> Optional[float]:
+        """Estimate a quantile of the recent latencies.
+
+        Args:
+            q: Quantile between 0 and 1.
+            now: Wall-clock time. Defaults to the current time.
+
+        Returns:
+            The upper bound of the quantile's bucket in seconds, or None if
+            there are fewer than `min_samples` recent samples.
+        """
+        buckets: Dict[int, int] = defaultdict(int)
+        for counts in self._merged(now).values():
+            for bucket, count in counts.items():
+                buckets[bucket] += count
+
+        total = sum(buckets.values())
+        if total < self._min_samples:
+            return None
+
+        rank = max(1, math.ceil(q * total))
+        seen = 0
+        for bucket in sorted(buckets):
+            seen += buckets[bucket]
+            if seen >= rank:
+                return self._gamma**bucket
+        return None
+
+    def take_pending(self) -> SketchCounts:
+        """Take the samples recorded since the last merge with a store."""
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def set_counts(self, counts: SketchCounts):
+        """Replace the known counts, e.g. with the counts merged by a store."""
+        self._counts = {
+            window: defaultdict(int, {int(b): int(c) for b, c in buckets.items()})
+            for window, buckets in counts.items()
+        }
+        self._expire()
+
+    def restore_pending(self, pending: SketchCounts):
+        """Put back samples that could not be merged with a store."""
+        for window, buckets in pending.items():
+            counts = self._pending.setdefault(window, defaultdict(int))
+            for bucket, count in buckets.items():
+                counts[bucket] += count
+        self._expire()
+
+    def _merged(self, now: Optional[float]) -> SketchCounts:
+        merged = {}
+        for window in self.windows(now):
+            counts: Dict[int, int] = defaultdict(int)
+            for source in (self._counts, self._pending):
+                for bucket, count in source.get(window, {}).items():
+                    counts[bucket] += count
+            merged[window] = counts
+        return merged
+
+    def _expire(self, now: Optional[float] = None):
+        oldest = self.windows(now)[0]
+        for counts in (self._counts, self._pending):
+            for window in [w for w in counts if w < oldest]:
+                del counts[window]
+
+
+class TTFSLatencyEstimator:
+    """Process-wide TTFS sketches, one per STT provider and model.
+
+    STT services record the TTFS of each turn with `add()` and read the
+    current P99 with `p99()`. If a store is set, new samples are merged with
+    the store at most every `sync_interval_secs` per sketch.
+    """
+
+    def __init__(
+        self,
+        *,
+        store: Optional[BaseTTFSLatencyStore] = None,
+        sync_interval_secs: float = 10.0,
+        **sketch_kwargs,
+    ):
+        """Initialize the estimator.
+
+        Args:
+            store: Optional store to share sketches between processes.
+            sync_interval_secs: Minimum time between merges of a sketch.
+            **sketch_kwargs: Arguments for each `TTFSLatencySketch`.
+        """
+        self._store = store
+        self._sync_interval_secs = sync_interval_secs
+        self._sketch_kwargs = sketch_kwargs
+        self._sketches: Dict[str, TTFSLatencySketch] = {}
+        self._last_sync: Dict[str, float] = {}
+        self._syncing: Set[str] = set()
+
+    @staticmethod
+    def key(provider: str, model: str) -> str:
+        """Sketch key of an STT provider and model."""
+        return f"{provider}:{model}" if model else provider
+
+    @property
+    def store(self) -> Optional[BaseTTFSLatencyStore]:
+        """Store used to share sketches between processes, if any."""
+        return self._store
+
+    def set_store(self, store: Optional[BaseTTFSLatencyStore]):
+        """Set the store used to share sketches between processes."""
+        self._store = store
+
+    def sketch(self, key: str) -> TTFSLatencySketch:
+        """Get (or create) the sketch for the given key."""
+        sketch = self._sketches.get(key)
+        if not sketch:
+            sketch = TTFSLatencySketch(**self._sketch_kwargs)
+            self._sketches[key] = sketch
+        return sketch
+
+    def add(self, key: str, latency: float):
+        """Record the TTFS of a turn."""
+        self.sketch(key).add(latency, pending=self._store is not None)
+
+    def p99(self, key: str) -> Optional[float]:
+        """Current P99 TTFS for the given key, if enough turns were recorded."""
+        return self.sketch(key).quantile(0.99)
+
+    def should_sync(self, key: str) -> bool:
+        """Whether the sketch is due to be merged with the store."""
+        if not self._store or key in self._syncing:
+            return False
+        return time.monotonic() - self._last_sync.get(key, 0.0) >= self._sync_interval_secs
+
+    async def sync(self, key: str):
+        """Merge the sketch's new samples with the store."""
+        store = self._store
+        if not store or key in self._syncing:
+            return
+
+        sketch = self.sketch(key)
+        pending = sketch.take_pending()
+        self._syncing.add(key)
+        self._last_sync[key] = time.monotonic()
+        try:
+            sketch.set_counts(await store.merge(key, pending, sketch.windows()))
+        except asyncio.CancelledError:
+            sketch.restore_pending(pending)
+            raise
+        except Exception as e:
+            logger.warning(f"Unable to merge STT latency sketch {key}: {e}")
+            sketch.restore_pending(pending)
+        finally:
+            self._syncing.discard(key)
+
+
+# Shared by all the STT services of the process.
+ttfs_latency_estimator = TTFSLatencyEstimator()
@@ -35,12 +35,22 @@ from pipecat.metrics.metrics import TTFBMetricsData
 from pipecat.processors.frame_processor import FrameDirection
 from pipecat.services.ai_service import AIService
 from pipecat.services.stt_latency import DEFAULT_TTFS_P99
+from pipecat.services.stt_latency_estimator import TTFSLatencyEstimator
 from pipecat.services.websocket_service import WebsocketService
 from pipecat.transcriptions.language import Language
 
 # Duration in seconds of silent audio sent for WebSocket keepalive (100ms).
 _KEEPALIVE_SILENCE_DURATION = 0.1
 
+# Relative change of the estimated TTFS P99 that is published again.
+_TTFS_REPUBLISH_CHANGE = 0.1
+
+# Bounds of the estimated TTFS P99: never below this many seconds, nor above
+# this factor of the service's static value, so a skewed or polluted sketch
+# can't make turn stop timeouts unusably short or long.
+_TTFS_ESTIMATE_MIN = 0.25
+_TTFS_ESTIMATE_MAX_FACTOR = 2.0
+
 
 class STTService(AIService):
     """Base class for speech-to-text services.
@@ -76,6 +86,7 @@ class STTService(AIService):
         sample_rate: Optional[int] = None,
         stt_ttfb_timeout: float = 2.0,
         ttfs_p99_latency: Optional[float] = None,
+        ttfs_estimator: Optional[TTFSLatencyEstimator] = None,
         **kwargs,
     ):
         """Initialize the STT service.
@@ -95,6 +106,10 @@ class STTService(AIService):
                 This is broadcast via STTMetadataFrame at pipeline start for downstream
                 processors (e.g., turn strategies) to optimize timing. Subclasses provide
                 measured defaults; pass a value here to override for your deployment.
+            ttfs_estimator: Optional estimator to record the measured time to final
+                segment of every turn into. Once it has enough samples for this
+                service's provider and model, its P99 replaces `ttfs_p99_latency` and
+                is broadcast again via STTMetadataFrame whenever it changes.
             **kwargs: Additional arguments passed to the parent AIService.
         """
         super().__init__(**kwargs)
@@ -106,6 +121,8 @@ class STTService(AIService):
         self._muted: bool = False
         self._user_id: str = ""
         self._ttfs_p99_latency = ttfs_p99_latency
+        self._ttfs_estimator = ttfs_estimator
+        self._published_ttfs: Optional[float] = None
 
         # STT TTFB tracking state
         self._stt_ttfb_timeout = stt_ttfb_timeout
@@ -154,6 +171,14 @@ class STTService(AIService):
             self._finalize_pending = True
             self._finalize_requested = False
 
+    def set_ttfs_estimator(self, estimator: Optional[TTFSLatencyEstimator]):
+        """Set the estimator that measured time to final segment is recorded into.
+
+        Args:
+            estimator: The estimator, or None to only use `ttfs_p99_latency`.
+        """
+        self._ttfs_estimator = estimator
+
     @property
     def sample_rate(self) -> int:
         """Get the current sample rate for audio processing.
@@ -330,12 +355,48 @@ class STTService(AIService):
 
     async def _push_stt_metadata(self):
         """Push STT metadata frame for downstream processors (e.g., turn strategies)."""
-        ttfs = self._ttfs_p99_latency
+        ttfs = self._estimated_ttfs_p99() or self._ttfs_p99_latency
         if ttfs is None:
             ttfs = DEFAULT_TTFS_P99
             logger.warning(f"{self.name}: ttfs_p99_latency not set, using default {ttfs}s")
+        self._published_ttfs = ttfs
         await self.broadcast_frame(STTMetadataFrame, service_name=self.name, ttfs_p99_latency=ttfs)
 
+    def _ttfs_estimator_key(self) -> str:
+        return TTFSLatencyEstimator.key(self.__class__.__name__, self.model_name)
+
+    def _estimated_ttfs_p99(self) -> Optional[float]:
+        if not self._ttfs_estimator:
+            return None
+        return self._clamp_ttfs_estimate(self._ttfs_estimator.p99(self._ttfs_estimator_key()))
+
+    def _clamp_ttfs_estimate(self, estimate: Optional[float]) -> Optional[float]:
+        if estimate is None:
+            return None
+        static = self._ttfs_p99_latency or DEFAULT_TTFS_P99
+        return min(max(estimate, _TTFS_ESTIMATE_MIN), static * _TTFS_ESTIMATE_MAX_FACTOR)
+
+    async def _record_ttfs(self, ttfs: float):
+        """Record a measured time to final segment and publish a changed P99."""
+        if not self._ttfs_estimator:
+            return
+
+        key = self._ttfs_estimator_key()
+        self._ttfs_estimator.add(key, ttfs)
+        if self._ttfs_estimator.should_sync(key):
+            self.create_task(self._ttfs_estimator.sync(key), name="ttfs_estimator_sync")
+
+        p99 = self._clamp_ttfs_estimate(self._ttfs_estimator.p99(key))
+        if p99 is None:
+            return
+        published = self._published_ttfs
+        if published and abs(p99 - published) < published * _TTFS_REPUBLISH_CHANGE:
+            return
+
+        logger.debug(f"{self}: Estimated TTFS P99 is now {p99:.3f}s")
+        self._published_ttfs = p99
+        await self.broadcast_frame(STTMetadataFrame, service_name=self.name, ttfs_p99_latency=p99)
+
     async def _cancel_ttfb_timeout(self):
         """Cancel any pending TTFB timeout task."""
         if self._ttfb_timeout_task:
@@ -428,6 +489,7 @@ class STTService(AIService):
         """
         if ttfb >= 0:
             logger.debug(f"{self} TTFB: {ttfb:.3f}s")
+            await self._record_ttfs(ttfb)
             if self.metrics_enabled:
                 ttfb_data = TTFBMetricsData(
                     processor=self.name,
@@ -9,29 +9,80 @@
 This module provides:
 1. CachedTTSData - data structure for cached audio + alignment
 2. TTSCacheManager - Redis-based cache manager for TTS data
-3. TTSCacheWarmer - Pre-warming utility to cache common sentences
+3. TTSMemoryCache - In-process LRU of TTS data bounded by audio bytes
+4. TTSPhraseCache - Phrase cache used by ``TTSService`` (memory for live
+   phrases, shared through Redis for phrases synthesized ahead of time)
+
+Pre-warming utilities (e.g. ``ElevenLabsCacheWarmer``) write entries with the
+same keys.
 """
 
+import asyncio
 import hashlib
 import json
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from loguru import logger
 
 try:
     import msgpack
 except ModuleNotFoundError:
-    logger.warning("msgpack not installed. TTS caching will not work.")
     msgpack = None
 
 try:
     import redis.asyncio as aioredis
 except ModuleNotFoundError:
-    logger.warning("redis not installed. TTS caching will not work.")
     aioredis = None
 
 
+def normalize_tts_text(text: str) -> str:
+    """Normalize text for cache lookups (case and whitespace insensitive).
+
+    Args:
+        text: The text to be synthesized
+
+    Returns:
+        The lowercased text with whitespace runs collapsed to single spaces
+    """
+    return " ".join(text.split()).lower()
+
+
+def generate_tts_cache_key(
+    text: str,
+    voice_id: str,
+    model: str,
+    sample_rate: int,
+    settings: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Generate a unique cache key for the given parameters.
+
+    Args:
+        text: The text to be synthesized
+        voice_id: Voice identifier
+        model: TTS model name
+        sample_rate: Audio sample rate
+        settings: Additional voice settings that affect output
+
+    Returns:
+        SHA256-based cache key
+    """
+    key_data = {
+        "text": normalize_tts_text(text),
+        "voice_id": voice_id,
+        "model": model,
+        "sample_rate": sample_rate,
+        "settings": settings or {},
+    }
+
+    # Settings may hold values that are not JSON serializable, use their string form.
+    key_str = json.dumps(key_data, sort_keys=True, default=str)
+    key_hash = hashlib.sha256(key_str.encode()).hexdigest()
+
+    return f"{TTSCacheManager.CACHE_PREFIX}{key_hash}"
+
+
 @dataclass
 class CachedTTSData:
     """Data structure for cached TTS audio and alignment data.
@@ -42,6 +93,8 @@ class CachedTTSData:
         num_channels: Number of audio channels
         word_timestamps: List of (word, timestamp_seconds) tuples
         total_duration_seconds: Total audio duration
+        ttfa_seconds: Time to first audio of the live synthesis that produced
+            this entry (0 if unknown)
     """
 
     audio_chunks: List[bytes]
@@ -49,6 +102,12 @@ class CachedTTSData:
     num_channels: int
     word_timestamps: List[Tuple[str, float]]
     total_duration_seconds: float
+    ttfa_seconds: float = 0.0
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the audio chunks in bytes."""
+        return sum(len(chunk) for chunk in self.audio_chunks)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -58,6 +117,7 @@ class CachedTTSData:
             "num_channels": self.num_channels,
             "word_timestamps": self.word_timestamps,
             "total_duration_seconds": self.total_duration_seconds,
+            "ttfa_seconds": self.ttfa_seconds,
         }
 
     @classmethod
@@ -69,6 +129,7 @@ class CachedTTSData:
             num_channels=data["num_channels"],
             word_timestamps=[tuple(wt) for wt in data["word_timestamps"]],
             total_duration_seconds=data["total_duration_seconds"],
+            ttfa_seconds=data.get("ttfa_seconds", 0.0),
         )
 
 
@@ -99,6 +160,9 @@ class TTSCacheManager:
         self._cache_ttl_seconds = cache_ttl_seconds
         self._redis_client: Optional[Any] = None
 
+        if msgpack is None or aioredis is None:
+            logger.warning("msgpack or redis not installed. TTS caching will not work.")
+
     async def connect(self):
         """Establish connection to Redis."""
         if aioredis is None:
@@ -134,21 +198,7 @@ class TTSCacheManager:
         Returns:
             SHA256-based cache key
         """
-        # Normalize text: lowercase and strip whitespace
-        normalized_text = text.strip().lower()
-
-        key_data = {
-            "text": normalized_text,
-            "voice_id": voice_id,
-            "model": model,
-            "sample_rate": sample_rate,
-            "settings": settings or {},
-        }
-
-        key_str = json.dumps(key_data, sort_keys=True)
-        key_hash = hashlib.sha256(key_str.encode()).hexdigest()
-
-        return f"{self.CACHE_PREFIX}{key_hash}"
+        return generate_tts_cache_key(text, voice_id, model, sample_rate, settings)
 
     async def get(self, cache_key: str) -> Optional[CachedTTSData]:
         """Retrieve cached TTS data.
@@ -231,3 +281,301 @@ class TTSCacheManager:
         except Exception as e:
             logger.warning(f"Error checking cache: {e}")
             return False
+
+
+class TTSMemoryCache:
+    """In-process LRU cache of TTS data, bounded by the size of the audio.
+
+    Entries larger than ``max_entry_bytes`` are not cached, so a single long
+    phrase can't evict the short ones that repeat the most.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entry_bytes: Optional[int] = None):
+        """Initialize the memory cache.
+
+        Args:
+            max_bytes: Maximum total size of the cached audio in bytes
+            max_entry_bytes: Maximum audio size of a single entry (defaults to
+                a quarter of ``max_bytes``)
+        """
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = max_entry_bytes or max_bytes // 4
+        self._entries: OrderedDict[str, CachedTTSData] = OrderedDict()
+        self._size_bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the cached audio in bytes."""
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
+
+    def get(self, cache_key: str) -> Optional[CachedTTSData]:
+        """Retrieve cached TTS data and mark it as recently used.
+
+        Args:
+            cache_key: The cache key to look up
+
+        Returns:
+            CachedTTSData if found, None otherwise
+        """
+        data = self._entries.get(cache_key)
+        if data is not None:
+            self._entries.move_to_end(cache_key)
+        return data
+
+    def set(self, cache_key: str, data: CachedTTSData) -> bool:
+        """Store TTS data, evicting the least recently used entries if needed.
+
+        Args:
+            cache_key: The cache key to store under
+            data: The TTS data to cache
+
+        Returns:
+            True if stored, False if the entry is too large
+        """
+        size = data.size_bytes
+        if size > self._max_entry_bytes:
+            return False
+
+        self.delete(cache_key)
+        self._entries[cache_key] = data
+        self._size_bytes += size
+        while self._size_bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size_bytes -= evicted.size_bytes
+        return True
+
+    def delete(self, cache_key: str):
+        """Delete a cache entry.
+
+        Args:
+            cache_key: The cache key to delete
+        """
+        data = self._entries.pop(cache_key, None)
+        if data is not None:
+            self._size_bytes -= data.size_bytes
+
+
+class TTSPhraseCache:
+    """Phrase cache used by ``TTSService``.
+
+    Lookups of phrases spoken live only go to the in-process
+    ``TTSMemoryCache``, so a miss costs no network round trip. Most live
+    phrases are unique (and may contain personal data), so a phrase
+    synthesized live is only cached once it's seen ``admit_after`` times, and
+    only in memory.
+
+    Static phrases (e.g. the fixed messages of a workflow) are synthesized
+    ahead of time with ``ensure()``, which also shares them through Redis (if
+    a ``TTSCacheManager`` is given): another worker loads them from Redis
+    instead of synthesizing them again. Writes to Redis happen in the
+    background.
+
+    A single instance is meant to be shared by all the TTS services of the
+    process, so a phrase synthesized for one call is replayed for the next
+    ones.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory_max_bytes: int = 64 * 1024 * 1024,
+        cache_manager: Optional[TTSCacheManager] = None,
+        admit_after: int = 2,
+        max_tracked_phrases: int = 10000,
+    ):
+        """Initialize the phrase cache.
+
+        Args:
+            memory_max_bytes: Maximum size of the audio kept in memory in bytes
+            cache_manager: Optional Redis cache for phrases synthesized with
+                ``ensure()``
+            admit_after: Times a phrase must be seen live before it's cached
+            max_tracked_phrases: Maximum number of phrases seen live but not
+                cached yet that are remembered (by cache key)
+        """
+        self._memory = TTSMemoryCache(max_bytes=memory_max_bytes)
+        self._cache_manager = cache_manager
+        self._admit_after = admit_after
+        self._max_tracked_phrases = max_tracked_phrases
+        # Cache key -> times seen live, for phrases not admitted yet
+        self._sightings: OrderedDict[str, int] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._redis_loads = 0
+        self._ttfa_saved_seconds = 0.0
+        # Phrases being loaded or synthesized by ensure(), by cache key
+        self._pending: Dict[str, asyncio.Future] = {}
+        # Writes to Redis in flight
+        self._writes: Set[asyncio.Task] = set()
+
+    @property
+    def memory(self) -> TTSMemoryCache:
+        """The in-process tier."""
+        return self._memory
+
+    async def connect(self):
+        """Connect the Redis tier, if any. Safe to call more than once."""
+        if not self._cache_manager:
+            return
+        try:
+            await self._cache_manager.connect()
+        except Exception as e:
+            logger.warning(f"Failed to connect to TTS cache, using memory only: {e}")
+            self._cache_manager = None
+
+    async def disconnect(self):
+        """Wait for the writes in flight and disconnect the Redis tier, if any."""
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+        if self._cache_manager:
+            await self._cache_manager.disconnect()
+
+    def generate_cache_key(
+        self,
+        text: str,
+        voice_id: str,
+        model: str,
+        sample_rate: int,
+        settings: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Generate the cache key of a phrase.
+
+        Args:
+            text: The text to be synthesized
+            voice_id: Voice identifier
+            model: TTS model name
+            sample_rate: Audio sample rate
+            settings: Additional voice settings that affect output
+
+        Returns:
+            SHA256-based cache key
+        """
+        return generate_tts_cache_key(text, voice_id, model, sample_rate, settings)
+
+    def get(self, cache_key: str) -> Optional[CachedTTSData]:
+        """Look up a phrase spoken live, in memory only.
+
+        Args:
+            cache_key: The cache key to look up
+
+        Returns:
+            The cached data, or None on a miss
+        """
+        data = self._memory.get(cache_key)
+        if data is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return data
+
+    def admit(self, cache_key: str) -> bool:
+        """Record that a phrase missing from the cache is synthesized live.
+
+        Args:
+            cache_key: The cache key of the phrase
+
+        Returns:
+            True if the phrase has been seen often enough to be cached
+        """
+        sightings = self._sightings.pop(cache_key, 0) + 1
+        if sightings >= self._admit_after:
+            return True
+        self._sightings[cache_key] = sightings
+        if len(self._sightings) > self._max_tracked_phrases:
+            self._sightings.popitem(last=False)
+        return False
+
+    def set(self, cache_key: str, data: CachedTTSData, *, persist: bool = False):
+        """Store a phrase in memory and, if asked, in Redis in the background.
+
+        Args:
+            cache_key: The cache key to store under
+            data: The TTS data to cache
+            persist: Whether to share the phrase with other workers through Redis
+        """
+        self._memory.set(cache_key, data)
+        if persist and self._cache_manager:
+            task = asyncio.create_task(self._cache_manager.set(cache_key, data))
+            self._writes.add(task)
+            task.add_done_callback(self._writes.discard)
+
+    async def ensure(
+        self,
+        cache_key: str,
+        synthesize: Callable[[], Awaitable[Optional[CachedTTSData]]],
+    ) -> bool:
+        """Make sure a phrase is in memory, synthesizing it if needed.
+
+        Phrases found in Redis are loaded into memory. Concurrent calls for the
+        same key (e.g. calls of the same workflow starting together) share a
+        single synthesis. Lookups made here are not counted in ``stats``.
+
+        Args:
+            cache_key: The cache key of the phrase
+            synthesize: Coroutine function returning the TTS data of the
+                phrase, or None if it couldn't be synthesized
+
+        Returns:
+            True if the phrase is cached
+        """
+        if self._memory.get(cache_key) is not None:
+            return True
+
+        pending = self._pending.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load_or_synthesize(cache_key, synthesize))
+            self._pending[cache_key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(cache_key, None))
+        # Other callers may still be waiting if this one is cancelled.
+        return await asyncio.shield(pending)
+
+    async def _load_or_synthesize(
+        self,
+        cache_key: str,
+        synthesize: Callable[[], Awaitable[Optional[CachedTTSData]]],
+    ) -> bool:
+        if self._cache_manager:
+            data = await self._cache_manager.get(cache_key)
+            if data is not None:
+                self._redis_loads += 1
+                self._memory.set(cache_key, data)
+                return True
+
+        data = await synthesize()
+        if data is None:
+            return False
+        self.set(cache_key, data, persist=True)
+        return True
+
+    def record_ttfa_saved(self, seconds: float):
+        """Record the time to first audio saved by a cache hit.
+
+        Args:
+            seconds: Time to first audio saved in seconds
+        """
+        self._ttfa_saved_seconds += seconds
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses and hit rate of the phrases spoken
+            live, the phrases loaded from Redis by ``ensure()``, the time to
+            first audio saved and the size of the memory tier
+        """
+        hits = self._hits
+        lookups = hits + self._misses
+        return {
+            "hits": hits,
+            "misses": self._misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "redis_loads": self._redis_loads,
+            "ttfa_saved_seconds": self._ttfa_saved_seconds,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory.size_bytes,
+        }
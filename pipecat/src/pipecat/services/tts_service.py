@@ -7,9 +7,10 @@
 """Base classes for Text-to-speech services."""
 
 import asyncio
+import time
 import uuid
 from abc import abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import (
     Any,
     AsyncGenerator,
@@ -40,6 +41,7 @@ from pipecat.frames.frames import (
     InterruptionFrame,
     LLMFullResponseEndFrame,
     LLMFullResponseStartFrame,
+    MetricsFrame,
     OutputAudioRawFrame,
     StartFrame,
     TextFrame,
@@ -51,8 +53,10 @@ from pipecat.frames.frames import (
     TTSTextFrame,
     TTSUpdateSettingsFrame,
 )
+from pipecat.metrics.metrics import TTSPhraseCacheMetricsData
 from pipecat.processors.frame_processor import FrameDirection
 from pipecat.services.ai_service import AIService
+from pipecat.services.tts_cache import CachedTTSData, TTSPhraseCache
 from pipecat.services.websocket_service import WebsocketService
 from pipecat.transcriptions.language import Language
 from pipecat.utils.text.base_text_aggregator import BaseTextAggregator
@@ -72,6 +76,19 @@ class TTSContext:
     append_to_context: bool = True
 
 
+@dataclass
+class _PhraseCapture:
+    """Audio and word timestamps of a phrase being synthesized live."""
+
+    cache_key: str
+    started_at: float
+    audio_chunks: List[bytes] = field(default_factory=list)
+    word_timestamps: List[Tuple[str, float]] = field(default_factory=list)
+    sample_rate: int = 0
+    num_channels: int = 1
+    ttfa: float = 0.0
+
+
 class TTSService(AIService):
     """Base class for text-to-speech services.
 
@@ -79,6 +96,13 @@ class TTSService(AIService):
     filtering, audio generation, and frame management. Supports configurable
     sentence aggregation, silence insertion, and frame processing control.
 
+    With a ``TTSPhraseCache``, phrases are looked up before synthesis and
+    replayed (audio and word timestamps) on a hit. Phrases synthesized live
+    while no other synthesis is in flight are stored once they complete,
+    unless interrupted, if they repeat (see ``TTSPhraseCache.admit()``). Each lookup is reported as
+    ``TTSPhraseCacheMetricsData``. Services that support it can also
+    synthesize phrases ahead of time with ``presynthesize()``.
+
     Event handlers:
         on_connected: Called when connected to the TTS service.
         on_disconnected: Called when disconnected from the TTS service.
@@ -143,6 +167,8 @@ class TTSService(AIService):
         text_filter: Optional[BaseTextFilter] = None,
         # Audio transport destination of the generated frames.
         transport_destination: Optional[str] = None,
+        # Phrase cache to replay repeated phrases from and populate from live synthesis.
+        phrase_cache: Optional[TTSPhraseCache] = None,
         **kwargs,
     ):
         """Initialize the TTS service.
@@ -176,6 +202,9 @@ class TTSService(AIService):
                     Use `text_filters` instead, which allows multiple filters.
 
             transport_destination: Destination for generated audio frames.
+            phrase_cache: Phrase cache to replay repeated phrases from. It is
+                populated from live synthesis of phrases that repeat and from
+                ``presynthesize()``.
             **kwargs: Additional arguments passed to the parent AIService.
         """
         super().__init__(**kwargs)
@@ -230,6 +259,11 @@ class TTSService(AIService):
         self._processing_text: bool = False
         self._tts_contexts: Dict[str, TTSContext] = {}
 
+        self._phrase_cache: Optional[TTSPhraseCache] = phrase_cache
+        self._phrase_capture: Optional[_PhraseCapture] = None
+        # Whether audio of a live synthesis may still arrive (until TTSStoppedFrame).
+        self._live_synthesis: bool = False
+
         self._register_event_handler("on_connected")
         self._register_event_handler("on_disconnected")
         self._register_event_handler("on_connection_error")
@@ -277,6 +311,78 @@ class TTSService(AIService):
         """
         self._voice_id = voice
 
+    def set_phrase_cache(self, phrase_cache: Optional[TTSPhraseCache]):
+        """Set the phrase cache used to replay repeated phrases.
+
+        Args:
+            phrase_cache: The phrase cache, or None to disable it.
+        """
+        self._phrase_cache = phrase_cache
+        self._phrase_capture = None
+
+    def generate_phrase_cache_key(self, text: str) -> str:
+        """Generate the phrase cache key of the given text.
+
+        Args:
+            text: The text that would be sent to the TTS service.
+
+        Returns:
+            The cache key for this text with the current voice, model, sample
+            rate and settings.
+        """
+        return self._phrase_cache.generate_cache_key(
+            text=text,
+            voice_id=self._voice_id,
+            model=self.model_name,
+            sample_rate=self.sample_rate,
+            settings=self._get_cache_settings(),
+        )
+
+    def _get_cache_settings(self) -> Dict[str, Any]:
+        """Get settings that affect TTS output for cache key generation."""
+        return {"service": type(self).__name__, **self._settings}
+
+    @property
+    def supports_presynthesis(self) -> bool:
+        """Whether phrases can be synthesized ahead of time with `presynthesize()`.
+
+        Only services whose `run_tts()` yields all the audio of a phrase
+        support it (HTTP services such as OpenAI, Deepgram HTTP or Google).
+        `WordTTSService` and `WebsocketTTSService` subclasses (e.g. Cartesia,
+        ElevenLabs, Deepgram, Rime, Azure, Inworld) don't: their word
+        timestamps are tied to the phrase being played and their audio is
+        pushed by a receive task, so there is nothing to capture ahead of time.
+        Phrases they speak are synthesized when spoken.
+        """
+        return True
+
+    async def presynthesize(self, text: str) -> bool:
+        """Synthesize a phrase into the phrase cache before it's spoken.
+
+        When the phrase is later spoken (e.g. with a `TTSSpeakFrame`), it's
+        replayed from the cache. Text filters are not applied here, so phrases
+        that a filter changes won't be found. The service must be started.
+
+        Args:
+            text: The text of the phrase.
+
+        Returns:
+            True if the phrase is in the phrase cache.
+        """
+        if not self._phrase_cache or not self.supports_presynthesis:
+            return False
+
+        text = text.lstrip("\n")
+        if not text.strip():
+            return False
+
+        transformed_text = await self._transform_text(text, AggregationType.SENTENCE)
+        prepared_text = self._prepare_text_for_tts(transformed_text)
+        cache_key = self.generate_phrase_cache_key(prepared_text)
+        return await self._phrase_cache.ensure(
+            cache_key, lambda: self._synthesize_phrase(prepared_text, cache_key)
+        )
+
     def create_context_id(self) -> str:
         """Generate a unique context ID for a TTS request.
 
@@ -351,6 +457,8 @@ class TTSService(AIService):
         if self._push_stop_frames and not self._stop_frame_task:
             self._stop_frame_task = self.create_task(self._stop_frame_handler())
         self._tracing_enabled = frame.enable_tracing
+        if self._phrase_cache:
+            await self._phrase_cache.connect()
 
     async def stop(self, frame: EndFrame):
         """Stop the TTS service.
@@ -507,6 +615,8 @@ class TTSService(AIService):
         elif isinstance(frame, TTSUpdateSettingsFrame):
             await self._update_settings(frame.settings)
         elif isinstance(frame, BotStoppedSpeakingFrame):
+            # All the audio has been played, in case the service didn't push a TTSStoppedFrame.
+            self._live_synthesis = False
             await self._maybe_resume_frame_processing()
             await self.push_frame(frame, direction)
         else:
@@ -519,6 +629,16 @@ class TTSService(AIService):
             frame: The frame to push.
             direction: The direction to push the frame.
         """
+        # Record the audio of a phrase synthesized live. It's complete (and
+        # stored after the frame is pushed) when we see TTSStoppedFrame.
+        completed_capture = None
+        if isinstance(frame, TTSAudioRawFrame) and self._phrase_capture:
+            if not self._capture_phrase_audio(self._phrase_capture, frame):
+                self._phrase_capture = None
+        elif isinstance(frame, TTSStoppedFrame):
+            self._live_synthesis = False
+            completed_capture, self._phrase_capture = self._phrase_capture, None
+
         # Clean up context when we see TTSStoppedFrame
         if isinstance(frame, TTSStoppedFrame) and frame.context_id:
             if frame.context_id in self._tts_contexts:
@@ -548,6 +668,9 @@ class TTSService(AIService):
         ):
             await self._stop_frame_queue.put(frame)
 
+        if completed_capture:
+            self._store_phrase_capture(completed_capture)
+
     async def _stream_audio_frames_from_iterator(
         self,
         iterator: AsyncIterator[bytes],
@@ -612,6 +735,9 @@ class TTSService(AIService):
 
     async def _handle_interruption(self, frame: InterruptionFrame, direction: FrameDirection):
         self._processing_text = False
+        # Interrupted audio is incomplete, don't cache it.
+        self._live_synthesis = False
+        self._phrase_capture = None
         await self._text_aggregator.handle_interruption()
         for filter in self._text_filters:
             await filter.handle_interruption()
@@ -701,10 +827,7 @@ class TTSService(AIService):
         # TTS supported tags for spelling or emotion or replacing an @ with "at"). For TTS
         # services that support word-level timestamps, this CAN affect the resulting context
         # since the TTSTextFrames are generated from the TTS output stream
-        transformed_text = text
-        for aggregation_type, transform in self._text_transforms:
-            if aggregation_type == type or aggregation_type == "*":
-                transformed_text = await transform(transformed_text, type)
+        transformed_text = await self._transform_text(text, type)
 
         self._tts_contexts[context_id] = TTSContext(
             append_to_context=append_tts_text_to_context
@@ -718,7 +841,9 @@ class TTSService(AIService):
         # Trigger event before starting TTS
         await self._call_event_handler("on_tts_request", context_id, prepared_text)
 
-        await self.process_generator(self.run_tts(prepared_text, context_id))
+        if not await self._maybe_replay_cached_phrase(prepared_text, text, type, context_id):
+            self._live_synthesis = True
+            await self.process_generator(self.run_tts(prepared_text, context_id))
 
         await self.stop_processing_metrics()
 
@@ -738,6 +863,152 @@ class TTSService(AIService):
                 frame.append_to_context = append_tts_text_to_context
             await self.push_frame(frame)
 
+    async def _transform_text(self, text: str, aggregated_by: str) -> str:
+        for aggregation_type, transform in self._text_transforms:
+            if aggregation_type == aggregated_by or aggregation_type == "*":
+                text = await transform(text, aggregated_by)
+        return text
+
+    async def _maybe_replay_cached_phrase(
+        self, prepared_text: str, text: str, aggregated_by: str, context_id: str
+    ) -> bool:
+        """Replay the phrase from the phrase cache, or start capturing it on a miss.
+
+        Returns:
+            True if the phrase has been replayed from the cache.
+        """
+        if not self._phrase_cache:
+            return False
+
+        # The audio of a previous phrase might still arrive, so we can't tell
+        # which phrase it belongs to.
+        self._phrase_capture = None
+
+        # Cached audio would be played before the audio still being
+        # synthesized, so only use the cache when nothing is in flight.
+        if self._live_synthesis:
+            return False
+
+        started_at = time.monotonic()
+        cache_key = self.generate_phrase_cache_key(prepared_text)
+        cached = self._phrase_cache.get(cache_key)
+        if not cached:
+            await self._push_phrase_cache_metrics(hit=False)
+            # Only capture phrases that repeat, most live phrases are unique.
+            if self._phrase_cache.admit(cache_key):
+                self._phrase_capture = _PhraseCapture(cache_key, started_at=time.monotonic())
+            return False
+
+        ttfa_saved = max(0.0, cached.ttfa_seconds - (time.monotonic() - started_at))
+        self._phrase_cache.record_ttfa_saved(ttfa_saved)
+        logger.debug(f"{self}: replaying cached phrase [{prepared_text}]")
+
+        await self.push_frame(TTSStartedFrame(context_id=context_id))
+        for chunk in cached.audio_chunks:
+            await self.push_frame(
+                TTSAudioRawFrame(
+                    chunk, cached.sample_rate, cached.num_channels, context_id=context_id
+                )
+            )
+        await self._push_cached_phrase_text(cached, text, aggregated_by, context_id)
+        await self.push_frame(TTSStoppedFrame(context_id=context_id))
+
+        await self._push_phrase_cache_metrics(hit=True, tier="memory", ttfa_saved=ttfa_saved)
+        return True
+
+    async def _push_cached_phrase_text(
+        self, cached: CachedTTSData, text: str, aggregated_by: str, context_id: str
+    ):
+        """Push the text of a replayed phrase.
+
+        If `_push_text_frames` is set the text is pushed after the audio as
+        for live synthesis, otherwise we push it here.
+        """
+        if self._push_text_frames:
+            return
+        frame = TTSTextFrame(text, aggregated_by=aggregated_by)
+        frame.context_id = context_id
+        if context_id in self._tts_contexts:
+            frame.append_to_context = self._tts_contexts[context_id].append_to_context
+        await self.push_frame(frame)
+
+    def _capture_phrase_audio(self, capture: _PhraseCapture, frame: TTSAudioRawFrame) -> bool:
+        """Add the audio to the capture, False if its format changed."""
+        if not capture.audio_chunks:
+            capture.ttfa = time.monotonic() - capture.started_at
+            capture.sample_rate = frame.sample_rate
+            capture.num_channels = frame.num_channels
+        elif (frame.sample_rate, frame.num_channels) != (
+            capture.sample_rate,
+            capture.num_channels,
+        ):
+            return False
+        capture.audio_chunks.append(frame.audio)
+        return True
+
+    async def _synthesize_phrase(self, text: str, cache_key: str) -> Optional[CachedTTSData]:
+        """Synthesize a phrase outside of the pipeline, for `presynthesize()`."""
+        logger.debug(f"{self}: presynthesizing [{text}]")
+        capture = _PhraseCapture(cache_key, started_at=time.monotonic())
+        try:
+            async for frame in self.run_tts(text, self.create_context_id()):
+                if isinstance(frame, ErrorFrame):
+                    logger.warning(f"{self}: unable to presynthesize [{text}]: {frame.error}")
+                    return None
+                if isinstance(frame, TTSAudioRawFrame):
+                    if not self._capture_phrase_audio(capture, frame):
+                        return None
+        except Exception as e:
+            logger.warning(f"{self}: unable to presynthesize [{text}]: {e}")
+            return None
+        return self._phrase_capture_data(capture)
+
+    def _store_phrase_capture(self, capture: _PhraseCapture):
+        if not self._phrase_cache:
+            return
+        data = self._phrase_capture_data(capture)
+        if data:
+            # Phrases spoken live stay in this process.
+            self._phrase_cache.set(capture.cache_key, data)
+
+    def _phrase_capture_data(self, capture: _PhraseCapture) -> Optional[CachedTTSData]:
+        if not capture.audio_chunks:
+            return None
+
+        num_bytes = sum(len(chunk) for chunk in capture.audio_chunks)
+        duration = num_bytes / (capture.sample_rate * capture.num_channels * 2)
+        word_timestamps = capture.word_timestamps
+        if word_timestamps:
+            # Some services time words from the start of the turn, not of the phrase.
+            first = word_timestamps[0][1]
+            word_timestamps = [(word, timestamp - first) for word, timestamp in word_timestamps]
+            # Words after the end of the audio mean we missed some of it.
+            if word_timestamps[-1][1] > duration:
+                logger.debug(f"{self}: not caching phrase with incomplete audio")
+                return None
+
+        return CachedTTSData(
+            audio_chunks=capture.audio_chunks,
+            sample_rate=capture.sample_rate,
+            num_channels=capture.num_channels,
+            word_timestamps=word_timestamps,
+            total_duration_seconds=duration,
+            ttfa_seconds=capture.ttfa,
+        )
+
+    async def _push_phrase_cache_metrics(
+        self, *, hit: bool, tier: Optional[str] = None, ttfa_saved: float = 0.0
+    ):
+        if self.can_generate_metrics() and self.metrics_enabled:
+            data = TTSPhraseCacheMetricsData(
+                processor=self.name,
+                model=self.model_name,
+                hit=hit,
+                tier=tier,
+                ttfa_saved=ttfa_saved,
+            )
+            await self.push_frame(MetricsFrame(data=[data]))
+
     async def _stop_frame_handler(self):
         has_started = False
         while True:
@@ -773,6 +1044,13 @@ class WordTTSService(TTSService):
         self._initial_word_times = []
         self._words_task = None
         self._llm_response_started: bool = False
+        # Whether a phrase of the current LLM response was replayed from the phrase cache.
+        self._phrase_replayed: bool = False
+
+    @property
+    def supports_presynthesis(self) -> bool:
+        """Word timestamps are queued for the phrase being played, so no."""
+        return False
 
     async def start_word_timestamps(self):
         """Start tracking word timestamps from the current time."""
@@ -797,6 +1075,13 @@ class WordTTSService(TTSService):
             word_times: List of (word, timestamp) tuples where timestamp is in seconds.
             context_id: Unique identifier for the TTS context.
         """
+        if self._phrase_capture:
+            self._phrase_capture.word_timestamps.extend(
+                (word, timestamp)
+                for word, timestamp in word_times
+                if word not in ("Reset", "TTSStoppedFrame")
+            )
+
         # Transform to include context_id in each tuple
         word_times_with_context = [(word, timestamp, context_id) for word, timestamp in word_times]
 
@@ -845,14 +1130,43 @@ class WordTTSService(TTSService):
 
         if isinstance(frame, LLMFullResponseStartFrame):
             self._llm_response_started = True
+            self._phrase_replayed = False
         elif isinstance(frame, (LLMFullResponseEndFrame, EndFrame)):
             await self.flush_audio()
+            # The service ends the response (with a "Reset" word) when it
+            # finishes synthesizing. If every phrase was replayed from the
+            # cache there's nothing being synthesized, so we end it here.
+            if self._phrase_replayed and self._llm_response_started and not self._live_synthesis:
+                await self._add_word_timestamps([("Reset", 0, None)])
+            self._phrase_replayed = False
 
     async def _handle_interruption(self, frame: InterruptionFrame, direction: FrameDirection):
         await super()._handle_interruption(frame, direction)
         self._llm_response_started = False
+        self._phrase_replayed = False
         await self.reset_word_timestamps()
 
+    async def _push_cached_phrase_text(
+        self, cached: CachedTTSData, text: str, aggregated_by: str, context_id: str
+    ):
+        """Push the words of a replayed phrase, timed from now."""
+        self._phrase_replayed = True
+        if self._push_text_frames or not cached.word_timestamps:
+            await super()._push_cached_phrase_text(cached, text, aggregated_by, context_id)
+            return
+
+        # Services that reset word timestamps when they see TTSStoppedFrame
+        # queue a "Reset" word, which is only handled once we have started.
+        await self.start_word_timestamps()
+        now = self.get_clock().get_time()
+        for word, timestamp in cached.word_timestamps:
+            frame = TTSTextFrame(word, aggregated_by=AggregationType.WORD)
+            frame.pts = now + seconds_to_nanoseconds(timestamp)
+            frame.context_id = context_id
+            if context_id in self._tts_contexts:
+                frame.append_to_context = self._tts_contexts[context_id].append_to_context
+            await self.push_frame(frame)
+
     def _create_words_task(self):
         if not self._words_task:
             self._words_queue = asyncio.Queue()
@@ -923,6 +1237,11 @@ class WebsocketTTSService(TTSService, WebsocketService):
         TTSService.__init__(self, **kwargs)
         WebsocketService.__init__(self, reconnect_on_error=reconnect_on_error, **kwargs)
 
+    @property
+    def supports_presynthesis(self) -> bool:
+        """Audio is received (and pushed) by the websocket task, so no."""
+        return False
+
     async def _report_error(self, error: ErrorFrame):
         await self._call_event_handler("on_connection_error", error.error)
         await self.push_error_frame(error)
@@ -0,0 +1,317 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Shared, batched Faster Whisper inference engine.
+
+Loading a ``WhisperModel`` per ``WhisperSTTService`` keeps one copy of the
+model per call and transcribes every user segment on its own. A
+``WhisperEngine`` owns a single model and a request queue shared by all the
+services of the process: segments that arrive while a batch is decoding are
+decoded together in the next one, with one encoder pass and one batched
+``generate()`` call.
+
+Segments longer than the model window (30 seconds), segments without a fixed
+language and batches of a single segment use ``WhisperModel.transcribe()``
+as before.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+from pydantic import BaseModel
+
+# Whisper decodes windows of 30 seconds of 16kHz audio.
+SAMPLE_RATE = 16000
+WINDOW_SAMPLES = 30 * SAMPLE_RATE
+# Mel frames of a 30-second window.
+WINDOW_FRAMES = 3000
+MAX_TOKENS = 448
+
+
+class WhisperEngineParams(BaseModel):
+    """Configuration parameters for a Whisper engine.
+
+    Parameters:
+        max_batch_size: Maximum number of segments decoded together.
+        max_batch_wait_secs: Time to wait for more segments before decoding a
+            batch that is not full. Segments that arrive while a batch is
+            decoding are batched anyway, so this can stay at 0.
+        beam_size: Beam size used for decoding.
+        vad_filter: Whether to run the Silero VAD of Faster Whisper on each
+            segment first, skipping segments without speech and trimming
+            leading and trailing silence.
+        vad_parameters: Options for the VAD filter (``VadOptions`` fields).
+        cpu_threads: Threads used by the model on CPU (0 for the default).
+    """
+
+    max_batch_size: int = 8
+    max_batch_wait_secs: float = 0.0
+    beam_size: int = 5
+    vad_filter: bool = False
+    vad_parameters: Optional[Dict[str, Any]] = None
+    cpu_threads: int = 0
+
+
+@dataclass
+class WhisperTranscription:
+    """Result of transcribing a segment with a ``WhisperEngine``.
+
+    Parameters:
+        text: Transcribed text.
+        queue_wait: Seconds the segment waited before its batch started decoding.
+        decode_time: Seconds spent decoding the batch.
+        batch_size: Number of segments decoded in the same batch.
+    """
+
+    text: str
+    queue_wait: float
+    decode_time: float
+    batch_size: int
+
+
+@dataclass
+class _WhisperRequest:
+    audio: np.ndarray
+    language: Optional[str]
+    no_speech_prob: float
+    future: asyncio.Future
+    queued_at: float = field(default_factory=time.monotonic)
+
+
+class WhisperEngine:
+    """One Faster Whisper model shared by many services, with batched decoding.
+
+    Requests are queued and decoded in a worker thread, one batch at a time;
+    the worker task only runs while there are queued requests.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        *,
+        device: str = "auto",
+        compute_type: str = "default",
+        params: Optional[WhisperEngineParams] = None,
+    ):
+        """Initialize the engine and load the model.
+
+        Args:
+            model: Faster Whisper model name or path.
+            device: The device to run inference on ('cpu', 'cuda', or 'auto').
+            compute_type: The compute type for inference ('default', 'int8', etc.).
+            params: Batching and prefilter configuration.
+        """
+        self._model_name = model
+        self._device = device
+        self._compute_type = compute_type
+        self._params = params or WhisperEngineParams()
+        self._model = None
+        self._pending: List[_WhisperRequest] = []
+        self._task: Optional[asyncio.Task] = None
+
+        self._load()
+
+    @property
+    def model(self):
+        """The loaded ``WhisperModel``, or None if it couldn't be loaded."""
+        return self._model
+
+    @property
+    def params(self) -> WhisperEngineParams:
+        """Batching and prefilter configuration."""
+        return self._params
+
+    def _load(self):
+        try:
+            from faster_whisper import WhisperModel
+
+            logger.debug(f"Loading Whisper model {self._model_name}...")
+            self._model = WhisperModel(
+                self._model_name,
+                device=self._device,
+                compute_type=self._compute_type,
+                cpu_threads=self._params.cpu_threads,
+            )
+            logger.debug("Loaded Whisper model")
+        except ModuleNotFoundError as e:
+            logger.error(f"Exception: {e}")
+            logger.error("In order to use Whisper, you need to `pip install pipecat-ai[whisper]`.")
+            self._model = None
+
+    async def transcribe(
+        self, audio: np.ndarray, *, language: Optional[str], no_speech_prob: float
+    ) -> WhisperTranscription:
+        """Transcribe a segment, batched with the segments of other services.
+
+        Args:
+            audio: 16kHz mono audio as float32 samples in the range [-1, 1].
+            language: Whisper language code, or None to detect the language.
+            no_speech_prob: Text with a no-speech probability at or above this
+                threshold is dropped.
+
+        Returns:
+            The transcription with its queue wait and decode times.
+        """
+        if not self._model:
+            raise RuntimeError("Whisper model not available")
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(_WhisperRequest(audio, language, no_speech_prob, future))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self):
+        while self._pending:
+            max_batch_size = self._params.max_batch_size
+            if self._params.max_batch_wait_secs and len(self._pending) < max_batch_size:
+                await asyncio.sleep(self._params.max_batch_wait_secs)
+
+            batch = [r for r in self._pending[:max_batch_size] if not r.future.done()]
+            del self._pending[:max_batch_size]
+            if not batch:
+                continue
+
+            started = time.monotonic()
+            try:
+                texts = await asyncio.to_thread(self._decode, batch)
+            except Exception as e:
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                continue
+            decode_time = time.monotonic() - started
+
+            for request, text in zip(batch, texts):
+                # Requests cancelled while decoding are already done.
+                if not request.future.done():
+                    request.future.set_result(
+                        WhisperTranscription(
+                            text=text,
+                            queue_wait=started - request.queued_at,
+                            decode_time=decode_time,
+                            batch_size=len(batch),
+                        )
+                    )
+
+    def _decode(self, batch: List[_WhisperRequest]) -> List[str]:
+        texts = [""] * len(batch)
+        groups: Dict[str, List[Tuple[int, np.ndarray]]] = {}
+        for index, request in enumerate(batch):
+            audio = self._prefilter(request.audio)
+            if audio is None:
+                continue
+            if request.language is None or len(audio) > WINDOW_SAMPLES:
+                texts[index] = self._transcribe(audio, request.language, request.no_speech_prob)
+            else:
+                groups.setdefault(request.language, []).append((index, audio))
+
+        for language, entries in groups.items():
+            if len(entries) == 1:
+                index, audio = entries[0]
+                texts[index] = self._transcribe(audio, language, batch[index].no_speech_prob)
+                continue
+            results = self._generate([audio for _, audio in entries], language)
+            for (index, _), (text, no_speech) in zip(entries, results):
+                if text and no_speech < batch[index].no_speech_prob:
+                    texts[index] = f"{text} "
+        return texts
+
+    def _prefilter(self, audio: np.ndarray) -> Optional[np.ndarray]:
+        """Trim the segment to its speech, or None if it has no speech."""
+        if not self._params.vad_filter:
+            return audio
+
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        speech = get_speech_timestamps(audio, VadOptions(**(self._params.vad_parameters or {})))
+        if not speech:
+            return None
+        return audio[speech[0]["start"] : speech[-1]["end"]]
+
+    def _transcribe(self, audio: np.ndarray, language: Optional[str], no_speech_prob: float) -> str:
+        segments, _ = self._model.transcribe(
+            audio, language=language, beam_size=self._params.beam_size
+        )
+        text = ""
+        for segment in segments:
+            if segment.no_speech_prob < no_speech_prob:
+                text += f"{segment.text} "
+        return text
+
+    def _generate(self, audios: List[np.ndarray], language: str) -> List[Tuple[str, float]]:
+        """Decode segments of the same language in one batch.
+
+        Returns:
+            The text and no-speech probability of each segment.
+        """
+        from faster_whisper.tokenizer import Tokenizer
+
+        tokenizer = Tokenizer(
+            self._model.hf_tokenizer,
+            self._model.model.is_multilingual,
+            task="transcribe",
+            language=language,
+        )
+        features = np.stack([self._window_features(audio) for audio in audios])
+        encoder_output = self._model.encode(features)
+        prompt = list(tokenizer.sot_sequence) + [tokenizer.no_timestamps]
+        results = self._model.model.generate(
+            encoder_output,
+            [prompt] * len(audios),
+            beam_size=self._params.beam_size,
+            max_length=MAX_TOKENS,
+            return_no_speech_prob=True,
+            suppress_blank=True,
+        )
+        return [
+            (
+                tokenizer.decode([t for t in result.sequences_ids[0] if t < tokenizer.eot]).strip(),
+                result.no_speech_prob,
+            )
+            for result in results
+        ]
+
+    def _window_features(self, audio: np.ndarray) -> np.ndarray:
+        """Mel features of a segment, padded to a 30-second window."""
+        features = self._model.feature_extractor(audio)[:, :WINDOW_FRAMES]
+        return np.pad(features, ((0, 0), (0, WINDOW_FRAMES - features.shape[-1])))
+
+
+_engines: Dict[Tuple[str, str, str], WhisperEngine] = {}
+
+
+def get_whisper_engine(
+    model: str,
+    *,
+    device: str = "auto",
+    compute_type: str = "default",
+    params: Optional[WhisperEngineParams] = None,
+) -> WhisperEngine:
+    """Get (or create) the engine shared by all the services of the process.
+
+    There is one engine per model, device and compute type. ``params`` only
+    apply when the engine is created.
+
+    Args:
+        model: Faster Whisper model name or path.
+        device: The device to run inference on ('cpu', 'cuda', or 'auto').
+        compute_type: The compute type for inference ('default', 'int8', etc.).
+        params: Batching and prefilter configuration for a new engine.
+
+    Returns:
+        The shared ``WhisperEngine``.
+    """
+    key = (model, device, compute_type)
+    engine = _engines.get(key)
+    if engine is None or engine.model is None:
+        engine = WhisperEngine(model, device=device, compute_type=compute_type, params=params)
+        _engines[key] = engine
+    return engine
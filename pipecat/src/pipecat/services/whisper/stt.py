@@ -18,8 +18,14 @@ import numpy as np
 from loguru import logger
 from typing_extensions import TYPE_CHECKING, override
 
-from pipecat.frames.frames import ErrorFrame, Frame, TranscriptionFrame
+from pipecat.frames.frames import ErrorFrame, Frame, MetricsFrame, TranscriptionFrame
+from pipecat.metrics.metrics import STTInferenceMetricsData
 from pipecat.services.stt_service import SegmentedSTTService
+from pipecat.services.whisper.engine import (
+    WhisperEngine,
+    WhisperTranscription,
+    get_whisper_engine,
+)
 from pipecat.transcriptions.language import Language, resolve_language
 from pipecat.utils.time import time_now_iso8601
 from pipecat.utils.tracing.service_decorators import traced_stt
@@ -177,6 +183,11 @@ class WhisperSTTService(SegmentedSTTService):
 
     This service uses Faster Whisper to perform speech-to-text transcription on audio
     segments. It supports multiple languages and various model sizes.
+
+    Services transcribe through a `WhisperEngine`. By default all the services
+    of the process with the same model, device and compute type share one
+    engine, so the model is loaded once and concurrent segments are decoded in
+    batches.
     """
 
     def __init__(
@@ -187,6 +198,7 @@ class WhisperSTTService(SegmentedSTTService):
         compute_type: str = "default",
         no_speech_prob: float = 0.4,
         language: Language = Language.EN,
+        engine: Optional[WhisperEngine] = None,
         **kwargs,
     ):
         """Initialize the Whisper STT service.
@@ -197,6 +209,9 @@ class WhisperSTTService(SegmentedSTTService):
             compute_type: The compute type for inference ('default', 'int8', 'int8_float16', etc.).
             no_speech_prob: Probability threshold for filtering out non-speech segments.
             language: The default language for transcription.
+            engine: Engine to transcribe with. Defaults to the engine shared by
+                the services of the process with the same model, device and
+                compute type.
             **kwargs: Additional arguments passed to SegmentedSTTService.
         """
         super().__init__(**kwargs)
@@ -205,6 +220,7 @@ class WhisperSTTService(SegmentedSTTService):
         self.set_model_name(model if isinstance(model, str) else model.value)
         self._no_speech_prob = no_speech_prob
         self._model: Optional[WhisperModel] = None
+        self._engine = engine
 
         self._settings = {
             "language": language,
@@ -244,24 +260,17 @@ class WhisperSTTService(SegmentedSTTService):
         self._settings["language"] = language
 
     def _load(self):
-        """Loads the Whisper model.
+        """Loads the Whisper model, or reuses the one of the shared engine.
 
         Note:
             If this is the first time this model is being run,
             it will take time to download from the Hugging Face model hub.
         """
-        try:
-            from faster_whisper import WhisperModel
-
-            logger.debug("Loading Whisper model...")
-            self._model = WhisperModel(
+        if not self._engine:
+            self._engine = get_whisper_engine(
                 self.model_name, device=self._device, compute_type=self._compute_type
             )
-            logger.debug("Loaded Whisper model")
-        except ModuleNotFoundError as e:
-            logger.error(f"Exception: {e}")
-            logger.error("In order to use Whisper, you need to `pip install pipecat-ai[whisper]`.")
-            self._model = None
+        self._model = self._engine.model
 
     @traced_stt
     async def _handle_transcription(
@@ -294,15 +303,13 @@ class WhisperSTTService(SegmentedSTTService):
         audio_float = np.frombuffer(audio, dtype=np.int16).astype(np.float32) / 32768.0
 
         whisper_lang = self.language_to_service_language(self._settings["language"])
-        segments, _ = await asyncio.to_thread(
-            self._model.transcribe, audio_float, language=whisper_lang
+        result = await self._engine.transcribe(
+            audio_float, language=whisper_lang, no_speech_prob=self._no_speech_prob
         )
-        text: str = ""
-        for segment in segments:
-            if segment.no_speech_prob < self._no_speech_prob:
-                text += f"{segment.text} "
+        text = result.text
 
         await self.stop_processing_metrics()
+        await self._push_inference_metrics(result)
 
         if text:
             await self._handle_transcription(text, True, self._settings["language"])
@@ -314,6 +321,17 @@ class WhisperSTTService(SegmentedSTTService):
                 self._settings["language"],
             )
 
+    async def _push_inference_metrics(self, result: WhisperTranscription):
+        if self.can_generate_metrics() and self.metrics_enabled:
+            data = STTInferenceMetricsData(
+                processor=self.name,
+                model=self.model_name,
+                queue_wait=result.queue_wait,
+                decode_time=result.decode_time,
+                batch_size=result.batch_size,
+            )
+            await self.push_frame(MetricsFrame(data=[data]))
+
 
 class WhisperSTTServiceMLX(WhisperSTTService):
     """Subclass of `WhisperSTTService` with MLX Whisper model support.
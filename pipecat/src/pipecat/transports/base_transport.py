@@ -86,6 +86,11 @@ class TransportParams(BaseModel):
         audio_out_end_silence_secs: How much silence to send after an EndFrame (0 for no silence).
         audio_out_max_consecutive_failures: Maximum consecutive audio write failures before cancelling.
         audio_out_sleep_between_failures: Sleep duration in seconds between consecutive failures.
+        audio_out_shared_clock: Pace audio output on the event loop's shared media clock
+            instead of a timer per audio chunk (network transports only).
+        audio_out_send_ahead_secs: How far audio output may run ahead of real time, so
+            event loop stalls are caught up and absorbed by the receiver's jitter buffer
+            (network transports only).
         audio_in_enabled: Enable audio input streaming.
         audio_in_sample_rate: Input audio sample rate in Hz.
         audio_in_channels: Number of input audio channels.
@@ -147,6 +152,8 @@ class TransportParams(BaseModel):
     audio_out_end_silence_secs: int = 2
     audio_out_max_consecutive_failures: int = 10
     audio_out_sleep_between_failures: float = 0.5
+    audio_out_shared_clock: bool = False
+    audio_out_send_ahead_secs: float = 0.0
     audio_in_enabled: bool = False
     audio_in_sample_rate: Optional[int] = None
     audio_in_channels: int = 1
@@ -11,9 +11,7 @@ communication over WebSocket connections, with support for audio streaming,
 frame serialization, and connection management.
 """
 
-import asyncio
 import io
-import time
 import wave
 from typing import Awaitable, Callable, Optional
 
@@ -40,6 +38,7 @@ from pipecat.transports.base_input import BaseInputTransport
 from pipecat.transports.base_output import BaseOutputTransport
 from pipecat.transports.base_transport import BaseTransport, TransportParams
 from pipecat.utils.asyncio.task_manager import BaseTaskManager
+from pipecat.utils.media_clock import MediaPacer
 
 
 class WebsocketClientParams(TransportParams):
@@ -336,8 +335,10 @@ class WebsocketClientOutputTransport(BaseOutputTransport):
         # would be sending it to quickly. Instead, we want to block to emulate
         # an audio device, this is what the send interval is. It will be
         # computed on StartFrame.
-        self._send_interval = 0
-        self._next_send_time = 0
+        self._pacer = MediaPacer(
+            send_ahead_secs=params.audio_out_send_ahead_secs,
+            use_shared_clock=params.audio_out_shared_clock,
+        )
 
         # Whether we have seen a StartFrame already.
         self._initialized = False
@@ -364,7 +365,7 @@ class WebsocketClientOutputTransport(BaseOutputTransport):
 
         self._initialized = True
 
-        self._send_interval = (self.audio_chunk_size / self.sample_rate) / 2
+        self._pacer.set_interval((self.audio_chunk_size / self.sample_rate) / 2)
         if self._params.serializer:
             await self._params.serializer.setup(frame)
         await self._session.connect()
@@ -391,6 +392,7 @@ class WebsocketClientOutputTransport(BaseOutputTransport):
     async def cleanup(self):
         """Clean up the output transport resources."""
         await super().cleanup()
+        await self._pacer.close()
         await self._transport.cleanup()
 
     async def send_message(
@@ -456,14 +458,7 @@ class WebsocketClientOutputTransport(BaseOutputTransport):
 
     async def _write_audio_sleep(self):
         """Simulate audio playback timing with sleep delays."""
-        # Simulate a clock.
-        current_time = time.monotonic()
-        sleep_duration = max(0, self._next_send_time - current_time)
-        await asyncio.sleep(sleep_duration)
-        if sleep_duration == 0:
-            self._next_send_time = time.monotonic() + self._send_interval
-        else:
-            self._next_send_time += self._send_interval
+        await self._pacer.wait()
 
 
 class WebsocketClientTransport(BaseTransport):
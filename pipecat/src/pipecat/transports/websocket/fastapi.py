@@ -13,7 +13,6 @@ with configurable session timeouts and WAV header generation.
 
 import asyncio
 import io
-import time
 import typing
 import wave
 from typing import Awaitable, Callable, Optional
@@ -39,6 +38,7 @@ from pipecat.transports.base_input import BaseInputTransport
 from pipecat.transports.base_output import BaseOutputTransport
 from pipecat.transports.base_transport import BaseTransport, TransportParams
 from pipecat.utils.enums import EndTaskReason
+from pipecat.utils.media_clock import MediaPacer
 
 try:
     from fastapi import WebSocket
@@ -361,8 +361,10 @@ class FastAPIWebsocketOutputTransport(BaseOutputTransport):
         # would be sending it to quickly. Instead, we want to block to emulate
         # an audio device, this is what the send interval is. It will be
         # computed on StartFrame.
-        self._send_interval = 0
-        self._next_send_time = 0
+        self._pacer = MediaPacer(
+            send_ahead_secs=params.audio_out_send_ahead_secs,
+            use_shared_clock=params.audio_out_shared_clock,
+        )
 
         # Buffer for optional protocol-level audio packetization.
         # Some serializers may emit arbitrarily sized raw PCM payloads, while
@@ -391,7 +393,7 @@ class FastAPIWebsocketOutputTransport(BaseOutputTransport):
         await self._client.setup(frame)
         if self._params.serializer:
             await self._params.serializer.setup(frame)
-        self._send_interval = (self.audio_chunk_size / self.sample_rate) / 2
+        self._pacer.set_interval((self.audio_chunk_size / self.sample_rate) / 2)
         await self.set_transport_ready(frame)
 
     async def stop(self, frame: EndFrame):
@@ -424,6 +426,7 @@ class FastAPIWebsocketOutputTransport(BaseOutputTransport):
     async def cleanup(self):
         """Clean up transport resources."""
         await super().cleanup()
+        await self._pacer.close()
         await self._transport.cleanup()
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
@@ -441,7 +444,7 @@ class FastAPIWebsocketOutputTransport(BaseOutputTransport):
                 self._audio_send_buffer.clear()
 
             await self._write_frame(frame)
-            self._next_send_time = 0
+            self._pacer.reset()
 
     async def send_message(
         self, frame: OutputTransportMessageFrame | OutputTransportMessageUrgentFrame
@@ -524,14 +527,7 @@ class FastAPIWebsocketOutputTransport(BaseOutputTransport):
 
     async def _write_audio_sleep(self):
         """Simulate audio playback timing with appropriate delays."""
-        # Simulate a clock.
-        current_time = time.monotonic()
-        sleep_duration = max(0, self._next_send_time - current_time)
-        await asyncio.sleep(sleep_duration)
-        if sleep_duration == 0:
-            self._next_send_time = time.monotonic() + self._send_interval
-        else:
-            self._next_send_time += self._send_interval
+        await self._pacer.wait()
 
 
 class FastAPIWebsocketTransport(BaseTransport):
@@ -13,7 +13,6 @@ handling, and frame serialization.
 
 import asyncio
 import io
-import time
 import wave
 from typing import Awaitable, Callable, Optional
 
@@ -38,6 +37,7 @@ from pipecat.serializers.base_serializer import FrameSerializer
 from pipecat.transports.base_input import BaseInputTransport
 from pipecat.transports.base_output import BaseOutputTransport
 from pipecat.transports.base_transport import BaseTransport, TransportParams
+from pipecat.utils.media_clock import MediaPacer
 
 try:
     import websockets
@@ -271,8 +271,10 @@ class WebsocketServerOutputTransport(BaseOutputTransport):
         # would be sending it to quickly. Instead, we want to block to emulate
         # an audio device, this is what the send interval is. It will be
         # computed on StartFrame.
-        self._send_interval = 0
-        self._next_send_time = 0
+        self._pacer = MediaPacer(
+            send_ahead_secs=params.audio_out_send_ahead_secs,
+            use_shared_clock=params.audio_out_shared_clock,
+        )
 
         # Whether we have seen a StartFrame already.
         self._initialized = False
@@ -303,7 +305,7 @@ class WebsocketServerOutputTransport(BaseOutputTransport):
 
         if self._params.serializer:
             await self._params.serializer.setup(frame)
-        self._send_interval = (self.audio_chunk_size / self.sample_rate) / 2
+        self._pacer.set_interval((self.audio_chunk_size / self.sample_rate) / 2)
         await self.set_transport_ready(frame)
 
     async def stop(self, frame: EndFrame):
@@ -327,6 +329,7 @@ class WebsocketServerOutputTransport(BaseOutputTransport):
     async def cleanup(self):
         """Cleanup resources and parent transport."""
         await super().cleanup()
+        await self._pacer.close()
         await self._transport.cleanup()
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
@@ -340,7 +343,7 @@ class WebsocketServerOutputTransport(BaseOutputTransport):
 
         if isinstance(frame, InterruptionFrame):
             await self._write_frame(frame)
-            self._next_send_time = 0
+            self._pacer.reset()
 
     async def send_message(
         self, frame: OutputTransportMessageFrame | OutputTransportMessageUrgentFrame
@@ -405,14 +408,7 @@ class WebsocketServerOutputTransport(BaseOutputTransport):
 
     async def _write_audio_sleep(self):
         """Simulate audio device timing by sleeping between audio chunks."""
-        # Simulate a clock.
-        current_time = time.monotonic()
-        sleep_duration = max(0, self._next_send_time - current_time)
-        await asyncio.sleep(sleep_duration)
-        if sleep_duration == 0:
-            self._next_send_time = time.monotonic() + self._send_interval
-        else:
-            self._next_send_time += self._send_interval
+        await self._pacer.wait()
 
 
 class WebsocketServerTransport(BaseTransport):
@@ -37,6 +37,10 @@ class UserTurnController(BaseObject):
     - on_user_turn_started: Emitted when a user turn starts.
     - on_user_turn_stopped: Emitted when a user turn stops.
     - on_user_turn_stop_timeout: Emitted if no stop strategy triggers before timeout.
+    - on_user_turn_paused: Emitted when VAD detects the user stopped speaking
+      during a user turn, before any stop strategy has ended the turn.
+    - on_user_turn_resumed: Emitted when VAD detects the user speaking again
+      during a user turn.
     - on_push_frame: Emitted when a strategy wants to push a frame.
     - on_broadcast_frame: Emitted when a strategy wants to broadcast a frame.
 
@@ -54,6 +58,14 @@ class UserTurnController(BaseObject):
         async def on_user_turn_stop_timeout(controller):
             ...
 
+        @controller.event_handler("on_user_turn_paused")
+        async def on_user_turn_paused(controller):
+            ...
+
+        @controller.event_handler("on_user_turn_resumed")
+        async def on_user_turn_resumed(controller):
+            ...
+
         @controller.event_handler("on_push_frame")
         async def on_push_frame(controller, frame: Frame, direction: FrameDirection):
             ...
@@ -94,6 +106,8 @@ class UserTurnController(BaseObject):
         self._register_event_handler("on_user_turn_started", sync=True)
         self._register_event_handler("on_user_turn_stopped", sync=True)
         self._register_event_handler("on_user_turn_stop_timeout", sync=True)
+        self._register_event_handler("on_user_turn_paused", sync=True)
+        self._register_event_handler("on_user_turn_resumed", sync=True)
 
     @property
     def task_manager(self) -> BaseTaskManager:
@@ -204,12 +218,18 @@ class UserTurnController(BaseObject):
         # The user started talking, let's reset the user turn timeout.
         self._user_turn_stop_timeout_event.set()
 
+        if self._user_turn:
+            await self._call_event_handler("on_user_turn_resumed")
+
     async def _handle_vad_user_stopped_speaking(self, frame: VADUserStoppedSpeakingFrame):
         self._user_speaking = False
 
         # The user stopped talking, let's reset the user turn timeout.
         self._user_turn_stop_timeout_event.set()
 
+        if self._user_turn:
+            await self._call_event_handler("on_user_turn_paused")
+
     async def _handle_transcription(self, frame: TranscriptionFrame | InterimTranscriptionFrame):
         # We have received a transcription, let's reset the user turn timeout.
         self._user_turn_stop_timeout_event.set()
@@ -0,0 +1,227 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Shared media clock for pacing output audio.
+
+Network output transports emulate an audio device by waiting between audio
+chunks. Done with one ``asyncio.sleep`` per chunk per call, a process with
+hundreds of calls arms thousands of timers per second. The ``MediaClock``
+replaces those with a single timer wheel per event loop: it ticks at a fixed
+interval and, in one pass, releases every paced write whose send time has
+come.
+
+Each transport owns a ``MediaPacer`` that keeps its absolute send schedule.
+The pacer can run up to ``send_ahead_secs`` ahead of real time, so when the
+event loop stalls the missed chunks are caught up (and absorbed by the
+provider's jitter buffer) instead of the schedule drifting.
+"""
+
+import asyncio
+import math
+import time
+import weakref
+from typing import Dict, List, Optional
+
+# Default tick of the shared clock, the smallest output packet interval in use.
+DEFAULT_TICK_SECS = 0.01
+
+
+class MediaClock:
+    """Per-event-loop timer wheel releasing paced media writes.
+
+    Waiters are bucketed by the tick at (or after) their release time. A single
+    background task wakes up once per tick and releases all due buckets; it only
+    runs while there are waiters. The task belongs to the event loop rather than
+    to any call's pipeline, since calls come and go while it keeps ticking for
+    the others; it is cancelled when the last pacer unregisters.
+    """
+
+    def __init__(self, tick_secs: float = DEFAULT_TICK_SECS):
+        """Initialize the media clock.
+
+        Args:
+            tick_secs: Interval between clock ticks in seconds.
+        """
+        self._tick_secs = tick_secs
+        self._wheel: Dict[int, List[asyncio.Future]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._num_pacers = 0
+        self._ticks = 0
+        self._released = 0
+        self._total_lag = 0.0
+        self._max_lag = 0.0
+
+    @property
+    def tick_secs(self) -> float:
+        """Interval between clock ticks in seconds."""
+        return self._tick_secs
+
+    def register(self):
+        """Register a pacer using this clock."""
+        self._num_pacers += 1
+
+    async def unregister(self):
+        """Unregister a pacer using this clock, stopping the clock after the last one."""
+        self._num_pacers = max(0, self._num_pacers - 1)
+        if self._num_pacers == 0:
+            await self._stop()
+
+    async def wait_until(self, release_time: float):
+        """Wait until the first tick at or after ``release_time``.
+
+        Args:
+            release_time: ``time.monotonic()`` time at which to resume.
+        """
+        if release_time <= time.monotonic():
+            await asyncio.sleep(0)
+            return
+
+        slot = math.ceil(release_time / self._tick_secs)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._wheel.setdefault(slot, []).append(future)
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run(), name="media_clock")
+        await future
+
+    def stats(self) -> Dict[str, float]:
+        """Tick, release and tick lag counters of this clock."""
+        return {
+            "pacers": self._num_pacers,
+            "pending": sum(len(futures) for futures in self._wheel.values()),
+            "ticks": self._ticks,
+            "released": self._released,
+            "mean_lag_ms": (self._total_lag / self._ticks * 1000) if self._ticks else 0.0,
+            "max_lag_ms": self._max_lag * 1000,
+        }
+
+    async def _stop(self):
+        task, self._task = self._task, None
+        for futures in self._wheel.values():
+            for future in futures:
+                future.cancel()
+        self._wheel.clear()
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self):
+        next_tick = time.monotonic()
+        while self._wheel:
+            now = time.monotonic()
+            lag = max(0.0, now - next_tick)
+            self._ticks += 1
+            self._total_lag += lag
+            self._max_lag = max(self._max_lag, lag)
+
+            current = math.floor(now / self._tick_secs)
+            for slot in sorted(slot for slot in self._wheel if slot <= current):
+                for future in self._wheel.pop(slot):
+                    # Waiters cancelled while waiting are already done.
+                    if not future.done():
+                        future.set_result(None)
+                        self._released += 1
+
+            if not self._wheel:
+                break
+            next_tick = (current + 1) * self._tick_secs
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+
+
+class MediaPacer:
+    """Paces a transport's output writes to emulate an audio device.
+
+    Keeps an absolute schedule of send times (one every ``interval`` seconds)
+    and waits for each slot either with its own ``asyncio.sleep`` or on the
+    shared ``MediaClock`` of the running event loop.
+    """
+
+    def __init__(self, *, send_ahead_secs: float = 0.0, use_shared_clock: bool = False):
+        """Initialize the pacer.
+
+        Args:
+            send_ahead_secs: How far (in seconds) writes may run ahead of the
+                schedule. Also how far behind the schedule may fall (e.g. after
+                an event loop stall) and still be caught up instead of restarted.
+            use_shared_clock: Wait on the event loop's shared ``MediaClock``
+                instead of sleeping per write.
+        """
+        self._send_ahead_secs = send_ahead_secs
+        self._use_shared_clock = use_shared_clock
+        self._interval = 0.0
+        self._next_send_time = 0.0
+        self._clock: Optional[MediaClock] = None
+
+    @property
+    def interval(self) -> float:
+        """Time between consecutive writes in seconds."""
+        return self._interval
+
+    def set_interval(self, interval: float):
+        """Set the time between consecutive writes.
+
+        Args:
+            interval: Time between writes in seconds.
+        """
+        self._interval = interval
+
+    def reset(self):
+        """Restart the schedule, e.g. after an interruption."""
+        self._next_send_time = 0.0
+
+    async def close(self):
+        """Release the shared clock, if one was used."""
+        if self._clock:
+            clock = self._clock
+            self._clock = None
+            await clock.unregister()
+
+    async def wait(self):
+        """Wait for the next send slot and advance the schedule."""
+        now = time.monotonic()
+        if self._next_send_time < now - self._send_ahead_secs:
+            # Idle, or further behind than we are allowed to catch up.
+            self._next_send_time = now
+
+        release_time = self._next_send_time - self._send_ahead_secs
+        if release_time > now:
+            if self._use_shared_clock:
+                await self._get_clock().wait_until(release_time)
+            else:
+                await asyncio.sleep(release_time - now)
+        else:
+            await asyncio.sleep(0)
+
+        self._next_send_time += self._interval
+
+    def _get_clock(self) -> MediaClock:
+        if self._clock is None:
+            self._clock = get_media_clock()
+            self._clock.register()
+        return self._clock
+
+
+_clocks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, MediaClock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_media_clock() -> MediaClock:
+    """Get (or create) the shared media clock of the running event loop.
+
+    Returns:
+        The ``MediaClock`` shared by every pacer of the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    clock = _clocks.get(loop)
+    if clock is None:
+        clock = MediaClock()
+        _clocks[loop] = clock
+    return clock
@@ -19,6 +19,7 @@ Dependencies:
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import FrozenSet, List, Optional, Sequence, Tuple
 
 import nltk
@@ -176,6 +177,26 @@ def match_endofsentence(text: str) -> int:
     return 0
 
 
+@lru_cache(maxsize=4096)
+def match_sentence_boundary(token: str, next_char: str) -> bool:
+    """Check whether a sentence ends after a token, given the next character.
+
+    NLTK's Punkt tokenizer decides each boundary from the token ending in
+    punctuation and the token that follows it (abbreviations, initials,
+    numbers and orthographic context), so the decision for "Mr. S" is the same
+    wherever that pair appears in a longer text. Decisions are cached, which
+    makes repeated abbreviations and common sentence endings free.
+
+    Args:
+        token: The whitespace-delimited token ending in sentence punctuation.
+        next_char: The first non-whitespace character after the token.
+
+    Returns:
+        True if the sentence ends after the token, False otherwise.
+    """
+    return match_endofsentence(f"{token} {next_char}") == len(token)
+
+
 def parse_start_end_tags(
     text: str,
     tags: Sequence[StartEndTags],
@@ -11,11 +11,30 @@ until it finds an end-of-sentence marker, making it suitable for basic TTS
 text processing scenarios.
 """
 
+import re
 from typing import AsyncIterator, Optional
 
-from pipecat.utils.string import SENTENCE_ENDING_PUNCTUATION, match_endofsentence
+from pipecat.utils.string import (
+    SENTENCE_ENDING_PUNCTUATION,
+    UNAMBIGUOUS_SENTENCE_ENDING_PUNCTUATION,
+    match_endofsentence,
+    match_sentence_boundary,
+)
 from pipecat.utils.text.base_text_aggregator import Aggregation, AggregationType, BaseTextAggregator
 
+# Closing quotes and brackets that belong to the sentence they follow, e.g. 'He said "hi."'
+CLOSING_PUNCTUATION = frozenset({'"', "'", ")", "]", "}", "”", "’", "»", "」", "』", "）"})
+
+# Punctuation that ends a clause. Full-width marks need no trailing whitespace.
+CLAUSE_ENDING_PUNCTUATION = frozenset({",", ":", "—", "，", "、", "："})
+_FULL_WIDTH_CLAUSE_ENDING_PUNCTUATION = frozenset({"，", "、", "："})
+
+_SENTENCE_END = re.compile("[" + re.escape("".join(SENTENCE_ENDING_PUNCTUATION)) + "]")
+_SENTENCE_OR_CLAUSE_END = re.compile(
+    "[" + re.escape("".join(SENTENCE_ENDING_PUNCTUATION | CLAUSE_ENDING_PUNCTUATION)) + "]"
+)
+_NON_WHITESPACE = re.compile(r"\S")
+
 
 class SimpleTextAggregator(BaseTextAggregator):
     """Simple text aggregator that accumulates text until sentence boundaries.
@@ -23,15 +42,27 @@ class SimpleTextAggregator(BaseTextAggregator):
     This aggregator provides basic functionality for accumulating text tokens
     and releasing them when an end-of-sentence marker is detected. It's the
     most straightforward implementation of text aggregation for TTS processing.
+
+    Optionally, the first utterance of a turn can be released early at a clause
+    boundary (e.g. "Sure, ") so that speech synthesis starts before the first
+    full sentence has been generated.
     """
 
-    def __init__(self):
+    def __init__(self, *, first_clause_min_words: Optional[int] = None):
         """Initialize the simple text aggregator.
 
         Creates an empty text buffer ready to begin accumulating text tokens.
+
+        Args:
+            first_clause_min_words: If set, the first aggregation of a turn is
+                released at the first clause boundary (",", ":", "—") once the
+                buffer holds at least this many words. Disabled by default.
         """
         self._text = ""
         self._needs_lookahead: bool = False
+        self._first_clause_min_words = first_clause_min_words
+        self._first_clause_pending: bool = first_clause_min_words is not None
+        self._clause_lookahead: bool = False
 
     @property
     def text(self) -> Aggregation:
@@ -45,10 +76,12 @@ class SimpleTextAggregator(BaseTextAggregator):
     async def aggregate(self, text: str) -> AsyncIterator[Aggregation]:
         """Aggregate text and yield completed sentences.
 
-        Processes the input text character-by-character. When sentence-ending
-        punctuation is detected, it waits for non-whitespace lookahead before
-        calling NLTK. This prevents false positives like "$29." being detected
-        as a sentence when it's actually "$29.95".
+        Processes the input text a chunk at a time: text between candidate
+        boundaries is appended in one step and only sentence-ending punctuation
+        (and, while waiting for lookahead, the next non-whitespace character) is
+        inspected. When sentence-ending punctuation is detected, it waits for
+        non-whitespace lookahead before deciding. This prevents false positives
+        like "$29." being detected as a sentence when it's actually "$29.95".
 
         Args:
             text: Text to aggregate.
@@ -56,13 +89,47 @@ class SimpleTextAggregator(BaseTextAggregator):
         Yields:
             Complete sentences as Aggregation objects.
         """
-        # Process text character by character
-        for char in text:
-            self._text += char
+        pos = 0
+        while pos < len(text):
+            if self._clause_lookahead:
+                # The character after a clause mark decides: "Sure, " vs "1,000".
+                self._clause_lookahead = False
+                if text[pos].isspace():
+                    result = self._take_first_clause()
+                    if result:
+                        yield result
+                continue
+
+            needs_lookahead = self._needs_lookahead
+            if needs_lookahead:
+                pattern = _NON_WHITESPACE
+            elif self._first_clause_pending:
+                pattern = _SENTENCE_OR_CLAUSE_END
+            else:
+                pattern = _SENTENCE_END
+
+            match = pattern.search(text, pos)
+            if not match:
+                # Nothing in the rest of the chunk can end a sentence
+                self._text += text[pos:]
+                break
+
+            self._text += text[pos : match.end()]
+            pos = match.end()
+            char = match.group()
+
+            if not needs_lookahead and char in CLAUSE_ENDING_PUNCTUATION:
+                if char in _FULL_WIDTH_CLAUSE_ENDING_PUNCTUATION:
+                    result = self._take_first_clause()
+                    if result:
+                        yield result
+                else:
+                    self._clause_lookahead = True
+                continue
 
-            # Check for sentence with lookahead
             result = await self._check_sentence_with_lookahead(char)
             if result:
+                self._first_clause_pending = False
                 yield result
 
     async def _check_sentence_with_lookahead(self, char: str) -> Optional[Aggregation]:
@@ -70,11 +137,12 @@ class SimpleTextAggregator(BaseTextAggregator):
 
         This method implements the core sentence detection logic with lookahead.
         When sentence-ending punctuation is detected, it waits for the next
-        non-whitespace character before calling NLTK. This disambiguates cases
+        non-whitespace character before deciding. This disambiguates cases
         like "$29." (not a sentence) vs "$29. Next" (sentence ends at period).
         Whitespace alone is not meaningful lookahead since it appears in both
         cases. Instead, the first non-whitespace character after the punctuation
-        is used to confirm the sentence boundary.
+        is used to confirm the sentence boundary. Further punctuation and
+        closing quotes extend the pending ending ("Wait...", 'He said "hi."').
 
         Subclasses can call this via super() to reuse the lookahead behavior
         while adding their own logic (e.g., tag handling, pattern matching).
@@ -87,29 +155,75 @@ class SimpleTextAggregator(BaseTextAggregator):
         """
         # If we need lookahead, check if we now have non-whitespace
         if self._needs_lookahead:
-            # Check if the new character is non-whitespace
-            if char.strip():
-                # We have meaningful lookahead, call NLTK
-                self._needs_lookahead = False
-                eos_marker = match_endofsentence(self._text)
-
-                if eos_marker:
-                    # NLTK confirmed a sentence - return it
-                    result = self._text[:eos_marker]
-                    self._text = self._text[eos_marker:]
-                    return Aggregation(text=result.strip(" "), type=AggregationType.SENTENCE)
-                # No sentence found - keep accumulating
+            # Whitespace is not meaningful lookahead, keep waiting
+            if not char.strip():
                 return None
-            # Still whitespace, keep waiting
+
+            # More punctuation or a closing quote, the ending continues
+            previous = self._text[-2:-1]
+            if (previous in SENTENCE_ENDING_PUNCTUATION or previous in CLOSING_PUNCTUATION) and (
+                char in SENTENCE_ENDING_PUNCTUATION or char in CLOSING_PUNCTUATION
+            ):
+                return None
+
+            self._needs_lookahead = False
+            eos_marker = self._find_endofsentence(char)
+            if eos_marker:
+                result = self._text[:eos_marker]
+                self._text = self._text[eos_marker:]
+                return Aggregation(text=result.strip(" "), type=AggregationType.SENTENCE)
+            # No sentence found - keep accumulating
             return None
 
         # Check if we just added sentence-ending punctuation
         if self._text and self._text[-1] in SENTENCE_ENDING_PUNCTUATION:
-            # Mark that we need lookahead (don't call NLTK yet)
+            # Mark that we need lookahead (don't decide yet)
             self._needs_lookahead = True
 
         return None
 
+    def _find_endofsentence(self, char: str) -> int:
+        """Find the end of the pending sentence once lookahead has arrived.
+
+        Args:
+            char: The lookahead character, the last character in the buffer.
+
+        Returns:
+            The position of the end of the sentence, or 0 if there is none.
+        """
+        before = self._text[:-1]
+        ending = before.rstrip()
+        if not ending:
+            return 0
+
+        if len(ending) < len(before):
+            # "world. N": decide from the token before the whitespace.
+            if ending[-1] in SENTENCE_ENDING_PUNCTUATION or ending[-1] in CLOSING_PUNCTUATION:
+                token = ending.rsplit(None, 1)[-1]
+                return len(ending) if match_sentence_boundary(token, char) else 0
+        elif (
+            ending[-1] in SENTENCE_ENDING_PUNCTUATION
+            and ending[-1] not in UNAMBIGUOUS_SENTENCE_ENDING_PUNCTUATION
+            and char.isalnum()
+        ):
+            # "$29.95", "U.S.A", "foo.bar@": the punctuation is part of a word
+            return 0
+
+        return match_endofsentence(self._text)
+
+    def _take_first_clause(self) -> Optional[Aggregation]:
+        """Release the buffer as the first clause of the turn if it is long enough.
+
+        Returns:
+            The clause as an Aggregation, or None if it is too short.
+        """
+        if len(self._text.split()) < self._first_clause_min_words:
+            return None
+        result = self._text
+        self._text = ""
+        self._first_clause_pending = False
+        return Aggregation(text=result.strip(" "), type=AggregationType.SENTENCE)
+
     async def flush(self) -> Optional[Aggregation]:
         """Flush any remaining text in the buffer.
 
@@ -134,6 +248,8 @@ class SimpleTextAggregator(BaseTextAggregator):
         """
         self._text = ""
         self._needs_lookahead = False
+        self._first_clause_pending = self._first_clause_min_words is not None
+        self._clause_lookahead = False
 
     async def reset(self):
         """Clear the internally aggregated text.
@@ -143,3 +259,5 @@ class SimpleTextAggregator(BaseTextAggregator):
         """
         self._text = ""
         self._needs_lookahead = False
+        self._first_clause_pending = self._first_clause_min_words is not None
+        self._clause_lookahead = False
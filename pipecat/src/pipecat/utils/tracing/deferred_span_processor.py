@@ -0,0 +1,249 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Background serialization of heavy span attributes.
+
+Tracing decorators can register raw (not yet serialized) payloads for a span
+with :func:`defer_span_attributes` instead of calling ``json.dumps`` on the
+event loop. When the span ends, :class:`DeferredAttributeSpanProcessor` hands
+the span to a background thread that serializes the payloads, merges them into
+the span attributes and forwards the result to the wrapped span processor
+(typically a ``BatchSpanProcessor``).
+
+When no deferred processor is installed, :func:`defer_span_attributes` returns
+False and callers are expected to serialize inline.
+"""
+
+import json
+import queue
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from loguru import logger
+
+from pipecat.utils.tracing.setup import OPENTELEMETRY_AVAILABLE
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor
+
+if OPENTELEMETRY_AVAILABLE:
+    from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor
+else:  # pragma: no cover - only used when OpenTelemetry is missing
+
+    class SpanProcessor:  # type: ignore[no-redef]
+        """Placeholder base class when OpenTelemetry is not installed."""
+
+
+# Pending payloads keyed by span id. Written on the event loop when a span is
+# being built, popped by the processor when the span ends, or when the span is
+# garbage collected without ending.
+_pending_attributes: Dict[int, Dict[str, Any]] = {}
+_pending_lock = threading.Lock()
+
+# Set while a DeferredAttributeSpanProcessor is installed and running.
+_active_processor: Optional["DeferredAttributeSpanProcessor"] = None
+
+
+def is_deferred_serialization_active() -> bool:
+    """Check whether a deferred attribute processor is currently installed.
+
+    Returns:
+        True if payloads registered with ``defer_span_attributes`` will be
+        serialized in the background, False otherwise.
+    """
+    return _active_processor is not None
+
+
+def defer_span_attributes(span, attributes: Dict[str, Any]) -> bool:
+    """Register attributes to be JSON-serialized after the span ends.
+
+    Values that are already strings are set as-is; any other value is passed
+    to ``json.dumps`` on the background thread.
+
+    Args:
+        span: The span the attributes belong to.
+        attributes: Mapping of attribute name to raw payload.
+
+    Returns:
+        True if the attributes were deferred, False if no deferred processor is
+        active and the caller must set the attributes itself.
+    """
+    if _active_processor is None:
+        return False
+
+    span_context = span.get_span_context()
+    if not span_context or not span_context.is_valid:
+        return False
+    if not span.is_recording():
+        # Attributes of a non-recording span are dropped anyway
+        return True
+
+    span_id = span_context.span_id
+    with _pending_lock:
+        pending = _pending_attributes.get(span_id)
+        if pending is None:
+            pending = _pending_attributes[span_id] = {}
+            try:
+                weakref.finalize(span, _drop_pending_attributes, span_id)
+            except TypeError:
+                pass
+        pending.update(attributes)
+    return True
+
+
+def _drop_pending_attributes(span_id: int):
+    # Runs when a span is garbage collected, possibly while the lock is held by
+    # the same thread, so it doesn't take it: a single pop is atomic.
+    _pending_attributes.pop(span_id, None)
+
+
+def serialize_attribute_value(value: Any) -> str:
+    """Serialize a deferred payload to a span attribute string.
+
+    Args:
+        value: The raw payload.
+
+    Returns:
+        The payload as a string, JSON-encoded unless it already is a string.
+    """
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, default=str)
+
+
+class DeferredAttributeSpanProcessor(SpanProcessor):
+    """Span processor that serializes deferred attributes on a worker thread.
+
+    Wraps another span processor. Spans without deferred attributes are
+    forwarded immediately; spans with deferred attributes are queued, enriched
+    on the worker thread, and then forwarded.
+    """
+
+    def __init__(self, span_processor: "SpanProcessor", max_queue_size: int = 2048):
+        """Initialize the processor and start the worker thread.
+
+        Args:
+            span_processor: The processor that receives the enriched spans.
+            max_queue_size: Maximum number of spans waiting for serialization.
+                When full, payloads are serialized inline instead of dropped.
+        """
+        global _active_processor
+
+        self._next = span_processor
+        self._queue: "queue.Queue[Optional[ReadableSpan]]" = queue.Queue(maxsize=max_queue_size)
+        self._payloads: Dict[int, Dict[str, Any]] = {}
+        self._payloads_lock = threading.Lock()
+        self._shutdown = False
+        self._thread = threading.Thread(
+            target=self._worker, name="pipecat-span-serializer", daemon=True
+        )
+        self._thread.start()
+        _active_processor = self
+
+    def on_start(self, span, parent_context=None) -> None:
+        """Forward span start to the wrapped processor.
+
+        Args:
+            span: The span that started.
+            parent_context: The parent context of the span.
+        """
+        self._next.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: "ReadableSpan") -> None:
+        """Queue spans with deferred attributes, forward the rest.
+
+        Args:
+            span: The span that ended.
+        """
+        with _pending_lock:
+            payload = _pending_attributes.pop(span.context.span_id, None)
+
+        if not payload or self._shutdown:
+            if payload:
+                span = self._enrich(span, payload)
+            self._next.on_end(span)
+            return
+
+        with self._payloads_lock:
+            self._payloads[span.context.span_id] = payload
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            with self._payloads_lock:
+                self._payloads.pop(span.context.span_id, None)
+            self._next.on_end(self._enrich(span, payload))
+
+    def shutdown(self) -> None:
+        """Drain pending spans, stop the worker and shut down the wrapped processor."""
+        global _active_processor
+
+        if _active_processor is self:
+            _active_processor = None
+        self._shutdown = True
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+        self._next.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Wait for queued spans to be serialized, then flush the wrapped processor.
+
+        Args:
+            timeout_millis: Maximum time to wait for both.
+
+        Returns:
+            False if the queued spans were not serialized in time, the result
+            of the wrapped processor's flush otherwise.
+        """
+        deadline = time.monotonic() + timeout_millis / 1000
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("Timed out serializing deferred span attributes")
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        remaining_millis = max(0, int((deadline - time.monotonic()) * 1000))
+        return self._next.force_flush(remaining_millis)
+
+    def _worker(self):
+        while True:
+            span = self._queue.get()
+            try:
+                if span is None:
+                    return
+                with self._payloads_lock:
+                    payload = self._payloads.pop(span.context.span_id, {})
+                self._next.on_end(self._enrich(span, payload))
+            except Exception as e:
+                logger.warning(f"Error serializing deferred span attributes: {e}")
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _enrich(span: "ReadableSpan", payload: Dict[str, Any]) -> "ReadableSpan":
+        attributes = dict(span.attributes or {})
+        for key, value in payload.items():
+            try:
+                attributes[key] = serialize_attribute_value(value)
+            except Exception as e:
+                logger.warning(f"Unable to serialize span attribute '{key}': {e}")
+
+        return ReadableSpan(
+            name=span.name,
+            context=span.context,
+            parent=span.parent,
+            resource=span.resource,
+            attributes=attributes,
+            events=span.events,
+            links=span.links,
+            kind=span.kind,
+            status=span.status,
+            start_time=span.start_time,
+            end_time=span.end_time,
+            instrumentation_scope=span.instrumentation_scope,
+        )
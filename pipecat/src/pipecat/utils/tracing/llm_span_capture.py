@@ -0,0 +1,314 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Sampled, incremental capture of LLM context for tracing spans.
+
+Recording the full context on every LLM span makes the serialized bytes grow
+quadratically over a call. This module decides, per LLM invocation, what (if
+anything) should be recorded:
+
+- ``FULL``: every span records the full sanitized context (legacy behavior).
+- ``DELTA`` (default): spans record only the messages appended since the
+  previous span of the same context. Tools are recorded only when they change.
+- ``METADATA``: spans record no messages or tools.
+
+On top of the mode, payload capture can be sampled per call (one context is
+one call): ``sample_rate`` decides at the first span whether the call is
+recorded at all (head sampling), ``head_spans`` limits recording to the first
+N spans of a call, and ``tail_latency_threshold``/``capture_errors`` force a
+full payload for slow or failing spans of otherwise unsampled calls (tail
+sampling).
+"""
+
+import os
+import random
+import weakref
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+
+class LLMSpanCaptureMode(str, Enum):
+    """What part of the LLM context is recorded on each span.
+
+    Parameters:
+        FULL: Record the full context on every span.
+        DELTA: Record only messages appended since the previous span.
+        METADATA: Do not record messages or tools.
+    """
+
+    FULL = "full"
+    DELTA = "delta"
+    METADATA = "metadata"
+
+
+@dataclass
+class LLMSpanCaptureParams:
+    """Configuration for LLM span payload capture.
+
+    Parameters:
+        mode: Capture mode for sampled spans.
+        sample_rate: Probability (0.0-1.0) that a call records payloads.
+        head_spans: If set, only the first N spans of a call record payloads.
+        tail_latency_threshold: If set, spans slower than this many seconds
+            record the full context even when not sampled.
+        capture_errors: Record the full context for spans that raise, even
+            when not sampled.
+    """
+
+    mode: LLMSpanCaptureMode = LLMSpanCaptureMode.DELTA
+    sample_rate: float = 1.0
+    head_spans: Optional[int] = None
+    tail_latency_threshold: Optional[float] = None
+    capture_errors: bool = True
+
+
+def _params_from_env() -> LLMSpanCaptureParams:
+    def _optional(name: str, cast: Callable[[str], Any]) -> Any:
+        value = os.environ.get(name)
+        return cast(value) if value not in (None, "") else None
+
+    return LLMSpanCaptureParams(
+        mode=LLMSpanCaptureMode(os.environ.get("PIPECAT_TRACING_CAPTURE_MODE", "delta").lower()),
+        sample_rate=float(os.environ.get("PIPECAT_TRACING_SAMPLE_RATE", "1.0")),
+        head_spans=_optional("PIPECAT_TRACING_HEAD_SPANS", int),
+        tail_latency_threshold=_optional("PIPECAT_TRACING_TAIL_LATENCY", float),
+    )
+
+
+_params: Optional[LLMSpanCaptureParams] = None
+
+
+def configure_llm_span_capture(params: LLMSpanCaptureParams):
+    """Set the process-wide LLM span capture configuration.
+
+    Args:
+        params: The capture configuration to use for subsequent spans.
+    """
+    global _params
+    _params = params
+
+
+def get_llm_span_capture_params() -> LLMSpanCaptureParams:
+    """Get the process-wide LLM span capture configuration.
+
+    Falls back to the ``PIPECAT_TRACING_*`` environment variables when
+    ``configure_llm_span_capture`` has not been called.
+
+    Returns:
+        The active capture configuration.
+    """
+    global _params
+    if _params is None:
+        _params = _params_from_env()
+    return _params
+
+
+@dataclass
+class _CaptureState:
+    """Per-context (per-call) capture bookkeeping."""
+
+    sampled: bool
+    span_count: int = 0
+    captured_len: int = 0
+    first_message: Any = None
+    last_message: Any = None
+    tools_key: Any = None
+
+
+@dataclass
+class LLMContextSnapshot:
+    """Payload captured at the start of an LLM span.
+
+    Parameters:
+        messages: Sanitized messages to record (full context or the appended
+            delta), or None if nothing is recorded.
+        tools: Tools to record, or None if unchanged or not recorded.
+        offset: Index of the first recorded message in the full context.
+        total_messages: Number of messages in the context at capture time.
+        recorded: Whether the payload should be attached to the span.
+    """
+
+    messages: Optional[List[Any]] = None
+    tools: Optional[Any] = None
+    offset: int = 0
+    total_messages: int = 0
+    recorded: bool = True
+    _sanitize: Optional[Callable[[int, int], List[Any]]] = field(default=None, repr=False)
+    _get_tools: Optional[Callable[[], Any]] = field(default=None, repr=False)
+
+    def to_input(self) -> Dict[str, Any]:
+        """Build the span ``input`` payload in ChatML format.
+
+        Returns:
+            A dict with ``messages`` and/or ``tools``.
+        """
+        span_input: Dict[str, Any] = {}
+        if self.messages:
+            span_input["messages"] = self.messages
+        if self.tools:
+            span_input["tools"] = self.tools
+        return span_input
+
+
+class LLMSpanCapture:
+    """Decides what context to record for each LLM span of a call.
+
+    State is kept per context object (weakly referenced), so one instance can
+    be shared by every LLM service in the process.
+    """
+
+    def __init__(self, params: Optional[LLMSpanCaptureParams] = None):
+        """Initialize the capture helper.
+
+        Args:
+            params: Capture configuration. Defaults to the process-wide one.
+        """
+        self._params = params
+        self._states: "weakref.WeakKeyDictionary[Any, _CaptureState]" = weakref.WeakKeyDictionary()
+
+    @property
+    def params(self) -> LLMSpanCaptureParams:
+        """Get the capture configuration in use."""
+        return self._params or get_llm_span_capture_params()
+
+    def snapshot(
+        self,
+        context: Any,
+        messages: List[Any],
+        sanitize: Callable[[int, int], List[Any]],
+        tools_key: Any = None,
+        get_tools: Optional[Callable[[], Any]] = None,
+    ) -> LLMContextSnapshot:
+        """Capture what should be recorded for a new span of ``context``.
+
+        ``sanitize(start, end)`` is only called for the recorded range, so the
+        cost on the hot path is proportional to the delta, not the call.
+
+        Args:
+            context: The LLM context (used as the per-call key).
+            messages: The current (unsanitized) context messages.
+            sanitize: Returns sanitized messages ``[start:end]`` of the context.
+            tools_key: Identity of the current tools, used to detect changes.
+            get_tools: Function returning the tools in loggable format.
+
+        Returns:
+            The snapshot to attach to the span.
+        """
+        params = self.params
+        state = self._get_state(context, params)
+        state.span_count += 1
+        total = len(messages)
+
+        recorded = (
+            params.mode != LLMSpanCaptureMode.METADATA
+            and state.sampled
+            and (params.head_spans is None or state.span_count <= params.head_spans)
+        )
+
+        if not recorded:
+            # Keep delta bookkeeping in sync so later sampled spans stay small.
+            # The snapshot keeps the sanitizer in case the span is tail-sampled.
+            self._advance(state, messages, tools_key)
+            return LLMContextSnapshot(
+                total_messages=total,
+                recorded=False,
+                _sanitize=sanitize,
+                _get_tools=get_tools,
+            )
+
+        offset = 0
+        if params.mode == LLMSpanCaptureMode.DELTA and self._is_continuation(state, messages):
+            offset = state.captured_len
+
+        tools = None
+        if (
+            params.mode == LLMSpanCaptureMode.FULL
+            or state.tools_key is not tools_key
+            or offset == 0
+        ):
+            tools = get_tools() if get_tools else None
+
+        snapshot = LLMContextSnapshot(
+            messages=sanitize(offset, total) if offset < total else [],
+            tools=tools,
+            offset=offset,
+            total_messages=total,
+        )
+        self._advance(state, messages, tools_key)
+        return snapshot
+
+    def tail_capture(
+        self, snapshot: LLMContextSnapshot, elapsed: float, error: bool = False
+    ) -> bool:
+        """Record the full context on an unrecorded span if it is slow or failed.
+
+        Args:
+            snapshot: The snapshot taken at span start. Updated in place when
+                the span is tail-sampled.
+            elapsed: Span duration in seconds.
+            error: Whether the traced call raised.
+
+        Returns:
+            True if the snapshot now holds a payload to attach to the span.
+        """
+        if snapshot.recorded or snapshot._sanitize is None:
+            return False
+        params = self.params
+        if params.mode == LLMSpanCaptureMode.METADATA:
+            return False
+        threshold = params.tail_latency_threshold
+        if not (
+            (error and params.capture_errors) or (threshold is not None and elapsed >= threshold)
+        ):
+            return False
+
+        snapshot.messages = snapshot._sanitize(0, snapshot.total_messages)
+        snapshot.tools = snapshot._get_tools() if snapshot._get_tools else None
+        snapshot.offset = 0
+        snapshot.recorded = True
+        return True
+
+    def _get_state(self, context: Any, params: LLMSpanCaptureParams) -> _CaptureState:
+        try:
+            state = self._states.get(context)
+        except TypeError:
+            # Context is not weak-referenceable; treat each span independently.
+            return _CaptureState(sampled=random.random() < params.sample_rate)
+        if state is None:
+            state = _CaptureState(sampled=random.random() < params.sample_rate)
+            self._states[context] = state
+        return state
+
+    @staticmethod
+    def _is_continuation(state: _CaptureState, messages: List[Any]) -> bool:
+        """Check that ``messages`` extends what was captured for the previous span."""
+        n = state.captured_len
+        if n == 0 or len(messages) < n:
+            return False
+        return messages[0] is state.first_message and messages[n - 1] is state.last_message
+
+    @staticmethod
+    def _advance(state: _CaptureState, messages: List[Any], tools_key: Any):
+        state.captured_len = len(messages)
+        state.first_message = messages[0] if messages else None
+        state.last_message = messages[-1] if messages else None
+        state.tools_key = tools_key
+
+
+_default_capture: Optional[LLMSpanCapture] = None
+
+
+def get_llm_span_capture() -> LLMSpanCapture:
+    """Get the process-wide LLM span capture helper.
+
+    Returns:
+        The shared ``LLMSpanCapture`` instance.
+    """
+    global _default_capture
+    if _default_capture is None:
+        _default_capture = LLMSpanCapture()
+    return _default_capture
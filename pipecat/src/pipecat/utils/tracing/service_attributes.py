@@ -194,6 +194,7 @@ def add_llm_span_attributes(
     parameters: Optional[Dict[str, Any]] = None,
     extra_parameters: Optional[Dict[str, Any]] = None,
     ttfb: Optional[float] = None,
+    record_input: bool = True,
     **kwargs,
 ) -> None:
     """Add LLM-specific attributes to a span.
@@ -210,6 +211,9 @@ def add_llm_span_attributes(
         parameters: Service parameters.
         extra_parameters: Additional parameters.
         ttfb: Time to first byte in seconds.
+        record_input: Whether to serialize messages and tools into the
+            ``input`` attribute. Callers that record the input themselves
+            (e.g. incrementally or off the event loop) pass False.
         **kwargs: Additional attributes to add.
     """
     # Add standard attributes
@@ -219,17 +223,18 @@ def add_llm_span_attributes(
     span.set_attribute("gen_ai.output.type", "text")
     span.set_attribute("stream", stream)
 
-    span_input = {}
+    if record_input:
+        span_input = {}
 
-    # Add optional attributes
-    if messages:
-        span_input["messages"] = messages
+        # Add optional attributes
+        if messages:
+            span_input["messages"] = messages
 
-    if tools:
-        span_input["tools"] = tools
+        if tools:
+            span_input["tools"] = tools
 
-    # Set input in ChatML format
-    span.set_attribute("input", json.dumps(span_input))
+        # Set input in ChatML format
+        span.set_attribute("input", json.dumps(span_input))
 
     if output:
         span.set_attribute("output", output)
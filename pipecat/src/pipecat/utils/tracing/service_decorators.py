@@ -16,6 +16,7 @@ import copy
 import functools
 import inspect
 import json
+import time
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeVar
 
 from loguru import logger
@@ -38,6 +39,8 @@ from pipecat.utils.tracing.context_registry import (
     get_current_conversation_context,
     get_current_turn_context,
 )
+from pipecat.utils.tracing.deferred_span_processor import defer_span_attributes
+from pipecat.utils.tracing.llm_span_capture import LLMContextSnapshot, get_llm_span_capture
 from pipecat.utils.tracing.service_attributes import (
     add_gemini_live_span_attributes,
     add_llm_span_attributes,
@@ -146,6 +149,112 @@ def _get_standard_tools_for_logging(tools: Any) -> Optional[List[Dict[str, Any]]
     return None
 
 
+def _snapshot_llm_context(context) -> Optional[LLMContextSnapshot]:
+    """Capture the part of an LLM context that should be recorded on a span.
+
+    Args:
+        context: An ``LLMContext`` or ``OpenAILLMContext``.
+
+    Returns:
+        The snapshot, or None for unsupported context types.
+    """
+    capture = get_llm_span_capture()
+
+    if isinstance(context, OpenAILLMContext):
+        # OpenAILLMContext and subclasses have their own (provider-specific)
+        # logging format
+        return capture.snapshot(
+            context,
+            context.messages,
+            lambda start, end: context.get_messages_for_logging(start, end),
+            tools_key=getattr(context, "_tools", None),
+            get_tools=lambda: context.tools,
+        )
+
+    if isinstance(context, LLMContext):
+        # Universal LLMContext - messages are already in standard ChatML format
+        return capture.snapshot(
+            context,
+            context.messages,
+            lambda start, end: _sanitize_messages_for_logging(context.messages[start:end]),
+            tools_key=context.tools,
+            get_tools=lambda: _get_standard_tools_for_logging(context.tools),
+        )
+
+    return None
+
+
+def _snapshot_realtime_context(context, adapter) -> LLMContextSnapshot:
+    """Capture the part of a realtime LLM context that should be recorded on a span.
+
+    Args:
+        context: An ``LLMContext``, or an ``OpenAILLMContext`` for the beta service.
+        adapter: The realtime service's LLM adapter.
+
+    Returns:
+        The snapshot.
+    """
+    capture = get_llm_span_capture()
+
+    if isinstance(context, OpenAILLMContext):
+        return capture.snapshot(
+            context,
+            context.messages,
+            lambda start, end: context.get_messages_for_logging(start, end),
+        )
+
+    # Offsets are into the messages the adapter sends, not context.messages
+    messages = adapter.get_messages(context)
+    return capture.snapshot(
+        context,
+        messages,
+        lambda start, end: adapter.get_messages_for_logging(context, start, end),
+    )
+
+
+def _record_llm_span_input(span, snapshot: LLMContextSnapshot, attribute: str = "input"):
+    """Attach a context snapshot to a span.
+
+    The payload is JSON-serialized on the background serializer thread when a
+    ``DeferredAttributeSpanProcessor`` is installed, and inline otherwise.
+
+    Args:
+        span: The span to attach the snapshot to.
+        snapshot: The captured context.
+        attribute: Name of the attribute holding the serialized payload.
+    """
+    span.set_attribute("context.total_messages", snapshot.total_messages)
+    span.set_attribute("context.recorded", snapshot.recorded)
+    if not snapshot.recorded:
+        return
+
+    span.set_attribute("context.message_offset", snapshot.offset)
+    payload = snapshot.to_input()
+    if not defer_span_attributes(span, {attribute: payload}):
+        span.set_attribute(attribute, json.dumps(payload))
+
+
+def _tail_capture_llm_span(
+    span, snapshot: Optional[LLMContextSnapshot], start_time: float, error: bool = False
+):
+    """Record the full context on an unsampled span that turned out slow or failed.
+
+    Args:
+        span: The LLM span.
+        snapshot: The snapshot taken when the span started, if any.
+        start_time: ``time.monotonic()`` value taken before the LLM call.
+        error: Whether the LLM call raised.
+    """
+    if snapshot is None:
+        return
+    try:
+        elapsed = time.monotonic() - start_time
+        if get_llm_span_capture().tail_capture(snapshot, elapsed, error=error):
+            _record_llm_span_input(span, snapshot)
+    except Exception as e:
+        logger.warning(f"Error tail-sampling LLM span: {e}")
+
+
 def _get_parent_service_context(self):
     """Get the parent service span context (internal use only).
 
@@ -509,6 +618,7 @@ def traced_llm(func: Optional[Callable] = None, *, name: Optional[str] = None) -
 
                         # Store original method and output aggregator
                         original_push_frame = self.push_frame
+                        snapshot = None
                         # Accumulator for plain text tokens streamed by the LLM
                         output_text = ""  # Simple string accumulation
 
@@ -579,31 +689,9 @@ def traced_llm(func: Optional[Callable] = None, *, name: Optional[str] = None) -
                             # Replace push_frame to capture output
                             self.push_frame = traced_push_frame
 
-                            # Get messages for logging in standard ChatML format
-                            # For OpenAILLMContext: use context's own get_messages_for_logging() method
-                            # For LLMContext: use context.messages directly (already in standard format)
-                            #                 and sanitize for logging
-                            messages = None
-
-                            if isinstance(context, OpenAILLMContext):
-                                # OpenAILLMContext and subclasses have their own method
-                                messages = context.get_messages_for_logging()
-                            elif isinstance(context, LLMContext):
-                                # Universal LLMContext - use standard messages directly
-                                # context.messages returns messages in standard ChatML format
-                                messages = _sanitize_messages_for_logging(context.messages)
-
-                            # Get tools in standard format for logging
-                            # For OpenAILLMContext: tools property returns provider-specific format
-                            # For LLMContext: use standard tools from ToolsSchema
-                            tools = None
-
-                            if isinstance(context, OpenAILLMContext):
-                                # OpenAILLMContext: tools property handles adapter conversion internally
-                                tools = context.tools
-                            elif isinstance(context, LLMContext):
-                                # Universal LLMContext - use standard tools format
-                                tools = _get_standard_tools_for_logging(context.tools)
+                            # Capture the context (full, delta-only or nothing,
+                            # depending on the capture mode and sampling)
+                            snapshot = _snapshot_llm_context(context)
 
                             # Get settings from the service
                             params = {}
@@ -628,19 +716,26 @@ def traced_llm(func: Optional[Callable] = None, *, name: Optional[str] = None) -
                                 "parameters": params,
                             }
 
-                            # Add optional attributes only if they exist
-                            attribute_kwargs["messages"] = messages
-                            attribute_kwargs["tools"] = tools
-
-                            # Add all gathered attributes to the span
-                            add_llm_span_attributes(span=current_span, **attribute_kwargs)
+                            # Add all gathered attributes to the span. The input is
+                            # recorded separately from the context snapshot.
+                            add_llm_span_attributes(
+                                span=current_span, record_input=False, **attribute_kwargs
+                            )
+                            if snapshot is not None:
+                                _record_llm_span_input(current_span, snapshot)
 
                         except Exception as e:
                             logger.warning(f"Error setting up LLM tracing: {e}")
                             # Don't raise - let the function execute anyway
 
                         # Run function with modified push_frame to capture the output
-                        result = await f(self, context, *args, **kwargs)
+                        start_time = time.monotonic()
+                        try:
+                            result = await f(self, context, *args, **kwargs)
+                        except Exception:
+                            _tail_capture_llm_span(current_span, snapshot, start_time, error=True)
+                            raise
+                        _tail_capture_llm_span(current_span, snapshot, start_time)
 
                         # --------------------------------------------------------------
                         # Append JSON dump of function calls to the output text so that
@@ -1054,6 +1149,7 @@ def traced_openai_realtime(operation: str) -> Callable:
 
                         # Operation-specific attribute collection
                         operation_attrs = {}
+                        context_snapshot = None
 
                         if operation == "llm_setup":
                             # Capture session properties and tools
@@ -1103,11 +1199,11 @@ def traced_openai_realtime(operation: str) -> Callable:
                             # Capture context messages being sent
                             if hasattr(self, "_context") and self._context:
                                 try:
-                                    messages = self.get_llm_adapter().get_messages_for_logging(
-                                        self._context
+                                    snapshot = _snapshot_realtime_context(
+                                        self._context, self.get_llm_adapter()
                                     )
-                                    if messages:
-                                        operation_attrs["context_messages"] = json.dumps(messages)
+                                    if snapshot.messages:
+                                        context_snapshot = snapshot
                                 except Exception as e:
                                     logger.warning(f"Error getting context messages: {e}")
 
@@ -1190,6 +1286,22 @@ def traced_openai_realtime(operation: str) -> Callable:
                             **operation_attrs,
                         )
 
+                        # Record the context (delta-only, off the event loop when
+                        # a deferred span processor is installed)
+                        if context_snapshot is not None:
+                            current_span.set_attribute(
+                                "context.message_offset", context_snapshot.offset
+                            )
+                            current_span.set_attribute(
+                                "context.total_messages", context_snapshot.total_messages
+                            )
+                            if not defer_span_attributes(
+                                current_span, {"context_messages": context_snapshot.messages}
+                            ):
+                                current_span.set_attribute(
+                                    "context_messages", json.dumps(context_snapshot.messages)
+                                )
+
                         # For llm_response operation, also handle token usage metrics
                         if operation == "llm_response" and hasattr(self, "start_llm_usage_metrics"):
                             evt = args[0] if args else None
@@ -38,6 +38,7 @@ def setup_tracing(
     service_name: str = "pipecat",
     exporter=None,  # User-provided exporter
     console_export: bool = False,
+    deferred_serialization: bool = True,
 ) -> bool:
     """Set up OpenTelemetry tracing with a user-provided exporter.
 
@@ -46,6 +47,9 @@ def setup_tracing(
         exporter: A pre-configured OpenTelemetry span exporter instance.
                   If None, only console export will be available if enabled.
         console_export: Whether to also export traces to console (useful for debugging).
+        deferred_serialization: Whether heavy span attributes (LLM context and
+            tools) are JSON-serialized on a background thread instead of the
+            event loop.
 
     Returns:
         True if setup was successful, False otherwise.
@@ -82,7 +86,14 @@ def setup_tracing(
 
         # Add user-provided exporter if available
         if exporter:
-            tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
+            span_processor = BatchSpanProcessor(exporter)
+            if deferred_serialization:
+                from pipecat.utils.tracing.deferred_span_processor import (
+                    DeferredAttributeSpanProcessor,
+                )
+
+                span_processor = DeferredAttributeSpanProcessor(span_processor)
+            tracer_provider.add_span_processor(span_processor)
 
         return True
     except Exception as e:
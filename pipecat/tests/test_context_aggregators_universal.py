@@ -20,6 +20,8 @@ from pipecat.frames.frames import (
     LLMMessagesAppendFrame,
     LLMMessagesUpdateFrame,
     LLMRunFrame,
+    LLMSpeculationCommitFrame,
+    LLMSpeculativeContextFrame,
     LLMTextFrame,
     LLMThoughtEndFrame,
     LLMThoughtStartFrame,
@@ -386,6 +388,120 @@ class TestLLMUserAggregator(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(strategy)  # strategy is None for end/cancel
         self.assertEqual(message.content, "Hello!")
 
+    def _speculative_user_aggregator(self, context: LLMContext) -> LLMUserAggregator:
+        return LLMUserAggregator(
+            context,
+            params=LLMUserAggregatorParams(
+                user_turn_strategies=UserTurnStrategies(
+                    stop=[
+                        SpeechTimeoutUserTurnStopStrategy(user_speech_timeout=TRANSCRIPTION_TIMEOUT)
+                    ],
+                ),
+                enable_speculative_generation=True,
+            ),
+        )
+
+    async def test_speculative_generation_commit(self):
+        context = LLMContext()
+        user_aggregator = self._speculative_user_aggregator(context)
+
+        pipeline = Pipeline([user_aggregator])
+
+        frames_to_send = [
+            VADUserStartedSpeakingFrame(),
+            TranscriptionFrame(text="Hello!", user_id="", timestamp="now"),
+            SleepFrame(),
+            VADUserStoppedSpeakingFrame(),
+            # Wait for user_speech_timeout to elapse
+            SleepFrame(sleep=TRANSCRIPTION_TIMEOUT + 0.1),
+        ]
+        expected_down_frames = [
+            VADUserStartedSpeakingFrame,
+            UserStartedSpeakingFrame,
+            InterruptionFrame,
+            VADUserStoppedSpeakingFrame,
+            LLMSpeculativeContextFrame,
+            UserStoppedSpeakingFrame,
+            LLMSpeculationCommitFrame,
+        ]
+        (received_down, _) = await run_test(
+            pipeline,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+        self.assertEqual(received_down[-1].speculation_id, received_down[-3].id)
+        self.assertEqual(context.get_messages(), [{"role": "user", "content": "Hello!"}])
+
+    async def test_speculative_generation_discarded_on_resume(self):
+        context = LLMContext()
+        user_aggregator = self._speculative_user_aggregator(context)
+
+        pipeline = Pipeline([user_aggregator])
+
+        frames_to_send = [
+            VADUserStartedSpeakingFrame(),
+            TranscriptionFrame(text="I want to", user_id="", timestamp="now"),
+            SleepFrame(),
+            VADUserStoppedSpeakingFrame(),
+            SleepFrame(sleep=TRANSCRIPTION_TIMEOUT / 4),
+            # The user keeps talking before user_speech_timeout elapses.
+            VADUserStartedSpeakingFrame(),
+            TranscriptionFrame(text="book a flight.", user_id="", timestamp="now"),
+            SleepFrame(),
+            VADUserStoppedSpeakingFrame(),
+            SleepFrame(sleep=TRANSCRIPTION_TIMEOUT + 0.1),
+        ]
+        expected_down_frames = [
+            VADUserStartedSpeakingFrame,
+            UserStartedSpeakingFrame,
+            InterruptionFrame,
+            VADUserStoppedSpeakingFrame,
+            LLMSpeculativeContextFrame,
+            VADUserStartedSpeakingFrame,
+            InterruptionFrame,
+            VADUserStoppedSpeakingFrame,
+            LLMSpeculativeContextFrame,
+            UserStoppedSpeakingFrame,
+            LLMSpeculationCommitFrame,
+        ]
+        await run_test(
+            pipeline,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+        self.assertEqual(
+            context.get_messages(), [{"role": "user", "content": "I want to book a flight."}]
+        )
+
+    async def test_speculative_generation_not_while_bot_speaking(self):
+        context = LLMContext()
+        user_aggregator = self._speculative_user_aggregator(context)
+
+        pipeline = Pipeline([user_aggregator])
+
+        frames_to_send = [
+            BotStartedSpeakingFrame(),
+            VADUserStartedSpeakingFrame(),
+            TranscriptionFrame(text="Hello!", user_id="", timestamp="now"),
+            SleepFrame(),
+            VADUserStoppedSpeakingFrame(),
+            SleepFrame(sleep=TRANSCRIPTION_TIMEOUT + 0.1),
+        ]
+        expected_down_frames = [
+            BotStartedSpeakingFrame,
+            VADUserStartedSpeakingFrame,
+            UserStartedSpeakingFrame,
+            InterruptionFrame,
+            VADUserStoppedSpeakingFrame,
+            UserStoppedSpeakingFrame,
+            LLMContextFrame,
+        ]
+        await run_test(
+            pipeline,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+
 
 class TestLLMAssistantAggregator(unittest.IsolatedAsyncioTestCase):
     async def test_empty(self):
@@ -38,9 +38,14 @@ For AWS Bedrock adapter:
 4. System messages: first extracted as system parameter, later ones converted to user messages
 5. Consecutive messages with same role are merged into multi-content-block messages
 6. Empty text content is converted to "(empty)"
+
+For the per-context message conversion cache:
+1. Only messages added or replaced since the previous invocation are converted again
+2. Merging messages and adding cache control markers doesn't modify cached conversions
 """
 
 import unittest
+from unittest.mock import patch
 
 from google.genai.types import Content, Part
 
@@ -992,5 +997,93 @@ class TestAWSBedrockGetLLMInvocationParams(unittest.TestCase):
         self.assertEqual(len(params["messages"]), 0)
 
 
+class TestMessageConversionCache(unittest.TestCase):
+    def setUp(self) -> None:
+        """Sets up a common adapter instance for all tests."""
+        self.adapter = AnthropicLLMAdapter()
+
+    def _count_conversions(self):
+        return patch.object(
+            self.adapter,
+            "_from_universal_context_message",
+            wraps=self.adapter._from_universal_context_message,
+        )
+
+    def test_only_new_messages_are_converted(self):
+        """Test that repeated invocations only convert messages added since the previous one."""
+        context = LLMContext(
+            messages=[
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": "Hello"},
+                {"role": "assistant", "content": "Hi there!"},
+            ]
+        )
+        with self._count_conversions() as convert:
+            first = self.adapter.get_llm_invocation_params(context, enable_prompt_caching=False)
+            self.assertEqual(convert.call_count, 3)
+
+            context.add_message({"role": "user", "content": "What's the weather?"})
+            second = self.adapter.get_llm_invocation_params(context, enable_prompt_caching=False)
+            self.assertEqual(convert.call_count, 4)
+
+        self.assertEqual(second["messages"][:2], first["messages"])
+        self.assertEqual(second["messages"][2], {"role": "user", "content": "What's the weather?"})
+
+    def test_replaced_and_reassigned_messages_are_converted_again(self):
+        """Test that replacing a message or reassigning its content invalidates its conversion."""
+        context = LLMContext(
+            messages=[
+                {"role": "user", "content": "Check the weather"},
+                {"role": "tool", "tool_call_id": "call_1", "content": "IN_PROGRESS"},
+            ]
+        )
+        self.adapter.get_llm_invocation_params(context, enable_prompt_caching=False)
+
+        context.replace_message(1, {**context.messages[1], "content": "Sunny"})
+        params = self.adapter.get_llm_invocation_params(context, enable_prompt_caching=False)
+        self.assertEqual(params["messages"][0]["content"][-1]["content"], "Sunny")
+
+        context.messages[0]["content"] = "Check the forecast"
+        params = self.adapter.get_llm_invocation_params(context, enable_prompt_caching=False)
+        self.assertEqual(
+            params["messages"][0]["content"][0], {"type": "text", "text": "Check the forecast"}
+        )
+
+    def test_cached_conversions_are_not_modified(self):
+        """Test that merging and cache control markers don't leak into later invocations."""
+        context = LLMContext(
+            messages=[
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": "Hello"},
+                {"role": "user", "content": "Are you there?"},
+                {"role": "assistant", "content": "Yes!"},
+                {"role": "user", "content": "Great"},
+            ]
+        )
+        with_markers = self.adapter.get_llm_invocation_params(context, enable_prompt_caching=True)
+        self.assertEqual(
+            with_markers["messages"][0]["content"][-1]["cache_control"], {"type": "ephemeral"}
+        )
+
+        without_markers = self.adapter.get_llm_invocation_params(
+            context, enable_prompt_caching=False
+        )
+        self.assertEqual(
+            without_markers["messages"],
+            [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": "Hello"},
+                        {"type": "text", "text": "Are you there?"},
+                    ],
+                },
+                {"role": "assistant", "content": "Yes!"},
+                {"role": "user", "content": "Great"},
+            ],
+        )
+        self.assertEqual(context.messages[1], {"role": "user", "content": "Hello"})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,176 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import gc
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from opentelemetry.sdk.trace import TracerProvider
+
+from pipecat.processors.aggregators.llm_context import LLMContext
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+from pipecat.utils.tracing import deferred_span_processor
+from pipecat.utils.tracing.deferred_span_processor import (
+    DeferredAttributeSpanProcessor,
+    defer_span_attributes,
+)
+from pipecat.utils.tracing.llm_span_capture import (
+    LLMSpanCapture,
+    LLMSpanCaptureMode,
+    LLMSpanCaptureParams,
+)
+from pipecat.utils.tracing.service_decorators import _snapshot_llm_context
+
+
+def _snapshot(capture: LLMSpanCapture, context: LLMContext):
+    return capture.snapshot(
+        context,
+        context.messages,
+        lambda start, end: [dict(m) for m in context.messages[start:end]],
+        tools_key=context.tools,
+        get_tools=lambda: ["tools"],
+    )
+
+
+class TestLLMSpanCapture(unittest.TestCase):
+    def test_full_mode_records_everything(self):
+        capture = LLMSpanCapture(LLMSpanCaptureParams(mode=LLMSpanCaptureMode.FULL))
+        context = LLMContext(messages=[{"role": "system", "content": "Be nice"}])
+
+        first = _snapshot(capture, context)
+        context.add_message({"role": "user", "content": "Hi"})
+        second = _snapshot(capture, context)
+
+        self.assertEqual(len(first.messages), 1)
+        self.assertEqual(len(second.messages), 2)
+        self.assertEqual(second.offset, 0)
+        self.assertEqual(second.tools, ["tools"])
+
+    def test_delta_mode_records_appended_messages(self):
+        capture = LLMSpanCapture(LLMSpanCaptureParams(mode=LLMSpanCaptureMode.DELTA))
+        context = LLMContext(messages=[{"role": "system", "content": "Be nice"}])
+
+        first = _snapshot(capture, context)
+        context.add_message({"role": "user", "content": "Hi"})
+        context.add_message({"role": "assistant", "content": "Hello"})
+        second = _snapshot(capture, context)
+
+        self.assertEqual(first.offset, 0)
+        self.assertEqual(first.tools, ["tools"])
+        self.assertEqual(second.offset, 1)
+        self.assertEqual(second.total_messages, 3)
+        self.assertEqual([m["content"] for m in second.messages], ["Hi", "Hello"])
+        # Tools did not change, so they are not recorded again
+        self.assertIsNone(second.tools)
+
+    def test_delta_mode_falls_back_to_full_when_context_rewritten(self):
+        capture = LLMSpanCapture(LLMSpanCaptureParams(mode=LLMSpanCaptureMode.DELTA))
+        context = LLMContext(messages=[{"role": "system", "content": "Node A"}])
+
+        _snapshot(capture, context)
+        context.set_messages(
+            [{"role": "system", "content": "Node B"}, {"role": "user", "content": "Hi"}]
+        )
+        snapshot = _snapshot(capture, context)
+
+        self.assertEqual(snapshot.offset, 0)
+        self.assertEqual(len(snapshot.messages), 2)
+
+    def test_head_spans_and_tail_latency(self):
+        capture = LLMSpanCapture(
+            LLMSpanCaptureParams(
+                mode=LLMSpanCaptureMode.DELTA, head_spans=1, tail_latency_threshold=2.0
+            )
+        )
+        context = LLMContext(messages=[{"role": "system", "content": "Be nice"}])
+
+        self.assertTrue(_snapshot(capture, context).recorded)
+
+        context.add_message({"role": "user", "content": "Hi"})
+        unsampled = _snapshot(capture, context)
+        self.assertFalse(unsampled.recorded)
+        self.assertIsNone(unsampled.messages)
+
+        # Fast spans stay unrecorded, slow ones get the full context
+        self.assertFalse(capture.tail_capture(unsampled, elapsed=0.5))
+        self.assertTrue(capture.tail_capture(unsampled, elapsed=2.5))
+        self.assertEqual(len(unsampled.messages), 2)
+
+    def test_unsampled_call_records_nothing_but_errors(self):
+        capture = LLMSpanCapture(LLMSpanCaptureParams(sample_rate=0.0))
+        context = LLMContext(messages=[{"role": "user", "content": "Hi"}])
+
+        snapshot = _snapshot(capture, context)
+        self.assertFalse(snapshot.recorded)
+        self.assertTrue(capture.tail_capture(snapshot, elapsed=0.1, error=True))
+
+    def test_metadata_mode(self):
+        capture = LLMSpanCapture(LLMSpanCaptureParams(mode=LLMSpanCaptureMode.METADATA))
+        context = LLMContext(messages=[{"role": "user", "content": "Hi"}])
+
+        snapshot = _snapshot(capture, context)
+        self.assertFalse(snapshot.recorded)
+        self.assertFalse(capture.tail_capture(snapshot, elapsed=100.0, error=True))
+
+    def test_openai_context_sanitizes_recorded_range_only(self):
+        capture = LLMSpanCapture(LLMSpanCaptureParams(mode=LLMSpanCaptureMode.DELTA))
+        context = OpenAILLMContext(messages=[{"role": "system", "content": "Be nice"}])
+        ranges = []
+        get_messages_for_logging = context.get_messages_for_logging
+
+        def recording(start=0, end=None):
+            ranges.append((start, end))
+            return get_messages_for_logging(start, end)
+
+        context.get_messages_for_logging = recording
+        with patch(
+            "pipecat.utils.tracing.service_decorators.get_llm_span_capture",
+            return_value=capture,
+        ):
+            _snapshot_llm_context(context)
+            context.add_message({"role": "user", "content": "Hi"})
+            snapshot = _snapshot_llm_context(context)
+
+        self.assertEqual(ranges, [(0, 1), (1, 2)])
+        self.assertEqual(snapshot.messages, [{"role": "user", "content": "Hi"}])
+
+
+class TestDeferredAttributeSpanProcessor(unittest.TestCase):
+    def setUp(self):
+        self.next_processor = MagicMock()
+        self.processor = DeferredAttributeSpanProcessor(self.next_processor)
+        self.tracer = TracerProvider().get_tracer("test")
+
+    def tearDown(self):
+        self.processor.shutdown()
+
+    def test_pending_attributes_dropped_for_spans_that_never_end(self):
+        span = self.tracer.start_span("llm")
+        self.assertTrue(defer_span_attributes(span, {"input": {"messages": []}}))
+        self.assertEqual(len(deferred_span_processor._pending_attributes), 1)
+
+        del span
+        gc.collect()
+
+        self.assertEqual(deferred_span_processor._pending_attributes, {})
+
+    def test_force_flush_times_out(self):
+        released = threading.Event()
+        self.next_processor.on_end.side_effect = lambda span: released.wait(5)
+        span = self.tracer.start_span("llm")
+        defer_span_attributes(span, {"input": {"messages": []}})
+        self.processor.on_end(span)
+
+        self.assertFalse(self.processor.force_flush(timeout_millis=50))
+        self.next_processor.force_flush.assert_not_called()
+
+        released.set()
+        self.assertTrue(self.processor.force_flush(timeout_millis=5000))
+
+
+if __name__ == "__main__":
+    unittest.main()
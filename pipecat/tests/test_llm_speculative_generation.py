@@ -0,0 +1,168 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+
+from pipecat.frames.frames import (
+    InterruptionFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMSpeculationCommitFrame,
+    LLMSpeculativeContextFrame,
+    LLMTextFrame,
+    MetricsFrame,
+    TextFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.metrics.metrics import SpeculativeGenerationMetricsData
+from pipecat.pipeline.task import PipelineParams
+from pipecat.processors.aggregators.llm_context import LLMContext
+from pipecat.tests import MockLLMService, run_test
+from pipecat.tests.utils import SleepFrame
+
+RESPONSE = "Sure, I can help you with that."
+
+
+def _speculation_metrics(frames):
+    return [
+        data
+        for frame in frames
+        if isinstance(frame, MetricsFrame)
+        for data in frame.data
+        if isinstance(data, SpeculativeGenerationMetricsData)
+    ]
+
+
+class TestLLMSpeculativeGeneration(unittest.IsolatedAsyncioTestCase):
+    def _llm(self) -> MockLLMService:
+        return MockLLMService(
+            mock_chunks=MockLLMService.create_text_chunks(RESPONSE, chunk_size=8),
+            chunk_delay=0.01,
+        )
+
+    def _context_frame(self) -> LLMSpeculativeContextFrame:
+        context = LLMContext(messages=[{"role": "user", "content": "Can you help me?"}])
+        return LLMSpeculativeContextFrame(context=context)
+
+    async def test_response_held_until_commit(self):
+        frame = self._context_frame()
+        frames_to_send = [
+            frame,
+            # Let the whole response be generated.
+            SleepFrame(sleep=0.3),
+            UserStoppedSpeakingFrame(),
+            LLMSpeculationCommitFrame(speculation_id=frame.id),
+            SleepFrame(),
+        ]
+        expected_down_frames = [
+            MetricsFrame,
+            MetricsFrame,
+            MetricsFrame,
+            # Nothing from the response is released before the commit.
+            UserStoppedSpeakingFrame,
+            LLMFullResponseStartFrame,
+            LLMTextFrame,
+            LLMTextFrame,
+            LLMTextFrame,
+            LLMTextFrame,
+            LLMFullResponseEndFrame,
+            MetricsFrame,
+            LLMSpeculationCommitFrame,
+        ]
+        (received_down, _) = await run_test(
+            self._llm(),
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+            pipeline_params=PipelineParams(enable_metrics=True),
+        )
+
+        text = "".join(f.text for f in received_down if isinstance(f, LLMTextFrame))
+        self.assertEqual(text, RESPONSE)
+
+        [metrics] = _speculation_metrics(received_down)
+        self.assertTrue(metrics.committed)
+        self.assertGreater(metrics.latency_saved, 0)
+        self.assertEqual(metrics.wasted_completion_tokens, 0)
+
+    async def test_frames_after_response_not_held(self):
+        frame = self._context_frame()
+        frames_to_send = [
+            frame,
+            # Let the whole response be generated.
+            SleepFrame(sleep=0.3),
+            TextFrame(text="passing through"),
+            SleepFrame(),
+            LLMSpeculationCommitFrame(speculation_id=frame.id),
+            SleepFrame(),
+        ]
+        expected_down_frames = [
+            # Not part of the speculative response, so not held back.
+            TextFrame,
+            LLMFullResponseStartFrame,
+            LLMTextFrame,
+            LLMTextFrame,
+            LLMTextFrame,
+            LLMTextFrame,
+            LLMFullResponseEndFrame,
+            LLMSpeculationCommitFrame,
+        ]
+        await run_test(
+            self._llm(),
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+
+    async def test_response_discarded_on_interruption(self):
+        frames_to_send = [
+            self._context_frame(),
+            SleepFrame(sleep=0.03),
+            InterruptionFrame(),
+            SleepFrame(sleep=0.3),
+        ]
+        expected_down_frames = [
+            MetricsFrame,
+            MetricsFrame,
+            MetricsFrame,
+            MetricsFrame,
+            InterruptionFrame,
+        ]
+        (received_down, _) = await run_test(
+            self._llm(),
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+            pipeline_params=PipelineParams(enable_metrics=True),
+        )
+
+        [metrics] = _speculation_metrics(received_down)
+        self.assertFalse(metrics.committed)
+        self.assertGreater(metrics.wasted_completion_tokens, 0)
+        self.assertEqual(metrics.latency_saved, 0)
+
+    async def test_commit_before_generation_starts(self):
+        frame = self._context_frame()
+        frames_to_send = [
+            frame,
+            LLMSpeculationCommitFrame(speculation_id=frame.id),
+            SleepFrame(sleep=0.3),
+        ]
+        expected_down_frames = [
+            LLMSpeculationCommitFrame,
+            LLMFullResponseStartFrame,
+            LLMTextFrame,
+            LLMTextFrame,
+            LLMTextFrame,
+            LLMTextFrame,
+            LLMFullResponseEndFrame,
+        ]
+        await run_test(
+            self._llm(),
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import time
+import unittest
+
+from pipecat.utils.media_clock import MediaClock, MediaPacer, get_media_clock
+
+
+class TestMediaClock(unittest.IsolatedAsyncioTestCase):
+    async def test_releases_all_waiters_of_a_tick_together(self):
+        clock = MediaClock(tick_secs=0.01)
+        release_time = time.monotonic() + 0.2
+
+        await asyncio.gather(*(clock.wait_until(release_time) for _ in range(50)))
+
+        self.assertGreaterEqual(time.monotonic(), release_time)
+        stats = clock.stats()
+        self.assertEqual(stats["released"], 50)
+        self.assertEqual(stats["pending"], 0)
+        # One timer for all waiters, not one per waiter
+        self.assertLess(stats["ticks"], 30)
+
+    async def test_cancelled_waiter_does_not_block_others(self):
+        clock = MediaClock(tick_secs=0.01)
+        release_time = time.monotonic() + 0.02
+        cancelled = asyncio.create_task(clock.wait_until(release_time))
+        waiter = asyncio.create_task(clock.wait_until(release_time))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        await asyncio.wait_for(waiter, timeout=1)
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(clock.stats()["released"], 1)
+
+    async def test_clock_is_shared_per_event_loop(self):
+        self.assertIs(get_media_clock(), get_media_clock())
+
+
+class TestMediaPacer(unittest.IsolatedAsyncioTestCase):
+    async def _pace(self, pacer: MediaPacer, writes: int) -> float:
+        start = time.monotonic()
+        for _ in range(writes):
+            await pacer.wait()
+        return time.monotonic() - start
+
+    async def test_paces_writes_at_interval(self):
+        for use_shared_clock in (False, True):
+            pacer = MediaPacer(use_shared_clock=use_shared_clock)
+            pacer.set_interval(0.01)
+            elapsed = await self._pace(pacer, 11)
+            # The first write goes out immediately
+            self.assertGreaterEqual(elapsed, 0.1)
+            self.assertLess(elapsed, 0.2)
+            await pacer.close()
+
+    async def test_send_ahead_lets_writes_run_ahead(self):
+        pacer = MediaPacer(send_ahead_secs=0.05)
+        pacer.set_interval(0.01)
+        # 5 writes fit in the send-ahead budget
+        elapsed = await self._pace(pacer, 5)
+        self.assertLess(elapsed, 0.01)
+
+    async def test_stall_within_send_ahead_is_caught_up(self):
+        pacer = MediaPacer(send_ahead_secs=0.1)
+        pacer.set_interval(0.02)
+        start = time.monotonic()
+        await pacer.wait()
+        # Event loop stall
+        time.sleep(0.06)
+        # The schedule is kept: the missed slots go out back to back
+        await self._pace(pacer, 3)
+        self.assertAlmostEqual(pacer._next_send_time, start + 0.08, delta=0.005)
+
+    async def test_reset_restarts_schedule(self):
+        pacer = MediaPacer()
+        pacer.set_interval(10)
+        await pacer.wait()
+        pacer.reset()
+        elapsed = await self._pace(pacer, 1)
+        self.assertLess(elapsed, 0.01)
+
+    async def test_shared_clock_outlives_the_pacer_that_started_it(self):
+        first = MediaPacer(use_shared_clock=True)
+        second = MediaPacer(use_shared_clock=True)
+        first.set_interval(10)
+        second.set_interval(0.05)
+        await first.wait()
+        await second.wait()
+
+        # The first caller starts the clock, then leaves while the second waits
+        first_waiting = asyncio.create_task(first.wait())
+        await asyncio.sleep(0)
+        second_waiting = asyncio.create_task(second.wait())
+        await asyncio.sleep(0)
+        clock_task = get_media_clock()._task
+        first_waiting.cancel()
+        await first.close()
+
+        await asyncio.wait_for(second_waiting, timeout=1)
+        self.assertFalse(clock_task.cancelled())
+
+        # The last pacer stops the clock
+        await second.close()
+        self.assertIsNone(get_media_clock()._task)
+
+
+if __name__ == "__main__":
+    unittest.main()
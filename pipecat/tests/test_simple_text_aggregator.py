@@ -180,6 +180,64 @@ class TestSimpleTextAggregator(unittest.IsolatedAsyncioTestCase):
         result = await self.aggregator.flush()
         assert result.text == "こんにちは。"
 
+    async def test_chunked_tokens_match_single_chunk(self):
+        """Test that token boundaries don't change the aggregations."""
+        text = "Hello Mr. Smith. It costs $29.95/month. Is that ok? Great"
+
+        expected = [agg.text async for agg in SimpleTextAggregator().aggregate(text)]
+
+        aggregator = SimpleTextAggregator()
+        results = []
+        for i in range(0, len(text), 3):
+            results.extend([agg.text async for agg in aggregator.aggregate(text[i : i + 3])])
+
+        assert results == expected
+        assert results == ["Hello Mr. Smith.", "It costs $29.95/month.", "Is that ok?"]
+
+    async def test_lookahead_ellipsis(self):
+        """Test that an ellipsis is kept together while waiting for lookahead."""
+        results = [agg async for agg in self.aggregator.aggregate("Wait... what?! Ok")]
+
+        assert [r.text for r in results] == ["Wait... what?!"]
+
+    async def test_lookahead_closing_quote(self):
+        """Test that a closing quote stays with its sentence."""
+        results = [agg async for agg in self.aggregator.aggregate('He said "hi." Then')]
+
+        assert len(results) == 1
+        assert results[0].text == 'He said "hi."'
+
+    async def test_first_clause_flush(self):
+        """Test that the first clause of a turn is released early."""
+        aggregator = SimpleTextAggregator(first_clause_min_words=2)
+
+        results = []
+        for token in ["Sure", " thing", ",", " let", " me", " check", ", ok."]:
+            results.extend([agg async for agg in aggregator.aggregate(token)])
+
+        # Only the first clause of the turn is released early
+        assert [r.text for r in results] == ["Sure thing,"]
+        result = await aggregator.flush()
+        assert result.text == "let me check, ok."
+
+        # flush() ends the turn, the next one gets its own early clause
+        results = [agg async for agg in aggregator.aggregate("Yes indeed, it is")]
+        assert [r.text for r in results] == ["Yes indeed,"]
+
+    async def test_first_clause_min_words(self):
+        """Test that short clauses and numbers are not released early."""
+        aggregator = SimpleTextAggregator(first_clause_min_words=3)
+
+        results = [agg async for agg in aggregator.aggregate("Yes, it is 1,000 dollars, ok")]
+
+        assert [r.text for r in results] == ["Yes, it is 1,000 dollars,"]
+
+    async def test_first_clause_disabled_by_default(self):
+        """Test that clauses are not released without first_clause_min_words."""
+        results = [agg async for agg in self.aggregator.aggregate("Sure thing, let me check")]
+
+        assert len(results) == 0
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,194 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import time
+import unittest
+from typing import AsyncGenerator
+
+from pipecat.frames.frames import (
+    Frame,
+    STTMetadataFrame,
+    TranscriptionFrame,
+    VADUserStartedSpeakingFrame,
+    VADUserStoppedSpeakingFrame,
+)
+from pipecat.services.stt_latency_estimator import (
+    BaseTTFSLatencyStore,
+    TTFSLatencyEstimator,
+    TTFSLatencySketch,
+)
+from pipecat.services.stt_service import STTService
+from pipecat.tests.utils import SleepFrame, run_test
+
+NOW = 1_000_000.0
+
+
+class MemoryTTFSLatencyStore(BaseTTFSLatencyStore):
+    """Store shared by several estimators, as Redis would be across processes."""
+
+    def __init__(self):
+        self.counts = {}
+        self.fail = False
+
+    async def merge(self, key, pending, windows):
+        if self.fail:
+            raise ConnectionError("store unavailable")
+        sketch = self.counts.setdefault(key, {})
+        for window, buckets in pending.items():
+            stored = sketch.setdefault(window, {})
+            for bucket, count in buckets.items():
+                stored[bucket] = stored.get(bucket, 0) + count
+        return {window: dict(sketch.get(window, {})) for window in windows}
+
+
+class NoopSTTService(STTService):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.published_ttfs = []
+
+    async def run_stt(self, audio: bytes) -> AsyncGenerator[Frame, None]:
+        yield None
+
+    async def broadcast_frame(self, frame_cls, **kwargs):
+        if frame_cls is STTMetadataFrame:
+            self.published_ttfs.append(kwargs["ttfs_p99_latency"])
+        await super().broadcast_frame(frame_cls, **kwargs)
+
+
+class TestTTFSLatencySketch(unittest.TestCase):
+    def test_quantiles_within_relative_accuracy(self):
+        sketch = TTFSLatencySketch(relative_accuracy=0.02, min_samples=1)
+        for i in range(1, 1001):
+            sketch.add(i / 1000, now=NOW)
+
+        for q, expected in [(0.5, 0.5), (0.9, 0.9), (0.99, 0.99)]:
+            value = sketch.quantile(q, now=NOW)
+            self.assertGreaterEqual(value, expected)
+            self.assertLessEqual(value, expected * 1.05)
+
+    def test_min_samples(self):
+        sketch = TTFSLatencySketch(min_samples=5)
+        for _ in range(4):
+            sketch.add(0.3, now=NOW)
+        self.assertIsNone(sketch.quantile(0.99, now=NOW))
+
+        sketch.add(0.3, now=NOW)
+        self.assertIsNotNone(sketch.quantile(0.99, now=NOW))
+
+    def test_old_windows_are_forgotten(self):
+        sketch = TTFSLatencySketch(window_secs=60, min_samples=1)
+        for _ in range(10):
+            sketch.add(2.0, now=NOW)
+
+        # Still in the previous window.
+        self.assertAlmostEqual(sketch.quantile(0.99, now=NOW + 60), 2.0, delta=0.1)
+
+        sketch.add(0.3, now=NOW + 120)
+        self.assertEqual(sketch.count(now=NOW + 120), 1)
+        self.assertAlmostEqual(sketch.quantile(0.99, now=NOW + 120), 0.3, delta=0.02)
+
+
+class TestTTFSLatencyEstimator(unittest.IsolatedAsyncioTestCase):
+    async def test_sketches_merged_through_store(self):
+        store = MemoryTTFSLatencyStore()
+        worker_a = TTFSLatencyEstimator(store=store, min_samples=1)
+        worker_b = TTFSLatencyEstimator(store=store, min_samples=1)
+        key = TTFSLatencyEstimator.key("DeepgramSTTService", "nova-3")
+
+        for _ in range(99):
+            worker_a.add(key, 0.3)
+        worker_b.add(key, 1.5)
+        worker_b.add(key, 1.5)
+
+        self.assertTrue(worker_a.should_sync(key))
+        await worker_a.sync(key)
+        self.assertFalse(worker_a.should_sync(key))
+        await worker_b.sync(key)
+
+        self.assertEqual(worker_b.sketch(key).count(), 101)
+        self.assertAlmostEqual(worker_b.p99(key), 1.5, delta=0.1)
+        # Worker A picks up worker B's samples on its next sync.
+        self.assertAlmostEqual(worker_a.p99(key), 0.3, delta=0.02)
+        await worker_a.sync(key)
+        self.assertAlmostEqual(worker_a.p99(key), 1.5, delta=0.1)
+
+    async def test_samples_kept_when_store_fails(self):
+        store = MemoryTTFSLatencyStore()
+        estimator = TTFSLatencyEstimator(store=store, min_samples=1)
+
+        estimator.add("stt", 0.4)
+        store.fail = True
+        await estimator.sync("stt")
+        self.assertEqual(estimator.sketch("stt").count(), 1)
+
+        store.fail = False
+        await estimator.sync("stt")
+        self.assertEqual(sum(sum(b.values()) for b in store.counts["stt"].values()), 1)
+        self.assertEqual(estimator.sketch("stt").count(), 1)
+
+
+class TestSTTServiceTTFSEstimation(unittest.IsolatedAsyncioTestCase):
+    async def test_estimated_p99_published(self):
+        estimator = TTFSLatencyEstimator(min_samples=3)
+        stt = NoopSTTService(ttfs_p99_latency=2.0, ttfs_estimator=estimator)
+
+        frames_to_send = []
+        for _ in range(3):
+            frames_to_send += [
+                VADUserStartedSpeakingFrame(),
+                # Speech ended 0.2s before the VAD stop, the final transcript
+                # arrives right away: TTFS is ~0.2s.
+                VADUserStoppedSpeakingFrame(stop_secs=0.2, timestamp=time.time()),
+                TranscriptionFrame(text="Hello!", user_id="", timestamp="", finalized=True),
+                SleepFrame(sleep=0.01),
+            ]
+        await run_test(stt, frames_to_send=frames_to_send)
+
+        key = TTFSLatencyEstimator.key("NoopSTTService", "")
+        self.assertEqual(estimator.sketch(key).count(), 3)
+        # The static value at start, then the estimate once there are enough turns.
+        self.assertEqual(len(stt.published_ttfs), 2)
+        self.assertEqual(stt.published_ttfs[0], 2.0)
+        # ~0.2s, raised to the lower bound.
+        self.assertGreaterEqual(stt.published_ttfs[1], 0.25)
+        self.assertLess(stt.published_ttfs[1], 0.3)
+
+    async def test_metadata_uses_estimate(self):
+        estimator = TTFSLatencyEstimator(min_samples=3)
+        key = TTFSLatencyEstimator.key("NoopSTTService", "")
+        for _ in range(3):
+            estimator.add(key, 0.5)
+
+        stt = NoopSTTService(ttfs_p99_latency=2.0, ttfs_estimator=estimator)
+        frames_to_send = [
+            VADUserStartedSpeakingFrame(),
+            VADUserStoppedSpeakingFrame(stop_secs=0.2, timestamp=time.time() - 1.0),
+            TranscriptionFrame(text="Hello!", user_id="", timestamp="", finalized=True),
+        ]
+        await run_test(stt, frames_to_send=frames_to_send)
+
+        # The estimate replaces the static value at start, then a slower turn
+        # moves the P99 enough to be published again.
+        self.assertEqual(len(stt.published_ttfs), 2)
+        self.assertAlmostEqual(stt.published_ttfs[0], 0.5, delta=0.02)
+        # At least 1.2s, plus the time it took to start the pipeline.
+        self.assertGreaterEqual(stt.published_ttfs[1], 1.2)
+        self.assertLess(stt.published_ttfs[1], 1.6)
+
+    async def test_estimate_bounded_by_static_value(self):
+        estimator = TTFSLatencyEstimator(min_samples=3)
+        key = TTFSLatencyEstimator.key("NoopSTTService", "")
+        for _ in range(3):
+            estimator.add(key, 10.0)
+
+        stt = NoopSTTService(ttfs_p99_latency=1.5, ttfs_estimator=estimator)
+        await run_test(stt, frames_to_send=[])
+
+        self.assertEqual(stt.published_ttfs, [3.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,315 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+from typing import AsyncGenerator, Dict, Optional
+
+from pipecat.frames.frames import (
+    AggregatedTextFrame,
+    Frame,
+    MetricsFrame,
+    TTSAudioRawFrame,
+    TTSSpeakFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    TTSTextFrame,
+)
+from pipecat.metrics.metrics import TTSPhraseCacheMetricsData
+from pipecat.pipeline.task import PipelineParams
+from pipecat.services.tts_cache import (
+    CachedTTSData,
+    TTSCacheManager,
+    TTSMemoryCache,
+    TTSPhraseCache,
+    generate_tts_cache_key,
+)
+from pipecat.services.tts_service import TTSService, WordTTSService
+from pipecat.tests.utils import SleepFrame, run_test
+
+SAMPLE_RATE = 16000
+
+
+def cached_data(num_bytes: int, ttfa_seconds: float = 0.0) -> CachedTTSData:
+    return CachedTTSData(
+        audio_chunks=[b"\x00" * num_bytes],
+        sample_rate=SAMPLE_RATE,
+        num_channels=1,
+        word_timestamps=[],
+        total_duration_seconds=num_bytes / (SAMPLE_RATE * 2),
+        ttfa_seconds=ttfa_seconds,
+    )
+
+
+class FakeRedisCacheManager(TTSCacheManager):
+    """Cache manager keeping entries in a dict instead of Redis."""
+
+    def __init__(self):
+        super().__init__(redis_url="redis://unused")
+        self.entries: Dict[str, CachedTTSData] = {}
+
+    async def connect(self):
+        pass
+
+    async def get(self, cache_key: str) -> Optional[CachedTTSData]:
+        return self.entries.get(cache_key)
+
+    async def set(self, cache_key: str, data: CachedTTSData) -> bool:
+        self.entries[cache_key] = data
+        return True
+
+
+class FakeTTSService(TTSService):
+    """Synthesizes two chunks of audio per phrase after a short delay."""
+
+    def __init__(self, **kwargs):
+        super().__init__(sample_rate=SAMPLE_RATE, **kwargs)
+        self.requests = []
+
+    def can_generate_metrics(self) -> bool:
+        return True
+
+    async def run_tts(self, text: str, context_id: str) -> AsyncGenerator[Frame, None]:
+        self.requests.append(text)
+        yield TTSStartedFrame(context_id=context_id)
+        await asyncio.sleep(0.05)
+        for value in (b"\x01", b"\x02"):
+            yield TTSAudioRawFrame(value * 320, SAMPLE_RATE, 1, context_id=context_id)
+        yield TTSStoppedFrame(context_id=context_id)
+
+
+class FakeWordTTSService(WordTTSService):
+    """Synthesizes one chunk of audio per phrase with word timestamps."""
+
+    def __init__(self, **kwargs):
+        super().__init__(sample_rate=SAMPLE_RATE, push_text_frames=False, **kwargs)
+        self.requests = []
+
+    async def run_tts(self, text: str, context_id: str) -> AsyncGenerator[Frame, None]:
+        self.requests.append(text)
+        yield TTSStartedFrame(context_id=context_id)
+        yield TTSAudioRawFrame(b"\x01" * SAMPLE_RATE, SAMPLE_RATE, 1, context_id=context_id)
+        await self.start_word_timestamps()
+        # Times relative to the start of the turn.
+        await self.add_word_timestamps([("Hello", 2.0), ("there", 2.25)], context_id)
+        await self.add_word_timestamps([("TTSStoppedFrame", 0)], context_id)
+
+
+class TestTTSMemoryCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = TTSMemoryCache(max_bytes=300, max_entry_bytes=200)
+
+        cache.set("a", cached_data(100))
+        cache.set("b", cached_data(100))
+        cache.get("a")
+        cache.set("c", cached_data(150))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.size_bytes, 250)
+        self.assertFalse(cache.set("d", cached_data(201)))
+        self.assertEqual(len(cache), 2)
+
+    def test_key_normalizes_text(self):
+        key = generate_tts_cache_key("Hello   there. ", "voice", "model", SAMPLE_RATE)
+
+        self.assertEqual(key, generate_tts_cache_key("hello there.", "voice", "model", SAMPLE_RATE))
+        self.assertNotEqual(key, generate_tts_cache_key("hello there.", "voice", "model", 8000))
+
+
+class TestTTSPhraseCache(unittest.IsolatedAsyncioTestCase):
+    async def test_live_lookups_only_in_memory(self):
+        redis = FakeRedisCacheManager()
+        redis.entries["key"] = cached_data(100)
+        cache = TTSPhraseCache(cache_manager=redis)
+
+        self.assertIsNone(cache.get("key"))
+        # Phrases synthesized ahead of time are loaded from Redis.
+        self.assertTrue(await cache.ensure("key", lambda: None))
+        self.assertIsNotNone(cache.get("key"))
+
+        stats = cache.stats
+        self.assertEqual((stats["hits"], stats["misses"], stats["redis_loads"]), (1, 1, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 1 / 2)
+
+    async def test_live_phrases_admitted_when_repeated(self):
+        cache = TTSPhraseCache(max_tracked_phrases=2)
+
+        self.assertFalse(cache.admit("a"))
+        self.assertTrue(cache.admit("a"))
+        self.assertFalse(cache.admit("b"))
+        self.assertFalse(cache.admit("c"))
+        self.assertFalse(cache.admit("d"))
+        # "b" was forgotten.
+        self.assertFalse(cache.admit("b"))
+
+    async def test_redis_written_in_background(self):
+        written = asyncio.Event()
+        redis = FakeRedisCacheManager()
+        set_entry = redis.set
+
+        async def slow_set(cache_key: str, data: CachedTTSData) -> bool:
+            await written.wait()
+            return await set_entry(cache_key, data)
+
+        redis.set = slow_set
+        cache = TTSPhraseCache(cache_manager=redis)
+
+        cache.set("live", cached_data(100))
+        cache.set("static", cached_data(100), persist=True)
+        self.assertIsNotNone(cache.memory.get("static"))
+        self.assertEqual(redis.entries, {})
+
+        written.set()
+        await cache.disconnect()
+        self.assertEqual(list(redis.entries), ["static"])
+
+
+class TestTTSServicePhraseCache(unittest.IsolatedAsyncioTestCase):
+    async def test_repeated_phrase_replayed_from_cache(self):
+        redis = FakeRedisCacheManager()
+        cache = TTSPhraseCache(cache_manager=redis)
+        tts = FakeTTSService(phrase_cache=cache)
+
+        down_frames, _ = await run_test(
+            tts,
+            frames_to_send=[
+                TTSSpeakFrame("Hello there."),
+                TTSSpeakFrame("hello  there."),
+                TTSSpeakFrame("Hello   there."),
+            ],
+            expected_down_frames=[
+                MetricsFrame,
+                AggregatedTextFrame,
+                MetricsFrame,  # Miss, first sighting
+                TTSStartedFrame,
+                TTSAudioRawFrame,
+                TTSAudioRawFrame,
+                TTSStoppedFrame,
+                MetricsFrame,
+                TTSTextFrame,
+                AggregatedTextFrame,
+                MetricsFrame,  # Miss, captured
+                TTSStartedFrame,
+                TTSAudioRawFrame,
+                TTSAudioRawFrame,
+                TTSStoppedFrame,
+                MetricsFrame,
+                TTSTextFrame,
+                AggregatedTextFrame,
+                TTSStartedFrame,
+                TTSAudioRawFrame,
+                TTSAudioRawFrame,
+                TTSStoppedFrame,
+                MetricsFrame,  # Hit
+                MetricsFrame,
+                TTSTextFrame,
+            ],
+            pipeline_params=PipelineParams(enable_metrics=True),
+        )
+
+        self.assertEqual(tts.requests, ["Hello there.", "hello  there."])
+        # Phrases spoken live aren't shared through Redis.
+        self.assertEqual(redis.entries, {})
+
+        audio = [f.audio for f in down_frames if isinstance(f, TTSAudioRawFrame)]
+        self.assertEqual(audio, [b"\x01" * 320, b"\x02" * 320] * 3)
+        texts = [f.text for f in down_frames if isinstance(f, TTSTextFrame)]
+        self.assertEqual(texts, ["Hello there.", "hello  there.", "Hello   there."])
+
+        metrics = [
+            d
+            for f in down_frames
+            if isinstance(f, MetricsFrame)
+            for d in f.data
+            if isinstance(d, TTSPhraseCacheMetricsData)
+        ]
+        self.assertEqual(
+            [(m.hit, m.tier) for m in metrics], [(False, None), (False, None), (True, "memory")]
+        )
+        self.assertGreater(metrics[2].ttfa_saved, 0.03)
+        self.assertEqual(cache.stats["hits"], 1)
+
+    async def test_word_timestamps_replayed(self):
+        cache = TTSPhraseCache(admit_after=1)
+        tts = FakeWordTTSService(phrase_cache=cache)
+
+        down_frames, _ = await run_test(
+            tts,
+            frames_to_send=[
+                TTSSpeakFrame("Hello there."),
+                # Let the words (and TTSStoppedFrame) of the first phrase go out.
+                SleepFrame(0.1),
+                TTSSpeakFrame("Hello there."),
+            ],
+            expected_down_frames=[
+                AggregatedTextFrame,
+                TTSStartedFrame,
+                TTSAudioRawFrame,
+                TTSTextFrame,
+                TTSTextFrame,
+                TTSStoppedFrame,
+            ]
+            * 2,
+        )
+
+        self.assertEqual(tts.requests, ["Hello there."])
+        entry = cache.get(tts.generate_phrase_cache_key("Hello there."))
+        self.assertEqual(entry.word_timestamps, [("Hello", 0.0), ("there", 0.25)])
+
+        words = [f for f in down_frames if isinstance(f, TTSTextFrame)]
+        self.assertEqual([f.text for f in words], ["Hello", "there"] * 2)
+        self.assertEqual(words[3].pts - words[2].pts, 250_000_000)
+
+
+class TestTTSServicePresynthesis(unittest.IsolatedAsyncioTestCase):
+    async def test_presynthesized_phrase_replayed(self):
+        redis = FakeRedisCacheManager()
+        cache = TTSPhraseCache(cache_manager=redis)
+        tts = FakeTTSService(phrase_cache=cache)
+        other_tts = FakeTTSService(phrase_cache=cache)
+        for service in (tts, other_tts):
+            service._sample_rate = SAMPLE_RATE
+
+        # Both calls share a single synthesis.
+        results = await asyncio.gather(
+            tts.presynthesize("Goodbye!"), other_tts.presynthesize("Goodbye!")
+        )
+        self.assertEqual(results, [True, True])
+        self.assertEqual(tts.requests + other_tts.requests, ["Goodbye!"])
+        self.assertTrue(await tts.presynthesize("Goodbye!"))
+        self.assertEqual(len(tts.requests), 1)
+
+        down_frames, _ = await run_test(
+            tts,
+            frames_to_send=[TTSSpeakFrame("Goodbye!")],
+            expected_down_frames=[
+                AggregatedTextFrame,
+                TTSStartedFrame,
+                TTSAudioRawFrame,
+                TTSAudioRawFrame,
+                TTSStoppedFrame,
+                TTSTextFrame,
+            ],
+        )
+
+        self.assertEqual(len(tts.requests), 1)
+        self.assertEqual(cache.stats["hits"], 1)
+        # Shared with other workers.
+        await cache.disconnect()
+        self.assertEqual(len(redis.entries), 1)
+
+    async def test_presynthesis_unsupported(self):
+        tts = FakeWordTTSService(phrase_cache=TTSPhraseCache())
+
+        self.assertFalse(tts.supports_presynthesis)
+        self.assertFalse(await tts.presynthesize("Goodbye!"))
+        self.assertFalse(await FakeTTSService().presynthesize("Goodbye!"))
+        self.assertEqual(tts.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -199,6 +199,51 @@ class TestUserTurnController(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(should_stop)
         self.assertTrue(timeout)
 
+    async def test_user_turn_paused_and_resumed(self):
+        controller = UserTurnController(
+            user_turn_strategies=UserTurnStrategies(
+                stop=[SpeechTimeoutUserTurnStopStrategy(user_speech_timeout=TRANSCRIPTION_TIMEOUT)],
+            )
+        )
+
+        await controller.setup(self.task_manager)
+
+        events = []
+
+        @controller.event_handler("on_user_turn_paused")
+        async def on_user_turn_paused(controller):
+            events.append("paused")
+
+        @controller.event_handler("on_user_turn_resumed")
+        async def on_user_turn_resumed(controller):
+            events.append("resumed")
+
+        @controller.event_handler("on_user_turn_stopped")
+        async def on_user_turn_stopped(controller, strategy, params):
+            events.append("stopped")
+
+        # The first VAD start begins the turn, it doesn't resume it.
+        await controller.process_frame(VADUserStartedSpeakingFrame())
+        await controller.process_frame(
+            TranscriptionFrame(text="I want to", user_id="", timestamp="now")
+        )
+        await controller.process_frame(VADUserStoppedSpeakingFrame())
+        self.assertEqual(events, ["paused"])
+
+        await controller.process_frame(VADUserStartedSpeakingFrame())
+        await controller.process_frame(
+            TranscriptionFrame(text="book a flight.", user_id="", timestamp="now")
+        )
+        await controller.process_frame(VADUserStoppedSpeakingFrame())
+        self.assertEqual(events, ["paused", "resumed", "paused"])
+
+        await asyncio.sleep(TRANSCRIPTION_TIMEOUT + 0.1)
+        self.assertEqual(events, ["paused", "resumed", "paused", "stopped"])
+
+        # No user turn, so VAD changes are not pauses.
+        await controller.process_frame(VADUserStoppedSpeakingFrame())
+        self.assertEqual(events, ["paused", "resumed", "paused", "stopped"])
+
 
 if __name__ == "__main__":
     unittest.main()
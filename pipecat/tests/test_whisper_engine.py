@@ -0,0 +1,117 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+from pipecat.frames.frames import TranscriptionFrame
+from pipecat.services.whisper.engine import (
+    WhisperEngine,
+    WhisperEngineParams,
+    get_whisper_engine,
+)
+from pipecat.services.whisper.stt import WhisperSTTService
+
+
+class FakeWhisperModel:
+    """Transcribes a segment as the number of samples it has."""
+
+    def __init__(self):
+        self.transcribed = []
+
+    def transcribe(self, audio, language=None, beam_size=5):
+        self.transcribed.append((len(audio), language))
+        segment = SimpleNamespace(text=f" {len(audio)}", no_speech_prob=0.1)
+        return [segment], None
+
+
+class FakeWhisperEngine(WhisperEngine):
+    """Engine with a fake model that records the decoded batches."""
+
+    def __init__(self, **kwargs):
+        self.batches = []
+        super().__init__("fake", **kwargs)
+
+    def _load(self):
+        self._model = FakeWhisperModel()
+
+    def _generate(self, audios, language):
+        self.batches.append([len(audio) for audio in audios])
+        return [(str(len(audio)), 0.9 if len(audio) == 0 else 0.1) for audio in audios]
+
+
+def segment(samples: int) -> np.ndarray:
+    return np.zeros(samples, dtype=np.float32)
+
+
+class TestWhisperEngine(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_segments_batched(self):
+        engine = FakeWhisperEngine()
+
+        results = await asyncio.gather(
+            *(engine.transcribe(segment(n), language="en", no_speech_prob=0.4) for n in (1, 2, 3))
+        )
+
+        self.assertEqual(engine.batches, [[1, 2, 3]])
+        self.assertEqual([r.text for r in results], ["1 ", "2 ", "3 "])
+        self.assertTrue(all(r.batch_size == 3 for r in results))
+        self.assertTrue(all(r.queue_wait >= 0 and r.decode_time >= 0 for r in results))
+
+    async def test_max_batch_size(self):
+        engine = FakeWhisperEngine(params=WhisperEngineParams(max_batch_size=2))
+
+        results = await asyncio.gather(
+            *(engine.transcribe(segment(n), language="en", no_speech_prob=0.4) for n in (1, 2, 3))
+        )
+
+        # The last segment is alone in its batch and is transcribed as before.
+        self.assertEqual(engine.batches, [[1, 2]])
+        self.assertEqual(engine.model.transcribed, [(3, "en")])
+        self.assertEqual([r.batch_size for r in results], [2, 2, 1])
+        self.assertEqual(results[2].text, " 3 ")
+
+    async def test_no_speech_and_language_detection(self):
+        engine = FakeWhisperEngine()
+
+        results = await asyncio.gather(
+            engine.transcribe(segment(0), language="en", no_speech_prob=0.4),
+            engine.transcribe(segment(5), language="en", no_speech_prob=0.4),
+            engine.transcribe(segment(7), language=None, no_speech_prob=0.4),
+        )
+
+        self.assertEqual(engine.batches, [[0, 5]])
+        self.assertEqual(engine.model.transcribed, [(7, None)])
+        self.assertEqual([r.text for r in results], ["", "5 ", " 7 "])
+
+    async def test_shared_engine(self):
+        with patch.object(WhisperEngine, "_load", FakeWhisperEngine._load):
+            engine = get_whisper_engine("shared-test", device="cpu")
+            self.assertIs(get_whisper_engine("shared-test", device="cpu"), engine)
+            self.assertIsNot(get_whisper_engine("shared-test", device="cuda"), engine)
+
+            stt = WhisperSTTService(model="shared-test", device="cpu")
+            self.assertIs(stt._model, engine.model)
+
+
+class TestWhisperSTTServiceEngine(unittest.IsolatedAsyncioTestCase):
+    async def test_run_stt_uses_engine(self):
+        engine = FakeWhisperEngine()
+        stt = WhisperSTTService(model="fake", engine=engine)
+
+        frames = [frame async for frame in stt.run_stt(bytes(320))]
+
+        self.assertEqual(len(frames), 1)
+        self.assertIsInstance(frames[0], TranscriptionFrame)
+        self.assertEqual(frames[0].text, " 160 ")
+        self.assertEqual(engine.model.transcribed, [(160, "en")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -54,6 +54,7 @@ LATEST_LINK="$BASE_LOG_DIR/latest"      # Symlink to latest logs
 VENV_PATH="$BASE_DIR/venv"
 
 ARQ_WORKERS=${ARQ_WORKERS:-1}
+MEDIA_WORKERS=${MEDIA_WORKERS:-0}  # Dedicated call pipeline processes (0 = run calls in uvicorn)
 LOG_TO_FILE=${LOG_TO_FILE:-true}    # Set to false in Docker to use stdout
 WAIT_FOR_PROCESSES=${WAIT_FOR_PROCESSES:-false}  # Set to true in Docker to keep container alive
 
@@ -112,6 +113,12 @@ for ((i=1; i<=ARQ_WORKERS; i++)); do
   SERVICE_COMMANDS+=("python -m arq api.tasks.arq.WorkerSettings --custom-log-dict api.tasks.arq.LOG_CONFIG")
 done
 
+# Add media workers dynamically; uvicorn relays call media websockets to them
+for ((i=0; i<MEDIA_WORKERS; i++)); do
+  SERVICE_NAMES+=("media_worker$i")
+  SERVICE_COMMANDS+=("python -m api.services.media_workers.worker --index $i")
+done
+
 ###############################################################################
 ### 3) Activate virtual environment
 ###############################################################################
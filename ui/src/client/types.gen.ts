@@ -1373,6 +1373,7 @@ export type WorkflowRunsResponse = {
     applied_filters?: Array<{
         [key: string]: unknown;
     }> | null;
+    next_cursor?: string | null;
 };
 
 export type WorkflowSummaryResponse = {
@@ -2199,6 +2200,10 @@ export type GetWorkflowRunsApiV1WorkflowWorkflowIdRunsGetData = {
          * Sort order ('asc' or 'desc')
          */
         sort_order?: string | null;
+        /**
+         * next_cursor from the previous page (overrides page)
+         */
+        cursor?: string | null;
     };
     url: '/api/v1/workflow/{workflow_id}/runs';
 };
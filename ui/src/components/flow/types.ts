@@ -40,6 +40,12 @@ export type FlowNodeData = {
         max_retries: number;
         retry_delay_seconds: number;
     };
+    // Send many runs' events to the endpoint in one request ({"events": [...]})
+    batch_config?: {
+        enabled: boolean;
+        max_events: number;
+        window_seconds: number;
+    };
     // Tools - array of tool UUIDs that can be invoked by this node
     tool_uuids?: string[];
     // Documents - array of knowledge base document UUIDs that can be referenced by this node